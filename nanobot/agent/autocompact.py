@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from collections.abc import Collection
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Coroutine
@@ -27,6 +28,14 @@ class AutoCompact:
         self._ttl = session_ttl_minutes
         self._archiving: set[str] = set()
         self._summaries: dict[str, SessionSummary] = {}
+        # Idle-expiry index: a min-heap of (updated_at, key) with lazy deletion.
+        # ``_idle_at`` holds the live timestamp per key; heap entries that no
+        # longer match it are stale.  Saves and loads keep it current, so a
+        # check only touches sessions that actually became due.
+        self._idle_heap: list[tuple[float, str]] = []
+        self._idle_at: dict[str, float] = {}
+        self._idle_seeded = False
+        sessions.set_save_observer(self.observe_session)
 
     def _is_expired(self, ts: datetime | str | None,
                     now: datetime | None = None) -> bool:
@@ -46,14 +55,69 @@ class AutoCompact:
             return False
         return idle_seconds >= self._ttl * 60
 
-    def _has_unarchived_messages(self, key: str) -> bool:
-        session = self.sessions.get_or_create(key)
-        return session.last_consolidated < len(session.messages)
+    @staticmethod
+    def _timestamp(ts: datetime | str | None) -> float | None:
+        if not ts:
+            return None
+        try:
+            if isinstance(ts, str):
+                ts = datetime.fromisoformat(ts)
+            return ts.timestamp()
+        except (OSError, OverflowError, TypeError, ValueError):
+            return None
 
     @classmethod
     def _is_internal_session(cls, key: str) -> bool:
         return key.startswith(cls._INTERNAL_SESSION_PREFIXES)
 
+    @staticmethod
+    def _has_unarchived_messages(session: Session) -> bool:
+        return session.last_consolidated < len(session.messages)
+
+    def _track_idle(self, key: str, updated_at: float) -> None:
+        if self._idle_at.get(key) == updated_at:
+            return
+        self._idle_at[key] = updated_at
+        heapq.heappush(self._idle_heap, (updated_at, key))
+
+    def observe_session(self, key: str, session: Session | None) -> None:
+        """Keep the idle index in sync with a saved, loaded or deleted session."""
+        if (
+            session is None
+            or self._is_internal_session(key)
+            or not self._has_unarchived_messages(session)
+        ):
+            self._idle_at.pop(key, None)
+            return
+        updated_at = self._timestamp(session.updated_at)
+        if updated_at is None:
+            self._idle_at.pop(key, None)
+            return
+        self._track_idle(key, updated_at)
+
+    def _seed_idle_index(self) -> None:
+        """Index persisted sessions once; later changes arrive via ``observe_session``."""
+        self._idle_seeded = True
+        for info in self.sessions.list_sessions():
+            key = info.get("key", "")
+            if not key or self._is_internal_session(key) or key in self._idle_at:
+                continue
+            if info.get("has_unarchived_messages") is False:
+                continue
+            updated_at = self._timestamp(info.get("updated_at"))
+            if updated_at is not None:
+                self._track_idle(key, updated_at)
+
+    def _pop_due(self, cutoff: float) -> list[tuple[float, str]]:
+        due: list[tuple[float, str]] = []
+        while self._idle_heap and self._idle_heap[0][0] <= cutoff:
+            updated_at, key = heapq.heappop(self._idle_heap)
+            if self._idle_at.get(key) != updated_at:
+                continue
+            del self._idle_at[key]
+            due.append((updated_at, key))
+        return due
+
     def check_expired(
         self,
         schedule_background: Callable[[Coroutine[Any, Any, None]], None],
@@ -61,23 +125,56 @@ class AutoCompact:
         active_session_keys: Collection[str] = (),
     ) -> None:
         """Schedule archival for idle sessions, skipping those with in-flight agent tasks."""
-        now = datetime.now()
-        for info in self.sessions.list_sessions():
-            key = info.get("key", "")
-            if not key or self._is_internal_session(key) or key in self._archiving:
-                continue
-            if key in active_session_keys:
-                continue
-            updated_at = info.get("updated_at")
-            if self._is_expired(updated_at, now) and self._has_unarchived_messages(key):
-                session = self.sessions.get_or_create(key)
-                try:
-                    runtime = resolve_runtime(session)
-                except (KeyError, ValueError):
-                    # Invalid session selections remain recoverable through /model.
-                    continue
-                self._archiving.add(key)
-                schedule_background(self._archive(key, runtime=runtime))
+        if self._ttl <= 0:
+            return
+        if not self._idle_seeded:
+            self._seed_idle_index()
+        due = self._pop_due(datetime.now().timestamp() - self._ttl * 60)
+        for index, (updated_at, key) in enumerate(due):
+            try:
+                self._check_due_session(
+                    key,
+                    updated_at,
+                    schedule_background,
+                    resolve_runtime,
+                    active_session_keys,
+                )
+            except BaseException:
+                # Sessions this check did not reach are still due next time.
+                for pending_at, pending_key in due[index + 1:]:
+                    self._idle_at.setdefault(pending_key, pending_at)
+                    heapq.heappush(self._idle_heap, (pending_at, pending_key))
+                raise
+
+    def _check_due_session(
+        self,
+        key: str,
+        updated_at: float,
+        schedule_background: Callable[[Coroutine[Any, Any, None]], None],
+        resolve_runtime: Callable[[Session], LLMRuntime],
+        active_session_keys: Collection[str],
+    ) -> None:
+        if key in self._archiving or key in active_session_keys:
+            # Busy sessions stay indexed and are rechecked next time.
+            self._track_idle(key, updated_at)
+            return
+        session = self.sessions.get_or_create(key)
+        if not self._has_unarchived_messages(session):
+            self._idle_at.pop(key, None)
+            return
+        if self._idle_at.get(key, updated_at) > updated_at:
+            # Loading the session surfaced newer activity; it is not idle yet.
+            return
+        # Stay indexed until archival saves the session, so unresolvable
+        # sessions are retried on the next check.
+        self._track_idle(key, updated_at)
+        try:
+            runtime = resolve_runtime(session)
+        except (KeyError, ValueError):
+            # Invalid session selections remain recoverable through /model.
+            return
+        self._archiving.add(key)
+        schedule_background(self._archive(key, runtime=runtime))
 
     async def _archive(self, key: str, *, runtime: LLMRuntime) -> None:
         if self._is_internal_session(key):
@@ -1,7 +1,5 @@
 """Context builder for assembling agent prompts."""
 
-import base64
-import mimetypes
 import platform
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,13 +7,13 @@ from typing import Any, Mapping, Sequence, cast
 
 from nanobot.agent.memory import MemoryStore
 from nanobot.agent.skills import SkillsLoader
-from nanobot.agent.tools import image_generation as image_generation_tools
 from nanobot.agent.tools import mcp as mcp_tools
 from nanobot.agent.tools import sessions as session_tools
 from nanobot.agent.tools.registry import ToolRegistry
 from nanobot.apps.cli import utils as cli_app_utils
 from nanobot.bus.events import (
     INBOUND_META_RUNTIME_CONTROL,
+    RUNTIME_CONTROL_IMAGE_GENERATION_RELOAD,
     RUNTIME_CONTROL_SESSION_DISCARD,
     InboundMessage,
 )
@@ -31,10 +29,10 @@ from nanobot.session.keys import last_channel_from_metadata
 from nanobot.session.manager import Session
 from nanobot.session.summary import SessionSummary
 from nanobot.utils.helpers import (
-    detect_image_mime,
     load_bundled_template,
     truncate_text_to_tokens,
 )
+from nanobot.utils.image_pipeline import DEFAULT_IMAGE_LIMITS, ImageLimits, ImagePipeline
 from nanobot.utils.prompt_templates import render_template
 
 
@@ -48,9 +46,15 @@ def session_extra(metadata: Mapping[str, Any] | None) -> dict[str, Any]:
 
 
 async def handle_runtime_control(state: Any, msg: InboundMessage, tools: ToolRegistry) -> bool:
-    if msg.metadata.get(INBOUND_META_RUNTIME_CONTROL) == RUNTIME_CONTROL_SESSION_DISCARD:
+    control = msg.metadata.get(INBOUND_META_RUNTIME_CONTROL)
+    if control == RUNTIME_CONTROL_SESSION_DISCARD:
         await state.discard_session(msg.session_key)
         return True
+    if control != RUNTIME_CONTROL_IMAGE_GENERATION_RELOAD:
+        return False
+    # Imported on demand: the image tool module pulls in the provider stack.
+    from nanobot.agent.tools import image_generation as image_generation_tools
+
     return await image_generation_tools.handle_runtime_control(state, msg, tools)
 
 
@@ -84,12 +88,18 @@ class ContextBuilder:
     _MAX_RECENT_HISTORY = 50
     _MAX_HISTORY_TOKENS = 8_000  # hard cap on recent history section size (tokens)
     _RUNTIME_CONTEXT_END = RUNTIME_CONTEXT_END
+    _STATIC_PROMPT_CACHE_MAX_ENTRIES = 32
 
     def __init__(self, workspace: Path, timezone: str | None = None, disabled_skills: list[str] | None = None):
         self.workspace = workspace
         self.timezone = timezone
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace, disabled_skills=set(disabled_skills) if disabled_skills else None)
+        self.images = ImagePipeline.for_runtime()
+        # (channel, project root, include_memory) -> (fingerprint, static prompt)
+        self._static_prompt_cache: dict[
+            tuple[str | None, Path, bool], tuple[tuple[object, ...], str]
+        ] = {}
 
     def build_system_prompt(
         self,
@@ -102,33 +112,20 @@ class ContextBuilder:
         session_key: str | None = None,
         unified_session: bool = False,
     ) -> str:
-        """Build the system prompt from identity, bootstrap files, memory, and skills."""
-        root = workspace or self.workspace
-        parts = [self._get_identity(channel=channel, workspace=root)]
+        """Build the system prompt from identity, bootstrap files, memory, and skills.
 
-        bootstrap = self._load_bootstrap_files(root)
-        if bootstrap:
-            parts.append(bootstrap)
-
-        parts.append(render_template("agent/tool_contract.md"))
-
-        if include_memory:
-            memory = self.memory.read_memory()
-            if memory and not self._is_template_content(memory, "memory/MEMORY.md"):
-                parts.append(f"# Memory\n\n## Long-term Memory\n{memory}")
-
-        active_skills = self.skills.get_always_skills()
-        if active_skills:
-            active_content = self.skills.load_skills_for_context(active_skills)
-            if active_content:
-                parts.append(f"# Active Skills\n\n{active_content}")
-
-        skills_summary = self.skills.build_skills_summary(
-            exclude=set(active_skills),
-            workspace=root,
-        )
-        if skills_summary:
-            parts.append(render_template("agent/skills_section.md", skills_summary=skills_summary))
+        The static sections are cached (see :meth:`_static_system_prompt`);
+        recent history and the session summary are appended after them so the
+        prompt prefix stays byte-stable across turns.
+        """
+        root = workspace or self.workspace
+        parts = [
+            self._static_system_prompt(
+                channel=channel,
+                workspace=root,
+                include_memory=include_memory,
+            )
+        ]
 
         if include_memory_recent_history:
             entries = self.memory.read_recent_history_for_prompt(
@@ -162,6 +159,83 @@ class ContextBuilder:
 
         return "\n\n---\n\n".join(parts)
 
+    def _static_system_prompt(
+        self,
+        *,
+        channel: str | None,
+        workspace: Path,
+        include_memory: bool,
+    ) -> str:
+        """Return identity, bootstrap files, memory and skills, reusing the last render.
+
+        The cache entry is reused while the stat fingerprint of every input
+        file and the skills fingerprint are unchanged.
+        """
+        key = (channel, workspace, include_memory)
+        fingerprint = self._static_prompt_fingerprint(workspace, include_memory=include_memory)
+        cached = self._static_prompt_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        parts = [self._get_identity(channel=channel, workspace=workspace)]
+
+        bootstrap = self._load_bootstrap_files(workspace)
+        if bootstrap:
+            parts.append(bootstrap)
+
+        parts.append(render_template("agent/tool_contract.md"))
+
+        if include_memory:
+            memory = self.memory.read_memory()
+            if memory and not self._is_template_content(memory, "memory/MEMORY.md"):
+                parts.append(f"# Memory\n\n## Long-term Memory\n{memory}")
+
+        active_skills = self.skills.get_always_skills()
+        if active_skills:
+            active_content = self.skills.load_skills_for_context(active_skills)
+            if active_content:
+                parts.append(f"# Active Skills\n\n{active_content}")
+
+        skills_summary = self.skills.build_skills_summary(
+            exclude=set(active_skills),
+            workspace=workspace,
+        )
+        if skills_summary:
+            parts.append(render_template("agent/skills_section.md", skills_summary=skills_summary))
+
+        prompt = "\n\n---\n\n".join(parts)
+        if (
+            key not in self._static_prompt_cache
+            and len(self._static_prompt_cache) >= self._STATIC_PROMPT_CACHE_MAX_ENTRIES
+        ):
+            self._static_prompt_cache.pop(next(iter(self._static_prompt_cache)))
+        self._static_prompt_cache[key] = (fingerprint, prompt)
+        return prompt
+
+    def _static_prompt_fingerprint(
+        self,
+        workspace: Path,
+        *,
+        include_memory: bool,
+    ) -> tuple[object, ...]:
+        paths = [
+            workspace / "AGENTS.md",
+            self.workspace / "SOUL.md",
+            self.workspace / "USER.md",
+        ]
+        if include_memory:
+            paths.append(self.memory.memory_file)
+        stamp: list[object] = []
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                stamp.append(None)
+            else:
+                stamp.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        stamp.append(self.skills.fingerprint())
+        return tuple(stamp)
+
     @staticmethod
     def _without_duplicate_session_summary(
         entries: list[dict[str, Any]],
@@ -273,6 +347,7 @@ class ContextBuilder:
         include_memory_recent_history: bool = True,
         session_key: str | None = None,
         unified_session: bool = False,
+        image_limits: ImageLimits = DEFAULT_IMAGE_LIMITS,
     ) -> list[dict[str, Any]]:
         """Build the complete message list for an LLM call."""
         root = workspace or self.workspace
@@ -296,6 +371,7 @@ class ContextBuilder:
             media=media,
             current_role=current_role,
             runtime_context_blocks=runtime_context_blocks,
+            image_limits=image_limits,
         )
         if messages[-1].get("role") == current_role:
             last = dict(messages[-1])
@@ -320,9 +396,14 @@ class ContextBuilder:
         media: list[str] | None = None,
         current_role: str = "user",
         runtime_context_blocks: Sequence[RuntimeContextBlock] | None = None,
+        image_limits: ImageLimits = DEFAULT_IMAGE_LIMITS,
     ) -> dict[str, Any]:
         """Build only the fresh turn message without merging it into history."""
-        content = self.build_user_content(current_message, image_paths=media)
+        content = self.build_user_content(
+            current_message,
+            image_paths=media,
+            image_limits=image_limits,
+        )
         blocks: list[RuntimeContextBlock] = []
         if current_role == "user":
             blocks.extend(runtime_context_blocks or ())
@@ -341,27 +422,26 @@ class ContextBuilder:
         self,
         text: str,
         image_paths: list[str] | None,
+        *,
+        image_limits: ImageLimits = DEFAULT_IMAGE_LIMITS,
     ) -> str | list[dict[str, Any]]:
-        """Build user message content from prefiltered image paths."""
+        """Build user message content from prefiltered image paths.
+
+        Images are downscaled to *image_limits* through :attr:`images`; call
+        ``await self.images.warm(...)`` first to do that work off the event loop.
+        """
         if not image_paths:
             return text
 
         image_blocks: list[dict[str, Any]] = []
         for path in image_paths:
-            p = Path(path)
-            if not p.is_file():
-                continue
-            raw = p.read_bytes()
-            # Re-detect from the bytes used for the request: the file may have
-            # changed since attachment routing, and the data URL needs its MIME.
-            mime = detect_image_mime(raw) or mimetypes.guess_type(path)[0]
-            if not mime or not mime.startswith("image/"):
+            prepared = self.images.prepare(path, image_limits)
+            if prepared is None:
                 continue
-            b64 = base64.b64encode(raw).decode()
             image_blocks.append({
                 "type": "image_url",
-                "image_url": {"url": f"data:{mime};base64,{b64}"},
-                "_meta": {"path": str(p)},
+                "image_url": {"url": prepared.data_url},
+                "_meta": {"path": str(Path(path))},
             })
 
         if not image_blocks:
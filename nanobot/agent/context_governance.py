@@ -7,13 +7,14 @@ mutate an existing session history list in place.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from loguru import logger
 
 from nanobot.utils.helpers import (
+    TokenCountCache,
     estimate_message_tokens,
     estimate_prompt_tokens_chain,
     find_legal_message_start,
@@ -70,6 +71,75 @@ class ContextGovernanceConfig:
     inflight_start_index: int = 0
 
 
+@dataclass(slots=True)
+class ContextGovernanceState:
+    """Per-run memo of the repaired message prefix.
+
+    A run only appends to its message list, so each ``prepare_for_model``
+    call repairs the messages added since the previous call and reuses the
+    repaired prefix.  The memo is dropped, forcing a full pass, when an
+    earlier message was replaced or edited, a tool call is still waiting for
+    its result, or in-flight compaction rewrote earlier tool results.
+    """
+
+    config: ContextGovernanceConfig | None = None
+    sources: list[dict[str, Any]] = field(default_factory=list)
+    tail_snapshot: dict[str, Any] | None = None
+    repaired: list[dict[str, Any]] = field(default_factory=list)
+    declared: set[str] = field(default_factory=set)
+    fulfilled: set[str] = field(default_factory=set)
+    open_calls: set[str] = field(default_factory=set)
+    compacted: frozenset[str] = frozenset()
+    token_counts: TokenCountCache = field(default_factory=TokenCountCache, repr=False)
+    last_estimate: tuple[list[dict[str, Any]], int, str] | None = field(default=None, repr=False)
+    full_passes: int = 0
+    incremental_passes: int = 0
+
+    def reset(self) -> None:
+        self.config = None
+        self.sources = []
+        self.tail_snapshot = None
+        self.repaired = []
+        self.declared = set()
+        self.fulfilled = set()
+        self.open_calls = set()
+        self.compacted = frozenset()
+
+    def reusable_length(
+        self,
+        config: ContextGovernanceConfig,
+        messages: list[dict[str, Any]],
+        compacted_tool_call_ids: set[str],
+    ) -> int:
+        """Length of the memoized prefix still valid for *messages*, else 0."""
+        count = len(self.sources)
+        if (
+            not count
+            or self.config is not config
+            or len(messages) < count
+            or self.compacted != frozenset(compacted_tool_call_ids)
+            or any(msg is not src for msg, src in zip(messages, self.sources))
+            # Runner-side bookkeeping edits the newest message in place.
+            or messages[count - 1] != self.tail_snapshot
+        ):
+            return 0
+        return count
+
+    def remember(
+        self,
+        config: ContextGovernanceConfig,
+        messages: list[dict[str, Any]],
+        repaired: list[dict[str, Any]],
+        compacted_tool_call_ids: set[str],
+    ) -> None:
+        self.config = config
+        self.sources = list(messages)
+        self.tail_snapshot = dict(messages[-1]) if messages else None
+        # An unchanged history comes back as the caller's own list, which keeps growing.
+        self.repaired = list(repaired) if repaired is messages else repaired
+        self.compacted = frozenset(compacted_tool_call_ids)
+
+
 class ContextGovernor:
     """Prepare model-copy messages while preserving persisted history."""
 
@@ -78,17 +148,78 @@ class ContextGovernor:
         config: ContextGovernanceConfig,
         messages: list[dict[str, Any]],
         compacted_tool_call_ids: set[str],
+        *,
+        state: ContextGovernanceState | None = None,
     ) -> list[dict[str, Any]]:
-        updated = self.strip_placeholder_assistant_messages(messages)
-        updated = self.strip_malformed_tool_calls(updated)
-        updated = self.drop_orphan_tool_results(updated)
-        updated = self.backfill_missing_tool_results(updated)
-        updated = self.apply_tool_result_budget(config, updated)
-        updated = self.compact_inflight_overflow(config, updated, compacted_tool_call_ids)
-        updated = self.snip_history(config, updated)
+        if state is None:
+            state = ContextGovernanceState()
+        state.last_estimate = None
+        repaired = self._repair_appended(config, messages, compacted_tool_call_ids, state)
+        updated = self.compact_inflight_overflow(
+            config, repaired, compacted_tool_call_ids, state=state
+        )
+        updated = self.snip_history(config, updated, state=state)
+        if updated is repaired:
+            # The repair passes already ran over exactly this list.
+            return repaired
         updated = self.drop_orphan_tool_results(updated)
         return self.backfill_missing_tool_results(updated)
 
+    def _repair_appended(
+        self,
+        config: ContextGovernanceConfig,
+        messages: list[dict[str, Any]],
+        compacted_tool_call_ids: set[str],
+        state: ContextGovernanceState,
+    ) -> list[dict[str, Any]]:
+        """Run the per-message repair passes over messages not yet memoized."""
+        start = state.reusable_length(config, messages, compacted_tool_call_ids)
+        if start:
+            state.incremental_passes += 1
+            appended = messages[start:]
+        else:
+            state.reset()
+            state.full_passes += 1
+            appended = messages
+        updated = self.strip_placeholder_assistant_messages(appended)
+        updated = self.strip_malformed_tool_calls(updated)
+        updated = self._drop_orphan_tool_results(
+            updated, state.declared, state.fulfilled, state.open_calls
+        )
+        updated = self._backfill_missing_tool_results(updated, state.fulfilled)
+        updated = self._apply_tool_result_budget(config, updated, offset=len(state.repaired))
+        updated = self._apply_recorded_compactions(updated, compacted_tool_call_ids)
+        repaired = state.repaired + updated if start else updated
+
+        if state.open_calls:
+            # Backfilled placeholders may still be superseded by real results.
+            state.reset()
+        else:
+            state.remember(config, messages, repaired, compacted_tool_call_ids)
+        return repaired
+
+    @staticmethod
+    def _estimate_prompt_tokens(
+        config: ContextGovernanceConfig,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        state: ContextGovernanceState | None,
+    ) -> tuple[int, str]:
+        if state is None:
+            return estimate_prompt_tokens_chain(config.provider, config.model, messages, tools)
+        last = state.last_estimate
+        if last is not None and last[0] is messages:
+            return last[1], last[2]
+        estimate, source = estimate_prompt_tokens_chain(
+            config.provider,
+            config.model,
+            messages,
+            tools,
+            cache=state.token_counts,
+        )
+        state.last_estimate = (messages, estimate, source)
+        return estimate, source
+
     @staticmethod
     def input_budget(config: ContextGovernanceConfig) -> int:
         if not config.context_window_tokens:
@@ -234,8 +365,16 @@ class ContextGovernor:
         messages: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Drop invalid tool results before history is sent back to providers."""
-        declared: set[str] = set()
-        fulfilled: set[str] = set()
+        return ContextGovernor._drop_orphan_tool_results(messages, set(), set(), set())
+
+    @staticmethod
+    def _drop_orphan_tool_results(
+        messages: list[dict[str, Any]],
+        declared: set[str],
+        fulfilled: set[str],
+        open_calls: set[str],
+    ) -> list[dict[str, Any]]:
+        """Orphan cleanup continuing from call ids seen in earlier messages."""
         updated: list[dict[str, Any]] | None = None
         for idx, msg in enumerate(messages):
             role = msg.get("role")
@@ -244,7 +383,10 @@ class ContextGovernor:
                     if isinstance(tc, dict):
                         tool_call = cast(dict[str, Any], tc)
                         if tool_call.get("id"):
-                            declared.add(str(tool_call["id"]))
+                            call_id = str(tool_call["id"])
+                            declared.add(call_id)
+                            if call_id not in fulfilled:
+                                open_calls.add(call_id)
             if role == "tool":
                 tid = msg.get("tool_call_id")
                 tid_str = str(tid) if tid else ""
@@ -253,6 +395,7 @@ class ContextGovernor:
                         updated = [dict(m) for m in messages[:idx]]
                     continue
                 fulfilled.add(tid_str)
+                open_calls.discard(tid_str)
             if updated is not None:
                 updated.append(dict(msg))
 
@@ -265,8 +408,15 @@ class ContextGovernor:
         messages: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Insert synthetic error results for assistant tool_calls with missing tool outputs."""
+        return ContextGovernor._backfill_missing_tool_results(messages, set())
+
+    @staticmethod
+    def _backfill_missing_tool_results(
+        messages: list[dict[str, Any]],
+        fulfilled_before: set[str],
+    ) -> list[dict[str, Any]]:
         declared: list[tuple[int, str, str]] = []
-        fulfilled: set[str] = set()
+        fulfilled = set(fulfilled_before)
         for idx, msg in enumerate(messages):
             role = msg.get("role")
             if role == "assistant":
@@ -309,6 +459,15 @@ class ContextGovernor:
         self,
         config: ContextGovernanceConfig,
         messages: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return self._apply_tool_result_budget(config, messages)
+
+    def _apply_tool_result_budget(
+        self,
+        config: ContextGovernanceConfig,
+        messages: list[dict[str, Any]],
+        *,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         updated = messages
         for idx, message in enumerate(messages):
@@ -316,7 +475,7 @@ class ContextGovernor:
                 continue
             normalized = self.normalize_tool_result(
                 config,
-                str(message.get("tool_call_id") or f"tool_{idx}"),
+                str(message.get("tool_call_id") or f"tool_{offset + idx}"),
                 str(message.get("name") or "tool"),
                 message.get("content"),
             )
@@ -331,6 +490,8 @@ class ContextGovernor:
         config: ContextGovernanceConfig,
         messages: list[dict[str, Any]],
         compacted_tool_call_ids: set[str],
+        *,
+        state: ContextGovernanceState | None = None,
     ) -> list[dict[str, Any]]:
         """Compact in-flight tool results only when the request would overflow."""
         budget = self.input_budget(config)
@@ -339,12 +500,7 @@ class ContextGovernor:
 
         tools = config.tools.get_definitions()
         updated = self._apply_recorded_compactions(messages, compacted_tool_call_ids)
-        estimate, source = estimate_prompt_tokens_chain(
-            config.provider,
-            config.model,
-            updated,
-            tools,
-        )
+        estimate, source = self._estimate_prompt_tokens(config, updated, tools, state)
         if estimate <= budget:
             return updated
 
@@ -367,12 +523,7 @@ class ContextGovernor:
                 updated = [dict(m) for m in messages]
             compacted_tool_call_ids.add(tool_call_id)
             self._compact_tool_result_at(updated, idx)
-            estimate, source = estimate_prompt_tokens_chain(
-                config.provider,
-                config.model,
-                updated,
-                tools,
-            )
+            estimate, source = self._estimate_prompt_tokens(config, updated, tools, state)
             if estimate <= target:
                 break
 
@@ -391,6 +542,8 @@ class ContextGovernor:
         self,
         config: ContextGovernanceConfig,
         messages: list[dict[str, Any]],
+        *,
+        state: ContextGovernanceState | None = None,
     ) -> list[dict[str, Any]]:
         if not messages or not config.context_window_tokens:
             return messages
@@ -400,12 +553,7 @@ class ContextGovernor:
             return messages
 
         tools = config.tools.get_definitions()
-        estimate, _ = estimate_prompt_tokens_chain(
-            config.provider,
-            config.model,
-            messages,
-            tools,
-        )
+        estimate, _ = self._estimate_prompt_tokens(config, messages, tools, state)
         if estimate <= budget:
             return messages
 
@@ -11,7 +11,7 @@ import os
 import time
 import weakref
 from collections.abc import Coroutine, Iterable, Mapping
-from contextlib import AbstractContextManager, ExitStack, nullcontext, suppress
+from contextlib import AbstractContextManager, ExitStack, suppress
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -43,6 +43,7 @@ from nanobot.agent.turn_delivery import (
 )
 from nanobot.agent.turn_delivery import TurnRoute as TurnRoute
 from nanobot.agent.turn_hooks import AgentTurnHookSpec, build_agent_turn_hook
+from nanobot.agent.turn_scheduler import TurnScheduler, classify_turn, model_limit_keys
 from nanobot.bus.events import INBOUND_META_USER_SHELL, InboundMessage, OutboundMessage
 from nanobot.bus.outbound_events import StreamedResponseEvent
 from nanobot.bus.queue import MessageBus
@@ -96,6 +97,7 @@ if TYPE_CHECKING:
         Config,
         ProviderConfig,
         ToolsConfig,
+        TurnSchedulerConfig,
     )
     from nanobot.cron.service import CronService
     from nanobot.triggers.local_store import LocalTriggerStore
@@ -291,8 +293,9 @@ class AgentLoop:
         restart_mode: str = "auto",
         local_trigger_store: LocalTriggerStore | None = None,
         idle_compact_check_interval_seconds: int = 0,
+        turn_scheduler_config: TurnSchedulerConfig | None = None,
     ):
-        from nanobot.config.schema import ToolsConfig
+        from nanobot.config.schema import ToolsConfig, TurnSchedulerConfig
 
         _tc = tools_config or ToolsConfig()
         defaults = AgentDefaults()
@@ -428,9 +431,18 @@ class AgentLoop:
         )
         # NANOBOT_MAX_CONCURRENT_REQUESTS: <=0 means unlimited; default 3.
         _max = int(os.environ.get("NANOBOT_MAX_CONCURRENT_REQUESTS", "3"))
-        self._concurrency_gate: asyncio.Semaphore | None = (
-            asyncio.Semaphore(_max) if _max > 0 else None
+        _sched = turn_scheduler_config or TurnSchedulerConfig()
+        self._turn_scheduler = TurnScheduler(
+            _max,
+            class_weights=_sched.class_weights,
+            class_limits=_sched.class_limits,
+            channel_weights=_sched.channel_weights,
+            session_weights=_sched.session_weights,
+            concurrency_limits=_sched.concurrency_limits,
         )
+        # Model of the last built turn for sessions pinned to a preset; other
+        # sessions follow the default model.
+        self._session_turn_models: dict[str, str] = {}
         self.consolidator = Consolidator(
             store=self.context.memory,
             sessions=self.sessions,
@@ -515,6 +527,7 @@ class AgentLoop:
             disabled_skills=defaults.disabled_skills,
             session_ttl_minutes=defaults.session_ttl_minutes,
             idle_compact_check_interval_seconds=defaults.idle_compact_check_interval_seconds,
+            turn_scheduler_config=defaults.turn_scheduler,
             consolidation_ratio=defaults.consolidation_ratio,
             tools_config=config.tools,
             model_presets=preset_helpers.configured_model_presets(config),
@@ -566,6 +579,22 @@ class AgentLoop:
             self.sessions.save(session)
             return self.llm_runtime()
 
+    def turn_scheduler_stats(self) -> dict[str, Any]:
+        """Return turn admission counters and queue wait times per class."""
+        return self._turn_scheduler.stats()
+
+    def _turn_limit_keys(self, session_key: str) -> tuple[str, ...]:
+        """Return the model concurrency-limit keys a session's next turn counts against."""
+        if not self._turn_scheduler.concurrency_limits:
+            return ()
+        return model_limit_keys(self._session_turn_models.get(session_key, self.model))
+
+    def _remember_turn_model(self, session_key: str, session: Session, runtime: LLMRuntime) -> None:
+        if session.metadata.get(SESSION_MODEL_PRESET_METADATA_KEY):
+            self._session_turn_models[session_key] = runtime.model
+        else:
+            self._session_turn_models.pop(session_key, None)
+
     def set_session_model_preset(
         self,
         session_key: str,
@@ -576,6 +605,7 @@ class AgentLoop:
         session = self.sessions.get_or_create(session_key)
         session.metadata[SESSION_MODEL_PRESET_METADATA_KEY] = runtime.model_preset
         self.sessions.save(session)
+        self._remember_turn_model(session_key, session, runtime)
         return runtime
 
     def _publish_runtime_selection(
@@ -734,6 +764,7 @@ class AgentLoop:
         """Build the initial message list for the LLM turn."""
         assert ctx.session is not None
         scope = self.workspace_scopes.for_message(ctx.msg, ctx.session.metadata)
+        provider = ctx.runtime.provider if ctx.runtime is not None else self.provider
         return self.context.build_messages(
             history=ctx.history,
             current_message=ctx.msg.content,
@@ -746,6 +777,7 @@ class AgentLoop:
             include_memory_recent_history=not ctx.ephemeral,
             session_key=ctx.session.key,
             unified_session=self._unified_session,
+            image_limits=provider.image_limits,
         )
 
     def _request_context_for_turn(self, ctx: TurnContext) -> RequestContext:
@@ -1008,9 +1040,12 @@ class AgentLoop:
                         image_paths,
                     )
                     image_paths = image_paths or None
+                if image_paths:
+                    await self.context.images.warm(image_paths, runtime.provider.image_limits)
                 user_content = self.context.build_user_content(
                     content,
                     image_paths=image_paths,
+                    image_limits=runtime.provider.image_limits,
                 )
                 row: dict[str, Any] = {"role": "user", "content": user_content}
                 metadata_value = cast(object, pending_msg.metadata)
@@ -1331,7 +1366,12 @@ class AgentLoop:
         if session_key != msg.session_key:
             msg = dataclasses.replace(msg, session_key_override=session_key)
         lock = self._get_session_lock(session_key)
-        gate = self._concurrency_gate or nullcontext()
+        gate = self._turn_scheduler.slot(
+            classify_turn(msg),
+            session_key=session_key,
+            channel=msg.channel,
+            limit_keys=self._turn_limit_keys(session_key),
+        )
 
         delivery = self.turn_delivery_factory.unrouted(msg, session_key)
         pending: asyncio.Queue[InboundMessage] | None = None
@@ -1804,6 +1844,7 @@ class AgentLoop:
         if runtime is None:
             runtime = self.runtime_for_session(session)
             ctx.runtime = runtime
+        self._remember_turn_model(ctx.session_key, session, runtime)
         if ctx.session_key.startswith("dream:"):
             logger.info(
                 "Dream run using model={} (preset={})",
@@ -1853,6 +1894,11 @@ class AgentLoop:
         ctx.request_context = self._request_context_for_turn(ctx)
         if ctx.kind is TurnKind.USER:
             ctx.runtime_context_blocks = await self._resolve_runtime_context_for_turn(ctx)
+        media = ctx.msg.media if ctx.kind is TurnKind.USER and ctx.msg.media else None
+        if media:
+            # Decode and downscale attachments in a worker thread; prompt
+            # assembly below then serves them from the image cache.
+            await self.context.images.warm(media, runtime.provider.image_limits)
         staged_provider_state = False
         if stored_state is not None and runtime.provider.can_resume_conversation_state(
             stored_state,
@@ -1860,8 +1906,9 @@ class AgentLoop:
         ):
             current_provider_message = self.context.build_current_message(
                 ctx.msg.content,
-                media=ctx.msg.media if ctx.kind is TurnKind.USER and ctx.msg.media else None,
+                media=media,
                 runtime_context_blocks=ctx.runtime_context_blocks,
+                image_limits=runtime.provider.image_limits,
             )
             task_id = ctx.msg.metadata.get("subagent_task_id") if is_subagent else None
             already_staged = False
@@ -8,15 +8,17 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import json
 import os
 import re
 import threading
 import weakref
 from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterator, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, cast
 
 from loguru import logger
 
@@ -52,6 +54,31 @@ if TYPE_CHECKING:
 # MemoryStore — pure file I/O layer
 # ---------------------------------------------------------------------------
 
+_HISTORY_INDEX_HEAD_BYTES = 256
+
+
+@dataclass
+class _HistoryIndex:
+    """Byte offsets of valid history.jsonl entries, extended while the file only grows."""
+
+    inode: int
+    head: bytes
+    size: int = 0  # bytes indexed so far; always ends on a complete line
+    cursors: list[int] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=list)
+    session_offsets: dict[str | None, list[int]] = field(default_factory=dict)
+    monotonic: bool = True
+    max_cursor: int = 0
+
+    def add(self, cursor: int, offset: int, session_key: str | None) -> None:
+        if self.cursors and cursor <= self.cursors[-1]:
+            self.monotonic = False
+        self.cursors.append(cursor)
+        self.offsets.append(offset)
+        self.session_offsets.setdefault(session_key, []).append(offset)
+        self.max_cursor = max(self.max_cursor, cursor)
+
+
 
 class MemoryStore:
     """Pure file I/O for memory files: MEMORY.md, history.jsonl, SOUL.md, USER.md."""
@@ -89,6 +116,8 @@ class MemoryStore:
         self._oversize_logged = False  # rate-limit oversized-entry warning
         self._dream_prompt_oversize_logged = False
         self._append_lock = threading.Lock()  # serialize cursor allocation + append
+        self._index_lock = threading.Lock()  # guards _history_index
+        self._history_index: _HistoryIndex | None = None
         self._git = GitStore(workspace, tracked_files=[
             "SOUL.md", "USER.md", "memory/MEMORY.md", "memory/.dream_cursor",
         ])
@@ -311,6 +340,8 @@ class MemoryStore:
             with open(self.history_file, "a", encoding="utf-8") as f:
                 f.write(json.dumps(record, ensure_ascii=False) + "\n")
             self._cursor_file.write_text(str(cursor), encoding="utf-8")
+            with self._index_lock:
+                self._sync_history_index()
         return cursor
 
     @staticmethod
@@ -320,11 +351,16 @@ class MemoryStore:
             return None
         return value
 
-    def _iter_valid_entries(self) -> Iterator[tuple[dict[str, Any], int]]:
+    def _iter_valid_entries(
+        self,
+        *,
+        start: int = 0,
+        offsets: list[int] | None = None,
+    ) -> Iterator[tuple[dict[str, Any], int]]:
         """Yield ``(entry, cursor)`` for well-formed entries; warn once on corruption."""
         poisoned: Any = None
         malformed_cursor: int | None = None
-        for entry in self._read_entries():
+        for entry in self._read_entries(start=start, offsets=offsets):
             raw = entry.get("cursor")
             if raw is None:
                 continue
@@ -336,20 +372,30 @@ class MemoryStore:
                 malformed_cursor = cursor
                 continue
             yield entry, cursor
-        if poisoned is not None and not self._corruption_logged:
-            self._corruption_logged = True
-            logger.warning(
-                "history.jsonl contains an invalid cursor ({!r}); dropping it. "
-                "Usually caused by an external writer; further occurrences suppressed.",
-                poisoned,
-            )
-        if malformed_cursor is not None and not self._malformed_entry_logged:
-            self._malformed_entry_logged = True
-            logger.warning(
-                "history.jsonl contains a malformed entry at cursor {}; dropping it. "
-                "Usually caused by an external writer; further occurrences suppressed.",
-                malformed_cursor,
-            )
+        if poisoned is not None:
+            self._warn_invalid_cursor(poisoned)
+        if malformed_cursor is not None:
+            self._warn_malformed_entry(malformed_cursor)
+
+    def _warn_invalid_cursor(self, poisoned: Any) -> None:
+        if self._corruption_logged:
+            return
+        self._corruption_logged = True
+        logger.warning(
+            "history.jsonl contains an invalid cursor ({!r}); dropping it. "
+            "Usually caused by an external writer; further occurrences suppressed.",
+            poisoned,
+        )
+
+    def _warn_malformed_entry(self, cursor: int) -> None:
+        if self._malformed_entry_logged:
+            return
+        self._malformed_entry_logged = True
+        logger.warning(
+            "history.jsonl contains a malformed entry at cursor {}; dropping it. "
+            "Usually caused by an external writer; further occurrences suppressed.",
+            cursor,
+        )
 
     @staticmethod
     def _valid_history_payload(entry: dict[str, Any]) -> bool:
@@ -378,19 +424,69 @@ class MemoryStore:
         if cursor_counter is not None:
             if last_cursor is not None:
                 return max(cursor_counter, last_cursor) + 1
-            max_history_cursor = max((c for _, c in self._iter_valid_entries()), default=0)
-            return max(cursor_counter, max_history_cursor) + 1
+            return max(cursor_counter, self._max_history_cursor()) + 1
 
         # Fast path: trust the tail when intact.  Otherwise scan the whole
         # file and take ``max`` — that stays correct even if the monotonic
         # invariant was broken by external writes.
         if last_cursor is not None:
             return last_cursor + 1
-        return max((c for _, c in self._iter_valid_entries()), default=0) + 1
+        return self._max_history_cursor() + 1
+
+    def _max_history_cursor(self) -> int:
+        with self._index_lock:
+            index = self._sync_history_index()
+            return index.max_cursor if index is not None else 0
 
     def read_unprocessed_history(self, since_cursor: int) -> list[dict[str, Any]]:
         """Return history entries with a valid cursor > *since_cursor*."""
-        return [e for e, c in self._iter_valid_entries() if c > since_cursor]
+        return self._read_history_after(since_cursor)
+
+    def _read_history_after(
+        self,
+        since_cursor: int,
+        *,
+        session_key: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Seek to the first entry after *since_cursor* instead of parsing the whole file.
+
+        With *session_key*, only that session's indexed lines are read. Falls
+        back to a full scan when cursors are out of order or the file changed
+        under the index.
+        """
+        with self._index_lock:
+            index = self._sync_history_index()
+            expected_cursor: int | None = None
+            if index is None or not index.monotonic:
+                start = None
+                offsets: list[int] | None = None
+            else:
+                first = bisect.bisect_right(index.cursors, since_cursor)
+                if first == len(index.cursors):
+                    return []
+                start = index.offsets[first]
+                expected_cursor = index.cursors[first]
+                if session_key is None:
+                    offsets = None
+                else:
+                    session_offsets = index.session_offsets.get(session_key, [])
+                    offsets = session_offsets[bisect.bisect_left(session_offsets, start):]
+
+        if start is None:
+            entries = [(e, c) for e, c in self._iter_valid_entries() if c > since_cursor]
+        else:
+            entries = list(self._iter_valid_entries(start=start, offsets=offsets))
+            first_cursor = entries[0][1] if entries else None
+            if offsets is None and first_cursor != expected_cursor:
+                # The file was rewritten in place; rebuild on the next read.
+                with self._index_lock:
+                    self._history_index = None
+                entries = [(e, c) for e, c in self._iter_valid_entries() if c > since_cursor]
+            else:
+                entries = [(e, c) for e, c in entries if c > since_cursor]
+        if session_key is not None:
+            return [e for e, _ in entries if e.get("session_key") == session_key]
+        return [e for e, _ in entries]
 
     @classmethod
     def _is_internal_history_session(cls, session_key: str | None) -> bool:
@@ -409,11 +505,11 @@ class MemoryStore:
         unified_session: bool = False,
     ) -> list[dict[str, Any]]:
         """Return unprocessed history entries safe to inject into a turn prompt."""
+        if session_key is not None and not unified_session:
+            return self._read_history_after(since_cursor, session_key=session_key)
         entries = self.read_unprocessed_history(since_cursor=since_cursor)
         if session_key is None:
             return entries
-        if not unified_session:
-            return [e for e in entries if e.get("session_key") == session_key]
 
         return [
             entry
@@ -454,23 +550,92 @@ class MemoryStore:
 
     # -- JSONL helpers -------------------------------------------------------
 
-    def _read_entries(self) -> list[dict[str, Any]]:
-        """Read all entries from history.jsonl."""
+    def _read_entries(
+        self,
+        *,
+        start: int = 0,
+        offsets: list[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read entries from history.jsonl, from byte *start* or only at *offsets*."""
         entries: list[dict[str, Any]] = []
         with suppress(FileNotFoundError):
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            parsed: object = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-                        if isinstance(parsed, dict):
-                            entries.append(cast(dict[str, Any], parsed))
+            with open(self.history_file, "rb") as f:
+                if offsets is None:
+                    f.seek(start)
+                    lines: Iterable[bytes] = f
+                else:
+                    lines = []
+                    for offset in offsets:
+                        f.seek(offset)
+                        lines.append(f.readline())
+                for raw_line in lines:
+                    parsed = self._parse_history_line(raw_line)
+                    if parsed is not None:
+                        entries.append(parsed)
 
         return entries
 
+    @staticmethod
+    def _parse_history_line(raw_line: bytes) -> dict[str, Any] | None:
+        line = raw_line.strip()
+        if not line:
+            return None
+        try:
+            parsed: object = json.loads(line.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return cast(dict[str, Any], parsed) if isinstance(parsed, dict) else None
+
+    def _sync_history_index(self) -> _HistoryIndex | None:
+        """Bring the offset index up to date with history.jsonl; caller holds ``_index_lock``.
+
+        Appends (ours or external) are indexed incrementally from the last
+        indexed byte. A replaced, truncated or rewritten file is re-indexed.
+        """
+        try:
+            with open(self.history_file, "rb") as f:
+                st = os.fstat(f.fileno())
+                head = f.read(_HISTORY_INDEX_HEAD_BYTES)
+                index = self._history_index
+                if (
+                    index is None
+                    or index.inode != st.st_ino
+                    or st.st_size < index.size
+                    or not head.startswith(index.head)
+                ):
+                    index = _HistoryIndex(inode=st.st_ino, head=head)
+                elif index.size:
+                    f.seek(index.size - 1)
+                    if f.read(1) != b"\n":
+                        index = _HistoryIndex(inode=st.st_ino, head=head)
+                if st.st_size == index.size:
+                    self._history_index = index
+                    return index
+                if len(index.head) < _HISTORY_INDEX_HEAD_BYTES:
+                    index.head = head
+                f.seek(index.size)
+                offset = index.size
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break  # a concurrent append is mid-write
+                    entry = self._parse_history_line(raw_line)
+                    if entry is not None and entry.get("cursor") is not None:
+                        # Indexed reads skip these lines, so report them here.
+                        cursor = self._valid_cursor(entry["cursor"])
+                        if cursor is None:
+                            self._warn_invalid_cursor(entry["cursor"])
+                        elif not self._valid_history_payload(entry):
+                            self._warn_malformed_entry(cursor)
+                        else:
+                            index.add(cursor, offset, entry.get("session_key"))
+                    offset += len(raw_line)
+                index.size = offset
+        except FileNotFoundError:
+            self._history_index = None
+            return None
+        self._history_index = index
+        return index
+
     def _read_last_entry(self) -> dict[str, Any] | None:
         """Read the last entry from the JSONL file efficiently."""
         try:
@@ -494,12 +659,22 @@ class MemoryStore:
         """Overwrite history.jsonl with the given entries (atomic write)."""
         tmp_path = self.history_file.with_suffix(self.history_file.suffix + ".tmp")
         try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "wb") as f:
+                index = _HistoryIndex(inode=os.fstat(f.fileno()).st_ino, head=b"")
                 for entry in entries:
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    raw_line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+                    cursor = self._valid_cursor(entry.get("cursor"))
+                    if cursor is not None and self._valid_history_payload(entry):
+                        index.add(cursor, index.size, entry.get("session_key"))
+                    if len(index.head) < _HISTORY_INDEX_HEAD_BYTES:
+                        index.head += raw_line[: _HISTORY_INDEX_HEAD_BYTES - len(index.head)]
+                    f.write(raw_line)
+                    index.size += len(raw_line)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(tmp_path, self.history_file)
+            with self._index_lock:
+                self._history_index = index
 
             # fsync the directory so the rename is durable.
             # On Windows, opening a directory with O_RDONLY raises
@@ -845,7 +1020,7 @@ class Consolidator:
                 last_boundary = (idx, removed_tokens)
                 if removed_tokens >= tokens_to_remove:
                     return last_boundary
-            removed_tokens += estimate_message_tokens(message)
+            removed_tokens += session.token_counts.count(message, estimate_message_tokens)
 
         return last_boundary
 
@@ -887,11 +1062,16 @@ class Consolidator:
             session_key=session.key,
             unified_session=self.unified_session,
         )
+        # Only persisted history belongs in the session's count cache; the
+        # system prompt changes per turn and the probe is synthetic.
+        persisted = {id(message) for message in history}
         return estimate_prompt_tokens_chain(
             runtime.provider,
             runtime.model,
             probe_messages,
             self._get_tool_definitions(),
+            cache=session.token_counts,
+            cacheable=lambda message: id(message) in persisted,
         )
 
     def _input_token_budget(self, runtime: LLMRuntime) -> int:
@@ -29,14 +29,9 @@ def load_model_preset_catalog(
     config_path: Path | None = None,
 ) -> dict[str, ModelPresetConfig]:
     """Load the current preset catalog from the configured file."""
-    from nanobot.config.loader import load_config, resolve_config_env_vars
+    from nanobot.config.snapshot import load_config_snapshot
 
-    return configured_model_presets(
-        resolve_config_env_vars(
-            load_config(config_path),
-            config_path=config_path,
-        ),
-    )
+    return configured_model_presets(load_config_snapshot(config_path, resolve_env=True, shared=True))
 
 
 def make_preset_snapshot_loader(
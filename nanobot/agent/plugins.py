@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import json
 import re
+from contextlib import suppress
 from dataclasses import dataclass, replace
 from hashlib import sha256
 from pathlib import Path
@@ -145,6 +146,39 @@ def enabled_agent_plugin_skill_dirs(
     )
 
 
+def agent_plugin_skills_stamp(workspace: Path) -> tuple[object, ...]:
+    """Return a stat-only stamp that changes when enabled plugin skills may change.
+
+    Cheap enough to check every turn: it never hashes package contents. Reads
+    still revalidate the package through ``enabled_agent_plugin_skill_dirs``.
+    """
+    workspace = workspace.expanduser().resolve()
+    workspace_id = sha256(str(workspace).encode()).hexdigest()[:12]
+    data_root = get_config_path().expanduser().resolve().parent / "plugin-data" / workspace_id
+    stamp: list[object] = [_stat_stamp(data_root)]
+    with suppress(OSError):
+        for data_dir in sorted(data_root.iterdir()):
+            stamp.append((data_dir.name, _stat_stamp(data_dir / "enabled")))
+    plugins_root = workspace / "plugins"
+    stamp.append(_stat_stamp(plugins_root))
+    with suppress(OSError):
+        for plugin_root in sorted(plugins_root.iterdir()):
+            skills_root = plugin_root / "skills"
+            stamp.append((plugin_root.name, _stat_stamp(plugin_root), _stat_stamp(skills_root)))
+            with suppress(OSError):
+                for skill_root in sorted(skills_root.iterdir()):
+                    stamp.append(_stat_stamp(skill_root / "SKILL.md"))
+    return tuple(stamp)
+
+
+def _stat_stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
 def _skill_cache_key(workspace: Path) -> tuple[Path, Path]:
     return (
         workspace.expanduser().resolve(),
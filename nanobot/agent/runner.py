@@ -16,6 +16,7 @@ from loguru import logger
 
 from nanobot.agent.context_governance import (
     ContextGovernanceConfig,
+    ContextGovernanceState,
     ContextGovernor,
 )
 from nanobot.agent.hook import AgentHook, AgentHookContext, AgentRunHookContext
@@ -439,6 +440,7 @@ class AgentRunner:
         had_injections = False
         injection_cycles = 0
         compacted_tool_call_ids: set[str] = set()
+        governance_state = ContextGovernanceState()
         pending_stream_content: str | None = None
         conversation_state = ProviderConversationStateController(
             provider=spec.runtime.provider,
@@ -469,6 +471,7 @@ class AgentRunner:
                 governance_config,
                 messages,
                 compacted_tool_call_ids,
+                state=governance_state,
             )
             context = AgentHookContext(
                 iteration=iteration,
@@ -592,6 +595,7 @@ class AgentRunner:
                         governance_config,
                         messages,
                         compacted_tool_call_ids,
+                        state=governance_state,
                     )
                     if response.provider_state is not None
                     else None
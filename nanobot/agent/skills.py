@@ -87,6 +87,38 @@ class SkillsLoader:
             entries.append({"name": name, "path": str(skill_file), "source": source})
         return entries
 
+    def fingerprint(self) -> tuple[object, ...]:
+        """Return a cheap stamp that changes whenever the skills listing may change.
+
+        Covers workspace and plugin SKILL.md files (by stat), the disabled set,
+        and what requirement checks read: env vars and the ``PATH`` directories.
+        Built-in skills ship with the package and are not re-checked.
+        """
+        from nanobot.agent.plugins import agent_plugin_skills_stamp
+
+        stamp: list[object] = [
+            frozenset(self.disabled_skills),
+            hash(frozenset(os.environ.items())),
+            agent_plugin_skills_stamp(self.workspace),
+        ]
+        # Installing a required CLI touches its PATH directory.
+        for bin_dir in os.environ.get("PATH", "").split(os.pathsep):
+            try:
+                stamp.append(os.stat(bin_dir).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        try:
+            skill_dirs = sorted(self.workspace_skills.iterdir())
+        except OSError:
+            skill_dirs = []
+        for skill_dir in skill_dirs:
+            try:
+                st = (skill_dir / "SKILL.md").stat()
+            except OSError:
+                continue
+            stamp.append((skill_dir.name, st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(stamp)
+
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
         List all available skills.
@@ -1,9 +1,12 @@
 """Base class for agent tools."""
 from __future__ import annotations
 
+import hashlib
 import math
+import threading
 import typing
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable
 from copy import deepcopy
 from typing import Any, TypeVar, cast
@@ -26,6 +29,13 @@ _JSON_TYPE_MAP: dict[str, type | tuple[type, ...]] = {
     "object": dict,
 }
 
+SchemaValidator = Callable[[Any, str], list[str]]
+"""``(value, path) -> errors``, as returned by :func:`compile_json_schema`."""
+
+# Distinct parameter schemas seen in one process: built-in tools plus every
+# connected MCP server's tools.
+_MAX_COMPILED_SCHEMAS = 1024
+
 
 class Schema(ABC):
     """Abstract base for JSON Schema fragments describing tool parameters.
@@ -141,6 +151,173 @@ class Schema(ABC):
         return Schema.validate_json_schema_value(value, self.to_json_schema(), path)
 
 
+def _interpreted(schema: Any) -> SchemaValidator:
+    def validate(val: Any, path: str) -> list[str]:
+        return Schema.validate_json_schema_value(val, schema, path)
+
+    return validate
+
+
+def compile_json_schema(schema: dict[str, Any]) -> SchemaValidator:
+    """Compile a schema fragment into a validator equivalent to :meth:`Schema.validate_json_schema_value`.
+
+    Keyword lookups and type resolution happen once here instead of on every
+    call; the returned function produces the same messages in the same order.
+    Fragments whose shape the compiler does not model (non-dict nodes, odd
+    ``type``/``properties``/``required`` values) are handed to the
+    interpreter unchanged, so malformed schemas fail exactly as before.
+    """
+    if not isinstance(cast(object, schema), dict):
+        return _interpreted(schema)
+    raw_type = schema.get("type")
+    t = Schema.resolve_json_schema_type(raw_type)
+    if t is not None and not isinstance(cast(object, t), str):
+        return _interpreted(schema)
+    props = schema.get("properties", {})
+    required = schema.get("required", [])
+    if t == "object" and (
+        not isinstance(props, dict) or not isinstance(required, (list, tuple))
+    ):
+        return _interpreted(schema)
+
+    nullable = bool((isinstance(raw_type, list) and "null" in raw_type) or schema.get("nullable", False))
+    expected: type | tuple[type, ...] | None = _JSON_TYPE_MAP.get(t) if t is not None else None
+    reject_bool = t in ("integer", "number")
+    check_finite = t == "number"
+    # Keyword values keep their raw JSON types, exactly as the interpreter
+    # reads them; only their presence is decided here.
+    has_enum = "enum" in schema
+    enum: Any = schema.get("enum")
+    numeric = t in ("integer", "number")
+    has_min = "minimum" in schema
+    minimum: Any = schema.get("minimum")
+    has_max = "maximum" in schema
+    maximum: Any = schema.get("maximum")
+    is_string = t == "string"
+    has_min_len = "minLength" in schema
+    min_len: Any = schema.get("minLength")
+    has_max_len = "maxLength" in schema
+    max_len: Any = schema.get("maxLength")
+    is_array = t == "array"
+    has_min_items = "minItems" in schema
+    min_items: Any = schema.get("minItems")
+    has_max_items = "maxItems" in schema
+    max_items: Any = schema.get("maxItems")
+    items = compile_json_schema(schema["items"]) if is_array and "items" in schema else None
+
+    is_object = t == "object"
+    prop_validators: dict[str, SchemaValidator] = {}
+    required_keys: tuple[Any, ...] = ()
+    additional_forbidden = False
+    additional: SchemaValidator | None = None
+    if is_object:
+        prop_validators = {k: compile_json_schema(v) for k, v in cast(dict[str, Any], props).items()}
+        required_keys = tuple(cast(list[Any], required))
+        extra = schema.get("additionalProperties", True)
+        additional_forbidden = extra is False
+        if isinstance(extra, dict):
+            additional = compile_json_schema(cast(dict[str, Any], extra))
+
+    def validate(val: Any, path: str) -> list[str]:
+        if nullable and val is None:
+            return []
+        if expected is not None and (
+            not isinstance(val, expected) or (reject_bool and isinstance(val, bool))
+        ):
+            return [f"{path or 'parameter'} should be {t}"]
+        if check_finite and isinstance(val, float) and not math.isfinite(val):
+            return [f"{path or 'parameter'} must be finite"]
+
+        errors: list[str] = []
+        if has_enum and val not in enum:
+            errors.append(f"{path or 'parameter'} must be one of {enum}")
+        if numeric:
+            number_value = cast(float, val)
+            if has_min and number_value < minimum:
+                errors.append(f"{path or 'parameter'} must be >= {minimum}")
+            if has_max and number_value > maximum:
+                errors.append(f"{path or 'parameter'} must be <= {maximum}")
+        elif is_string:
+            string_value = cast(str, val)
+            if has_min_len and len(string_value) < min_len:
+                errors.append(f"{path or 'parameter'} must be at least {min_len} chars")
+            if has_max_len and len(string_value) > max_len:
+                errors.append(f"{path or 'parameter'} must be at most {max_len} chars")
+        elif is_object:
+            object_value = cast(dict[str, Any], val)
+            for k in required_keys:
+                if k not in object_value:
+                    errors.append(f"missing required {Schema.subpath(path, k)}")
+            for k, v in object_value.items():
+                prop = prop_validators.get(k)
+                if prop is not None:
+                    errors.extend(prop(v, f"{path}.{k}" if path else k))
+                elif additional_forbidden:
+                    errors.append(f"unexpected parameter {Schema.subpath(path, k)}")
+                elif additional is not None:
+                    errors.extend(additional(v, f"{path}.{k}" if path else k))
+        elif is_array:
+            array_value = cast(list[Any], val)
+            if has_min_items and len(array_value) < min_items:
+                errors.append(f"{path or 'parameter'} must have at least {min_items} items")
+            if has_max_items and len(array_value) > max_items:
+                errors.append(f"{path or 'parameter'} must be at most {max_items} items")
+            if items is not None:
+                for i, item in enumerate(array_value):
+                    errors.extend(items(item, f"{path}[{i}]"))
+        return errors
+
+    return validate
+
+
+class _CompiledSchemaCache:
+    """Schema fingerprint -> compiled validator, shared by every tool (LRU)."""
+
+    def __init__(self, max_entries: int = _MAX_COMPILED_SCHEMAS) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._validators: OrderedDict[str, SchemaValidator] = OrderedDict()
+        self.hits = 0
+        self.compiles = 0
+
+    def get(self, schema: dict[str, Any]) -> SchemaValidator:
+        key = hashlib.blake2b(repr(schema).encode(), digest_size=16).hexdigest()
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return validator
+        validator = compile_json_schema(schema)
+        with self._lock:
+            validator = self._validators.setdefault(key, validator)
+            self._validators.move_to_end(key)
+            self.compiles += 1
+            while len(self._validators) > self.max_entries:
+                self._validators.popitem(last=False)
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "compiles": self.compiles, "schemas": len(self._validators)}
+
+
+_COMPILED_SCHEMAS = _CompiledSchemaCache()
+
+
+def compiled_json_schema_validator(schema: dict[str, Any]) -> SchemaValidator:
+    """Shared compiled validator for *schema*, compiled on first use of its fingerprint."""
+    return _COMPILED_SCHEMAS.get(schema)
+
+
+def clear_compiled_schemas() -> None:
+    _COMPILED_SCHEMAS.clear()
+
+
 class ToolResult(str):
     """String-compatible tool output with structured status."""
 
@@ -205,6 +382,9 @@ class Tool(ABC):
 
     config_key: str = ""
     _plugin_discoverable: bool = True
+    # (schema object, validator) from the last validate_params call; a tool
+    # whose ``parameters`` returns a new dict is looked up by fingerprint.
+    _compiled_params: tuple[dict[str, Any], SchemaValidator] | None = None
     _scopes: set[str] = {"core"}
 
     @classmethod
@@ -248,9 +428,25 @@ class Tool(ABC):
                 casted[k] = v
         return casted
 
+    def _validation_schema(self) -> dict[str, Any]:
+        """Parameter schema for casting and validation, without the defensive copy ``parameters`` makes."""
+        prop = getattr(type(self), "parameters", None)
+        if isinstance(prop, _FrozenParameters):
+            return prop.frozen
+        return self.parameters or {}
+
+    def _params_validator(self, schema: dict[str, Any]) -> SchemaValidator:
+        """Compiled validator for *schema*, remembered per tool while the schema object stays the same."""
+        compiled = self._compiled_params
+        if compiled is not None and compiled[0] is schema:
+            return compiled[1]
+        validator = compiled_json_schema_validator({**schema, "type": "object"})
+        self._compiled_params = (schema, validator)
+        return validator
+
     def cast_params(self, params: dict[str, Any]) -> dict[str, Any]:
         """Apply safe schema-driven casts before validation."""
-        schema = self.parameters or {}
+        schema = self._validation_schema()
         if schema.get("type", "object") != "object":
             return params
         return self._cast_object(params, schema)
@@ -298,10 +494,10 @@ class Tool(ABC):
         """Validate against JSON schema; empty list means valid."""
         if not isinstance(cast(object, params), dict):
             return [f"parameters must be an object, got {type(params).__name__}"]
-        schema = self.parameters or {}
+        schema = self._validation_schema()
         if schema.get("type", "object") != "object":
             raise ValueError(f"Schema must be object type, got {schema.get('type')!r}")
-        return Schema.validate_json_schema_value(params, {**schema, "type": "object"}, "")
+        return self._params_validator(schema)(params, "")
 
     def to_schema(self) -> dict[str, Any]:
         """OpenAI function schema."""
@@ -315,6 +511,12 @@ class Tool(ABC):
         }
 
 
+class _FrozenParameters(property):
+    """``parameters`` property installed by :func:`tool_parameters`; keeps the frozen schema reachable."""
+
+    frozen: dict[str, Any]
+
+
 def tool_parameters(schema: dict[str, Any]) -> Callable[[type[_ToolT]], type[_ToolT]]:
     """Class decorator: attach JSON Schema and inject a concrete ``parameters`` property.
 
@@ -335,11 +537,12 @@ def tool_parameters(schema: dict[str, Any]) -> Callable[[type[_ToolT]], type[_To
     def decorator(cls: type[_ToolT]) -> type[_ToolT]:
         frozen = deepcopy(schema)
 
-        @property
         def parameters(self: Any) -> dict[str, Any]:
             return deepcopy(frozen)
 
-        cls.parameters = parameters  # type: ignore[assignment]
+        prop = _FrozenParameters(parameters)
+        prop.frozen = frozen
+        cls.parameters = prop  # type: ignore[assignment]
 
         abstract = getattr(cls, "__abstractmethods__", None)
         if abstract is not None and "parameters" in abstract:
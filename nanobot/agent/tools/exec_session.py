@@ -546,7 +546,7 @@ class WriteStdinTool(Tool):
 
     @classmethod
     def config_cls(cls):
-        from nanobot.agent.tools.shell import ExecToolConfig
+        from nanobot.agent.tools.config import ExecToolConfig
 
         return ExecToolConfig
 
@@ -697,7 +697,7 @@ class ListExecSessionsTool(Tool):
 
     @classmethod
     def config_cls(cls):
-        from nanobot.agent.tools.shell import ExecToolConfig
+        from nanobot.agent.tools.config import ExecToolConfig
 
         return ExecToolConfig
 
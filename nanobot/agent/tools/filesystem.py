@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from nanobot.agent.tools.base import Tool, ToolResult, tool_parameters
+from nanobot.agent.tools.config import FileToolsConfig
 from nanobot.agent.tools.context import ToolContext
 from nanobot.agent.tools.file_state import FileStates, _hash_file, current_file_states
 from nanobot.agent.tools.path_utils import resolve_workspace_path
@@ -19,17 +20,10 @@ from nanobot.agent.tools.schema import (
     StringSchema,
     tool_parameters_schema,
 )
-from nanobot.config_base import Base
 from nanobot.security.workspace_access import current_tool_workspace
 from nanobot.utils.helpers import build_image_content_blocks, detect_image_mime
 
 
-class FileToolsConfig(Base):
-    """Filesystem tools configuration."""
-
-    enable: bool = True  # built-in file tools on by default
-
-
 class _FsTool(Tool):
     """Shared base for filesystem tools — common init and path resolution."""
 
@@ -1,69 +1,64 @@
-"""Tool discovery and registration via package scanning."""
+"""Tool discovery and registration via the built-in manifest and plugins."""
 
 # pyright: reportIncompatibleVariableOverride=false
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
+from collections.abc import Iterable, Iterator
 from importlib.metadata import entry_points
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from nanobot.agent.tools.base import Tool, ToolResult
+from nanobot.agent.tools.manifest import BUILTIN_TOOLS, SKIP_MODULES, scan_tool_classes
 from nanobot.agent.tools.registry import ToolRegistry
 
 if TYPE_CHECKING:
     from nanobot.agent.tools.context import RequestContext, ToolContext
 
-_SKIP_MODULES = frozenset({
-    "base", "schema", "registry", "context", "loader", "config",
-    "file_state", "sandbox", "mcp", "__init__", "runtime_control",
-})
+_SKIP_MODULES = SKIP_MODULES
 
 
 class ToolLoader:
     def __init__(self, package: Any = None, *, test_classes: list[type[Tool]] | None = None):
-        if package is None:
-            import nanobot.agent.tools as _pkg
-            package = _pkg
+        # The default package is served from the static manifest; a custom
+        # package is scanned module by module.
         self._package = package
         self._test_classes = test_classes
         self._discovered: list[type[Tool]] | None = None
         self._plugins: dict[str, type[Tool]] | None = None
 
     def discover(self) -> list[type[Tool]]:
+        """Return every built-in tool class, importing all of their modules."""
         if self._test_classes is not None:
             return list(self._test_classes)
         if self._discovered is not None:
             return self._discovered
-        seen: set[int] = set()
-        results: list[type[Tool]] = []
-        for _importer, module_name, _ispkg in pkgutil.iter_modules(self._package.__path__):
-            if module_name.startswith("_") or module_name in _SKIP_MODULES:
+        if self._package is not None:
+            self._discovered = scan_tool_classes(self._package)
+        else:
+            results: list[type[Tool]] = []
+            for entry in BUILTIN_TOOLS:
+                try:
+                    results.append(entry.load())
+                except Exception:
+                    logger.exception("Failed to import tool module: {}", entry.module)
+            self._discovered = results
+        return self._discovered
+
+    def _builtin_candidates(self, ctx: ToolContext, scope: str) -> Iterator[type[Tool]]:
+        """Yield built-in tools for *scope*, importing only those whose gate is open."""
+        if self._test_classes is not None or self._package is not None:
+            yield from self.discover()
+            return
+        for entry in BUILTIN_TOOLS:
+            if scope not in entry.scopes or not entry.gate_open(ctx):
                 continue
             try:
-                module = importlib.import_module(f".{module_name}", self._package.__name__)
+                yield entry.load()
             except Exception:
-                logger.exception("Failed to import tool module: %s", module_name)
-                continue
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, Tool)
-                    and attr is not Tool
-                    and not attr_name.startswith("_")
-                    and not getattr(attr, "__abstractmethods__", None)
-                    and getattr(attr, "_plugin_discoverable", True)
-                    and id(attr) not in seen
-                ):
-                    seen.add(id(attr))
-                    results.append(attr)
-        results.sort(key=lambda cls: cls.__name__)
-        self._discovered = results
-        return results
+                logger.exception("Failed to import tool module: {}", entry.module)
 
     def _discover_plugins(self) -> dict[str, type[Tool]]:
         """Discover external tool plugins registered via entry_points."""
@@ -92,7 +87,10 @@ class ToolLoader:
     def load(self, ctx: ToolContext, registry: ToolRegistry, *, scope: str = "core") -> list[str]:
         registered: list[str] = []
         builtin_names: set[str] = set()
-        sources = [(self.discover(), False), (self._discover_plugins().values(), True)]
+        sources: list[tuple[Iterable[type[Tool]], bool]] = [
+            (self._builtin_candidates(ctx, scope), False),
+            (self._discover_plugins().values(), True),
+        ]
         for source, is_plugin_source in sources:
             for tool_cls in source:
                 cls_label = tool_cls.__name__
@@ -0,0 +1,143 @@
+"""Static manifest of built-in tool classes.
+
+The loader reads this table instead of importing every module in the
+package, so a tool's module (and its dependencies) is only imported once
+its scope matches and its config gate is open.  ``requires`` lists dotted
+:class:`ToolContext` attributes that must all be truthy; they mirror the
+class's ``enabled()`` check, which still runs after import.
+
+Regenerate the module/class/scope columns with
+``python -m nanobot.agent.tools.manifest`` after adding a tool;
+``tests/tools/test_tool_manifest.py`` fails while the table is stale.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from nanobot.agent.tools.base import Tool
+
+_PACKAGE = "nanobot.agent.tools"
+
+# Infrastructure modules that never define discoverable tools.
+SKIP_MODULES = frozenset({
+    "base", "schema", "registry", "context", "loader", "config", "manifest",
+    "file_state", "sandbox", "mcp", "__init__", "runtime_control",
+})
+
+
+@dataclass(frozen=True, slots=True)
+class ToolManifestEntry:
+    module: str
+    class_name: str
+    scopes: frozenset[str] = frozenset({"core"})
+    requires: tuple[str, ...] = ()
+
+    def gate_open(self, ctx: Any) -> bool:
+        """Cheap pre-import check of the config the tool's ``enabled()`` reads."""
+        for path in self.requires:
+            value: Any = ctx
+            for part in path.split("."):
+                value = getattr(value, part, None)
+            if not value:
+                return False
+        return True
+
+    def load(self) -> type[Tool]:
+        module = importlib.import_module(f"{_PACKAGE}.{self.module}")
+        return getattr(module, self.class_name)
+
+
+_CORE_SUBAGENT = frozenset({"core", "subagent"})
+_FILE_SCOPES = frozenset({"core", "subagent", "memory"})
+
+# Sorted by class name: registration order matches the old package scan.
+BUILTIN_TOOLS: tuple[ToolManifestEntry, ...] = (
+    ToolManifestEntry("apply_patch", "ApplyPatchTool", _CORE_SUBAGENT, ("config.file.enable",)),
+    ToolManifestEntry("cli_apps", "CliAppsTool", _CORE_SUBAGENT, ("config.cli_apps.enable",)),
+    ToolManifestEntry("long_task", "CreateGoalTool", requires=("sessions",)),
+    ToolManifestEntry("cron", "CronTool", requires=("cron_service",)),
+    ToolManifestEntry("filesystem", "EditFileTool", _FILE_SCOPES, ("config.file.enable",)),
+    ToolManifestEntry("shell", "ExecTool", _CORE_SUBAGENT, ("config.exec.enable",)),
+    ToolManifestEntry("search", "FindFilesTool", _CORE_SUBAGENT, ("config.file.enable",)),
+    ToolManifestEntry("search", "GrepTool", _CORE_SUBAGENT, ("config.file.enable",)),
+    ToolManifestEntry(
+        "image_generation", "ImageGenerationTool", requires=("config.image_generation.enabled",)
+    ),
+    ToolManifestEntry("filesystem", "ListDirTool", _CORE_SUBAGENT, ("config.file.enable",)),
+    ToolManifestEntry(
+        "exec_session", "ListExecSessionsTool", _CORE_SUBAGENT, ("config.exec.enable",)
+    ),
+    ToolManifestEntry("session_messages", "ListSessionsTool", requires=("sessions",)),
+    ToolManifestEntry("message", "MessageTool"),
+    ToolManifestEntry("filesystem", "ReadFileTool", _FILE_SCOPES, ("config.file.enable",)),
+    ToolManifestEntry("sessions", "ReadSessionTool", requires=("sessions",)),
+    ToolManifestEntry("sessions", "SearchSessionsTool", requires=("sessions",)),
+    ToolManifestEntry(
+        "session_messages", "SendSessionMessageTool", requires=("sessions", "bus")
+    ),
+    ToolManifestEntry("spawn", "SpawnTool"),
+    ToolManifestEntry("long_task", "UpdateGoalTool", requires=("sessions",)),
+    ToolManifestEntry("web", "WebFetchTool", _CORE_SUBAGENT, ("config.web.enable",)),
+    ToolManifestEntry("web", "WebSearchTool", _CORE_SUBAGENT, ("config.web.enable",)),
+    ToolManifestEntry("filesystem", "WriteFileTool", _FILE_SCOPES, ("config.file.enable",)),
+    ToolManifestEntry("exec_session", "WriteStdinTool", _CORE_SUBAGENT, ("config.exec.enable",)),
+)
+
+
+def scan_tool_classes(package: ModuleType) -> list[type[Tool]]:
+    """Import every module in *package* and collect its concrete Tool classes."""
+    from nanobot.agent.tools.base import Tool
+
+    seen: set[int] = set()
+    results: list[type[Tool]] = []
+    for _importer, module_name, _ispkg in pkgutil.iter_modules(package.__path__):
+        if module_name.startswith("_") or module_name in SKIP_MODULES:
+            continue
+        try:
+            module = importlib.import_module(f".{module_name}", package.__name__)
+        except Exception:
+            logger.exception("Failed to import tool module: {}", module_name)
+            continue
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type)
+                and issubclass(attr, Tool)
+                and attr is not Tool
+                and not attr_name.startswith("_")
+                and not getattr(attr, "__abstractmethods__", None)
+                and getattr(attr, "_plugin_discoverable", True)
+                and id(attr) not in seen
+            ):
+                seen.add(id(attr))
+                results.append(attr)
+    results.sort(key=lambda cls: cls.__name__)
+    return results
+
+
+def scanned_manifest() -> list[tuple[str, str, frozenset[str]]]:
+    """Module, class and scopes of every tool found by a full package scan."""
+    import nanobot.agent.tools as package
+
+    prefix = f"{_PACKAGE}."
+    return [
+        (
+            cls.__module__.removeprefix(prefix),
+            cls.__name__,
+            frozenset(getattr(cls, "_scopes", {"core"})),
+        )
+        for cls in scan_tool_classes(package)
+    ]
+
+
+if __name__ == "__main__":
+    for module, class_name, scopes in scanned_manifest():
+        print(f"{module:20} {class_name:24} {sorted(scopes)}")
@@ -9,8 +9,7 @@ from typing import TYPE_CHECKING, Protocol, TypeAlias, runtime_checkable
 
 if TYPE_CHECKING:
     from nanobot.agent.subagent import SubagentManager, SubagentStatus
-    from nanobot.agent.tools.shell import ExecToolConfig
-    from nanobot.agent.tools.web import WebToolsConfig
+    from nanobot.agent.tools.config import ExecToolConfig, WebToolsConfig
     from nanobot.config.schema import ModelPresetConfig
     from nanobot.utils.llm_runtime import LLMRuntime
 
@@ -4,18 +4,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
-from typing import Any, Iterable, TypeVar
+from typing import Any, Iterable, Iterator, TypeVar
 
-from nanobot.agent.tools.base import ToolResult
+from nanobot.agent.tools.base import Tool, ToolResult
+from nanobot.agent.tools.context import ToolContext
 from nanobot.agent.tools.filesystem import ListDirTool, _FsTool
 
 _DEFAULT_HEAD_LIMIT = 250
 _DEFAULT_FILE_HEAD_LIMIT = 200
+_SCAN_BATCH = 64
+_SCAN_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+_INDEX_MAX_DIRS = 20_000
+_INDEX_MAX_FILES = 20_000
+_INDEX_MAX_TEXT_BYTES = 1_000_000
+_TRIGRAM_MIN_BITS = 512
+_TRIGRAM_MAX_BITS = 1 << 15
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
 T = TypeVar("T")
 _TYPE_GLOB_MAP = {
     "py": ("*.py", "*.pyi"),
@@ -100,8 +113,164 @@ def _matches_query(rel_path: str, query: str | None) -> bool:
     return all(term in haystack for term in terms)
 
 
+def _required_literal(pattern: str, fixed_strings: bool) -> str | None:
+    """Return a substring every matching line must contain, if one is obvious."""
+    if not fixed_strings and _REGEX_META_RE.search(pattern):
+        return None
+    return pattern or None
+
+
+def _trigram_filter(lowered: str) -> bytes:
+    """Build a small bloom filter over the distinct trigrams of *lowered* text."""
+    trigrams = {lowered[i : i + 3] for i in range(len(lowered) - 2)}
+    bits = _TRIGRAM_MIN_BITS
+    while bits < len(trigrams) * 8 and bits < _TRIGRAM_MAX_BITS:
+        bits <<= 1
+    mask = bits - 1
+    table = bytearray(bits // 8)
+    for trigram in trigrams:
+        slot = hash(trigram) & mask
+        table[slot >> 3] |= 1 << (slot & 7)
+    return bytes(table)
+
+
+def _may_contain(table: bytes, literal: str) -> bool:
+    mask = len(table) * 8 - 1
+    for i in range(len(literal) - 2):
+        slot = hash(literal[i : i + 3]) & mask
+        if not table[slot >> 3] & (1 << (slot & 7)):
+            return False
+    return True
+
+
+@dataclass(slots=True)
+class _DirListing:
+    mtime_ns: int
+    dirnames: list[str]
+    filenames: list[str]
+
+
+@dataclass(slots=True)
+class _FileEntry:
+    mtime_ns: int
+    size: int
+    binary: bool
+    # Trigram bloom filter over the lower-cased text; only kept for ASCII files,
+    # where lower-casing agrees with ``re.IGNORECASE``.
+    trigrams: bytes | None = None
+
+
+@dataclass(slots=True)
+class _FileScan:
+    mtime: float = 0.0
+    large: bool = False
+    binary: bool = False
+    lines: list[str] = field(default_factory=list)
+    matches: list[int] = field(default_factory=list)
+
+
+class _WorkspaceIndex:
+    """Process-wide cache of directory listings and per-file content filters.
+
+    Entries are validated against ``st_mtime_ns`` (and ``st_size`` for files)
+    on every lookup, so edits from tools, the shell or the user show up on the
+    next search. Eviction is FIFO once the bounds are reached.
+    """
+
+    def __init__(self, max_dirs: int = _INDEX_MAX_DIRS, max_files: int = _INDEX_MAX_FILES):
+        self._max_dirs = max_dirs
+        self._max_files = max_files
+        self._lock = threading.Lock()
+        self._dirs: dict[str, _DirListing] = {}
+        self._files: dict[str, _FileEntry] = {}
+
+    def listdir(self, path: str, ignore: set[str]) -> tuple[list[str], list[str]] | None:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._dirs.get(path)
+        if cached is None or cached.mtime_ns != mtime_ns:
+            listing = _scan_dir(path)
+            if listing is None:
+                return None
+            cached = _DirListing(mtime_ns, *listing)
+            with self._lock:
+                if path not in self._dirs and len(self._dirs) >= self._max_dirs:
+                    self._dirs.pop(next(iter(self._dirs)))
+                self._dirs[path] = cached
+        return [d for d in cached.dirnames if d not in ignore], cached.filenames
+
+    def file_entry(self, path: str, st: os.stat_result) -> _FileEntry | None:
+        with self._lock:
+            entry = self._files.get(path)
+        if entry is None or entry.mtime_ns != st.st_mtime_ns or entry.size != st.st_size:
+            return None
+        return entry
+
+    def store_file(self, path: str, entry: _FileEntry) -> None:
+        with self._lock:
+            if path not in self._files and len(self._files) >= self._max_files:
+                self._files.pop(next(iter(self._files)))
+            self._files[path] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+            self._files.clear()
+
+
+def _scan_dir(path: str) -> tuple[list[str], list[str]] | None:
+    """List *path* the way ``os.walk`` does: symlinked dirs are not descended."""
+    dirnames: list[str] = []
+    filenames: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                    continue
+                try:
+                    is_link = entry.is_symlink()
+                except OSError:
+                    is_link = False
+                if not is_link:
+                    dirnames.append(entry.name)
+    except OSError:
+        return None
+    return sorted(dirnames), sorted(filenames)
+
+
+_WORKSPACE_INDEX = _WorkspaceIndex()
+_scan_pool: ThreadPoolExecutor | None = None
+_scan_pool_lock = threading.Lock()
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            _scan_pool = ThreadPoolExecutor(
+                max_workers=_SCAN_WORKERS, thread_name_prefix="nanobot-search",
+            )
+        return _scan_pool
+
+
 class _SearchTool(_FsTool):
     _IGNORE_DIRS = set(ListDirTool._IGNORE_DIRS)
+    _use_index = True
+
+    @classmethod
+    def create(cls, ctx: ToolContext) -> Tool:
+        tool = super().create(ctx)
+        if isinstance(tool, _SearchTool):
+            tool._use_index = ctx.config.file.search_index
+        return tool
 
     def _display_path(self, target: Path, root: Path) -> str:
         workspace = self._display_workspace()
@@ -110,15 +279,31 @@ class _SearchTool(_FsTool):
                 return target.relative_to(workspace).as_posix()
         return target.relative_to(root).as_posix()
 
+    def _walk(self, root: Path) -> Iterator[tuple[Path, list[str]]]:
+        """Yield ``(directory, sorted filenames)`` top-down, like ``os.walk``."""
+        if not self._use_index:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames if d not in self._IGNORE_DIRS)
+                yield Path(dirpath), sorted(filenames)
+            return
+
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            listing = _WORKSPACE_INDEX.listdir(current, self._IGNORE_DIRS)
+            if listing is None:
+                continue
+            dirnames, filenames = listing
+            yield Path(current), filenames
+            stack.extend(os.path.join(current, d) for d in reversed(dirnames))
+
     def _iter_files(self, root: Path) -> Iterable[Path]:
         if root.is_file():
             yield root
             return
 
-        for dirpath, dirnames, filenames in os.walk(root):
-            dirnames[:] = sorted(d for d in dirnames if d not in self._IGNORE_DIRS)
-            current = Path(dirpath)
-            for filename in sorted(filenames):
+        for current, filenames in self._walk(root):
+            for filename in filenames:
                 yield current / filename
 
 
@@ -192,19 +377,18 @@ class FindFilesTool(_SearchTool):
             },
         }
 
-    def _iter_paths(self, root: Path, *, include_dirs: bool) -> Iterable[Path]:
+    def _iter_paths(self, root: Path, *, include_dirs: bool) -> Iterable[tuple[Path, bool]]:
+        """Yield ``(path, is_dir)`` pairs under *root*."""
         if root.is_file():
-            yield root
+            yield root, False
             return
         if include_dirs:
-            yield root
-        for dirpath, dirnames, filenames in os.walk(root):
-            dirnames[:] = sorted(d for d in dirnames if d not in self._IGNORE_DIRS)
-            current = Path(dirpath)
+            yield root, True
+        for current, filenames in self._walk(root):
             if include_dirs and current != root:
-                yield current
-            for filename in sorted(filenames):
-                yield current / filename
+                yield current, True
+            for filename in filenames:
+                yield current / filename, False
 
     async def execute(
         self,
@@ -217,6 +401,31 @@ class FindFilesTool(_SearchTool):
         head_limit: int | None = None,
         offset: int = 0,
         **kwargs: Any,
+    ) -> str:
+        # Directory walks can take seconds on large workspaces; keep them off
+        # the event loop so other sessions stay responsive.
+        return await asyncio.to_thread(
+            self._find,
+            path,
+            query,
+            glob,
+            type,
+            include_dirs,
+            sort,
+            head_limit,
+            offset,
+        )
+
+    def _find(
+        self,
+        path: str,
+        query: str | None,
+        glob: str | None,
+        type: str | None,
+        include_dirs: bool,
+        sort: str,
+        head_limit: int | None,
+        offset: int,
     ) -> str:
         try:
             target = self._resolve(path or ".")
@@ -236,26 +445,28 @@ class FindFilesTool(_SearchTool):
             root = target if target.is_dir() else target.parent
             matches: list[tuple[str, float]] = []
 
-            for candidate in self._iter_paths(target, include_dirs=include_dirs):
-                if candidate.is_dir() and not include_dirs:
+            for candidate, is_dir in self._iter_paths(target, include_dirs=include_dirs):
+                if is_dir and type:
                     continue
                 rel_path = candidate.relative_to(root).as_posix()
-                display_path = self._display_path(candidate, root)
                 name = candidate.name
 
                 if glob and not _match_glob(rel_path, name, glob):
                     continue
-                if candidate.is_file() and not _matches_type(name, type):
-                    continue
-                if candidate.is_dir() and type:
+                if (
+                    not is_dir
+                    and not _matches_type(name, type)
+                    and candidate.is_file()
+                ):
                     continue
+                display_path = self._display_path(candidate, root)
                 if not _matches_query(display_path, query):
                     continue
-                try:
-                    mtime = candidate.stat().st_mtime
-                except OSError:
-                    mtime = 0.0
-                suffix = "/" if candidate.is_dir() else ""
+                mtime = 0.0
+                if sort == "modified":
+                    with suppress(OSError):
+                        mtime = candidate.stat().st_mtime
+                suffix = "/" if is_dir else ""
                 matches.append((display_path + suffix, mtime))
 
             if sort == "modified":
@@ -426,6 +637,142 @@ class GrepTool(_SearchTool):
         head_limit: int | None = None,
         offset: int = 0,
         **kwargs: Any,
+    ) -> str:
+        # File reads and regex matching run on a worker thread (and fan out to
+        # the scan pool) so a large grep never blocks the event loop.
+        return await asyncio.to_thread(
+            self._grep,
+            pattern,
+            path,
+            glob,
+            type,
+            case_insensitive,
+            fixed_strings,
+            output_mode,
+            context_before,
+            context_after,
+            max_matches,
+            max_results,
+            head_limit,
+            offset,
+        )
+
+    def _scan_file(
+        self,
+        file_path: Path,
+        max_file_bytes: int,
+        regex: re.Pattern[str],
+        literal: str | None,
+        case_insensitive: bool,
+        first_only: bool,
+    ) -> _FileScan:
+        """Read one file and return its matching line numbers."""
+        key = str(file_path)
+        st: os.stat_result | None = None
+        with suppress(OSError):
+            st = file_path.stat()
+        scan = _FileScan(mtime=st.st_mtime if st is not None else 0.0)
+        if st is not None and st.st_size > max_file_bytes:
+            scan.large = True
+            return scan
+
+        entry = _WORKSPACE_INDEX.file_entry(key, st) if self._use_index and st else None
+        if entry is not None:
+            if entry.binary:
+                scan.binary = True
+                return scan
+            if (
+                literal is not None
+                and entry.trigrams is not None
+                and len(literal) >= 3
+                and literal.isascii()
+                and not _may_contain(entry.trigrams, literal.lower())
+            ):
+                return scan
+
+        with file_path.open("rb") as file:
+            raw = file.read(max_file_bytes + 1)
+        if len(raw) > max_file_bytes:
+            scan.large = True
+            return scan
+        content: str | None = None
+        if not _is_binary(raw):
+            with suppress(UnicodeDecodeError):
+                content = raw.decode("utf-8")
+        if self._use_index and st is not None and entry is None:
+            trigrams = None
+            if content is not None and content.isascii() and len(raw) <= _INDEX_MAX_TEXT_BYTES:
+                trigrams = _trigram_filter(content.lower())
+            _WORKSPACE_INDEX.store_file(
+                key,
+                _FileEntry(st.st_mtime_ns, st.st_size, content is None, trigrams),
+            )
+        if content is None:
+            scan.binary = True
+            return scan
+
+        # Cheap whole-file rejection when every match must contain a literal.
+        if literal is not None:
+            if not case_insensitive:
+                if literal not in content:
+                    return scan
+            elif content.isascii() and literal.isascii():
+                if literal.lower() not in content.lower():
+                    return scan
+
+        scan.lines = content.splitlines()
+        for idx, line in enumerate(scan.lines, start=1):
+            if regex.search(line):
+                scan.matches.append(idx)
+                if first_only:
+                    break
+        return scan
+
+    def _iter_scans(
+        self,
+        files: Iterable[Path],
+        max_file_bytes: int,
+        regex: re.Pattern[str],
+        literal: str | None,
+        case_insensitive: bool,
+        first_only: bool,
+    ) -> Iterator[tuple[Path, _FileScan]]:
+        """Scan *files* in parallel batches, yielding results in walk order."""
+        pool = _get_scan_pool()
+        batch: list[Path] = []
+
+        def _scan(path: Path) -> _FileScan:
+            return self._scan_file(
+                path, max_file_bytes, regex, literal, case_insensitive, first_only,
+            )
+
+        def _run(paths: list[Path]) -> Iterator[tuple[Path, _FileScan]]:
+            scans = pool.map(_scan, paths)
+            return zip(paths, scans)
+
+        for file_path in files:
+            batch.append(file_path)
+            if len(batch) >= _SCAN_BATCH:
+                yield from _run(batch)
+                batch = []
+        if batch:
+            yield from _run(batch)
+
+    def _grep(
+        self,
+        pattern: str,
+        path: str,
+        glob: str | None,
+        type: str | None,
+        case_insensitive: bool,
+        fixed_strings: bool,
+        output_mode: str,
+        context_before: int,
+        context_after: int,
+        max_matches: int | None,
+        max_results: int | None,
+        head_limit: int | None,
+        offset: int,
     ) -> str:
         try:
             target = self._resolve(path or ".")
@@ -464,48 +811,44 @@ class GrepTool(_SearchTool):
                 self._MAX_EXPLICIT_FILE_BYTES if target.is_file() else self._MAX_FILE_BYTES
             )
 
-            for file_path in self._iter_files(target):
-                rel_path = file_path.relative_to(root).as_posix()
-                if glob and not _match_glob(rel_path, file_path.name, glob):
-                    continue
-                if not _matches_type(file_path.name, type):
-                    continue
-
-                with file_path.open("rb") as file:
-                    raw = file.read(max_file_bytes + 1)
-                if len(raw) > max_file_bytes:
+            candidates = (
+                file_path
+                for file_path in self._iter_files(target)
+                if (
+                    not glob
+                    or _match_glob(file_path.relative_to(root).as_posix(), file_path.name, glob)
+                )
+                and _matches_type(file_path.name, type)
+            )
+            scans = self._iter_scans(
+                candidates,
+                max_file_bytes,
+                regex,
+                _required_literal(pattern, fixed_strings),
+                case_insensitive,
+                first_only=output_mode == "files_with_matches",
+            )
+            for file_path, scan in scans:
+                if scan.large:
                     skipped_large += 1
                     continue
-                if _is_binary(raw):
+                if scan.binary:
                     skipped_binary += 1
                     continue
-                try:
-                    mtime = file_path.stat().st_mtime
-                except OSError:
-                    mtime = 0.0
-                try:
-                    content = raw.decode("utf-8")
-                except UnicodeDecodeError:
-                    skipped_binary += 1
+                if not scan.matches:
                     continue
 
-                lines = content.splitlines()
+                lines = scan.lines
                 display_path = self._display_path(file_path, root)
-                file_had_match = False
-                for idx, line in enumerate(lines, start=1):
-                    if not regex.search(line):
-                        continue
-                    file_had_match = True
-
-                    if output_mode == "count":
-                        counts[display_path] = counts.get(display_path, 0) + 1
-                        continue
-                    if output_mode == "files_with_matches":
-                        if display_path not in matching_files:
-                            matching_files.append(display_path)
-                            file_mtimes[display_path] = mtime
-                        break
+                if output_mode == "count":
+                    counts[display_path] = counts.get(display_path, 0) + len(scan.matches)
+                if output_mode in {"count", "files_with_matches"}:
+                    if display_path not in file_mtimes:
+                        matching_files.append(display_path)
+                        file_mtimes[display_path] = scan.mtime
+                    continue
 
+                for idx in scan.matches:
                     seen_content_matches += 1
                     if seen_content_matches <= offset:
                         continue
@@ -525,12 +868,6 @@ class GrepTool(_SearchTool):
                         break
                     blocks.append(block)
                     result_chars += extra_sep + len(block)
-                if output_mode == "count" and file_had_match:
-                    if display_path not in matching_files:
-                        matching_files.append(display_path)
-                        file_mtimes[display_path] = mtime
-                if output_mode in {"count", "files_with_matches"} and file_had_match:
-                    continue
                 if truncated or size_truncated:
                     break
 
@@ -17,9 +17,9 @@ from typing import Any, Protocol, cast
 from urllib.parse import unquote
 
 from loguru import logger
-from pydantic import Field
 
 from nanobot.agent.tools.base import Tool, ToolResult, tool_parameters
+from nanobot.agent.tools.config import ExecToolConfig
 from nanobot.agent.tools.context import ToolContext, current_request_session_key
 from nanobot.agent.tools.exec_session import (
     DEFAULT_EXEC_SESSION_MANAGER,
@@ -39,7 +39,6 @@ from nanobot.agent.tools.schema import (
     tool_parameters_schema,
 )
 from nanobot.config.paths import get_media_dir
-from nanobot.config_base import Base
 from nanobot.security.workspace_access import current_scope_allows_loopback, current_tool_workspace
 from nanobot.security.workspace_policy import is_path_within
 
@@ -90,19 +89,8 @@ _WORKSPACE_BOUNDARY_NOTE = (
     "restrict_to_workspace policy and ask how to proceed."
 )
 
-
-class ExecToolConfig(Base):
-    """Shell exec tool configuration."""
-    enable: bool = True
-    timeout: int = Field(default=60, ge=0)  # Hard timeout (s); 0 = no limit. Not capped by the per-call max.
-    path_prepend: str = ""
-    path_append: str = ""
-    sandbox: str = ""
-    sandbox_ro_binds: list[str] = Field(default_factory=list)
-    sandbox_rw_binds: list[str] = Field(default_factory=list)
-    allowed_env_keys: list[str] = Field(default_factory=list)
-    allow_patterns: list[str] = Field(default_factory=list)
-    deny_patterns: list[str] = Field(default_factory=list)
+# The runner turns this marker into a non-retryable security hint.
+_INTERNAL_URL_ERROR = "Error: Command blocked by safety guard (internal/private URL detected)"
 
 
 @dataclass(slots=True)
@@ -324,7 +312,7 @@ class ExecTool(Tool):
         if max_output_chars is None:
             max_output_chars = max_output_tokens
 
-        prepared = self._prepare_command(command, working_dir, timeout, shell, login)
+        prepared = await self._prepare_command(command, working_dir, timeout, shell, login)
         if isinstance(prepared, str):
             return prepared
 
@@ -434,7 +422,7 @@ class ExecTool(Tool):
             return self.timeout
         return None
 
-    def _prepare_command(
+    async def _prepare_command(
         self,
         command: str,
         working_dir: str | None = None,
@@ -475,7 +463,8 @@ class ExecTool(Tool):
             cwd,
             restrict_to_workspace=access.restrict_to_workspace,
             workspace_root=workspace_root,
-        )
+            check_urls=False,
+        ) or await self._guard_internal_urls(command)
         if guard_error:
             return guard_error
 
@@ -830,6 +819,18 @@ class ExecTool(Tool):
                 env[key] = val
         return env
 
+    def _allow_loopback_urls(self) -> bool:
+        return current_scope_allows_loopback(enabled=self.webui_allow_local_service_access)
+
+    async def _guard_internal_urls(self, command: str) -> str | None:
+        """Internal-URL part of :meth:`_guard_command`, resolved off the event loop."""
+        from nanobot.security.network import contains_internal_url_async
+        if await contains_internal_url_async(
+            command.strip(), allow_loopback=self._allow_loopback_urls(),
+        ):
+            return ToolResult.error(_INTERNAL_URL_ERROR)
+        return None
+
     def _guard_command(
         self,
         command: str,
@@ -837,8 +838,13 @@ class ExecTool(Tool):
         *,
         restrict_to_workspace: bool | None = None,
         workspace_root: str | None = None,
+        check_urls: bool = True,
     ) -> str | None:
-        """Best-effort safety guard for potentially destructive commands."""
+        """Best-effort safety guard for potentially destructive commands.
+
+        ``check_urls=False`` skips the blocking internal-URL scan so async
+        callers can run :meth:`_guard_internal_urls` instead.
+        """
         cmd = command.strip()
         lower = cmd.lower()
 
@@ -859,15 +865,10 @@ class ExecTool(Tool):
             if self.allow_patterns:
                 return ToolResult.error("Error: Command blocked by allowlist filter (not in allowlist)")
 
-        from nanobot.security.network import contains_internal_url
-        if contains_internal_url(
-            cmd,
-            allow_loopback=current_scope_allows_loopback(
-                enabled=self.webui_allow_local_service_access,
-            ),
-        ):
-            # The runner turns this marker into a non-retryable security hint.
-            return ToolResult.error("Error: Command blocked by safety guard (internal/private URL detected)")
+        if check_urls:
+            from nanobot.security.network import contains_internal_url
+            if contains_internal_url(cmd, allow_loopback=self._allow_loopback_urls()):
+                return ToolResult.error(_INTERNAL_URL_ERROR)
 
         should_restrict = self.restrict_to_workspace if restrict_to_workspace is None else restrict_to_workspace
         if should_restrict:
@@ -10,14 +10,21 @@ import json
 import os
 import re
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import Any, cast
 from urllib.parse import parse_qsl, quote, urljoin, urlparse
 
 import httpx
 from loguru import logger
-from pydantic import Field
 
 from nanobot.agent.tools.base import Tool, ToolResult, tool_parameters
+from nanobot.agent.tools.config import (
+    WebFetchConfig,
+    WebSearchConfig,
+    WebToolsConfig,
+)
 from nanobot.agent.tools.context import ToolContext
 from nanobot.agent.tools.schema import (
     BooleanSchema,
@@ -25,8 +32,9 @@ from nanobot.agent.tools.schema import (
     StringSchema,
     tool_parameters_schema,
 )
-from nanobot.config_base import Base
 from nanobot.utils.helpers import build_image_content_blocks
+from nanobot.utils.http_pool import pooled_client
+from nanobot.utils.web_cache import WebCacheEntry, WebResultCache, record_web_cache_lookup
 
 # Shared constants
 _DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
@@ -40,47 +48,6 @@ _VOLCENGINE_TIME_RANGES = {"OneDay", "OneWeek", "OneMonth", "OneYear"}
 _VOLCENGINE_DATE_RANGE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.\.\d{4}-\d{2}-\d{2}$")
 
 
-# Single source of truth for selectable search providers (CLI wizard + WebUI).
-# "credential" describes what each provider needs: none / api_key / base_url /
-# optional_api_key.
-SEARCH_PROVIDER_OPTIONS: tuple[dict[str, str], ...] = (
-    {"name": "duckduckgo", "label": "DuckDuckGo", "credential": "none"},
-    {"name": "brave", "label": "Brave Search", "credential": "api_key"},
-    {"name": "tavily", "label": "Tavily", "credential": "api_key"},
-    {"name": "searxng", "label": "SearXNG", "credential": "base_url"},
-    {"name": "jina", "label": "Jina", "credential": "api_key"},
-    {"name": "kagi", "label": "Kagi", "credential": "api_key"},
-    {"name": "exa", "label": "Exa", "credential": "api_key"},
-    {"name": "olostep", "label": "Olostep", "credential": "api_key"},
-    {"name": "bocha", "label": "Bocha", "credential": "api_key"},
-    {"name": "volcengine", "label": "Volcengine Search", "credential": "api_key"},
-    {"name": "keenable", "label": "Keenable", "credential": "optional_api_key"},
-)
-
-
-class WebSearchConfig(Base):
-    """Web search configuration."""
-    provider: str = "duckduckgo"
-    api_key: str = ""
-    base_url: str = ""
-    max_results: int = 5
-    timeout: int = 30
-
-
-class WebFetchConfig(Base):
-    """Web fetch tool configuration."""
-    use_jina_reader: bool = True
-
-
-class WebToolsConfig(Base):
-    """Web tools configuration."""
-    enable: bool = True
-    proxy: str | None = None
-    user_agent: str | None = None
-    search: WebSearchConfig = Field(default_factory=WebSearchConfig)
-    fetch: WebFetchConfig = Field(default_factory=WebFetchConfig)
-
-
 def _strip_tags(text: str) -> str:
     """Remove HTML tags and decode entities."""
     text = re.sub(r'<script[\s\S]*?</script>', '', text, flags=re.I)
@@ -108,38 +75,31 @@ def _validate_url(url: str) -> tuple[bool, str]:
         return False, str(e)
 
 
-def _validate_url_safe(url: str) -> tuple[bool, str]:
+async def _validate_url_safe(url: str) -> tuple[bool, str]:
     """Validate URL with SSRF protection: scheme, domain, and resolved IP check."""
-    from nanobot.security.network import validate_url_target
+    from nanobot.security.network import validate_url_target_async
 
-    return validate_url_target(url)
+    return await validate_url_target_async(url)
 
 
-def _resolve_url_safe(url: str) -> tuple[bool, str, tuple[str, ...]]:
+async def _resolve_url_safe(url: str) -> tuple[bool, str, tuple[str, ...]]:
     """Validate URL and return the resolved IPs to pin during the request."""
-    from nanobot.security.network import resolve_url_target
+    from nanobot.security.network import resolve_url_target_async
 
-    return resolve_url_target(url)
+    return await resolve_url_target_async(url)
 
 
-def _pinned_dns_transport() -> httpx.AsyncBaseTransport:
+def _pinned_dns_transport(*, limits: httpx.Limits | None = None) -> httpx.AsyncBaseTransport:
     from nanobot.security.network import PinnedDNSAsyncTransport
 
-    return PinnedDNSAsyncTransport()
-
+    return PinnedDNSAsyncTransport(limits=limits)
 
-def _fetch_client_kwargs(proxy: str | None, timeout: float) -> dict[str, Any]:
-    from nanobot.security.network import httpx_env_proxy_mounts
 
-    kwargs: dict[str, Any] = {"timeout": timeout}
+def _fetch_client(proxy: str | None, timeout: float) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Pooled client for fetching untrusted URLs: DNS-pinned unless a proxy is set."""
     if proxy:
-        kwargs["proxy"] = proxy
-    else:
-        kwargs["transport"] = _pinned_dns_transport()
-        mounts = httpx_env_proxy_mounts()
-        if mounts:
-            kwargs["mounts"] = mounts
-    return kwargs
+        return pooled_client(proxy=proxy, timeout=timeout)
+    return pooled_client(timeout=timeout, transport_factory=_pinned_dns_transport)
 
 
 def _unsafe_url_request_error(exc: BaseException) -> str | None:
@@ -209,7 +169,7 @@ async def _get_with_safe_redirects(
     """GET a URL while validating every redirect target before requesting it."""
     current_url = url
     for _ in range(MAX_REDIRECTS + 1):
-        is_valid, error_msg, _ = _resolve_url_safe(current_url)
+        is_valid, error_msg, _ = await _resolve_url_safe(current_url)
         if not is_valid:
             return None, f"Redirect blocked: {error_msg}"
 
@@ -229,7 +189,7 @@ async def _get_with_safe_redirects(
             return response, None
 
         next_url = urljoin(str(response.url), location)
-        is_valid, error_msg = _validate_url_safe(next_url)
+        is_valid, error_msg = await _validate_url_safe(next_url)
         if not is_valid:
             await response.aclose()
             return None, f"Redirect blocked: {error_msg}"
@@ -249,7 +209,7 @@ async def _stream_with_safe_redirects(
     current_url = url
     chain_carries_credentials = _url_carries_credentials(url)
     for _ in range(MAX_REDIRECTS + 1):
-        is_valid, error_msg, _ = _resolve_url_safe(current_url)
+        is_valid, error_msg, _ = await _resolve_url_safe(current_url)
         if not is_valid:
             return None, None, f"Redirect blocked: {error_msg}", chain_carries_credentials
 
@@ -283,7 +243,7 @@ async def _stream_with_safe_redirects(
         chain_carries_credentials = (
             chain_carries_credentials or _url_carries_credentials(next_url)
         )
-        is_valid, error_msg = _validate_url_safe(next_url)
+        is_valid, error_msg = await _validate_url_safe(next_url)
         if not is_valid:
             await stream.__aexit__(None, None, None)
             return None, None, f"Redirect blocked: {error_msg}", chain_carries_credentials
@@ -339,6 +299,36 @@ def _normalize_volcengine_auth_level(value: Any) -> int | None:
     return auth_level
 
 
+def _result_cache(ctx: ToolContext, kind: str, ttl_s: int) -> WebResultCache | None:
+    """Build the runtime-dir result cache for *kind*, or None when caching is off."""
+    cache_config = ctx.config.web.cache
+    if not cache_config.enable or ttl_s <= 0:
+        return None
+    return WebResultCache.for_runtime(kind, ttl_s=ttl_s, max_disk_entries=cache_config.max_entries)
+
+
+@dataclass(slots=True)
+class _FetchedPage:
+    """Extracted page text before truncation; this is what web_fetch caches."""
+
+    final_url: str
+    status: int
+    extractor: str
+    text: str
+
+    def render(self, url: str, max_chars: int) -> str:
+        text = self.text
+        truncated = len(text) > max_chars
+        if truncated:
+            text = text[:max_chars]
+        text = f"{_UNTRUSTED_BANNER}\n\n{text}"
+        return json.dumps({
+            "url": url, "finalUrl": self.final_url, "status": self.status,
+            "extractor": self.extractor, "truncated": truncated, "length": len(text),
+            "untrusted": True, "text": text,
+        }, ensure_ascii=False)
+
+
 @tool_parameters(
     tool_parameters_schema(
         query=StringSchema("Search query"),
@@ -385,14 +375,15 @@ class WebSearchTool(Tool):
         config_loader: Callable[[], WebSearchConfig] | None = None
         if ctx.provider_snapshot_loader is not None:
             def _load_search_config() -> WebSearchConfig:
-                from nanobot.config.loader import load_config, resolve_config_env_vars
-                return resolve_config_env_vars(load_config()).tools.web.search
+                from nanobot.config.snapshot import load_config_snapshot
+                return load_config_snapshot(resolve_env=True, shared=True).tools.web.search
             config_loader = _load_search_config
         return cls(
             config=ctx.config.web.search,
             proxy=ctx.config.web.proxy,
             user_agent=ctx.config.web.user_agent,
             config_loader=config_loader,
+            cache=_result_cache(ctx, "search", ctx.config.web.cache.search_ttl_seconds),
         )
 
     def __init__(
@@ -401,11 +392,17 @@ class WebSearchTool(Tool):
         proxy: str | None = None,
         user_agent: str | None = None,
         config_loader: Callable[[], WebSearchConfig] | None = None,
+        cache: WebResultCache | None = None,
     ):
         self.config = config if config is not None else WebSearchConfig()
         self.proxy = proxy
         self.user_agent = user_agent if user_agent is not None else _DEFAULT_USER_AGENT
         self._config_loader = config_loader
+        self.cache = cache
+        # Set when a provider search fell back to DuckDuckGo in this task.
+        self._served_by_duckduckgo: ContextVar[bool] = ContextVar(
+            "web_search_served_by_duckduckgo", default=False
+        )
 
     def _refresh_config(self) -> None:
         if self._config_loader is None:
@@ -415,6 +412,10 @@ class WebSearchTool(Tool):
         except Exception:
             logger.exception("Failed to refresh web search config")
 
+    def _http(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Shared keep-alive client for the search provider APIs."""
+        return pooled_client(proxy=self.proxy, http2=True)
+
     def _effective_provider(self) -> str:
         """Resolve the backend that execute() will actually use."""
         self._refresh_config()
@@ -480,17 +481,40 @@ class WebSearchTool(Tool):
         self._refresh_config()
         provider = self.config.provider.strip().lower() or "brave"
         n = min(max(count or self.config.max_results, 1), 10)
+        options: dict[str, Any] = {}
+        if provider == "volcengine":
+            options = {
+                "time_range": kwargs.get("timeRange", kwargs.get("time_range", time_range)),
+                "auth_level": kwargs.get("authLevel", kwargs.get("auth_level", auth_level)),
+                "query_rewrite": kwargs.get("queryRewrite", kwargs.get("query_rewrite", query_rewrite)),
+            }
+        elif provider == "bocha":
+            options = {"freshness": kwargs.get("freshness", "noLimit")}
+
+        if self.cache is None:
+            return await self._search(provider, query, n, options)
+        # Key by the backend that will answer: without an API key the
+        # configured provider falls back to DuckDuckGo.
+        effective = self._effective_provider()
+        cache_key = self.cache.make_key(effective, query.strip(), n, options)
+        cached = await self.cache.get_fresh(cache_key)
+        if cached is not None:
+            return cached.payload["result"]
+        token = self._served_by_duckduckgo.set(False)
+        try:
+            result = await self._search(provider, query, n, options)
+            fell_back = effective != "duckduckgo" and self._served_by_duckduckgo.get()
+        finally:
+            self._served_by_duckduckgo.reset(token)
+        if not getattr(result, "is_error", False) and not fell_back:
+            await self.cache.put(cache_key, {"result": str(result)})
+        return result
 
+    async def _search(self, provider: str, query: str, n: int, options: dict[str, Any]) -> str:
         if provider == "olostep":
             return await self._search_olostep(query, n)
         if provider == "volcengine":
-            return await self._search_volcengine(
-                query,
-                n,
-                time_range=kwargs.get("timeRange", kwargs.get("time_range", time_range)),
-                auth_level=kwargs.get("authLevel", kwargs.get("auth_level", auth_level)),
-                query_rewrite=kwargs.get("queryRewrite", kwargs.get("query_rewrite", query_rewrite)),
-            )
+            return await self._search_volcengine(query, n, **options)
         if provider == "duckduckgo":
             return await self._search_duckduckgo(query, n)
         elif provider == "tavily":
@@ -506,11 +530,7 @@ class WebSearchTool(Tool):
         elif provider == "exa":
             return await self._search_exa(query, n)
         elif provider == "bocha":
-            return await self._search_bocha(
-                query,
-                n,
-                freshness=kwargs.get("freshness", "noLimit"),
-            )
+            return await self._search_bocha(query, n, **options)
         elif provider == "keenable":
             return await self._search_keenable(query, n)
         elif provider == "serper":
@@ -591,7 +611,7 @@ class WebSearchTool(Tool):
                 "X-Subscription-Token": api_key,
                 "User-Agent": self.user_agent,
             }
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r: httpx.Response | None = None
                 for attempt in range(2):
                     r = await client.get(
@@ -628,7 +648,7 @@ class WebSearchTool(Tool):
             logger.warning("TAVILY_API_KEY not set, falling back to DuckDuckGo")
             return await self._search_duckduckgo(query, n)
         try:
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     "https://api.tavily.com/search",
                     headers={"Authorization": f"Bearer {api_key}", "User-Agent": self.user_agent},
@@ -654,7 +674,7 @@ class WebSearchTool(Tool):
         else:
             url += "/public"
         try:
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     url,
                     headers=headers,
@@ -688,7 +708,7 @@ class WebSearchTool(Tool):
         if not is_valid:
             return ToolResult.error(f"Error: invalid SearXNG URL: {error_msg}")
         try:
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.get(
                     endpoint,
                     params={"q": query, "format": "json"},
@@ -712,7 +732,7 @@ class WebSearchTool(Tool):
                 "User-Agent": self.user_agent,
             }
             encoded_query = quote(query, safe="")
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.get(
                     f"https://s.jina.ai/{encoded_query}",
                     headers=headers,
@@ -735,7 +755,7 @@ class WebSearchTool(Tool):
             logger.warning("KAGI_API_KEY not set, falling back to DuckDuckGo")
             return await self._search_duckduckgo(query, n)
         try:
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     "https://kagi.com/api/v1/search",
                     json={"query": query, "limit": n},
@@ -767,7 +787,7 @@ class WebSearchTool(Tool):
                 "numResults": n,
                 "contents": {"highlights": True},
             }
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     "https://api.exa.ai/search",
                     headers=headers,
@@ -819,7 +839,7 @@ class WebSearchTool(Tool):
                 "Content-Type": "application/json",
                 "User-Agent": self.user_agent,
             }
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     "https://google.serper.dev/search",
                     headers=headers,
@@ -891,7 +911,7 @@ class WebSearchTool(Tool):
             "X-Traffic-Tag": _VOLCENGINE_TRAFFIC_TAG,
         }
         try:
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     _VOLCENGINE_SEARCH_API_URL,
                     headers=headers,
@@ -967,6 +987,7 @@ class WebSearchTool(Tool):
         return _format_results(query, items, n)
 
     async def _search_duckduckgo(self, query: str, n: int) -> str:
+        self._served_by_duckduckgo.set(True)
         try:
             # Note: duckduckgo_search is synchronous and does its own requests
             # We run it in a thread to avoid blocking the loop
@@ -1008,7 +1029,7 @@ class WebSearchTool(Tool):
                 "summary": True,
                 "count": n,
             }
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._http() as client:
                 r = await client.post(
                     _BOCHA_SEARCH_API_URL,
                     headers=headers,
@@ -1084,13 +1105,22 @@ class WebFetchTool(Tool):
             config=ctx.config.web.fetch,
             proxy=ctx.config.web.proxy,
             user_agent=ctx.config.web.user_agent,
+            cache=_result_cache(ctx, "fetch", ctx.config.web.cache.fetch_ttl_seconds),
         )
 
-    def __init__(self, config: WebFetchConfig | None = None, proxy: str | None = None, user_agent: str | None = None, max_chars: int = 50000):
+    def __init__(
+        self,
+        config: WebFetchConfig | None = None,
+        proxy: str | None = None,
+        user_agent: str | None = None,
+        max_chars: int = 50000,
+        cache: WebResultCache | None = None,
+    ):
         self.config = config if config is not None else WebFetchConfig()
         self.proxy = proxy
         self.user_agent = user_agent or _DEFAULT_USER_AGENT
         self.max_chars = max_chars
+        self.cache = cache
 
     @property
     def read_only(self) -> bool:
@@ -1106,24 +1136,31 @@ class WebFetchTool(Tool):
         url = url.strip(" \t\r\n`\"'")
         extract_mode = kwargs.pop("extractMode", extract_mode)
         max_chars = cast(int, kwargs.pop("maxChars", max_chars) or self.max_chars)
-        is_valid, error_msg = _validate_url_safe(url)
+        is_valid, error_msg = await _validate_url_safe(url)
         if not is_valid:
             return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url}, ensure_ascii=False)
 
+        cache_key: str | None = None
+        cached: WebCacheEntry | None = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(url, extract_mode, self.config.use_jina_reader)
+            cached = await self.cache.get(cache_key)
+            if cached is not None and cached.is_fresh(self.cache.ttl_s):
+                record_web_cache_lookup(self.cache.kind, hit=True)
+                return _FetchedPage(**cached.payload).render(url, max_chars)
+        headers = {"User-Agent": self.user_agent}
+        if cached is not None and cached.revalidatable:
+            headers.update(cached.conditional_headers())
+        validators: dict[str, str | None] = {}
+
         # Detect and fetch images directly to avoid Jina's textual image captioning.
         # This local preflight also proves that no credential-bearing URL occurs
         # in the redirect chain before the original URL may be sent to Jina.
         jina_remote_safe = False
         try:
-            async with httpx.AsyncClient(
-                **_fetch_client_kwargs(self.proxy, 15.0),
-            ) as client:
+            async with _fetch_client(self.proxy, 15.0) as client:
                 r, stream, redirect_error, chain_carries_credentials = (
-                    await _stream_with_safe_redirects(
-                        client,
-                        url,
-                        headers={"User-Agent": self.user_agent},
-                    )
+                    await _stream_with_safe_redirects(client, url, headers=headers)
                 )
                 if redirect_error:
                     return json.dumps({"error": redirect_error, "url": url}, ensure_ascii=False)
@@ -1132,6 +1169,15 @@ class WebFetchTool(Tool):
                 jina_remote_safe = not chain_carries_credentials
 
                 try:
+                    if r.status_code == 304 and self.cache and cache_key and cached is not None:
+                        # Origin confirmed the cached extraction is still current.
+                        await self.cache.refresh(cache_key, cached)
+                        record_web_cache_lookup(self.cache.kind, hit=True, revalidated=True)
+                        return _FetchedPage(**cached.payload).render(url, max_chars)
+                    validators = {
+                        "etag": r.headers.get("etag"),
+                        "last_modified": r.headers.get("last-modified"),
+                    }
                     ctype = r.headers.get("content-type", "")
                     if ctype.startswith("image/"):
                         r.raise_for_status()
@@ -1150,15 +1196,32 @@ class WebFetchTool(Tool):
                 type(e).__name__,
             )
 
-        result = None
+        if self.cache is not None:
+            record_web_cache_lookup(self.cache.kind, hit=False)
+        result: Any = None
         if self.config.use_jina_reader and jina_remote_safe:
-            result = await self._fetch_jina(url, max_chars)
+            result = await self._extract_jina(url)
         if result is None:
-            result = await self._fetch_readability(url, extract_mode, max_chars)
-        return result
+            result = await self._extract_readability(url, extract_mode)
+        if not isinstance(result, _FetchedPage):
+            return result
+        # Error pages are returned but not cached; the next call retries the origin.
+        if self.cache is not None and cache_key is not None and result.status < 400:
+            await self.cache.put(cache_key, asdict(result), **validators)
+        return result.render(url, max_chars)
 
     async def _fetch_jina(self, url: str, max_chars: int) -> str | None:
         """Try fetching via Jina Reader API. Returns None on failure."""
+        page = await self._extract_jina(url)
+        return page.render(url, max_chars) if page is not None else None
+
+    async def _fetch_readability(self, url: str, extract_mode: str, max_chars: int) -> Any:
+        """Local fallback using readability-lxml."""
+        result = await self._extract_readability(url, extract_mode)
+        return result.render(url, max_chars) if isinstance(result, _FetchedPage) else result
+
+    async def _extract_jina(self, url: str) -> _FetchedPage | None:
+        """Extract *url* via Jina Reader API. Returns None on failure."""
         if _url_carries_credentials(url):
             logger.debug(
                 "Skipping Jina Reader for {}: URL carries credential material",
@@ -1174,7 +1237,7 @@ class WebFetchTool(Tool):
             jina_key = os.environ.get("JINA_API_KEY", "")
             if jina_key:
                 headers["Authorization"] = f"Bearer {jina_key}"
-            async with httpx.AsyncClient(proxy=self.proxy, timeout=20.0) as client:
+            async with pooled_client(proxy=self.proxy, timeout=20.0, http2=True) as client:
                 r = await client.get(f"https://r.jina.ai/{forwarded_url}", headers=headers)
                 if r.status_code == 429:
                     logger.debug("Jina Reader rate limited, falling back to readability")
@@ -1189,16 +1252,9 @@ class WebFetchTool(Tool):
 
             if title:
                 text = f"# {title}\n\n{text}"
-            truncated = len(text) > max_chars
-            if truncated:
-                text = text[:max_chars]
-            text = f"{_UNTRUSTED_BANNER}\n\n{text}"
-
-            return json.dumps({
-                "url": url, "finalUrl": data.get("url", url), "status": r.status_code,
-                "extractor": "jina", "truncated": truncated, "length": len(text),
-                "untrusted": True, "text": text,
-            }, ensure_ascii=False)
+            return _FetchedPage(
+                final_url=data.get("url", url), status=r.status_code, extractor="jina", text=text
+            )
         except Exception as e:
             logger.debug(
                 "Jina Reader failed for {}, falling back to readability ({})",
@@ -1207,12 +1263,10 @@ class WebFetchTool(Tool):
             )
             return None
 
-    async def _fetch_readability(self, url: str, extract_mode: str, max_chars: int) -> Any:
-        """Local fallback using readability-lxml."""
+    async def _extract_readability(self, url: str, extract_mode: str) -> _FetchedPage | Any:
+        """Extract *url* locally with readability-lxml; non-page results are final tool output."""
         try:
-            async with httpx.AsyncClient(
-                **_fetch_client_kwargs(self.proxy, 30.0),
-            ) as client:
+            async with _fetch_client(self.proxy, 30.0) as client:
                 r, redirect_error = await _get_with_safe_redirects(
                     client,
                     url,
@@ -1244,16 +1298,7 @@ class WebFetchTool(Tool):
             else:
                 text, extractor = r.text, "raw"
 
-            truncated = len(text) > max_chars
-            if truncated:
-                text = text[:max_chars]
-            text = f"{_UNTRUSTED_BANNER}\n\n{text}"
-
-            return json.dumps({
-                "url": url, "finalUrl": str(r.url), "status": r.status_code,
-                "extractor": extractor, "truncated": truncated, "length": len(text),
-                "untrusted": True, "text": text,
-            }, ensure_ascii=False)
+            return _FetchedPage(final_url=str(r.url), status=r.status_code, extractor=extractor, text=text)
         except httpx.ProxyError as e:
             logger.warning(
                 "WebFetch proxy error for {} ({})",
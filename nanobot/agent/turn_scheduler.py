@@ -0,0 +1,298 @@
+"""Weighted fair admission for agent turns."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import AsyncGenerator, Iterable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Literal, cast
+
+from loguru import logger
+
+from nanobot.bus.events import InboundMessage
+from nanobot.session.automation_turns import automation_history_overrides
+
+TurnClass = Literal["interactive", "automation", "subagent"]
+TURN_CLASSES: tuple[TurnClass, ...] = ("interactive", "automation", "subagent")
+
+# Interactive turns win four of every six contended slots by default, so a
+# burst of scheduled work cannot starve users without starving itself.
+DEFAULT_CLASS_WEIGHTS: dict[TurnClass, float] = {"interactive": 4.0, "automation": 1.0, "subagent": 1.0}
+
+# Flows whose finish tag fell behind the class clock carry no credit; prune
+# them once the table grows past this size.
+_FLOW_TABLE_PRUNE_AT = 256
+
+
+def classify_turn(msg: InboundMessage) -> TurnClass:
+    """Return the scheduling class for one inbound turn."""
+    if msg.channel == "system" and msg.sender_id == "subagent":
+        return "subagent"
+    if msg.channel == "system":
+        return "automation"
+    _, automation_metadata = automation_history_overrides(msg.metadata)
+    if automation_metadata:
+        return "automation"
+    return "interactive"
+
+
+def model_limit_keys(model: str) -> tuple[str, ...]:
+    """Return the concurrency-limit keys a model is counted against.
+
+    A limit may name the exact model (``anthropic/claude-opus-4-5``) or its
+    provider prefix (``anthropic``).
+    """
+    if "/" not in model:
+        return (model,)
+    return (model, model.split("/", 1)[0])
+
+
+def format_turn_scheduler_stats(stats: Mapping[str, Any]) -> str:
+    """One ``/status`` line from :meth:`TurnScheduler.stats`."""
+    capacity = stats.get("capacity")
+    line = f"\u23f3 Turns: {stats.get('running', 0)}/{capacity if capacity else 'unlimited'} running"
+    parts: list[str] = []
+    for name, row in cast(Mapping[str, Mapping[str, Any]], stats.get("classes") or {}).items():
+        if not row.get("admitted") and not row.get("waiting"):
+            continue
+        parts.append(
+            f"{name} {row.get('waiting', 0)} queued, avg wait {row.get('avg_wait_ms') or 0:.0f} ms"
+        )
+    if parts:
+        line += "; " + ", ".join(parts)
+    return line
+
+
+@dataclass(slots=True)
+class _ClassStats:
+    waiting: int = 0
+    running: int = 0
+    admitted: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    last_wait_ms: float | None = None
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.admitted += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.last_wait_ms = wait_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "waiting": self.waiting,
+            "running": self.running,
+            "admitted": self.admitted,
+            "avg_wait_ms": round(self.total_wait_ms / self.admitted, 1) if self.admitted else None,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+            "last_wait_ms": round(self.last_wait_ms, 1) if self.last_wait_ms is not None else None,
+        }
+
+
+@dataclass(slots=True)
+class _Waiter:
+    turn_class: TurnClass
+    limit_keys: tuple[str, ...]
+    start_tag: float
+    seq: int
+    enqueued_at: float
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class TurnScheduler:
+    """Admit agent turns by class weight, per-session fairness and model limits.
+
+    Classes are served by stride scheduling on *class_weights*, so interactive
+    turns get most contended slots while automation and subagent turns keep
+    making progress.  Inside a class each session is a flow with start-time
+    fair queuing: a session's finish tag carries across turns, so one busy
+    chat yields to quieter ones.  *class_limits* and *concurrency_limits*
+    (keyed by model or provider prefix) cap running turns independently of
+    the overall *capacity*; ``None`` capacity means no overall cap.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None,
+        *,
+        class_weights: Mapping[TurnClass, float] | None = None,
+        class_limits: Mapping[TurnClass, int] | None = None,
+        channel_weights: Mapping[str, float] | None = None,
+        session_weights: Mapping[str, float] | None = None,
+        concurrency_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        self.capacity = capacity if capacity is not None and capacity > 0 else None
+        self._class_weights: dict[TurnClass, float] = {
+            **DEFAULT_CLASS_WEIGHTS,
+            **(class_weights or {}),
+        }
+        self._class_limits: dict[TurnClass, int] = dict(class_limits or {})
+        self._channel_weights = dict(channel_weights or {})
+        self._session_weights = dict(session_weights or {})
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self._waiters: dict[TurnClass, list[_Waiter]] = {name: [] for name in TURN_CLASSES}
+        self._stats: dict[TurnClass, _ClassStats] = {name: _ClassStats() for name in TURN_CLASSES}
+        self._class_pass: dict[TurnClass, float] = dict.fromkeys(TURN_CLASSES, 0.0)
+        self._class_clock: dict[TurnClass, float] = dict.fromkeys(TURN_CLASSES, 0.0)
+        self._flow_finish: dict[TurnClass, dict[str, float]] = {
+            name: {} for name in TURN_CLASSES
+        }
+        self._running_by_key: dict[str, int] = {}
+        self._running = 0
+        self._seq = itertools.count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def stats(self) -> dict[str, Any]:
+        """Return admission counters and queue wait times per class."""
+        return {
+            "capacity": self.capacity,
+            "running": self._running,
+            "classes": {name: stats.snapshot() for name, stats in self._stats.items()},
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        turn_class: TurnClass,
+        *,
+        session_key: str,
+        channel: str,
+        limit_keys: Iterable[str] = (),
+    ) -> AsyncGenerator[None, None]:
+        """Hold one admission slot for the duration of a turn."""
+        keys = tuple(key for key in limit_keys if key in self.concurrency_limits)
+        await self._acquire(turn_class, session_key, channel, keys)
+        try:
+            yield
+        finally:
+            self._release(turn_class, keys)
+            self._admit_waiters()
+
+    async def _acquire(
+        self,
+        turn_class: TurnClass,
+        session_key: str,
+        channel: str,
+        keys: tuple[str, ...],
+    ) -> None:
+        weight = self._flow_weight(session_key, channel)
+        flows = self._flow_finish[turn_class]
+        start_tag = max(self._class_clock[turn_class], flows.get(session_key, 0.0))
+        flows[session_key] = start_tag + 1.0 / weight
+        stats = self._stats[turn_class]
+        if not any(self._waiters.values()) and self._has_room(turn_class, keys):
+            self._class_clock[turn_class] = start_tag
+            self._advance_class_pass(turn_class)
+            self._occupy(turn_class, keys)
+            stats.record_wait(0.0)
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            turn_class=turn_class,
+            limit_keys=keys,
+            start_tag=start_tag,
+            seq=next(self._seq),
+            enqueued_at=time.monotonic(),
+            future=loop.create_future(),
+        )
+        if not self._waiters[turn_class]:
+            # A class that was idle rejoins at the current pass instead of
+            # spending credit banked while it had nothing to run.
+            self._class_pass[turn_class] = max(
+                self._class_pass[turn_class],
+                min(self._class_pass.values()),
+            )
+        self._waiters[turn_class].append(waiter)
+        stats.waiting += 1
+        # Queued turns may all be blocked on class or model limits this one
+        # does not share, so give it a chance to run right away.
+        self._admit_waiters()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(turn_class, keys)
+            else:
+                self._waiters[turn_class].remove(waiter)
+                stats.waiting -= 1
+            self._admit_waiters()
+            raise
+
+    def _flow_weight(self, session_key: str, channel: str) -> float:
+        weight = self._session_weights.get(session_key, self._channel_weights.get(channel, 1.0))
+        return weight if weight > 0 else 1.0
+
+    def _has_room(self, turn_class: TurnClass, keys: tuple[str, ...]) -> bool:
+        if self.capacity is not None and self._running >= self.capacity:
+            return False
+        class_limit = self._class_limits.get(turn_class)
+        if class_limit is not None and self._stats[turn_class].running >= class_limit:
+            return False
+        return all(
+            self._running_by_key.get(key, 0) < self.concurrency_limits[key] for key in keys
+        )
+
+    def _occupy(self, turn_class: TurnClass, keys: tuple[str, ...]) -> None:
+        self._running += 1
+        self._stats[turn_class].running += 1
+        for key in keys:
+            self._running_by_key[key] = self._running_by_key.get(key, 0) + 1
+
+    def _release(self, turn_class: TurnClass, keys: tuple[str, ...]) -> None:
+        self._running -= 1
+        self._stats[turn_class].running -= 1
+        for key in keys:
+            remaining = self._running_by_key.get(key, 0) - 1
+            if remaining > 0:
+                self._running_by_key[key] = remaining
+            else:
+                self._running_by_key.pop(key, None)
+
+    def _advance_class_pass(self, turn_class: TurnClass) -> None:
+        weight = self._class_weights.get(turn_class, 1.0)
+        self._class_pass[turn_class] += 1.0 / (weight if weight > 0 else 1.0)
+
+    def _admit_waiters(self) -> None:
+        while self.capacity is None or self._running < self.capacity:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            turn_class = waiter.turn_class
+            self._waiters[turn_class].remove(waiter)
+            stats = self._stats[turn_class]
+            stats.waiting -= 1
+            self._class_clock[turn_class] = waiter.start_tag
+            self._advance_class_pass(turn_class)
+            self._prune_flows(turn_class)
+            self._occupy(turn_class, waiter.limit_keys)
+            wait_ms = (time.monotonic() - waiter.enqueued_at) * 1000
+            stats.record_wait(wait_ms)
+            logger.debug("Admitted {} turn after {:.0f} ms in queue", turn_class, wait_ms)
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        queued: list[TurnClass] = [name for name in TURN_CLASSES if self._waiters[name]]
+        for turn_class in sorted(queued, key=self._class_pass.__getitem__):
+            eligible = [
+                waiter
+                for waiter in self._waiters[turn_class]
+                if not waiter.future.done() and self._has_room(turn_class, waiter.limit_keys)
+            ]
+            if eligible:
+                return min(eligible, key=lambda waiter: (waiter.start_tag, waiter.seq))
+        return None
+
+    def _prune_flows(self, turn_class: TurnClass) -> None:
+        flows = self._flow_finish[turn_class]
+        if len(flows) <= _FLOW_TABLE_PRUNE_AT:
+            return
+        clock = self._class_clock[turn_class]
+        for key in [key for key, finish in flows.items() if finish <= clock]:
+            del flows[key]
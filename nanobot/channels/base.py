@@ -52,9 +52,11 @@ class BaseChannel(ABC):
                 resolve_transcription_config,
                 transcribe_audio_file,
             )
-            from nanobot.config.loader import load_config
+            from nanobot.config.snapshot import load_config_snapshot
 
-            return await transcribe_audio_file(file_path, resolve_transcription_config(load_config()))
+            return await transcribe_audio_file(
+                file_path, resolve_transcription_config(load_config_snapshot(shared=True))
+            )
         except Exception:
             self.logger.exception("Audio transcription failed")
             return ""
@@ -118,6 +120,14 @@ class BaseChannel(ABC):
         """
         return True
 
+    def transport_status(self) -> dict[str, Any] | None:
+        """Return channel-owned transport health for the manager's runtime status.
+
+        ``None`` (the default) adds nothing; channels with their own send
+        queues can report depth and lag here.
+        """
+        return None
+
     def start_error_message(self, error: Exception) -> str | None:
         """Return an actionable public message for a channel startup failure.
 
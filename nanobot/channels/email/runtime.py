@@ -1,12 +1,15 @@
-"""Email channel implementation using IMAP polling + SMTP replies."""
+"""Email channel implementation using IMAP IDLE/polling + SMTP replies."""
 
 import asyncio
 import html
 import imaplib
 import mimetypes
 import re
+import select
 import smtplib
+import socket
 import ssl
+import time
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import date
@@ -54,6 +57,8 @@ class EmailConfig(Base):
 
     auto_reply_enabled: bool = True
     poll_interval_seconds: int = 30
+    imap_idle_enabled: bool = True  # Push via IMAP IDLE when the server advertises it
+    imap_idle_timeout_seconds: int = 600  # Re-issue IDLE (and re-check) at least this often
     mark_seen: bool = True
     post_action: Literal["delete", "move"] | None = None
     post_action_move_mailbox: str | None = None
@@ -77,9 +82,145 @@ class EmailConfig(Base):
 class _ServerFeatures:
     move: bool
     uidplus: bool
+    idle: bool = False
     uid_store: bool | None = None
 
 
+def _close_imap_client(client: Any) -> None:
+    with suppress(Exception):
+        client.logout()
+
+
+class _ImapIdleConnection:
+    """One logged-in, SELECTed IMAP connection that waits for mail with IDLE (RFC 2177).
+
+    ``imaplib`` has no IDLE support before Python 3.14, so the IDLE exchange
+    reads the socket directly; every other command goes through the wrapped
+    ``imaplib`` client.  :meth:`interrupt` wakes a blocked :meth:`wait` from
+    another thread.  The caller fetches once right after the connection is
+    opened, so the EXISTS count reported by SELECT is dropped here.
+    """
+
+    _CHANGE_RE = re.compile(rb"^\*\s+\d+\s+(EXISTS|RECENT)\b", re.IGNORECASE)
+    _DONE_TIMEOUT_S = 30.0
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self._buffer = b""
+        self._tag_counter = 0
+        self._interrupted = False
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._take_pending_changes()
+
+    def wait(self, timeout_s: float) -> bool:
+        """Block in IDLE until the mailbox reports new mail, *timeout_s* passes or
+        :meth:`interrupt` is called; return whether new mail was announced.
+
+        Returns immediately when imaplib already received an EXISTS or RECENT
+        response while running an earlier command.
+        """
+        if self._take_pending_changes():
+            return True
+        self._tag_counter += 1
+        tag = f"NBIDLE{self._tag_counter}".encode()
+        self.client.send(tag + b" IDLE\r\n")
+        changed = False
+        deadline = time.monotonic() + self._DONE_TIMEOUT_S
+        while True:
+            line = self._read_line(deadline, interruptible=False)
+            if line is None or line.startswith(tag + b" "):
+                raise imaplib.IMAP4.error(f"IDLE rejected: {line!r}")
+            if line.startswith(b"+"):
+                break
+            changed = changed or bool(self._CHANGE_RE.match(line))
+        deadline = time.monotonic() + timeout_s
+        while not changed and not self._interrupted:
+            line = self._read_line(deadline, interruptible=True)
+            if line is None:
+                break
+            changed = bool(self._CHANGE_RE.match(line))
+        self.client.send(b"DONE\r\n")
+        deadline = time.monotonic() + self._DONE_TIMEOUT_S
+        while True:
+            line = self._read_line(deadline, interruptible=False)
+            if line is None:
+                raise imaplib.IMAP4.abort("IDLE was not terminated by the server")
+            if line.startswith(tag + b" "):
+                if not line[len(tag) + 1 :].upper().startswith(b"OK"):
+                    raise imaplib.IMAP4.error(f"IDLE failed: {line!r}")
+                return changed
+            changed = changed or bool(self._CHANGE_RE.match(line))
+
+    def interrupt(self) -> None:
+        self._interrupted = True
+        with suppress(OSError):
+            self._wake_w.send(b"\0")
+
+    def close(self) -> None:
+        _close_imap_client(self.client)
+        for sock in (self._wake_r, self._wake_w):
+            with suppress(OSError):
+                sock.close()
+
+    def _take_pending_changes(self) -> bool:
+        """Consume EXISTS/RECENT responses that arrived outside IDLE.
+
+        imaplib keeps them in ``untagged_responses`` and may have read more
+        bytes into ``client.file`` than it parsed; both would otherwise be
+        invisible to the raw socket reads in :meth:`_read_line`.
+        """
+        responses = self.client.untagged_responses
+        changed = any([responses.pop("EXISTS", None), responses.pop("RECENT", None)])
+        self._drain_client_file()
+        while b"\n" in self._buffer:
+            line, _, self._buffer = self._buffer.partition(b"\n")
+            changed = bool(self._CHANGE_RE.match(line.rstrip(b"\r"))) or changed
+        return changed
+
+    def _drain_client_file(self) -> None:
+        sock = self.client.sock
+        timeout = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            while True:
+                try:
+                    chunk = self.client.file.read1(65536)
+                except (BlockingIOError, ssl.SSLWantReadError):
+                    break
+                if not chunk:
+                    break
+                self._buffer += chunk
+        finally:
+            sock.settimeout(timeout)
+
+    def _read_line(self, deadline: float, *, interruptible: bool) -> bytes | None:
+        sock = self.client.sock
+        while b"\n" not in self._buffer:
+            pending = sock.pending() if isinstance(sock, ssl.SSLSocket) else 0
+            if not pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                readable, _, _ = select.select([sock, self._wake_r], [], [], remaining)
+                if self._wake_r in readable:
+                    with suppress(OSError):
+                        self._wake_r.recv(64)
+                    if interruptible:
+                        return None
+                if sock not in readable:
+                    continue
+            try:
+                data = sock.recv(65536)
+            except ssl.SSLWantReadError:
+                continue
+            if not data:
+                raise imaplib.IMAP4.abort("socket error: EOF during IDLE")
+            self._buffer += data
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.rstrip(b"\r")
+
+
 class EmailChannel(BaseChannel):
     """
     Email channel.
@@ -138,6 +279,8 @@ class EmailChannel(BaseChannel):
         self._last_message_id_by_chat: dict[str, str] = {}
         self._processed_uids: set[str] = set()  # Capped to prevent unbounded growth
         self._MAX_PROCESSED_UIDS = 100000
+        self._idle_conn: _ImapIdleConnection | None = None
+        self._idle_supported: bool | None = None
 
     async def start(self) -> None:
         """Start polling IMAP for inbound emails."""
@@ -158,9 +301,18 @@ class EmailChannel(BaseChannel):
                 "Emails with spoofed From headers will be accepted. "
                 "Set verify_dkim=true and verify_spf=true for anti-spoofing protection."
             )
-        self.logger.info("Starting Email channel (IMAP polling mode)...")
+        self.logger.info(
+            "Starting Email channel (IMAP {} mode)...",
+            "IDLE" if self.config.imap_idle_enabled else "polling",
+        )
 
         poll_seconds = max(5, int(self.config.poll_interval_seconds))
+        try:
+            await self._run_inbound_loop(poll_seconds)
+        finally:
+            self._close_idle_connection()
+
+    async def _run_inbound_loop(self, poll_seconds: int) -> None:
         while self._running:
             try:
                 inbound_items, skipped_uids = await asyncio.to_thread(self._fetch_new_messages)
@@ -204,11 +356,55 @@ class EmailChannel(BaseChannel):
 
             if not self._running:
                 break
+            await self._wait_for_new_mail(poll_seconds)
+
+    async def _wait_for_new_mail(self, poll_seconds: int) -> None:
+        """IDLE on the persistent connection when possible, else sleep one poll interval."""
+        if not self.config.imap_idle_enabled or self._idle_supported is False:
             await asyncio.sleep(poll_seconds)
+            return
+        try:
+            idled = await asyncio.to_thread(self._idle_wait)
+        except Exception as exc:
+            self.logger.warning("IMAP IDLE interrupted, reconnecting after {}s: {}", poll_seconds, exc)
+            self._close_idle_connection()
+            idled = False
+        if not idled and self._running:
+            await asyncio.sleep(poll_seconds)
+
+    def _idle_wait(self) -> bool:
+        """Wait for new mail with IDLE; return False when IDLE is unavailable."""
+        conn = self._idle_conn
+        if conn is None:
+            mailbox = self.config.imap_mailbox or "INBOX"
+            client = self._open_imap_client(mailbox=mailbox, missing_mailbox_ok=True)
+            if client is None:
+                return False
+            if not self._server_features(client).idle:
+                self._idle_supported = False
+                _close_imap_client(client)
+                self.logger.info("IMAP server does not support IDLE; polling instead")
+                return False
+            self._idle_supported = True
+            self._idle_conn = _ImapIdleConnection(client)
+            # Mail that arrived since the last fetch is already counted in the
+            # SELECT reply and will never be announced in IDLE; fetch first.
+            return True
+        if not self._running:
+            return True
+        conn.wait(max(30, int(self.config.imap_idle_timeout_seconds)))
+        return True
+
+    def _close_idle_connection(self) -> None:
+        conn, self._idle_conn = self._idle_conn, None
+        if conn is not None:
+            conn.close()
 
     async def stop(self) -> None:
-        """Stop polling loop."""
+        """Stop the inbound loop, waking any pending IDLE."""
         self._running = False
+        if self._idle_conn is not None:
+            self._idle_conn.interrupt()
 
     async def send(self, msg: OutboundMessage) -> None:
         """Send email via SMTP."""
@@ -356,6 +552,13 @@ class EmailChannel(BaseChannel):
 
     def _fetch_new_messages(self) -> tuple[list[dict[str, Any]], set[str]]:
         """Poll IMAP and return parsed unread messages plus skipped message UIDs."""
+        conn = self._idle_conn
+        if conn is not None:
+            try:
+                return self._fetch_new_messages_batch(conn.client)
+            except Exception as exc:
+                self.logger.warning("IMAP IDLE connection failed, fetching over a new one: {}", exc)
+                self._close_idle_connection()
         return self._fetch_messages(
             search_criteria=("UNSEEN",),
             mark_seen=self.config.mark_seen,
@@ -363,6 +566,40 @@ class EmailChannel(BaseChannel):
             limit=0,
         )
 
+    def _fetch_new_messages_batch(self, client: Any) -> tuple[list[dict[str, Any]], set[str]]:
+        """Fetch every unseen, unprocessed message on an open connection with one UID FETCH."""
+        messages: list[dict[str, Any]] = []
+        skipped_uids: set[str] = set()
+        cycle_uids: set[str] = set()
+        status, data = client.uid("SEARCH", "UNSEEN")
+        if status != "OK" or not data or not data[0]:
+            return messages, skipped_uids
+        uids = [
+            uid
+            for raw in data[0].split()
+            if (uid := raw.decode("ascii", errors="ignore")) and uid not in self._processed_uids
+        ]
+        if not uids:
+            return messages, skipped_uids
+        status, fetched = client.uid("FETCH", ",".join(uids), "(BODY.PEEK[] UID)")
+        if status != "OK" or not fetched:
+            return messages, skipped_uids
+
+        seen_uids: list[str] = []
+        for item in fetched:
+            if not isinstance(item, tuple):
+                continue
+            fetched_item = cast(tuple[Any, ...], item)
+            raw_bytes = self._extract_message_bytes([fetched_item])
+            if raw_bytes is None:
+                continue
+            uid = self._extract_uid([fetched_item])
+            if self._consume_message(raw_bytes, uid, True, messages, skipped_uids, cycle_uids) and uid:
+                seen_uids.append(uid)
+        if seen_uids and self.config.mark_seen:
+            client.uid("STORE", ",".join(seen_uids), "+FLAGS", "(\\Seen)")
+        return messages, skipped_uids
+
     def fetch_messages_between_dates(
         self,
         start_date: date,
@@ -455,110 +692,117 @@ class EmailChannel(BaseChannel):
                     continue
 
                 uid = self._extract_uid(fetched)
-                if uid and uid in cycle_uids:
-                    continue
-                if dedupe and uid and uid in self._processed_uids:
-                    continue
-
-                parsed = BytesParser(policy=policy.default).parsebytes(raw_bytes)
-                sender = parseaddr(parsed.get("From", ""))[1].strip().lower()
-                if not sender:
-                    continue
-                if self._is_self_address(sender):
-                    self.logger.info("From {} ignored: matches bot-owned address", sender)
-                    self._remember_processed_uid(uid, dedupe, cycle_uids)
-                    if mark_seen:
-                        client.store(imap_id, "+FLAGS", "\\Seen")
-                    if uid:
-                        skipped_uids.add(uid)
-                    continue
-
-                # --- Anti-spoofing: verify Authentication-Results ---
-                spf_pass, dkim_pass = self._check_authentication_results(parsed)
-                if self.config.verify_spf and not spf_pass:
-                    self.logger.warning(
-                        "From {} rejected: SPF verification failed "
-                        "(no 'spf=pass' in Authentication-Results header)",
-                        sender,
-                    )
-                    self._remember_processed_uid(uid, dedupe, cycle_uids)
-                    if uid:
-                        skipped_uids.add(uid)
-                    continue
-                if self.config.verify_dkim and not dkim_pass:
-                    self.logger.warning(
-                        "From {} rejected: DKIM verification failed "
-                        "(no 'dkim=pass' in Authentication-Results header)",
-                        sender,
-                    )
-                    self._remember_processed_uid(uid, dedupe, cycle_uids)
-                    if uid:
-                        skipped_uids.add(uid)
-                    continue
+                if self._consume_message(raw_bytes, uid, dedupe, messages, skipped_uids, cycle_uids) and mark_seen:
+                    client.store(imap_id, "+FLAGS", "\\Seen")
+        finally:
+            _close_imap_client(client)
 
-                if not self.is_allowed(sender):
-                    self._remember_processed_uid(uid, dedupe, cycle_uids)
-                    if mark_seen:
-                        client.store(imap_id, "+FLAGS", "\\Seen")
-                    if uid:
-                        skipped_uids.add(uid)
-                    continue
+    def _consume_message(
+        self,
+        raw_bytes: bytes,
+        uid: str,
+        dedupe: bool,
+        messages: list[dict[str, Any]],
+        skipped_uids: set[str],
+        cycle_uids: set[str],
+    ) -> bool:
+        """Parse one fetched message into *messages* or *skipped_uids*; return whether to mark it seen."""
+        if uid and uid in cycle_uids:
+            return False
+        if dedupe and uid and uid in self._processed_uids:
+            return False
 
-                subject = self._decode_header_value(parsed.get("Subject", ""))
-                date_value = parsed.get("Date", "")
-                message_id = parsed.get("Message-ID", "").strip()
-                body = self._extract_text_body(parsed)
-
-                if not body:
-                    body = "(empty email body)"
-
-                body = body[: self.config.max_body_chars]
-                content = (
-                    f"[EMAIL-CONTEXT] Email received.\n"
-                    f"From: {sender}\n"
-                    f"Subject: {subject}\n"
-                    f"Date: {date_value}\n\n"
-                    f"{body}"
-                )
+        parsed = BytesParser(policy=policy.default).parsebytes(raw_bytes)
+        sender = parseaddr(parsed.get("From", ""))[1].strip().lower()
+        if not sender:
+            return False
+        if self._is_self_address(sender):
+            self.logger.info("From {} ignored: matches bot-owned address", sender)
+            self._remember_processed_uid(uid, dedupe, cycle_uids)
+            if uid:
+                skipped_uids.add(uid)
+            return True
+
+        # --- Anti-spoofing: verify Authentication-Results ---
+        spf_pass, dkim_pass = self._check_authentication_results(parsed)
+        if self.config.verify_spf and not spf_pass:
+            self.logger.warning(
+                "From {} rejected: SPF verification failed "
+                "(no 'spf=pass' in Authentication-Results header)",
+                sender,
+            )
+            self._remember_processed_uid(uid, dedupe, cycle_uids)
+            if uid:
+                skipped_uids.add(uid)
+            return False
+        if self.config.verify_dkim and not dkim_pass:
+            self.logger.warning(
+                "From {} rejected: DKIM verification failed "
+                "(no 'dkim=pass' in Authentication-Results header)",
+                sender,
+            )
+            self._remember_processed_uid(uid, dedupe, cycle_uids)
+            if uid:
+                skipped_uids.add(uid)
+            return False
 
-                # --- Attachment extraction ---
-                attachment_paths: list[str] = []
-                if self.config.allowed_attachment_types:
-                    saved = self._extract_attachments(
-                        parsed,
-                        uid or "noid",
-                        allowed_types=self.config.allowed_attachment_types,
-                        max_size=self.config.max_attachment_size,
-                        max_count=self.config.max_attachments_per_email,
-                    )
-                    for p in saved:
-                        attachment_paths.append(str(p))
-                        content += f"\n[attachment: {p.name} — saved to {p}]"
-
-                metadata = {
-                    "message_id": message_id,
-                    "subject": subject,
-                    "date": date_value,
-                    "sender_email": sender,
-                    "uid": uid,
-                }
-                messages.append(
-                    {
-                        "sender": sender,
-                        "subject": subject,
-                        "message_id": message_id,
-                        "content": content,
-                        "metadata": metadata,
-                        "media": attachment_paths,
-                    }
-                )
+        if not self.is_allowed(sender):
+            self._remember_processed_uid(uid, dedupe, cycle_uids)
+            if uid:
+                skipped_uids.add(uid)
+            return True
+
+        subject = self._decode_header_value(parsed.get("Subject", ""))
+        date_value = parsed.get("Date", "")
+        message_id = parsed.get("Message-ID", "").strip()
+        body = self._extract_text_body(parsed)
+
+        if not body:
+            body = "(empty email body)"
+
+        body = body[: self.config.max_body_chars]
+        content = (
+            f"[EMAIL-CONTEXT] Email received.\n"
+            f"From: {sender}\n"
+            f"Subject: {subject}\n"
+            f"Date: {date_value}\n\n"
+            f"{body}"
+        )
 
-                self._remember_processed_uid(uid, dedupe, cycle_uids)
+        # --- Attachment extraction ---
+        attachment_paths: list[str] = []
+        if self.config.allowed_attachment_types:
+            saved = self._extract_attachments(
+                parsed,
+                uid or "noid",
+                allowed_types=self.config.allowed_attachment_types,
+                max_size=self.config.max_attachment_size,
+                max_count=self.config.max_attachments_per_email,
+            )
+            for p in saved:
+                attachment_paths.append(str(p))
+                content += f"\n[attachment: {p.name} — saved to {p}]"
+
+        metadata = {
+            "message_id": message_id,
+            "subject": subject,
+            "date": date_value,
+            "sender_email": sender,
+            "uid": uid,
+        }
+        messages.append(
+            {
+                "sender": sender,
+                "subject": subject,
+                "message_id": message_id,
+                "content": content,
+                "metadata": metadata,
+                "media": attachment_paths,
+            }
+        )
 
-                if mark_seen:
-                    client.store(imap_id, "+FLAGS", "\\Seen")
-        finally:
-            self._close_imap_client(client)
+        self._remember_processed_uid(uid, dedupe, cycle_uids)
+        return True
 
     def _open_imap_client(self, mailbox: str, *, missing_mailbox_ok: bool = False) -> Any | None:
         if self.config.imap_use_ssl:
@@ -573,25 +817,20 @@ class EmailChannel(BaseChannel):
             except Exception as exc:
                 if missing_mailbox_ok and self._is_missing_mailbox_error(exc):
                     self.logger.warning("Mailbox unavailable, skipping poll for {}: {}", mailbox, exc)
-                    self._close_imap_client(client)
+                    _close_imap_client(client)
                     return None
                 raise
 
             if status != "OK":
                 self.logger.warning("Mailbox select returned {}, skipping poll for {}", status, mailbox)
-                self._close_imap_client(client)
+                _close_imap_client(client)
                 return None
         except Exception:
-            self._close_imap_client(client)
+            _close_imap_client(client)
             raise
 
         return client
 
-    @staticmethod
-    def _close_imap_client(client: Any) -> None:
-        with suppress(Exception):
-            client.logout()
-
     def _collect_self_addresses(self) -> set[str]:
         """Return normalized email addresses owned by this channel instance."""
         candidates = (
@@ -657,7 +896,7 @@ class EmailChannel(BaseChannel):
                 if uid:
                     self._apply_post_action(client, uid, features)
         finally:
-            self._close_imap_client(client)
+            _close_imap_client(client)
 
     def _apply_post_action(
         self,
@@ -700,7 +939,7 @@ class EmailChannel(BaseChannel):
                         caps.update(token.upper() for token in raw.decode("utf-8", errors="ignore").split())
                     elif isinstance(raw, str):
                         caps.update(token.upper() for token in raw.split())
-        return _ServerFeatures(move="MOVE" in caps, uidplus="UIDPLUS" in caps)
+        return _ServerFeatures(move="MOVE" in caps, uidplus="UIDPLUS" in caps, idle="IDLE" in caps)
 
     @staticmethod
     def _lookup_imap_id_by_uid(client: Any, uid: str) -> bytes | None:
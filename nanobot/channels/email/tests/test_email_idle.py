@@ -0,0 +1,220 @@
+"""IMAP IDLE push mode against an in-process IMAP stub."""
+
+from __future__ import annotations
+
+import asyncio
+import socketserver
+import threading
+from email.message import EmailMessage
+
+import pytest
+
+from nanobot.bus.queue import MessageBus
+from nanobot.channels.email.runtime import EmailChannel, EmailConfig
+
+
+def _raw_email(subject: str) -> bytes:
+    msg = EmailMessage()
+    msg["From"] = "alice@example.com"
+    msg["To"] = "bot@example.com"
+    msg["Subject"] = subject
+    msg["Message-ID"] = f"<{subject}@example.com>"
+    msg.set_content(f"body of {subject}")
+    return msg.as_bytes()
+
+
+class _Mailbox:
+    def __init__(self, *, idle: bool) -> None:
+        self.idle = idle
+        self.lock = threading.Lock()
+        self.messages: dict[int, bytes] = {}
+        self.seen: set[int] = set()
+        self.logins = 0
+        self.commands: list[str] = []
+        self.idlers: list[_IMAPHandler] = []
+        self.idling = threading.Event()
+
+    def deliver(self, uid: int, raw: bytes) -> None:
+        with self.lock:
+            self.messages[uid] = raw
+            count = len(self.messages)
+            idlers = list(self.idlers)
+        for handler in idlers:
+            handler.write(f"* {count} EXISTS\r\n".encode())
+
+    def uids(self) -> list[int]:
+        return sorted(self.messages)
+
+
+class _IMAPHandler(socketserver.StreamRequestHandler):
+    def write(self, data: bytes) -> None:
+        with self._write_lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def handle(self) -> None:
+        self._write_lock = threading.Lock()
+        box: _Mailbox = self.server.mailbox  # type: ignore[attr-defined]
+        self.write(b"* OK stub ready\r\n")
+        while line := self.rfile.readline():
+            tag, _, command = line.decode().rstrip("\r\n").partition(" ")
+            box.commands.append(command)
+            uid_mode = command.upper().startswith("UID ")
+            if uid_mode:
+                command = command[4:]
+            verb, _, args = command.partition(" ")
+            verb = verb.upper()
+            if verb == "CAPABILITY":
+                caps = "IMAP4rev1 UIDPLUS" + (" IDLE" if box.idle else "")
+                self.write(f"* CAPABILITY {caps}\r\n".encode())
+            elif verb == "LOGIN":
+                box.logins += 1
+            elif verb == "SELECT":
+                self.write(f"* {len(box.messages)} EXISTS\r\n".encode())
+            elif verb == "IDLE":
+                with box.lock:
+                    box.idlers.append(self)
+                self.write(b"+ idling\r\n")
+                box.idling.set()
+                self.rfile.readline()  # DONE
+                with box.lock:
+                    box.idlers.remove(self)
+                box.idling.clear()
+            elif verb == "SEARCH":
+                uids = box.uids()
+                hits = [
+                    str(uid if uid_mode else uids.index(uid) + 1)
+                    for uid in uids
+                    if uid not in box.seen
+                ]
+                self.write(f"* SEARCH {' '.join(hits)}\r\n".encode())
+            elif verb in {"FETCH", "STORE"}:
+                target, _, rest = args.partition(" ")
+                uids = box.uids()
+                selected = [
+                    int(part) if uid_mode else uids[int(part) - 1]
+                    for part in target.split(",")
+                ]
+                for uid in selected:
+                    if verb == "STORE":
+                        if "\\Seen" in rest:
+                            box.seen.add(uid)
+                        continue
+                    raw = box.messages[uid]
+                    seq = uids.index(uid) + 1
+                    self.write(f"* {seq} FETCH (UID {uid} BODY[] {{{len(raw)}}}\r\n".encode())
+                    self.write(raw + b")\r\n")
+            elif verb == "LOGOUT":
+                self.write(b"* BYE\r\n")
+                self.write(f"{tag} OK LOGOUT completed\r\n".encode())
+                return
+            else:
+                self.write(f"{tag} BAD unsupported\r\n".encode())
+                continue
+            self.write(f"{tag} OK {verb} completed\r\n".encode())
+
+
+@pytest.fixture
+def imap_stub():
+    servers: list[socketserver.ThreadingTCPServer] = []
+
+    def _start(*, idle: bool) -> tuple[_Mailbox, int]:
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _IMAPHandler)
+        server.daemon_threads = True
+        server.mailbox = _Mailbox(idle=idle)  # type: ignore[attr-defined]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server.mailbox, server.server_address[1]  # type: ignore[attr-defined]
+
+    yield _start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _config(port: int) -> EmailConfig:
+    return EmailConfig(
+        enabled=True,
+        consent_granted=True,
+        imap_host="127.0.0.1",
+        imap_port=port,
+        imap_use_ssl=False,
+        imap_username="bot@example.com",
+        imap_password="secret",
+        smtp_host="smtp.example.com",
+        smtp_username="bot@example.com",
+        smtp_password="secret",
+        allow_from=["*"],
+        verify_dkim=False,
+        verify_spf=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_idle_wakes_on_exists_and_batch_fetches_over_one_connection(imap_stub) -> None:
+    box, port = imap_stub(idle=True)
+    box.deliver(5, _raw_email("first"))
+    channel = EmailChannel(_config(port), MessageBus())
+    delivered: list[str] = []
+    second_delivered = asyncio.Event()
+
+    async def _handle_message(**kwargs):
+        delivered.append(kwargs["metadata"]["subject"])
+        if len(delivered) == 2:
+            second_delivered.set()
+
+    channel._handle_message = _handle_message  # type: ignore[method-assign]
+    task = asyncio.create_task(channel.start())
+    try:
+        assert await asyncio.to_thread(box.idling.wait, 5)
+        logins_before_push = box.logins
+        box.deliver(6, _raw_email("second"))
+        await asyncio.wait_for(second_delivered.wait(), 5)
+
+        assert delivered == ["first", "second"]
+        assert box.logins == logins_before_push
+        assert "UID FETCH 6 (BODY.PEEK[] UID)" in box.commands
+        assert box.seen == {5, 6}
+    finally:
+        await channel.stop()
+        await asyncio.wait_for(task, 5)
+    assert channel._idle_conn is None
+    assert box.commands[-1] == "LOGOUT"
+
+
+def test_idle_falls_back_to_polling_without_server_support(imap_stub) -> None:
+    box, port = imap_stub(idle=False)
+    channel = EmailChannel(_config(port), MessageBus())
+    channel._running = True
+
+    assert channel._idle_wait() is False
+    assert channel._idle_supported is False
+    assert channel._idle_conn is None
+    assert "IDLE" not in box.commands
+
+
+@pytest.mark.asyncio
+async def test_mail_arriving_before_idle_select_is_fetched_without_waiting(imap_stub) -> None:
+    box, port = imap_stub(idle=True)
+    channel = EmailChannel(_config(port), MessageBus())
+    delivered = asyncio.Event()
+    idle_wait = channel._idle_wait
+
+    def _idle_wait_after_delivery() -> bool:
+        if channel._idle_conn is None:
+            box.deliver(7, _raw_email("between"))
+        return idle_wait()
+
+    async def _handle_message(**kwargs):
+        assert kwargs["metadata"]["subject"] == "between"
+        delivered.set()
+
+    channel._idle_wait = _idle_wait_after_delivery  # type: ignore[method-assign]
+    channel._handle_message = _handle_message  # type: ignore[method-assign]
+    task = asyncio.create_task(channel.start())
+    try:
+        await asyncio.wait_for(delivered.wait(), 3)
+        assert box.seen == {7}
+    finally:
+        await channel.stop()
+        await asyncio.wait_for(task, 5)
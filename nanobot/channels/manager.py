@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import inspect
+from collections import deque
 from collections.abc import Awaitable, Callable, Iterable, Mapping
 from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -67,6 +69,82 @@ _BOOL_CAMEL_ALIASES: dict[str, str] = {
     "show_reasoning": "showReasoning",
 }
 
+@dataclass
+class _OutboundLane:
+    """One channel's outbound queue and the worker that drains it.
+
+    Each lane retries and backs off on its own, so a failing channel delays only
+    its own deliveries. :meth:`put` never waits: past ``capacity`` a stream delta
+    is merged into a queued delta of the same stream at the tail, and every
+    other message is still queued, so ``stream_end`` and final replies are never
+    dropped. Both cases count as overflows.
+    """
+
+    name: str
+    capacity: int
+    queue: deque[tuple[float, OutboundMessage]] = field(default_factory=deque)
+    pending: deque[tuple[float, OutboundMessage]] = field(default_factory=deque)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task[None] | None = None
+    sent: int = 0
+    failed: int = 0
+    overflowed: int = 0
+    last_latency_ms: float | None = None
+    max_latency_ms: float = 0.0
+
+    def put(self, enqueued_at: float, msg: OutboundMessage) -> None:
+        if len(self.queue) >= self.capacity:
+            if self.overflowed == 0:
+                logger.warning(
+                    "Outbound lane {} is full ({} queued); merging stream deltas",
+                    self.name,
+                    len(self.queue),
+                )
+            self.overflowed += 1
+            if self._merge_into_tail(msg):
+                return
+        self.queue.append((enqueued_at, msg))
+        self.ready.set()
+
+    async def get(self) -> tuple[float, OutboundMessage]:
+        while not self.queue:
+            self.ready.clear()
+            await self.ready.wait()
+        return self.queue.popleft()
+
+    def get_nowait(self) -> OutboundMessage:
+        if not self.queue:
+            raise asyncio.QueueEmpty
+        return self.queue.popleft()[1]
+
+    def _merge_into_tail(self, msg: OutboundMessage) -> bool:
+        event = outbound_event_from_message(msg)
+        if not self.queue or not isinstance(event, StreamDeltaEvent):
+            return False
+        enqueued_at, tail = self.queue[-1]
+        tail_event = outbound_event_from_message(tail)
+        if (
+            not isinstance(tail_event, StreamDeltaEvent)
+            or tail.chat_id != msg.chat_id
+            or tail_event.stream_id != event.stream_id
+        ):
+            return False
+        merged = replace_outbound_event(tail, tail_event, content=tail.content + msg.content)
+        self.queue[-1] = (enqueued_at, merged)
+        return True
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "queued": len(self.queue) + len(self.pending),
+            "capacity": self.capacity,
+            "sent": self.sent,
+            "failed": self.failed,
+            "overflowed": self.overflowed,
+            "last_latency_ms": self.last_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+
 def _default_channel_config(name: str) -> dict[str, Any] | None:
     from nanobot.channels.registry import load_channel_plugin
 
@@ -132,8 +210,11 @@ class ChannelManager:
         self._channel_errors: dict[str, str] = {}
         self._channel_tasks: dict[str, asyncio.Task[None]] = {}
         self._dispatch_task: asyncio.Task[None] | None = None
+        self._outbound_lanes: dict[str, _OutboundLane] = {}
         self._started = False
         self._origin_reply_fingerprints: dict[tuple[str, str, str], str] = {}
+        self._config_stale = False
+        self._unsubscribe_config: Callable[[], None] | None = None
 
         self._init_channels()
 
@@ -435,9 +516,8 @@ class ChannelManager:
                 "message": f"{plugin.display_name} is always enabled and is applied on restart.",
             }
 
-        from nanobot.config.loader import load_config
-
-        self.config = load_config()
+        self._reload_config()
+        self._config_stale = False
         section = self._channel_section(name, default_enabled=plugin.default_enabled)
         channel_setup_spec(name, plugin=plugin)
         instance_id = resolve_channel_action_target(instance_id)
@@ -581,6 +661,10 @@ class ChannelManager:
             return
 
         self._started = True
+        if getattr(self, "_unsubscribe_config", None) is None:
+            from nanobot.config.snapshot import config_snapshots
+
+            self._unsubscribe_config = config_snapshots().subscribe(self._on_config_changed)
         # Start outbound dispatcher
         self._dispatch_task = asyncio.create_task(self._dispatch_outbound())
 
@@ -638,10 +722,42 @@ class ChannelManager:
             deadline=deadline,
         )
 
+    def _on_config_changed(self, path: Path) -> None:
+        """Snapshot listener: mark ``self.config`` stale when our config file changed."""
+        if path.expanduser().resolve(strict=False) == getattr(self, "_config_path", None):
+            self._config_stale = True
+
+    def _sync_config(self) -> None:
+        """Reload ``self.config`` after the config file changed on disk."""
+        if not getattr(self, "_config_stale", False):
+            return
+        self._config_stale = False
+        try:
+            self._reload_config()
+        except Exception as e:
+            logger.warning("Keeping previous channel config, reload failed: {}", e)
+
+    def _reload_config(self) -> None:
+        """Re-read ``self.config`` from our config file as the gateway loaded it.
+
+        ``${VAR}`` references are resolved and the runtime workspace (which
+        ``--workspace`` may override) is kept, so rebuilt channels see the same
+        secrets and workspace as the ones started with the gateway.
+        """
+        from nanobot.config.snapshot import load_config_snapshot
+
+        fresh = load_config_snapshot(self._config_path, resolve_env=True)
+        fresh.agents.defaults.workspace = self.config.agents.defaults.workspace
+        self.config = fresh
+
     async def stop_all(self) -> None:
         """Stop all channels and the dispatcher."""
         logger.info("Stopping all channels...")
         self._started = False
+        unsubscribe_config = getattr(self, "_unsubscribe_config", None)
+        if unsubscribe_config is not None:
+            unsubscribe_config()
+            self._unsubscribe_config = None
 
         # Stop dispatcher
         if self._dispatch_task:
@@ -681,24 +797,24 @@ class ChannelManager:
         return False
 
     async def _dispatch_outbound(self) -> None:
-        """Dispatch outbound messages to the appropriate channel."""
-        logger.info("Outbound dispatcher started")
+        """Route outbound messages into per-channel lanes.
 
-        # Buffer for messages that couldn't be processed during delta coalescing
-        # (since asyncio.Queue doesn't support push_front)
-        pending: list[OutboundMessage] = []
+        Filtering happens here; delivery, retries, duplicate suppression and
+        stream-delta coalescing happen in each channel's lane worker.
+        """
+        logger.info("Outbound dispatcher started")
 
-        while True:
-            try:
-                # First check pending buffer before waiting on queue
-                if pending:
-                    msg = pending.pop(0)
-                else:
+        try:
+            while True:
+                try:
                     msg = await asyncio.wait_for(
                         self.bus.consume_outbound(),
                         timeout=1.0
                     )
+                except asyncio.TimeoutError:
+                    continue
 
+                self._sync_config()
                 event = outbound_event_from_message(msg)
                 progress_event = event if isinstance(event, ProgressEvent) else None
                 if progress_event and (
@@ -713,7 +829,7 @@ class ChannelManager:
                     # content silently drops here.
                     channel = self.channels.get(msg.channel)
                     if channel is not None and channel.show_reasoning:
-                        await self._send_with_retry(channel, msg)
+                        self._enqueue_outbound(msg)
                     continue
 
                 if progress_event:
@@ -736,34 +852,83 @@ class ChannelManager:
                 ):
                     continue
 
-                # Coalesce consecutive stream delta messages for the same (channel, chat_id)
-                # to reduce API calls and improve streaming latency
+                if msg.channel in self.channels:
+                    self._enqueue_outbound(msg)
+                else:
+                    logger.warning("Unknown channel: {}", msg.channel)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self._stop_outbound_lanes()
+
+    def _enqueue_outbound(self, msg: OutboundMessage) -> None:
+        """Hand *msg* to its channel lane without waiting on that lane."""
+        lanes = self._outbound_lanes
+        lane = lanes.get(msg.channel)
+        if lane is None or lane.task is None or lane.task.done():
+            lane = _OutboundLane(
+                name=msg.channel,
+                capacity=self.config.channels.outbound_queue_size,
+            )
+            lane.task = asyncio.create_task(self._run_outbound_lane(lane))
+            lanes[msg.channel] = lane
+        lane.put(asyncio.get_running_loop().time(), msg)
+
+    async def _stop_outbound_lanes(self) -> None:
+        lanes = list(self._outbound_lanes.values())
+        self._outbound_lanes = {}
+        for lane in lanes:
+            if lane.task is not None:
+                lane.task.cancel()
+        for lane in lanes:
+            if lane.task is not None:
+                with suppress(asyncio.CancelledError):
+                    await lane.task
+
+    async def _run_outbound_lane(self, lane: _OutboundLane) -> None:
+        """Deliver one channel's messages in order."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if lane.pending:
+                enqueued_at, msg = lane.pending.popleft()
+            else:
+                enqueued_at, msg = await lane.get()
+            try:
+                # Coalesce consecutive stream delta messages for the same
+                # (chat_id, stream_id) to reduce API calls and improve streaming latency
+                event = outbound_event_from_message(msg)
                 if isinstance(event, StreamDeltaEvent):
-                    msg, extra_pending = self._coalesce_stream_deltas(msg)
-                    pending.extend(extra_pending)
+                    msg, extra_pending = self._coalesce_stream_deltas(msg, lane.get_nowait)
+                    lane.pending.extend((enqueued_at, extra) for extra in extra_pending)
                     event = outbound_event_from_message(msg)
 
-                channel = self.channels.get(msg.channel)
-                if channel:
-                    # Duplicate suppression is scoped to a known source message
-                    # so repeated content from separate turns is still delivered.
-                    if (
-                        not isinstance(
-                            event,
-                            StreamDeltaEvent | StreamEndEvent | StreamedResponseEvent,
-                        )
-                    ):
-                        if self._should_suppress_outbound(msg):
-                            logger.info("Suppressing duplicate outbound message to {}:{}", msg.channel, msg.chat_id)
-                            continue
-                    await self._send_with_retry(channel, msg)
+                channel = self.channels.get(lane.name)
+                if channel is None:
+                    logger.warning("Unknown channel: {}", lane.name)
+                    continue
+                # Duplicate suppression is scoped to a known source message
+                # so repeated content from separate turns is still delivered.
+                if (
+                    not isinstance(
+                        event,
+                        StreamDeltaEvent | StreamEndEvent | StreamedResponseEvent,
+                    )
+                ):
+                    if self._should_suppress_outbound(msg):
+                        logger.info("Suppressing duplicate outbound message to {}:{}", msg.channel, msg.chat_id)
+                        continue
+                if await self._send_with_retry(channel, msg):
+                    lane.sent += 1
                 else:
-                    logger.warning("Unknown channel: {}", msg.channel)
-
-            except asyncio.TimeoutError:
-                continue
+                    lane.failed += 1
+                latency_ms = (loop.time() - enqueued_at) * 1000
+                lane.last_latency_ms = latency_ms
+                lane.max_latency_ms = max(lane.max_latency_ms, latency_ms)
             except asyncio.CancelledError:
-                break
+                raise
+            except Exception:
+                lane.failed += 1
+                logger.exception("Outbound lane {} failed to deliver a message", lane.name)
 
     @staticmethod
     async def _send_reasoning_delta(
@@ -847,16 +1012,21 @@ class ChannelManager:
             await channel.send(msg)
 
     def _coalesce_stream_deltas(
-        self, first_msg: OutboundMessage
+        self,
+        first_msg: OutboundMessage,
+        next_nowait: Callable[[], OutboundMessage] | None = None,
     ) -> tuple[OutboundMessage, list[OutboundMessage]]:
         """Merge consecutive stream deltas for the same (channel, chat_id, stream_id).
 
         This reduces the number of API calls when the queue has accumulated multiple
         deltas, which happens when LLM generates faster than the channel can process.
+        ``next_nowait`` pulls the next queued message (raising ``asyncio.QueueEmpty``);
+        it defaults to the bus outbound queue, and lanes pass their own queue.
 
         Returns:
             tuple of (merged_message, list_of_non_matching_messages)
         """
+        pull = next_nowait or self.bus.outbound.get_nowait
         first_event = outbound_event_from_message(first_msg)
         first_stream_id = first_event.stream_id if isinstance(first_event, StreamDeltaEvent) else None
         target_key = (first_msg.channel, first_msg.chat_id, first_stream_id)
@@ -872,7 +1042,7 @@ class ChannelManager:
         # stop and hand that boundary back to the dispatcher via `pending`.
         while True:
             try:
-                next_msg = self.bus.outbound.get_nowait()
+                next_msg = pull()
             except asyncio.QueueEmpty:
                 break
 
@@ -917,11 +1087,12 @@ class ChannelManager:
         msg: OutboundMessage,
         *,
         deadline: float | None = None,
-    ) -> None:
+    ) -> bool:
         """Send a message with retry on failure using exponential backoff.
 
         When deadline is provided, retry until that monotonic time instead of
-        stopping at the configured attempt limit.
+        stopping at the configured attempt limit. Returns whether the message
+        was delivered.
 
         Note: CancelledError is re-raised to allow graceful shutdown.
         """
@@ -932,7 +1103,7 @@ class ChannelManager:
             attempt += 1
             try:
                 await self._send_once(channel, msg)
-                return  # Send succeeded
+                return True  # Send succeeded
             except asyncio.CancelledError:
                 raise  # Propagate cancellation for graceful shutdown
             except Exception as e:
@@ -943,7 +1114,7 @@ class ChannelManager:
                         type(e).__name__,
                         e,
                     )
-                    return
+                    return False
                 loop = asyncio.get_running_loop()
                 exhausted = (
                     attempt >= max_attempts
@@ -955,7 +1126,7 @@ class ChannelManager:
                         "Failed to send to {} after {} attempts",
                         msg.channel, attempt,
                     )
-                    return
+                    return False
                 delay = _SEND_RETRY_DELAYS[min(attempt - 1, len(_SEND_RETRY_DELAYS) - 1)]
                 if deadline is not None:
                     delay = min(delay, max(0.0, deadline - loop.time()))
@@ -986,6 +1157,7 @@ class ChannelManager:
             )
         tasks = getattr(self, "_channel_tasks", {})
         errors = getattr(self, "_channel_errors", {})
+        lanes: dict[str, _OutboundLane] = getattr(self, "_outbound_lanes", {})
         status: dict[str, Any] = {}
         for runtime_name, (owner, instance_id) in runtime_specs.items():
             channel = self.channels.get(runtime_name)
@@ -1009,6 +1181,11 @@ class ChannelManager:
             }
             if error:
                 status[runtime_name]["error"] = error
+            lane = lanes.get(runtime_name)
+            if lane is not None:
+                status[runtime_name]["outbound"] = lane.status()
+            if channel is not None and (transport := channel.transport_status()) is not None:
+                status[runtime_name]["transport"] = transport
         return status
 
     @property
@@ -11,7 +11,7 @@ import re
 import ssl
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,7 +20,6 @@ from urllib.parse import urlsplit, urlunsplit
 
 from pydantic import Field, PrivateAttr, field_validator, model_validator
 from websockets.asyncio.server import ServerConnection, serve, unix_serve
-from websockets.exceptions import ConnectionClosed
 from websockets.http11 import Request as WsRequest
 
 from nanobot.bus.events import (
@@ -41,6 +40,7 @@ from nanobot.bus.outbound_events import (
 )
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
+from nanobot.channels.websocket.writer import ConnectionWriter
 from nanobot.command.builtin import USER_SHELL_COMMAND, builtin_command_starts_agent_turn
 from nanobot.config.schema import Base
 from nanobot.runtime_context import (
@@ -101,6 +101,8 @@ from nanobot.webui.websocket_logging import websockets_server_logger
 _WEBUI_HTTP_OPEN_TIMEOUT_S = 360.0
 _WEBUI_REQUEST_CACHE_TTL_S = 5 * 60.0
 _WEBUI_REQUEST_CACHE_MAX = 256
+# How long a fan-out waits for a caught-up client before treating it as lagging.
+_FANOUT_STALL_S = 0.5
 
 
 _ROUTING_ASSERTION_HEADERS = frozenset(
@@ -397,6 +399,8 @@ class WebSocketChannel(BaseChannel):
         self._conn_default: dict[ServerConnection, str] = {}
         # Connections authenticated with a one-time token from /webui/bootstrap.
         self._webui_connections: set[ServerConnection] = set()
+        # connection -> bounded outbound queue drained by its own writer task.
+        self._writers: dict[ServerConnection, ConnectionWriter] = {}
         # Delivery tasks are connection-bound, while operations are keyed only
         # by request_id so reconnect retries join or replay the original work.
         self._webui_request_tasks: dict[
@@ -543,6 +547,8 @@ class WebSocketChannel(BaseChannel):
         self._conn_default.pop(connection, None)
         self._webui_connections.discard(connection)
         self._discard_webui_request_lock_if_idle(connection)
+        if (writer := self._writers.pop(connection, None)) is not None:
+            writer.close()
 
     async def _maybe_push_persisted_goal_state(self, chat_id: str) -> None:
         """Replay actionable goal state after *chat_id* is subscribed.
@@ -590,16 +596,18 @@ class WebSocketChannel(BaseChannel):
         payload: dict[str, Any] = {"event": event}
         payload.update(fields)
         raw = json.dumps(payload, ensure_ascii=False)
-        try:
-            await connection.send(raw)
-        except ConnectionClosed:
-            await self._cleanup_connection(connection)
-        except Exception as e:
-            self.logger.warning("failed to send {} event: {}", event, e)
+        done = self._writer(connection).submit(raw, label=f" {event} ")
+        if done is not None:
+            # Failures were already logged by the writer; control events are best effort.
+            with suppress(Exception):
+                await done
 
     async def _broadcast_webui_event(self, event: str, **fields: Any) -> None:
-        for connection in tuple(self._webui_connections):
-            await self._send_event(connection, event, **fields)
+        payload: dict[str, Any] = {"event": event}
+        payload.update(fields)
+        raw = json.dumps(payload, ensure_ascii=False)
+        with suppress(Exception):
+            await self._fan_out(tuple(self._webui_connections), raw, label=f" {event} ")
 
     async def _broadcast_user_message(
         self,
@@ -647,10 +655,8 @@ class WebSocketChannel(BaseChannel):
         if active_turn_id is not None and started_at is not None:
             body["started_at"] = started_at
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in tuple(self._subs.get(chat_id, ())):
-            if connection is origin:
-                continue
-            await self._safe_send_to(connection, raw, label=" user_message ")
+        peers = [c for c in self._subs.get(chat_id, ()) if c is not origin]
+        await self._fan_out(peers, raw, label=" user_message ")
 
     @classmethod
     def default_config(cls) -> dict[str, Any]:
@@ -1600,6 +1606,9 @@ class WebSocketChannel(BaseChannel):
         self._webui_request_tasks.clear()
         self._webui_request_locks.clear()
         self._webui_request_operations.clear()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
         self._subs.clear()
         self._conn_chats.clear()
         self._conn_default.clear()
@@ -1615,14 +1624,56 @@ class WebSocketChannel(BaseChannel):
         label: str = "",
     ) -> None:
         """Send a raw frame to one connection, cleaning up on ConnectionClosed."""
-        try:
-            await connection.send(raw)
-        except ConnectionClosed:
-            await self._cleanup_connection(connection)
-            self.logger.warning("connection gone{}", label)
-        except Exception:
-            self.logger.exception("send failed{}", label)
-            raise
+        await self._fan_out((connection,), raw, label=label)
+
+    def _writer(self, connection: ServerConnection) -> ConnectionWriter:
+        writer = self._writers.get(connection)
+        if writer is None:
+            writer = self._writers[connection] = ConnectionWriter(
+                connection,
+                on_closed=lambda: self._cleanup_connection(connection),
+            )
+        return writer
+
+    async def _fan_out(
+        self,
+        conns: Iterable[ServerConnection],
+        raw: str,
+        *,
+        label: str = "",
+        body: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue one serialised frame for every connection in *conns*.
+
+        Waits (briefly) only for connections that were caught up, so a client
+        that is already behind never holds up the others or the dispatcher.
+        Send errors from caught-up connections propagate to the caller.
+        """
+        waits: list[asyncio.Future[None]] = []
+        for connection in conns:
+            writer = self._writer(connection)
+            caught_up = not writer.busy
+            done = writer.submit(raw, label=label, body=body)
+            if done is not None and caught_up:
+                waits.append(done)
+        if not waits:
+            return
+        finished, _ = await asyncio.wait(waits, timeout=_FANOUT_STALL_S)
+        for done in finished:
+            if not done.cancelled() and (exc := done.exception()) is not None:
+                raise exc
+
+    def transport_status(self) -> dict[str, Any] | None:
+        return {"connections": self.connection_lag()}
+
+    def connection_lag(self) -> list[dict[str, Any]]:
+        """Return send-queue depth and lag for every open connection."""
+        lag: list[dict[str, Any]] = []
+        for connection, writer in self._writers.items():
+            entry = writer.snapshot()
+            entry["chat_ids"] = sorted(self._conn_chats.get(connection, ()))
+            lag.append(entry)
+        return lag
 
     def _persist_turn_transcript_event(
         self,
@@ -1851,8 +1902,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(payload, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" ")
+        await self._fan_out(conns, raw, label=" ")
 
     async def send_reasoning_delta(
         self,
@@ -1890,8 +1940,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(body, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" reasoning ")
+        await self._fan_out(conns, raw, label=" reasoning ", body=body)
 
     async def send_reasoning_end(
         self,
@@ -1921,8 +1970,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(body, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" reasoning_end ")
+        await self._fan_out(conns, raw, label=" reasoning_end ")
 
     async def send_file_edit_events(
         self,
@@ -1945,8 +1993,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(payload, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" file_edit ")
+        await self._fan_out(conns, raw, label=" file_edit ")
 
     async def send_delta(
         self,
@@ -2001,8 +2048,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(body, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" stream ")
+        await self._fan_out(conns, raw, label=" stream ", body=body)
 
     async def send_turn_end(
         self,
@@ -2054,8 +2100,7 @@ class WebSocketChannel(BaseChannel):
         raw = json.dumps(body, ensure_ascii=False)
         if not conns:
             return
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" turn_end ")
+        await self._fan_out(conns, raw, label=" turn_end ")
 
     async def send_goal_state(self, chat_id: str, blob: dict[str, Any]) -> None:
         """Push persisted goal-state snapshot for *chat_id* (multi-chat isolation)."""
@@ -2064,8 +2109,7 @@ class WebSocketChannel(BaseChannel):
             return
         body = {"event": "goal_state", "chat_id": chat_id, "goal_state": blob}
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" goal_state ")
+        await self._fan_out(conns, raw, label=" goal_state ")
 
     async def send_goal_status(
         self,
@@ -2089,8 +2133,7 @@ class WebSocketChannel(BaseChannel):
         if turn_id:
             body["turn_id"] = turn_id
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" goal_status ")
+        await self._fan_out(conns, raw, label=" goal_status ")
 
     async def send_session_updated(self, chat_id: str, *, scope: str | None = None) -> None:
         """Notify WebUI clients that a session row should refresh."""
@@ -2101,8 +2144,7 @@ class WebSocketChannel(BaseChannel):
         if scope:
             body["scope"] = scope
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" session_updated ")
+        await self._fan_out(conns, raw, label=" session_updated ")
 
     async def send_user_input(
         self,
@@ -2126,8 +2168,7 @@ class WebSocketChannel(BaseChannel):
         if provenance:
             body["provenance"] = provenance
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" user_message ")
+        await self._fan_out(conns, raw, label=" user_message ")
 
     async def send_runtime_model_updated(
         self,
@@ -2146,8 +2187,7 @@ class WebSocketChannel(BaseChannel):
         if isinstance(model_preset, str) and model_preset.strip():
             body["model_preset"] = model_preset.strip()
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" runtime_model_updated ")
+        await self._fan_out(conns, raw, label=" runtime_model_updated ")
 
     async def send_turn_model_updated(
         self,
@@ -2178,5 +2218,4 @@ class WebSocketChannel(BaseChannel):
         if fallback:
             body["fallback"] = True
         raw = json.dumps(body, ensure_ascii=False)
-        for connection in conns:
-            await self._safe_send_to(connection, raw, label=" turn_model_updated ")
+        await self._fan_out(conns, raw, label=" turn_model_updated ")
@@ -2337,6 +2337,71 @@ async def test_send_delta_emits_delta_and_stream_end() -> None:
     assert second["stream_id"] == "sid"
     assert "text" not in second
 
+@pytest.mark.asyncio
+async def test_slow_connection_does_not_hold_back_other_subscribers(monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.channels.websocket.runtime._FANOUT_STALL_S", 0.01)
+    bus = MagicMock()
+    channel = WebSocketChannel({"enabled": True, "allowFrom": ["*"], "streaming": True}, bus, gateway=_basic_handler(bus))
+    unblock = asyncio.Event()
+    slow_frames: list[dict[str, Any]] = []
+
+    async def slow_send(raw: str) -> None:
+        await unblock.wait()
+        slow_frames.append(json.loads(raw))
+
+    slow_ws = AsyncMock()
+    slow_ws.send.side_effect = slow_send
+    fast_ws = AsyncMock()
+    channel._attach(slow_ws, "chat-1")
+    channel._attach(fast_ws, "chat-1")
+
+    for chunk in ("a", "b", "c", "d"):
+        await asyncio.wait_for(channel.send_delta("chat-1", chunk, stream_id="s"), timeout=1)
+    await asyncio.wait_for(
+        channel.send_delta("chat-1", "", stream_id="s", stream_end=True), timeout=1
+    )
+
+    fast_events = [json.loads(call[0][0]) for call in fast_ws.send.call_args_list]
+    assert [e["event"] for e in fast_events] == ["delta"] * 4 + ["stream_end"]
+    lag = channel.connection_lag()
+    assert sorted(entry["queued"] for entry in lag) == [0, 2]
+    assert all(entry["chat_ids"] == ["chat-1"] for entry in lag)
+
+    unblock.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # The first chunk was already on the wire; the rest merged while waiting.
+    assert [(e["event"], e.get("text")) for e in slow_frames] == [
+        ("delta", "a"),
+        ("delta", "bcd"),
+        ("stream_end", None),
+    ]
+    slow_stats = next(e for e in channel.connection_lag() if e["coalesced"])
+    assert slow_stats == {**slow_stats, "queued": 0, "sent": 3, "coalesced": 2}
+
+
+@pytest.mark.asyncio
+async def test_connection_too_far_behind_is_closed_for_replay(monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.channels.websocket.runtime._FANOUT_STALL_S", 0.01)
+    bus = MagicMock()
+    channel = WebSocketChannel({"enabled": True, "allowFrom": ["*"], "streaming": True}, bus, gateway=_basic_handler(bus))
+    never = asyncio.Event()
+
+    async def stuck_send(raw: str) -> None:
+        await never.wait()
+
+    stuck_ws = AsyncMock()
+    stuck_ws.send.side_effect = stuck_send
+    channel._attach(stuck_ws, "chat-1")
+    channel._writer(stuck_ws)._max_queued = 2
+
+    # Separate streams cannot be merged, so every frame takes a queue slot.
+    for idx in range(4):
+        await channel.send_delta("chat-1", "x", stream_id=f"s{idx}")
+    await asyncio.sleep(0)
+
+    stuck_ws.close.assert_awaited_once_with(1013, "client too slow")
+
 
 @pytest.mark.asyncio
 async def test_send_delta_preserves_webui_source_metadata() -> None:
@@ -2304,9 +2304,10 @@ async def test_session_delete_removes_file(
 ) -> None:
     monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
     sm = _seed_session(tmp_path, key="websocket:doomed")
-    from nanobot.webui.transcript import append_transcript_object
+    from nanobot.webui.transcript import append_transcript_object, flush_webui_transcripts
 
     append_transcript_object("websocket:doomed", {"event": "user", "chat_id": "doomed", "text": "x"})
+    flush_webui_transcripts()
     channel = _ch(bus, session_manager=sm, port=29903)
     server_task = asyncio.create_task(channel.start())
     try:
@@ -2334,13 +2335,14 @@ async def test_session_delete_removes_transcript_without_canonical_file(
 ) -> None:
     monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
     sm = SessionManager(tmp_path / "workspace")
-    from nanobot.webui.transcript import append_transcript_object
+    from nanobot.webui.transcript import append_transcript_object, flush_webui_transcripts
 
     key = "websocket:transcript-only"
     append_transcript_object(
         key,
         {"event": "user", "chat_id": "transcript-only", "text": "recover me"},
     )
+    flush_webui_transcripts()
     assert not sm._get_session_path(key).exists()
     webui_path = tmp_path / "webui" / f"{SessionManager.safe_key(key)}.jsonl"
     assert webui_path.is_file()
@@ -3082,6 +3084,50 @@ async def test_webui_thread_negotiates_gzip_for_large_payloads(
         await server_task
 
 
+@pytest.mark.asyncio
+async def test_webui_thread_answers_unchanged_threads_with_304(
+    bus: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from nanobot.webui.transcript import append_transcript_object
+
+    monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
+    key = "websocket:etag-thread"
+    sm = _seed_session(tmp_path, key=key)
+    for event in (
+        {"event": "user", "chat_id": "etag-thread", "text": "hi"},
+        {"event": "message", "chat_id": "etag-thread", "text": "hello back"},
+        {"event": "turn_end", "chat_id": "etag-thread"},
+    ):
+        append_transcript_object(key, event)
+    port = _free_port()
+    channel = _ch(bus, session_manager=sm, workspace_path=tmp_path, port=port)
+    server_task = asyncio.create_task(channel.start())
+    try:
+        token = channel.gateway.tokens.issue_api_token(300)
+        url = f"http://127.0.0.1:{port}/api/sessions/websocket%3Aetag-thread/webui-thread"
+        first = await _http_get(url, headers={"Authorization": f"Bearer {token}"})
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        unchanged = await _http_get(
+            url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+        )
+        assert unchanged.status_code == 304
+        assert unchanged.headers["ETag"] == etag
+        assert unchanged.content == b""
+
+        append_transcript_object(key, {"event": "user", "chat_id": "etag-thread", "text": "again"})
+        changed = await _http_get(
+            url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["messages"][-1]["content"] == "again"
+    finally:
+        await channel.stop()
+        await server_task
+
+
 @pytest.mark.asyncio
 async def test_session_delete_rejects_non_websocket_keys(
     bus: MagicMock, tmp_path: Path
@@ -0,0 +1,178 @@
+"""Per-connection outbound queues for WebSocket fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from websockets.asyncio.server import ServerConnection
+from websockets.exceptions import ConnectionClosed
+
+# Deltas that pile up behind a slow client are merged, so only frames that
+# must arrive individually count toward this bound.
+MAX_QUEUED_FRAMES = 256
+_COALESCED_EVENTS = frozenset({"delta", "reasoning_delta"})
+# 1013 "try again later": the client reconnects and replays the transcript.
+_SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+def _ignore_unretrieved(future: asyncio.Future[None]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+@dataclass(slots=True)
+class _Frame:
+    raw: str
+    label: str
+    enqueued_at: float
+    done: asyncio.Future[None]
+    # Only delta frames keep their payload, so later chunks can be merged in.
+    body: dict[str, Any] | None = field(default=None, repr=False)
+
+    def coalesces_with(self, body: dict[str, Any]) -> bool:
+        return (
+            self.body is not None
+            and self.body.get("event") == body.get("event")
+            and self.body.get("chat_id") == body.get("chat_id")
+            and self.body.get("stream_id") == body.get("stream_id")
+        )
+
+
+class ConnectionWriter:
+    """Bounded send queue drained by one writer task per connection.
+
+    Callers enqueue pre-serialised frames and get a future that resolves once
+    the frame was written (or the connection went away), so a slow browser
+    only delays itself.  While frames wait, consecutive ``delta`` and
+    ``reasoning_delta`` chunks of one stream merge into a single frame; every
+    other frame, including ``stream_end``, is delivered as is.  A client that
+    still falls :data:`MAX_QUEUED_FRAMES` behind is closed so it can
+    reconnect and replay the transcript instead of growing the queue forever.
+    """
+
+    def __init__(
+        self,
+        connection: ServerConnection,
+        *,
+        on_closed: Callable[[], Awaitable[None]],
+        max_queued: int = MAX_QUEUED_FRAMES,
+    ) -> None:
+        self._connection = connection
+        self._on_closed = on_closed
+        self._max_queued = max_queued
+        self._queue: deque[_Frame] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._current: _Frame | None = None
+        self._closed = False
+        self.sent = 0
+        self.coalesced = 0
+        self.last_lag_ms: float | None = None
+        self.max_lag_ms = 0.0
+
+    @property
+    def busy(self) -> bool:
+        """True while an earlier frame is still queued or being written."""
+        return self._task is not None
+
+    def submit(
+        self,
+        raw: str,
+        *,
+        label: str = "",
+        body: dict[str, Any] | None = None,
+    ) -> asyncio.Future[None] | None:
+        """Queue *raw*; pass the decoded *body* to let delta frames coalesce."""
+        if self._closed:
+            return None
+        if body is not None and body.get("event") not in _COALESCED_EVENTS:
+            body = None
+        if body is not None and self._queue and self._queue[-1].coalesces_with(body):
+            last = self._queue[-1]
+            assert last.body is not None
+            merged = {**last.body, "text": f"{last.body.get('text', '')}{body.get('text', '')}"}
+            last.body = merged
+            last.raw = json.dumps(merged, ensure_ascii=False)
+            self.coalesced += 1
+            return last.done
+        if len(self._queue) >= self._max_queued:
+            logger.warning(
+                "websocket client fell {} frames behind; closing slow connection",
+                len(self._queue),
+            )
+            self.close()
+            asyncio.get_running_loop().create_task(
+                self._connection.close(_SLOW_CLIENT_CLOSE_CODE, "client too slow")
+            )
+            return None
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        done.add_done_callback(_ignore_unretrieved)
+        self._queue.append(
+            _Frame(
+                raw=raw,
+                label=label,
+                enqueued_at=time.monotonic(),
+                done=done,
+                body=body,
+            )
+        )
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        return done
+
+    def close(self) -> None:
+        """Drop queued frames and stop the writer; safe from the writer itself."""
+        self._closed = True
+        frames = [*self._queue, *([self._current] if self._current is not None else [])]
+        self._queue.clear()
+        for frame in frames:
+            if not frame.done.done():
+                frame.done.set_result(None)
+        task = self._task
+        self._task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "last_lag_ms": round(self.last_lag_ms, 1) if self.last_lag_ms is not None else None,
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
+
+    async def _drain(self) -> None:
+        while self._queue and not self._closed:
+            frame = self._current = self._queue.popleft()
+            try:
+                await self._connection.send(frame.raw)
+            except ConnectionClosed:
+                # Hold this frame's waiter until subscriptions are cleaned up.
+                self._current = None
+                self.close()
+                await self._on_closed()
+                logger.warning("connection gone{}", frame.label)
+                if not frame.done.done():
+                    frame.done.set_result(None)
+                return
+            except Exception as e:
+                logger.exception("send failed{}", frame.label)
+                if not frame.done.done():
+                    frame.done.set_exception(e)
+                continue
+            lag_ms = (time.monotonic() - frame.enqueued_at) * 1000
+            self.sent += 1
+            self.last_lag_ms = lag_ms
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            if not frame.done.done():
+                frame.done.set_result(None)
+        self._current = None
+        if not self._closed:
+            self._task = None
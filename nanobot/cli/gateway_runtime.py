@@ -271,14 +271,23 @@ async def _close_gateway_runtime(
             task.cancel()
     if runtime_tasks is not None and not runtime_tasks.done():
         runtime_tasks.cancel()
+    from nanobot.utils.http_pool import close_http_clients, http_client_pool_stats
+
     for label, close in (
         ("agent", agent.aclose),
         ("MCP provider", mcp_provider.aclose),
+        ("HTTP client pool", close_http_clients),
     ):
         try:
             await asyncio.wait_for(close(), timeout=close_timeout)
         except BaseException as exc:  # noqa: BLE001 - shutdown must proceed
             logger.warning("Gateway shutdown: {} cleanup incomplete: {}", label, exc)
+    logger.debug("Gateway shutdown: HTTP client pool {}", http_client_pool_stats())
+    from nanobot.webui.token_usage import flush_token_usage
+    from nanobot.webui.transcript import flush_webui_transcripts
+
+    await asyncio.to_thread(flush_token_usage)
+    await asyncio.to_thread(flush_webui_transcripts)
     # Retrieving an already-finished gather prevents noisy unhandled exceptions,
     # but never wait for it here: its children were bounded individually above.
     if runtime_tasks is not None and runtime_tasks.done():
@@ -308,6 +317,7 @@ def _run_gateway(
     from nanobot.bus.queue import MessageBus
     from nanobot.bus.runtime_events import RuntimeEventBus
     from nanobot.channels.manager import ChannelManager
+    from nanobot.config.snapshot import config_snapshots
     from nanobot.config.watcher import watch_config_file
     from nanobot.cron.bound_runner import run_bound_cron_job
     from nanobot.cron.service import CronJobSkippedError, CronService
@@ -410,7 +420,10 @@ def _run_gateway(
 
     # Create cron service with workspace-scoped store
     cron_store_path = config.workspace_path / "cron" / "jobs.json"
-    cron = CronService(cron_store_path)
+    cron = CronService(
+        cron_store_path,
+        max_concurrent_jobs=config.gateway.cron_max_concurrent_jobs,
+    )
     trigger_store = LocalTriggerStore(config.workspace_path)
 
     turn_delivery_factory = TurnDeliveryFactory(
@@ -857,6 +870,11 @@ def _run_gateway(
             tasks,
             console.print,
         )
+        # Config edits (file watcher, WebUI saves) reach the agent as snapshot
+        # invalidations; the next admission re-reads the shared snapshot.
+        unsubscribe_config = config_snapshots().subscribe(
+            lambda _path: agent.invalidate_runtime_config()
+        )
         try:
             await cron.start()
             # Re-read once on first admission to close the watcher subscription window.
@@ -880,7 +898,7 @@ def _run_gateway(
                 asyncio.create_task(
                     watch_config_file(
                         Path(config_path),
-                        lambda: agent.invalidate_runtime_config(),
+                        lambda: config_snapshots().invalidate(Path(config_path)),
                     ),
                     name="nanobot-config-watcher",
                 ),
@@ -891,6 +909,7 @@ def _run_gateway(
                         store=trigger_store,
                         submit_turn=agent.submit_local_trigger_turn,
                         is_channel_enabled=lambda name: channels.get_channel(name) is not None,
+                        max_concurrent=config.gateway.trigger_max_concurrent_deliveries,
                     ),
                     name="nanobot-local-triggers",
                 ),
@@ -960,6 +979,7 @@ def _run_gateway(
                 if flushed:
                     logger.info("Shutdown: flushed {} session(s) to disk", flushed)
             finally:
+                unsubscribe_config()
                 restore_shutdown_handlers()
 
     with gateway_runtime.foreground_instance(gateway_start_options):
@@ -890,7 +890,7 @@ def _handle_search_provider_field(
     working_model: BaseModel, field_name: str, field_display: str, current_value: Any
 ) -> None:
     """Handle the web-search 'provider' field with the search-engine list."""
-    from nanobot.agent.tools.web import SEARCH_PROVIDER_OPTIONS
+    from nanobot.agent.tools.config import SEARCH_PROVIDER_OPTIONS
 
     choices = [opt["name"] for opt in SEARCH_PROVIDER_OPTIONS]
     default_choice = current_value if current_value in choices else choices[0]
@@ -910,7 +910,7 @@ def _resolve_field_handler(model: BaseModel, field_name: str) -> Any:
     """Resolve the handler for a field. WebSearchConfig shares the bare "provider"
     name with LLM configs but needs the search-engine picker, not the LLM list."""
     if field_name == "provider":
-        from nanobot.agent.tools.web import WebSearchConfig
+        from nanobot.agent.tools.config import WebSearchConfig
         if isinstance(model, WebSearchConfig):
             return _handle_search_provider_field
     return _FIELD_HANDLERS.get(field_name)
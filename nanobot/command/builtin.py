@@ -254,6 +254,37 @@ async def cmd_restart(ctx: CommandContext) -> OutboundMessage:
     )
 
 
+def _runtime_status_lines(loop: AgentLoop) -> list[str]:
+    """Process-wide queue and cache summaries for ``/status``; each source is best-effort."""
+    lines: list[str] = []
+    with suppress(Exception):
+        from nanobot.agent.turn_scheduler import format_turn_scheduler_stats
+
+        lines.append(format_turn_scheduler_stats(loop.turn_scheduler_stats()))
+    with suppress(Exception):
+        from nanobot.triggers.local_runner import (
+            format_local_trigger_queue_stats,
+            local_trigger_queue_stats,
+        )
+
+        trigger_stats = local_trigger_queue_stats()
+        if trigger_stats["active"]:
+            lines.append(format_local_trigger_queue_stats(trigger_stats))
+    with suppress(Exception):
+        from nanobot.security.network import dns_resolution_stats, format_dns_resolution_stats
+
+        dns_stats = dns_resolution_stats()
+        if dns_stats["lookups"] or dns_stats["cache_hits"]:
+            lines.append(format_dns_resolution_stats(dns_stats))
+    with suppress(Exception):
+        from nanobot.utils.http_pool import format_http_client_pool_stats, http_client_pool_stats
+
+        pool_stats = http_client_pool_stats()
+        if pool_stats["hits"] or pool_stats["misses"]:
+            lines.append(format_http_client_pool_stats(pool_stats))
+    return lines
+
+
 async def cmd_status(ctx: CommandContext) -> OutboundMessage:
     """Build an outbound status message for a session."""
     loop = ctx.loop
@@ -279,6 +310,11 @@ async def cmd_status(ctx: CommandContext) -> OutboundMessage:
             api_key=search_cfg.api_key or None,
         )
         search_usage_text = usage.format()
+    admission_text: str | None = None
+    with suppress(Exception):
+        status = runtime.provider.admission_status(runtime.model)
+        admission_text = status if isinstance(status, str) else None
+    runtime_lines = _runtime_status_lines(loop)
     active_tasks = loop._active_tasks.get(ctx.key, [])  # pyright: ignore[reportPrivateUsage]
     task_count = sum(1 for t in active_tasks if not t.done())
     with suppress(Exception):
@@ -293,6 +329,8 @@ async def cmd_status(ctx: CommandContext) -> OutboundMessage:
             session_msg_count=len(session.get_history(max_messages=0)),
             context_tokens_estimate=ctx_est,
             search_usage_text=search_usage_text,
+            admission_text=admission_text,
+            runtime_lines=runtime_lines,
             active_task_count=task_count,
             max_completion_tokens=runtime.generation.max_tokens,
         ),
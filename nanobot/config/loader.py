@@ -173,6 +173,10 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     # Temp + replace so a crash mid-write cannot leave a truncated config.json.
     _write_text_atomic(path, json.dumps(data, indent=2, ensure_ascii=False))
 
+    from nanobot.config.snapshot import config_snapshots
+
+    config_snapshots().invalidate(path)
+
 
 def merge_missing_defaults(existing: object, defaults: object) -> object:
     """Recursively add missing defaults without replacing configured values."""
@@ -12,12 +12,14 @@ from nanobot.config_base import Base
 from nanobot.cron.types import CronSchedule
 
 if TYPE_CHECKING:
-    from nanobot.agent.tools.cli_apps import CliAppsToolConfig
-    from nanobot.agent.tools.filesystem import FileToolsConfig
-    from nanobot.agent.tools.image_generation import ImageGenerationToolConfig
-    from nanobot.agent.tools.self import MyToolConfig
-    from nanobot.agent.tools.shell import ExecToolConfig
-    from nanobot.agent.tools.web import WebToolsConfig
+    from nanobot.agent.tools.config import (
+        CliAppsToolConfig,
+        ExecToolConfig,
+        FileToolsConfig,
+        ImageGenerationToolConfig,
+        MyToolConfig,
+        WebToolsConfig,
+    )
 
 
 class ChannelsConfig(Base):
@@ -35,6 +37,7 @@ class ChannelsConfig(Base):
     show_reasoning: bool = True  # surface model reasoning when channel implements it
     extract_document_text: bool = True  # Deprecated and ignored; documents are read on demand
     send_max_retries: int = Field(default=3, ge=0, le=10)  # Max delivery attempts (initial send included)
+    outbound_queue_size: int = Field(default=1000, ge=1, le=100_000)  # Per-channel outbound lane capacity
     transcription_provider: str = "groq"  # Deprecated: use top-level transcription.provider
     transcription_language: str | None = Field(default=None, pattern=r"^[a-z]{2,3}$")  # Deprecated: use top-level transcription.language
 
@@ -80,6 +83,32 @@ class DreamConfig(Base):
         return f"every {hours}h"
 
 
+class TurnSchedulerConfig(Base):
+    """Admission weights and limits for concurrent agent turns."""
+
+    class_weights: dict[Literal["interactive", "automation", "subagent"], float] = Field(
+        default_factory=dict
+    )  # Relative share of contended slots per class (defaults 4 / 1 / 1)
+    class_limits: dict[Literal["interactive", "automation", "subagent"], int] = Field(
+        default_factory=dict
+    )  # Max running turns per class, e.g. {"subagent": 1}
+    channel_weights: dict[str, float] = Field(default_factory=dict)  # Per-channel flow weight
+    session_weights: dict[str, float] = Field(default_factory=dict)  # Per-session flow weight
+    concurrency_limits: dict[str, int] = Field(
+        default_factory=dict
+    )  # Max running turns per model ("anthropic/claude-opus-4-5") or provider prefix ("anthropic")
+
+    @field_validator(
+        "class_weights", "class_limits", "channel_weights", "session_weights", "concurrency_limits"
+    )
+    @classmethod
+    def validate_positive(cls, value: dict[Any, Any]) -> dict[Any, Any]:
+        for key, item in value.items():
+            if item <= 0:
+                raise ValueError(f"{key!r} must be greater than 0")
+        return value
+
+
 class InlineFallbackConfig(Base):
     """One inline fallback model configuration."""
 
@@ -164,6 +193,7 @@ class AgentDefaults(Base):
         serialization_alias="consolidationRatio",
     )  # Consolidation target ratio (0.5 = 50% of budget retained after compression)
     dream: DreamConfig = Field(default_factory=DreamConfig)
+    turn_scheduler: TurnSchedulerConfig = Field(default_factory=TurnSchedulerConfig)
 
     @model_validator(mode="before")
     @classmethod
@@ -366,6 +396,8 @@ class GatewayConfig(Base):
     host: str = "127.0.0.1"  # Safer default: local-only bind.
     port: int = 18790
     restart_mode: Literal["auto", "exec", "spawn", "exit"] = "auto"
+    cron_max_concurrent_jobs: int = Field(default=4, ge=1, le=64)
+    trigger_max_concurrent_deliveries: int = Field(default=4, ge=1, le=64)
     heartbeat: HeartbeatConfig = Field(default_factory=HeartbeatConfig)
 
 
@@ -395,17 +427,17 @@ class ToolsConfig(Base):
     """Tools configuration.
 
     Field types for tool-specific sub-configs are resolved via model_rebuild()
-    at the bottom of this file so tool config classes can stay next to their
-    tool implementations.
+    at the bottom of this file; the classes live in ``nanobot.agent.tools.config``
+    so resolving them does not import the tool implementations.
     """
 
-    web: WebToolsConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.web", "WebToolsConfig"))
-    exec: ExecToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.shell", "ExecToolConfig"))
-    file: FileToolsConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.filesystem", "FileToolsConfig"))
-    cli_apps: CliAppsToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.cli_apps", "CliAppsToolConfig"))
-    my: MyToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.self", "MyToolConfig"))
+    web: WebToolsConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "WebToolsConfig"))
+    exec: ExecToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "ExecToolConfig"))
+    file: FileToolsConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "FileToolsConfig"))
+    cli_apps: CliAppsToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "CliAppsToolConfig"))
+    my: MyToolConfig = Field(default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "MyToolConfig"))
     image_generation: ImageGenerationToolConfig = Field(
-        default_factory=lambda: _lazy_default("nanobot.agent.tools.image_generation", "ImageGenerationToolConfig"),
+        default_factory=lambda: _lazy_default("nanobot.agent.tools.config", "ImageGenerationToolConfig"),
     )
     max_session_messages_per_minute: int = Field(default=6, ge=1)
     restrict_to_workspace: bool = False  # policy intent: keep tool access inside workspace when possible
@@ -686,12 +718,17 @@ def _resolve_tool_config_refs() -> None:
     """
     import sys
 
-    from nanobot.agent.tools.cli_apps import CliAppsToolConfig
-    from nanobot.agent.tools.filesystem import FileToolsConfig
-    from nanobot.agent.tools.image_generation import ImageGenerationToolConfig
-    from nanobot.agent.tools.self import MyToolConfig
-    from nanobot.agent.tools.shell import ExecToolConfig
-    from nanobot.agent.tools.web import WebFetchConfig, WebSearchConfig, WebToolsConfig
+    from nanobot.agent.tools.config import (
+        CliAppsToolConfig,
+        ExecToolConfig,
+        FileToolsConfig,
+        ImageGenerationToolConfig,
+        MyToolConfig,
+        WebCacheConfig,
+        WebFetchConfig,
+        WebSearchConfig,
+        WebToolsConfig,
+    )
 
     # Re-export into this module's namespace
     mod = sys.modules[__name__]
@@ -701,6 +738,7 @@ def _resolve_tool_config_refs() -> None:
     mod.WebToolsConfig = WebToolsConfig  # type: ignore[attr-defined]
     mod.WebSearchConfig = WebSearchConfig  # type: ignore[attr-defined]
     mod.WebFetchConfig = WebFetchConfig  # type: ignore[attr-defined]
+    mod.WebCacheConfig = WebCacheConfig  # type: ignore[attr-defined]
     mod.MyToolConfig = MyToolConfig  # type: ignore[attr-defined]
     mod.ImageGenerationToolConfig = ImageGenerationToolConfig  # type: ignore[attr-defined]
 
@@ -0,0 +1,213 @@
+"""Process-wide cache of parsed ``config.json`` snapshots.
+
+:func:`nanobot.config.loader.load_config` reads, migrates and validates the
+file on every call.  Hot paths (provider snapshots, the preset catalog, web
+search settings, channel transcription) only need to know whether the file
+changed, so :class:`ConfigSnapshotService` keeps one parsed ``Config`` per
+path keyed by the file's inode, mtime and size, confirmed by a content hash.
+A lookup is a ``stat`` call unless the file actually changed.
+
+Callers get a private deep copy they may hold and mutate.  Read-only hot
+paths pass ``shared=True`` to receive the cached instance itself, which
+must not be mutated; code that edits and saves the configuration keeps
+using ``load_config``.  Subscribers registered with
+:meth:`ConfigSnapshotService.subscribe` are notified when a path's content
+changes or is explicitly invalidated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from nanobot.config.loader import (
+    _ENV_REF_PATTERN,  # pyright: ignore[reportPrivateUsage]
+    get_config_path,
+    load_config,
+    resolve_config_env_vars,
+)
+from nanobot.config.schema import Config
+
+ConfigChangeListener = Callable[[Path], None]
+
+# Files modified this recently are re-hashed on every lookup: filesystem
+# timestamps are coarse enough that two same-sized writes in one tick can
+# leave the stat key unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_StatKey = tuple[int, int, int] | None
+
+
+@dataclass(slots=True)
+class _Snapshot:
+    stat_key: _StatKey
+    digest: str
+    config: Config
+    env_names: frozenset[str]
+    resolved: Config | None = None
+    resolved_env: tuple[str | None, ...] = ()
+
+
+class ConfigSnapshotService:
+    """Parsed ``Config`` per file path, re-read only when the file changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._snapshots: dict[Path, _Snapshot] = {}
+        self._listeners: list[ConfigChangeListener] = []
+        self.hits = 0
+        self.reloads = 0
+
+    def get(
+        self,
+        config_path: Path | None = None,
+        *,
+        resolve_env: bool = False,
+        shared: bool = False,
+    ) -> Config:
+        """Return the snapshot for *config_path* (default: the active config).
+
+        The result is a deep copy unless ``shared`` is set, in which case the
+        cached instance is returned and must be treated as read-only.  With
+        ``resolve_env`` the ``${VAR}`` references are resolved on a separate
+        copy, re-resolved when a referenced variable changes.  Raises
+        ``ConfigLoadError`` like ``load_config`` when the file is invalid.
+        """
+        path = config_path or get_config_path()
+        changed = False
+        with self._lock:
+            snapshot = self._snapshots.get(path)
+            stat_key = _stat_key(path)
+            if snapshot is None or not self._unchanged(path, snapshot, stat_key):
+                raw = _read_bytes(path)
+                digest = hashlib.blake2b(raw or b"", digest_size=16).hexdigest()
+                if snapshot is not None and snapshot.digest == digest:
+                    snapshot.stat_key = stat_key
+                else:
+                    changed = snapshot is not None
+                    snapshot = self._load(path, stat_key, digest, raw)
+            else:
+                self.hits += 1
+            config = self._resolved(path, snapshot) if resolve_env else snapshot.config
+        if changed:
+            self._notify(path)
+        return config if shared else config.model_copy(deep=True)
+
+    def invalidate(self, config_path: Path | None = None) -> None:
+        """Forget *config_path* (or every path) and notify subscribers."""
+        with self._lock:
+            if config_path is None:
+                paths = list(self._snapshots)
+                self._snapshots.clear()
+            else:
+                paths = [config_path]
+                self._snapshots.pop(config_path, None)
+        for path in paths:
+            self._notify(path)
+
+    def subscribe(self, listener: ConfigChangeListener) -> Callable[[], None]:
+        """Call *listener* with the path whenever a snapshot changes; returns an unsubscribe callable."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def clear(self) -> None:
+        """Drop every snapshot without notifying subscribers."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "reloads": self.reloads, "paths": len(self._snapshots)}
+
+    def _unchanged(self, path: Path, snapshot: _Snapshot, stat_key: _StatKey) -> bool:
+        if stat_key != snapshot.stat_key:
+            return False
+        if stat_key is None or time.time_ns() - stat_key[1] >= _RACY_WINDOW_NS:
+            return True
+        raw = _read_bytes(path)
+        return hashlib.blake2b(raw or b"", digest_size=16).hexdigest() == snapshot.digest
+
+    def _load(self, path: Path, stat_key: _StatKey, digest: str, raw: bytes | None) -> _Snapshot:
+        config = load_config(path)
+        text = raw.decode("utf-8", errors="replace") if raw else ""
+        snapshot = _Snapshot(
+            stat_key=stat_key,
+            digest=digest,
+            config=config,
+            env_names=frozenset(_ENV_REF_PATTERN.findall(text)),
+        )
+        self._snapshots[path] = snapshot
+        self.reloads += 1
+        return snapshot
+
+    def _resolved(self, path: Path, snapshot: _Snapshot) -> Config:
+        env = tuple(os.environ.get(name) for name in sorted(snapshot.env_names))
+        if snapshot.resolved is None or snapshot.resolved_env != env:
+            snapshot.resolved = resolve_config_env_vars(
+                snapshot.config.model_copy(deep=True),
+                config_path=path,
+            )
+            snapshot.resolved_env = env
+        return snapshot.resolved
+
+    def _notify(self, path: Path) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(path)
+            except Exception:
+                logger.exception("Config change listener failed for {}", path)
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+_service = ConfigSnapshotService()
+
+
+def config_snapshots() -> ConfigSnapshotService:
+    return _service
+
+
+def clear_config_snapshots() -> None:
+    _service.clear()
+
+
+def load_config_snapshot(
+    config_path: Path | None = None,
+    *,
+    resolve_env: bool = False,
+    shared: bool = False,
+) -> Config:
+    """``Config`` for *config_path*, re-parsed only after the file changes.
+
+    Returns a private copy; ``shared=True`` returns the cached read-only instance.
+    """
+    return _service.get(config_path, resolve_env=resolve_env, shared=shared)
@@ -160,6 +160,7 @@ class CronService:
         store_path: Path,
         on_job: Callable[[CronJob], Coroutine[Any, Any, str | None]] | None = None,
         max_sleep_ms: int = 300_000,  # 5 minutes
+        max_concurrent_jobs: int = 4,
     ):
         self.store_path = store_path
         self._action_path = store_path.parent / "action.jsonl"
@@ -172,6 +173,7 @@ class CronService:
         self._active_executions = 0
         self._store_dirty = False
         self.max_sleep_ms = max_sleep_ms
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
 
     def _should_persist_store(self) -> bool:
         """Return whether this instance currently owns the live store."""
@@ -395,6 +397,7 @@ class CronService:
                                 "status": r.status,
                                 "durationMs": r.duration_ms,
                                 "error": r.error,
+                                "lagMs": r.lag_ms,
                             }
                             for r in j.state.run_history
                         ],
@@ -544,10 +547,11 @@ class CronService:
                 if j.enabled and j.state.next_run_at_ms and now >= j.state.next_run_at_ms
             ]
 
-            for job in due_jobs:
-                await self._execute_job(job)
-
-            self._save_store()
+            if due_jobs:
+                # Every job persists its own outcome as it finishes.
+                await self._run_due_jobs(due_jobs)
+            else:
+                self._save_store()
         except Exception:
             # A load/persist failure must not kill the scheduler: keep the
             # in-memory store and retry on the next tick.  This mirrors the
@@ -564,9 +568,48 @@ class CronService:
             # single bad tick cannot silently stop all future jobs.
             self._arm_timer()
 
-    async def _execute_job(self, job: CronJob) -> None:
+    @staticmethod
+    def _serial_key(job: CronJob) -> str:
+        """Return the lane key; jobs bound to one session share a lane."""
+        if job.payload.session_key:
+            return f"session:{job.payload.session_key}"
+        return f"job:{job.id}"
+
+    async def _run_due_jobs(self, due_jobs: list[CronJob]) -> None:
+        """Run due jobs concurrently, at most ``max_concurrent_jobs`` at a time.
+
+        Jobs bound to the same session run one after another in store order so
+        their agent turns never race.  Each job persists its own outcome as
+        soon as it finishes instead of waiting for the rest of the batch.  The
+        first persistence failure is re-raised once the batch has finished;
+        the store then stays dirty so the next tick retries the save before
+        running anything again.
+        """
+        lanes: dict[str, list[CronJob]] = {}
+        for job in due_jobs:
+            lanes.setdefault(self._serial_key(job), []).append(job)
+        slots = asyncio.Semaphore(self.max_concurrent_jobs)
+        save_errors: list[Exception] = []
+
+        async def run_lane(jobs: list[CronJob]) -> None:
+            for job in jobs:
+                async with slots:
+                    await self._execute_job(job, scheduled_at_ms=job.state.next_run_at_ms)
+                    if save_errors:
+                        continue
+                    try:
+                        self._save_store()
+                    except Exception as exc:
+                        save_errors.append(exc)
+
+        await asyncio.gather(*(run_lane(jobs) for jobs in lanes.values()))
+        if save_errors:
+            raise save_errors[0]
+
+    async def _execute_job(self, job: CronJob, *, scheduled_at_ms: int | None = None) -> None:
         """Execute a single job."""
         start_ms = _now_ms()
+        lag_ms = max(0, start_ms - scheduled_at_ms) if scheduled_at_ms else None
         logger.info("Cron: executing job '{}' ({})", job.name, job.id)
 
         try:
@@ -602,6 +645,7 @@ class CronService:
             status=job.state.last_status,
             duration_ms=end_ms - start_ms,
             error=job.state.last_error,
+            lag_ms=lag_ms,
         ))
         job.state.run_history = job.state.run_history[-self._MAX_RUN_HISTORY:]
 
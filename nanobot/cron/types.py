@@ -89,6 +89,7 @@ class CronRunRecord:
     status: Literal["ok", "error", "skipped"]
     duration_ms: int = 0
     error: str | None = None
+    lag_ms: int | None = None  # Start delay past the scheduled run time.
 
     @classmethod
     def from_store_dict(cls, data: dict[str, Any]) -> CronRunRecord:
@@ -97,6 +98,7 @@ class CronRunRecord:
             status=data["status"],
             duration_ms=_store_int(get_camel_snake(data, "durationMs", "duration_ms", 0)),
             error=data.get("error"),
+            lag_ms=_store_int(get_camel_snake(data, "lagMs", "lag_ms"), None),
         )
 
 
@@ -0,0 +1,134 @@
+"""Adaptive admission control for provider requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from loguru import logger
+
+# AIMD bounds: start wide open so unthrottled endpoints behave as before, halve
+# on each rate-limit signal and grow back by one slot per window of successes.
+_INITIAL_LIMIT = 16.0
+_MIN_LIMIT = 1.0
+_MAX_LIMIT = 64.0
+_DECREASE_FACTOR = 0.5
+# Concurrent requests that were already in flight when the endpoint started
+# throttling all fail together; count them as one signal.
+_DECREASE_COOLDOWN_S = 1.0
+
+
+class ProviderAdmissionController:
+    """AIMD concurrency limit for one provider endpoint and model.
+
+    Requests past the current limit queue locally in FIFO order instead of
+    hitting a throttled API.  Success grows the limit additively; rate-limit
+    or overload responses shrink it multiplicatively and, when the provider
+    sent a retry-after hint, hold new requests until it expires.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.limit = _INITIAL_LIMIT
+        self.in_flight = 0
+        self.throttled = 0
+        self.admitted = 0
+        self.queued_total = 0
+        self.max_wait_ms = 0.0
+        self._paused_until = 0.0
+        self._last_decrease_at = float("-inf")
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @property
+    def paused_for_s(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    async def acquire(self, *, respect_pause: bool = True) -> None:
+        """Wait for a request slot.
+
+        Retries pass ``respect_pause=False``: they already slept through the
+        provider's retry-after window themselves.
+        """
+        started = time.monotonic()
+        if respect_pause and (pause := self.paused_for_s) > 0:
+            await asyncio.sleep(pause)
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._waiters or self.in_flight >= self._slots():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self.queued_total += 1
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self.release()
+                raise
+        else:
+            self.in_flight += 1
+        self.admitted += 1
+        self.max_wait_ms = max(self.max_wait_ms, (time.monotonic() - started) * 1000)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        if self.limit < _MAX_LIMIT:
+            self.limit = min(_MAX_LIMIT, self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        now = time.monotonic()
+        self.throttled += 1
+        if retry_after and retry_after > 0:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        if now - self._last_decrease_at < _DECREASE_COOLDOWN_S:
+            return
+        self._last_decrease_at = now
+        previous = self.limit
+        self.limit = max(_MIN_LIMIT, self.limit * _DECREASE_FACTOR)
+        if self.limit < previous:
+            logger.info(
+                "Provider {} is throttling; concurrency limit {} -> {}",
+                self.key,
+                int(previous),
+                self._slots(),
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self._slots(),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "throttled": self.throttled,
+            "paused_for_s": round(self.paused_for_s, 1),
+            "queued_total": self.queued_total,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+    def format_status(self) -> str:
+        line = (
+            f"\U0001f6a6 Provider admission: {self.in_flight}/{self._slots()} in flight, "
+            f"{self.waiting} queued, {self.throttled} throttled"
+        )
+        if (pause := self.paused_for_s) > 0:
+            line += f", paused {max(1, int(round(pause)))}s"
+        return line
+
+    def _slots(self) -> int:
+        return max(1, int(self.limit))
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self._slots():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
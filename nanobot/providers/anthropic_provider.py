@@ -21,6 +21,7 @@ from nanobot.providers.base import (
     resolve_stream_idle_timeout_s,
     tool_arguments_object_for_replay,
 )
+from nanobot.utils.image_pipeline import ImageLimits
 
 _ALNUM = string.ascii_letters + string.digits
 
@@ -84,6 +85,10 @@ class AnthropicProvider(LLMProvider):
     prompt caching, extended thinking, tool calls, and streaming.
     """
 
+    # Claude downsamples past ~1568 px anyway; 3.75 MB keeps the base64 payload
+    # under the API's 5 MB per-image cap.
+    image_limits = ImageLimits(max_edge=1568, max_bytes=3_750_000)
+
     def __init__(
         self,
         api_key: str | None = None,
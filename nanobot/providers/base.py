@@ -18,7 +18,9 @@ from typing import Any, cast
 import json_repair
 from loguru import logger
 
+from nanobot.providers.admission import ProviderAdmissionController
 from nanobot.utils.helpers import sanitize_surrogates_deep
+from nanobot.utils.image_pipeline import DEFAULT_IMAGE_LIMITS, ImageLimits
 
 STREAM_IDLE_TIMEOUT_ENV = "NANOBOT_STREAM_IDLE_TIMEOUT_S"
 DEFAULT_STREAM_IDLE_TIMEOUT_S = 90.0
@@ -311,6 +313,10 @@ class LLMProvider(ABC):
     """Base class for LLM providers."""
 
     supports_progress_deltas = False
+    # Attached images are downscaled to fit before they are sent.
+    image_limits: ImageLimits = DEFAULT_IMAGE_LIMITS
+    # Wrappers that delegate to other providers leave admission to those providers.
+    _admission_controlled = True
 
     _CHAT_RETRY_DELAYS = (1, 2, 4)
     _PERSISTENT_MAX_DELAY = 60
@@ -387,6 +393,35 @@ class LLMProvider(ABC):
         self.api_key = api_key
         self.api_base = api_base
         self.generation: GenerationSettings = GenerationSettings()
+        self._admission_controllers: dict[str, ProviderAdmissionController] = {}
+
+    def _admission_registry(self) -> dict[str, ProviderAdmissionController]:
+        controllers = cast(
+            dict[str, ProviderAdmissionController] | None,
+            self.__dict__.get("_admission_controllers"),
+        )
+        if controllers is None:
+            # Subclasses that skip LLMProvider.__init__ still get admission control.
+            controllers = self._admission_controllers = {}
+        return controllers
+
+    def admission_controller(self, model: str | None = None) -> ProviderAdmissionController:
+        """Return the shared admission controller for *model* on this provider."""
+        model = model or self.get_default_model()
+        controllers = self._admission_registry()
+        controller = controllers.get(model)
+        if controller is None:
+            controller = controllers[model] = ProviderAdmissionController(
+                f"{type(self).__name__}:{model}"
+            )
+        return controller
+
+    def admission_status(self, model: str | None = None) -> str | None:
+        """Summarise admission state for ``/status`` once *model* has been throttled."""
+        controller = self._admission_registry().get(model or self.get_default_model())
+        if controller is None or not (controller.throttled or controller.waiting):
+            return None
+        return controller.format_status()
 
     def can_resume_conversation_state(
         self,
@@ -639,6 +674,29 @@ class LLMProvider(ABC):
         # Unknown 429 defaults to WAIT+retry.
         return True
 
+    @classmethod
+    def _is_rate_limited_response(cls, response: LLMResponse) -> bool:
+        """Whether an error response signals throttling rather than a broken request."""
+        status = response.error_status_code
+        if status is not None and int(status) in (429, 529):
+            return int(status) == 529 or cls._is_retryable_429_response(response)
+        type_token = cls._normalize_error_token(response.error_type)
+        code_token = cls._normalize_error_token(response.error_code)
+        if any(
+            token in cls._RETRYABLE_429_ERROR_TOKENS
+            for token in (type_token, code_token)
+            if token is not None
+        ):
+            return True
+        if status is not None or cls.is_arrearage_response(response):
+            return False
+        # Legacy providers that report no status: only explicit throttling
+        # phrases count, never a bare number that may appear in any message.
+        content = (response.content or "").lower()
+        return any(
+            marker in content for marker in ("rate limit", "rate_limit", "too many requests", "overloaded")
+        )
+
     @staticmethod
     def _enforce_role_alternation(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Merge consecutive same-role messages and drop trailing assistant messages.
@@ -1090,6 +1148,27 @@ class LLMProvider(ABC):
             await asyncio.sleep(chunk)
             remaining -= chunk
 
+    async def _call_admitted(
+        self,
+        call: Callable[..., Awaitable[LLMResponse]],
+        kw: dict[str, Any],
+        controller: ProviderAdmissionController | None,
+        *,
+        respect_pause: bool,
+    ) -> LLMResponse:
+        if controller is None:
+            return await call(**kw)
+        await controller.acquire(respect_pause=respect_pause)
+        try:
+            response = await call(**kw)
+        finally:
+            controller.release()
+        if response.finish_reason != "error":
+            controller.on_success()
+        elif self._is_rate_limited_response(response):
+            controller.on_throttle(self._extract_retry_after_from_response(response))
+        return response
+
     async def _run_with_retry(
         self,
         call: Callable[..., Awaitable[LLMResponse]],
@@ -1108,9 +1187,14 @@ class LLMProvider(ABC):
         last_response: LLMResponse | None = None
         last_error_key: str | None = None
         identical_error_count = 0
+        controller = (
+            self.admission_controller(kw.get("model")) if self._admission_controlled else None
+        )
         while True:
             attempt += 1
-            response = await call(**kw)
+            response = await self._call_admitted(
+                call, kw, controller, respect_pause=attempt == 1
+            )
             if response.finish_reason != "error":
                 return response
             last_response = response
@@ -1172,7 +1256,9 @@ class LLMProvider(ABC):
                         retry_kw["messages"] = stripped
                     if stripped_context is not None:
                         retry_kw["provider_context"] = stripped_context
-                    result = await call(**retry_kw)
+                    result = await self._call_admitted(
+                        call, retry_kw, controller, respect_pause=False
+                    )
                     # Permanently strip images from the original messages so
                     # subsequent iterations do not repeat the error-retry cycle.
                     if result.finish_reason != "error":
@@ -19,6 +19,7 @@ from nanobot.providers.base import (
     resolve_stream_idle_timeout_s,
     tool_arguments_object_for_replay,
 )
+from nanobot.utils.image_pipeline import ImageLimits
 
 _IMAGE_DATA_URL = re.compile(r"^data:image/([a-zA-Z0-9.+-]+);base64,(.*)$", re.DOTALL)
 _TEXT_BLOCK_TYPES = {"text", "input_text", "output_text"}
@@ -50,6 +51,9 @@ def _next_or_none(iterator: Iterator[dict[str, Any]]) -> dict[str, Any] | None:
 class BedrockProvider(LLMProvider):
     """LLM provider using AWS Bedrock Runtime's Converse APIs."""
 
+    # Converse rejects image blocks over 3.75 MB.
+    image_limits = ImageLimits(max_edge=1568, max_bytes=3_750_000)
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -395,12 +395,9 @@ def load_provider_snapshot(
     *,
     preset_name: str | None = None,
 ) -> ProviderSnapshot:
-    from nanobot.config.loader import load_config, resolve_config_env_vars
+    from nanobot.config.snapshot import load_config_snapshot
 
     return build_provider_snapshot(
-        resolve_config_env_vars(
-            load_config(config_path),
-            config_path=config_path,
-        ),
+        load_config_snapshot(config_path, resolve_env=True, shared=True),
         preset_name=preset_name,
     )
@@ -19,6 +19,7 @@ from nanobot.providers.base import (
     ProviderConversationState,
     RetryEventCallback,
 )
+from nanobot.utils.image_pipeline import ImageLimits
 
 # Circuit breaker tuned to match OpenAICompatProvider's Responses API breaker.
 _PRIMARY_FAILURE_THRESHOLD = 3
@@ -115,6 +116,7 @@ class FallbackProvider(LLMProvider):
     """
 
     supports_stream_recover_callback = True
+    _admission_controlled = False
 
     def __init__(
         self,
@@ -141,9 +143,16 @@ class FallbackProvider(LLMProvider):
     def generation(self, value: GenerationSettings) -> None:
         self._primary.generation = value
 
+    @property
+    def image_limits(self) -> ImageLimits:
+        return self._primary.image_limits
+
     def get_default_model(self) -> str:
         return self._primary.get_default_model()
 
+    def admission_status(self, model: str | None = None) -> str | None:
+        return self._primary.admission_status(model)
+
     def set_fallback_model_observer(self, observer: FallbackModelObserver | None) -> None:
         """Attach a process-level observer without changing request call signatures."""
         self._fallback_model_observer = observer
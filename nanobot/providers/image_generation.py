@@ -7,6 +7,7 @@ import base64
 import binascii
 import re
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -23,6 +24,7 @@ from nanobot.security.network import (
     resolve_url_target,
 )
 from nanobot.utils.helpers import detect_image_mime
+from nanobot.utils.http_pool import HttpClientPolicy, http_client_pool, pooled_client
 
 _OPENROUTER_ATTRIBUTION_HEADERS = {
     "HTTP-Referer": "https://github.com/HKUDS/nanobot",
@@ -158,19 +160,24 @@ async def _download_image_data_url(
     transport: httpx.AsyncBaseTransport | None = None,
 ) -> str:
     try:
-        client_kwargs: dict[str, Any] = {
-            "follow_redirects": False,
-            "timeout": _DEFAULT_TIMEOUT_S,
-            "trust_env": False,
-        }
+        policy = HttpClientPolicy(timeout=_DEFAULT_TIMEOUT_S, trust_env=False)
+        client_cm: AbstractAsyncContextManager[httpx.AsyncClient]
         if proxy:
             # An explicit provider proxy is a user-selected trusted egress boundary.
             # Validate each URL locally, while the proxy owns final DNS resolution.
-            client_kwargs["proxy"] = proxy
+            client_cm = pooled_client(policy, proxy=proxy)
+        elif transport is None:
+            client_cm = pooled_client(policy, transport_factory=PinnedDNSAsyncTransport)
         else:
-            client_kwargs["transport"] = PinnedDNSAsyncTransport(inner=transport)
+            # A caller-supplied transport gets its own short-lived client.
+            client_cm = httpx.AsyncClient(
+                follow_redirects=False,
+                timeout=_DEFAULT_TIMEOUT_S,
+                trust_env=False,
+                transport=PinnedDNSAsyncTransport(inner=transport),
+            )
 
-        async with httpx.AsyncClient(**client_kwargs) as client:
+        async with client_cm as client:
             current_url = url
             for _ in range(_IMAGE_DOWNLOAD_MAX_REDIRECTS + 1):
                 if proxy:
@@ -334,12 +341,12 @@ class ImageGenerationProvider(ABC):
             raise ImageGenerationError(f"{label} returned no images: {provider_error}")
         raise ImageGenerationError(f"{label} returned no images for this request")
 
-    def _http_client_kwargs(self) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {"timeout": self.timeout}
-        if self.proxy:
-            kwargs["proxy"] = self.proxy
-            kwargs["trust_env"] = False
-        return kwargs
+    def _http_client_policy(self) -> HttpClientPolicy:
+        # An explicit proxy replaces environment proxy settings.
+        return HttpClientPolicy(timeout=self.timeout, proxy=self.proxy, trust_env=not self.proxy)
+
+    def _shared_client(self) -> httpx.AsyncClient:
+        return self._client or http_client_pool().client(self._http_client_policy())
 
     async def _http_post(
         self,
@@ -351,10 +358,7 @@ class ImageGenerationProvider(ABC):
     ) -> httpx.Response:
         if client is not None:
             return await client.post(url, headers=headers, json=body)
-        if self._client is not None:
-            return await self._client.post(url, headers=headers, json=body)
-        async with httpx.AsyncClient(**self._http_client_kwargs()) as c:
-            return await c.post(url, headers=headers, json=body)
+        return await self._shared_client().post(url, headers=headers, json=body)
 
 
 class OpenRouterImageGenerationClient(ImageGenerationProvider):
@@ -478,19 +482,15 @@ class AIHubMixImageGenerationClient(ImageGenerationProvider):
         }
         size = _aihubmix_size(aspect_ratio, image_size)
 
-        client = self._client or httpx.AsyncClient(**self._http_client_kwargs())
-        try:
-            return await self._generate_with_client(
-                client,
-                prompt=prompt,
-                model=model,
-                reference_images=refs,
-                size=size,
-                headers=headers,
-            )
-        finally:
-            if self._client is None:
-                await client.aclose()
+        client = self._shared_client()
+        return await self._generate_with_client(
+            client,
+            prompt=prompt,
+            model=model,
+            reference_images=refs,
+            size=size,
+            headers=headers,
+        )
 
     async def _generate_with_client(
         self,
@@ -1167,21 +1167,12 @@ class OpenAIImageGenerationClient(ImageGenerationProvider):
                 handles.append(handle)
                 files.append(("image[]", (p.name, handle, mime)))
 
-            client = self._client
-            if client is not None:
-                return await client.post(
-                    f"{self.api_base}/images/edits",
-                    headers=headers,
-                    data=body,
-                    files=files,
-                )
-            async with httpx.AsyncClient(**self._http_client_kwargs()) as c:
-                return await c.post(
-                    f"{self.api_base}/images/edits",
-                    headers=headers,
-                    data=body,
-                    files=files,
-                )
+            return await self._shared_client().post(
+                f"{self.api_base}/images/edits",
+                headers=headers,
+                data=body,
+                files=files,
+            )
         finally:
             for handle in handles:
                 handle.close()
@@ -1849,17 +1840,13 @@ class ZhipuImageGenerationClient(ImageGenerationProvider):
 
         url = f"{self.api_base}/images/generations"
 
-        client = self._client or httpx.AsyncClient(**self._http_client_kwargs())
-        try:
-            return await self._generate_with_client(
-                client,
-                headers=headers,
-                body=body,
-                url=url,
-            )
-        finally:
-            if self._client is None:
-                await client.aclose()
+        client = self._shared_client()
+        return await self._generate_with_client(
+            client,
+            headers=headers,
+            body=body,
+            url=url,
+        )
 
     async def _generate_with_client(
         self,
@@ -2006,17 +1993,13 @@ class ModelScopeImageGenerationClient(ImageGenerationProvider):
         body.update(self.extra_body)
 
         url = f"{self.api_base}/images/generations"
-        client = self._client or httpx.AsyncClient(**self._http_client_kwargs())
-        try:
-            return await self._generate_with_client(
-                client,
-                url=url,
-                headers=headers,
-                body=body,
-            )
-        finally:
-            if self._client is None:
-                await client.aclose()
+        client = self._shared_client()
+        return await self._generate_with_client(
+            client,
+            url=url,
+            headers=headers,
+            body=body,
+        )
 
     async def _generate_with_client(
         self,
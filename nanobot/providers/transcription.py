@@ -18,6 +18,8 @@ from typing import Any, cast
 import httpx
 from loguru import logger
 
+from nanobot.utils.http_pool import pooled_client
+
 _CHAT_COMPLETIONS_PATH = "chat/completions"
 _TRANSCRIPTIONS_PATH = "audio/transcriptions"
 _STEPFUN_ASR_PATH = "audio/asr/sse"
@@ -355,7 +357,7 @@ async def _post_stepfun_asr_with_retry(
         "Accept": "text/event-stream",
     }
 
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         for attempt in range(_MAX_RETRIES + 1):
             try:
                 async with client.stream(
@@ -435,7 +437,7 @@ async def _post_with_retry(
     provider_label: str,
     extract_text: Callable[[dict[str, Any]], str],
 ) -> str:
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         for attempt in range(_MAX_RETRIES + 1):
             try:
                 response = await client.post(**build_request())
@@ -558,7 +560,7 @@ class AssemblyAITranscriptionProvider:
             return ""
 
         headers = {"Authorization": self.api_key}
-        async with httpx.AsyncClient() as client:
+        async with pooled_client() as client:
             upload = await _request_json_with_retry(
                 client,
                 "POST",
@@ -6,7 +6,10 @@ import asyncio
 import ipaddress
 import re
 import socket
+import threading
+import time
 from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from typing import Any, cast
 from urllib.parse import urlparse
 from urllib.request import getproxies, proxy_bypass
@@ -30,6 +33,12 @@ _BLOCKED_NETWORKS = [
 _URL_RE = re.compile(r"https?://[^\s\"'`;|<>]+", re.IGNORECASE)
 _allowed_networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
 
+# Async resolution cache. getaddrinfo exposes no record TTL, so entries expire
+# after a fixed bound; failures are cached briefly to absorb retry storms.
+_DNS_CACHE_TTL_S = 60.0
+_DNS_NEGATIVE_TTL_S = 10.0
+_DNS_CACHE_MAX_ENTRIES = 1024
+
 
 def is_loopback_host(host: str) -> bool:
     """Return whether a bind target is explicitly limited to loopback."""
@@ -75,6 +84,121 @@ def _is_private(addr: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
     return any(normalized in net for net in _BLOCKED_NETWORKS)
 
 
+@dataclass
+class _DNSCacheEntry:
+    expires_at: float
+    addresses: tuple[str, ...] | None  # None records a resolution failure
+
+
+@dataclass
+class _DNSStats:
+    lookups: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    negative_hits: int = 0
+    total_ms: float = 0.0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+_dns_cache: dict[str, _DNSCacheEntry] = {}
+_dns_stats = _DNSStats()
+_dns_lock = threading.Lock()
+
+
+def _lookup_host(hostname: str) -> tuple[str, ...] | None:
+    """Resolve *hostname* with the system resolver; ``None`` when it fails."""
+    started = time.perf_counter()
+    try:
+        infos = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    except socket.gaierror:
+        addresses = None
+    else:
+        addresses = tuple(str(info[4][0]) for info in infos)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _dns_lock:
+        _dns_stats.lookups += 1
+        _dns_stats.failures += addresses is None
+        _dns_stats.total_ms += elapsed_ms
+        _dns_stats.last_ms = elapsed_ms
+        _dns_stats.max_ms = max(_dns_stats.max_ms, elapsed_ms)
+    return addresses
+
+
+async def _lookup_host_cached(hostname: str) -> tuple[str, ...] | None:
+    """Resolve *hostname* off the event loop, reusing recent answers.
+
+    Only raw addresses are cached; callers re-check every address against the
+    current block/allow lists on each use.
+    """
+    key = hostname.rstrip(".").lower()
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry.expires_at > now:
+            _dns_stats.cache_hits += 1
+            _dns_stats.negative_hits += entry.addresses is None
+            return entry.addresses
+
+    addresses = await asyncio.to_thread(_lookup_host, hostname)
+    ttl = _DNS_CACHE_TTL_S if addresses is not None else _DNS_NEGATIVE_TTL_S
+    with _dns_lock:
+        _dns_cache.pop(key, None)
+        while len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[key] = _DNSCacheEntry(time.monotonic() + ttl, addresses)
+    return addresses
+
+
+def clear_dns_cache() -> None:
+    """Drop all cached resolutions (e.g. after resolver configuration changes)."""
+    with _dns_lock:
+        _dns_cache.clear()
+
+
+def dns_resolution_stats() -> dict[str, Any]:
+    """Return counters and latency figures for SSRF-check DNS lookups."""
+    with _dns_lock:
+        stats = _dns_stats
+        return {
+            "lookups": stats.lookups,
+            "failures": stats.failures,
+            "cache_hits": stats.cache_hits,
+            "negative_hits": stats.negative_hits,
+            "cached_hosts": len(_dns_cache),
+            "avg_ms": stats.total_ms / stats.lookups if stats.lookups else 0.0,
+            "last_ms": stats.last_ms,
+            "max_ms": stats.max_ms,
+        }
+
+
+def format_dns_resolution_stats(stats: dict[str, Any]) -> str:
+    """One ``/status`` line from :func:`dns_resolution_stats`."""
+    return (
+        f"\U0001f310 DNS: {stats['lookups']} lookups (avg {stats['avg_ms']:.0f} ms), "
+        f"{stats['cache_hits']} cache hits, {stats['failures']} failures, "
+        f"{stats['cached_hosts']} hosts cached"
+    )
+
+
+def _parse_url_target(url: str) -> tuple[str | None, str]:
+    """Return ``(hostname, error)`` after the scheme and host checks."""
+    try:
+        p = urlparse(url)
+    except Exception as e:
+        return None, str(e)
+
+    if p.scheme not in ("http", "https"):
+        return None, f"Only http/https allowed, got '{p.scheme or 'none'}'"
+    if not p.netloc:
+        return None, "Missing domain"
+
+    hostname = p.hostname
+    if not hostname:
+        return None, "Missing hostname"
+    return hostname, ""
+
+
 def resolve_url_target(
     url: str,
     *,
@@ -96,24 +220,53 @@ def resolve_url_target(
     Returns (ok, error_message, resolved_ips).  When ok is True,
     resolved_ips contains the public IPs that were validated for this URL, or
     is empty when an unresolved hostname is delegated to a trusted proxy.
-    """
-    try:
-        p = urlparse(url)
-    except Exception as e:
-        return False, str(e), ()
 
-    if p.scheme not in ("http", "https"):
-        return False, f"Only http/https allowed, got '{p.scheme or 'none'}'", ()
-    if not p.netloc:
-        return False, "Missing domain", ()
-
-    hostname = p.hostname
-    if not hostname:
-        return False, "Missing hostname", ()
+    This resolves synchronously on every call; async code should use
+    :func:`resolve_url_target_async`.
+    """
+    hostname, error = _parse_url_target(url)
+    if hostname is None:
+        return False, error, ()
+    return _check_resolved_target(
+        hostname,
+        _lookup_host(hostname),
+        allow_loopback=allow_loopback,
+        trust_remote_dns=trust_remote_dns,
+    )
+
+
+async def resolve_url_target_async(
+    url: str,
+    *,
+    allow_loopback: bool = False,
+    trust_remote_dns: bool = False,
+) -> tuple[bool, str, tuple[str, ...]]:
+    """Async :func:`resolve_url_target` that never blocks the event loop.
 
-    try:
-        infos = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
-    except socket.gaierror:
+    Lookups run in a worker thread and are cached for a short TTL. Cached
+    addresses are validated again on every call, so SSRF allowlist changes
+    apply immediately. :class:`PinnedDNSAsyncTransport` still resolves afresh
+    before connecting and pins the connection to those addresses.
+    """
+    hostname, error = _parse_url_target(url)
+    if hostname is None:
+        return False, error, ()
+    return _check_resolved_target(
+        hostname,
+        await _lookup_host_cached(hostname),
+        allow_loopback=allow_loopback,
+        trust_remote_dns=trust_remote_dns,
+    )
+
+
+def _check_resolved_target(
+    hostname: str,
+    addresses: tuple[str, ...] | None,
+    *,
+    allow_loopback: bool,
+    trust_remote_dns: bool,
+) -> tuple[bool, str, tuple[str, ...]]:
+    if addresses is None:
         if not trust_remote_dns:
             return False, f"Cannot resolve hostname: {hostname}", ()
 
@@ -130,9 +283,9 @@ def resolve_url_target(
         return True, "", (str(_normalize_addr(literal_addr)),)
 
     addrs: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
-    for info in infos:
+    for address in addresses:
         try:
-            addr = ipaddress.ip_address(info[4][0])
+            addr = ipaddress.ip_address(address)
         except ValueError:
             continue
         addrs.append(addr)
@@ -151,6 +304,12 @@ def validate_url_target(url: str, *, allow_loopback: bool = False) -> tuple[bool
     return ok, error
 
 
+async def validate_url_target_async(url: str, *, allow_loopback: bool = False) -> tuple[bool, str]:
+    """Async :func:`validate_url_target` backed by the cached resolver."""
+    ok, error, _ = await resolve_url_target_async(url, allow_loopback=allow_loopback)
+    return ok, error
+
+
 def env_proxy_applies_to_url(url: str) -> bool:
     """Return True when process proxy settings would proxy this URL."""
     try:
@@ -171,7 +330,9 @@ def env_proxy_applies_to_url(url: str) -> bool:
     return not proxy_bypass(host)
 
 
-def httpx_env_proxy_mounts() -> dict[str, httpx.AsyncBaseTransport | None]:
+def httpx_env_proxy_mounts(
+    *, limits: httpx.Limits | None = None
+) -> dict[str, httpx.AsyncBaseTransport | None]:
     """Build HTTPX proxy mounts while leaving direct routes to the base transport."""
     proxies = getproxies()
     mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
@@ -180,7 +341,12 @@ def httpx_env_proxy_mounts() -> dict[str, httpx.AsyncBaseTransport | None]:
         if proxy_url:
             if "://" not in proxy_url:
                 proxy_url = f"http://{proxy_url}"
-            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(proxy=httpx.Proxy(proxy_url))
+            proxy = httpx.Proxy(proxy_url)
+            mounts[f"{scheme}://"] = (
+                httpx.AsyncHTTPTransport(proxy=proxy, limits=limits)
+                if limits is not None
+                else httpx.AsyncHTTPTransport(proxy=proxy)
+            )
 
     if not mounts:
         return {}
@@ -271,13 +437,24 @@ class PinnedDNSAsyncTransport(httpx.AsyncBaseTransport):
         *,
         allow_loopback: bool = False,
         inner: httpx.AsyncBaseTransport | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
         self._allow_loopback = allow_loopback
-        self._inner = inner or httpx.AsyncHTTPTransport()
+        if inner is None:
+            inner = (
+                httpx.AsyncHTTPTransport(limits=limits)
+                if limits is not None
+                else httpx.AsyncHTTPTransport()
+            )
+        self._inner = inner
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         url = str(request.url)
-        ok, error, resolved_ips = resolve_url_target(url, allow_loopback=self._allow_loopback)
+        # Connect-time check: always resolve afresh (off the loop) so a rebind
+        # after any cached pre-flight check is still caught, then pin to it.
+        ok, error, resolved_ips = await asyncio.to_thread(
+            resolve_url_target, url, allow_loopback=self._allow_loopback,
+        )
         if not ok:
             raise UnsafeURLRequestError(error, request=request)
         async with self._resolver_lock:
@@ -330,6 +507,15 @@ def contains_internal_url(command: str, *, allow_loopback: bool = False) -> bool
     return False
 
 
+async def contains_internal_url_async(command: str, *, allow_loopback: bool = False) -> bool:
+    """Async :func:`contains_internal_url` backed by the cached resolver."""
+    for m in _URL_RE.finditer(command):
+        ok, _ = await validate_url_target_async(m.group(0), allow_loopback=allow_loopback)
+        if not ok:
+            return True
+    return False
+
+
 def _is_allowed_loopback_target(
     hostname: str,
     addrs: list[ipaddress.IPv4Address | ipaddress.IPv6Address],
@@ -7,7 +7,6 @@ import json
 import os
 import re
 import secrets
-import shutil
 import stat
 from collections import OrderedDict
 from contextlib import contextmanager, suppress
@@ -15,7 +14,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Collection, Generator, Protocol, TypedDict, cast
+from typing import Any, Callable, Collection, Generator, Iterator, NotRequired, Protocol, TypedDict, cast
 from weakref import WeakValueDictionary
 
 from filelock import FileLock
@@ -29,6 +28,7 @@ from nanobot.runtime_context import (
 )
 from nanobot.session.model_selection import SESSION_MODEL_PRESET_METADATA_KEY
 from nanobot.utils.helpers import (
+    TokenCountCache,
     content_with_media_breadcrumbs,
     ensure_dir,
     estimate_message_tokens,
@@ -52,6 +52,7 @@ _PROVIDER_STATE_RECORD_TYPE = "provider_state"
 _PROVIDER_STATE_RECORD_PREFIX_RE = re.compile(
     r'^\s*\{\s*"_type"\s*:\s*"provider_state"\s*(?:,|\})'
 )
+_METADATA_RECORD_PREFIX_RE = re.compile(rb'^\s*\{\s*"_type"\s*:\s*"metadata"\s*(?:,|\})')
 _FORK_VOLATILE_METADATA_KEYS = {
     "goal_state",
     "pending_user_turn",
@@ -67,6 +68,10 @@ _WORKSPACE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
 _SESSION_MIGRATION_LOCK_TIMEOUT_SECONDS = 30
 _SESSION_FILES_LOCK_FILENAME = ".session-files.lock"
 _COPY_CHUNK_SIZE = 1024 * 1024
+_TAIL_READ_CHUNK_SIZE = 64 * 1024
+# Appended saves leave superseded metadata/provider-state records behind; compact
+# once they outweigh the live records (and this floor) to keep writes amortized O(delta).
+_APPEND_COMPACTION_MIN_STALE_CHARS = 256 * 1024
 
 
 def _json_object(value: object) -> dict[str, Any]:
@@ -81,6 +86,57 @@ def _is_provider_state_record_line(line: str) -> bool:
     return _PROVIDER_STATE_RECORD_PREFIX_RE.match(line) is not None
 
 
+def _iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """Yield the non-empty lines of *path* from last to first, reading from the end."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0:
+            size = min(_TAIL_READ_CHUNK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            buf = f.read(size) + buf
+            lines = buf.split(b"\n")
+            # The first piece may continue in the previous chunk.
+            buf = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.strip()
+        if buf.strip():
+            yield buf.strip()
+
+
+def _trailing_metadata_record(path: Path) -> dict[str, Any] | None:
+    """Return the metadata trailer left by an appended save, if the file ends with one.
+
+    Appended saves write a fresh metadata record after the new messages instead of
+    rewriting the first line, so the last metadata record in a file is authoritative.
+    When the final line is torn by an interrupted append, the scan continues back to
+    the newest metadata record that is still intact.
+    """
+    torn_tail = False
+    try:
+        for line in _iter_lines_reversed(path):
+            try:
+                record = _json_object(json.loads(line))
+            except (*_SESSION_DATA_ERRORS, UnicodeDecodeError):
+                torn_tail = True
+                continue
+            if _METADATA_RECORD_PREFIX_RE.match(line) is not None:
+                return record
+            if not torn_tail:
+                return None
+    except OSError:
+        return None
+    return None
+
+
+def _latest_metadata_record(first: dict[str, Any], path: Path) -> dict[str, Any]:
+    """Prefer an appended metadata trailer over the leading metadata record."""
+    trailer = _trailing_metadata_record(path)
+    return trailer if trailer is not None else first
+
+
 def _sanitize_assistant_replay_text(content: str) -> str:
     """Remove internal replay artifacts that the model may have copied before.
 
@@ -169,6 +225,9 @@ class Session:
     last_consolidated: int = 0  # Number of messages already consolidated to files
     provider_state: ProviderConversationState | None = field(default=None, repr=False)
     policy: SessionPolicy = field(default_factory=SessionPolicy, repr=False, compare=False)
+    token_counts: TokenCountCache = field(
+        default_factory=TokenCountCache, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not isinstance(cast(object, self.metadata), dict):
@@ -316,7 +375,7 @@ class Session:
             kept: list[dict[str, Any]] = []
             used = 0
             for message in reversed(out):
-                tokens = estimate_message_tokens(message)
+                tokens = self.token_counts.count(message, estimate_message_tokens)
                 if kept and used + tokens > max_tokens:
                     break
                 kept.append(message)
@@ -479,6 +538,7 @@ class SessionInfo(TypedDict):
     title: str
     preview: str
     path: str
+    has_unarchived_messages: NotRequired[bool]
 
 
 @dataclass(frozen=True)
@@ -491,6 +551,22 @@ class _SessionFileSnapshot:
     inode: int
 
 
+@dataclass
+class _AppendState:
+    """What the last save left on disk, so the next save can append only the delta."""
+
+    message_count: int
+    message_digest: Any  # hashlib object over the persisted message lines
+    provider_state_digest: str | None
+    provider_state_chars: int
+    trailer_chars: int
+    stale_chars: int
+    live_chars: int
+    inode: int
+    size: int
+    mtime_ns: int
+
+
 @dataclass(frozen=True)
 class SessionRestoreResult:
     restored: int
@@ -521,9 +597,23 @@ class SessionStore(Protocol):
 
 
 class JsonlSessionStore:
-    """JSONL implementation of session persistence."""
+    """JSONL implementation of session persistence.
+
+    A session file starts with a metadata record, followed by an optional
+    provider-state record and one line per message. With ``incremental_saves``
+    enabled, a save whose message prefix is unchanged on disk appends only the
+    new messages plus a metadata trailer; the last metadata and provider-state
+    records win. Any other change, and every ``fsync`` save, is written as a
+    compacted file via an atomic rename.
+    """
 
-    def __init__(self, workspace: Path, *, sessions_root: Path | None = None):
+    def __init__(
+        self,
+        workspace: Path,
+        *,
+        sessions_root: Path | None = None,
+        incremental_saves: bool = True,
+    ):
         canonical_workspace = Path(workspace).expanduser().resolve(strict=False)
         ensure_dir(canonical_workspace)
         root = (
@@ -540,6 +630,9 @@ class JsonlSessionStore:
         with suppress(OSError):
             os.chmod(root, 0o700)
         self.workspace = canonical_workspace
+        self.incremental_saves = incremental_saves
+        self._append_states: dict[str, _AppendState] = {}
+        self._token_count_lines: dict[str, int] = {}
         self._migration_lock = FileLock(
             str(root / ".workspace-migration.lock"),
             timeout=_SESSION_MIGRATION_LOCK_TIMEOUT_SECONDS,
@@ -1066,7 +1159,7 @@ class JsonlSessionStore:
                     else:
                         messages.append(data)
 
-            return Session(
+            session = Session(
                 key=key,
                 messages=messages,
                 created_at=created_at or datetime.now(),
@@ -1075,6 +1168,8 @@ class JsonlSessionStore:
                 last_consolidated=last_consolidated,
                 provider_state=provider_state,
             )
+            self._load_token_counts_unlocked(session)
+            return session
         except _SESSION_DATA_ERRORS as e:
             logger.warning("Failed to load session {}: {}", key, e)
             repaired = self._repair_unlocked(key)
@@ -1188,27 +1283,145 @@ class JsonlSessionStore:
 
     def _save_unlocked(self, session: Session, *, fsync: bool = False) -> None:
         path = self.get_session_path(session.key)
+        metadata_line = json.dumps(self._metadata_record(session), ensure_ascii=False) + "\n"
+        provider_state_line = (
+            json.dumps(
+                {
+                    "_type": _PROVIDER_STATE_RECORD_TYPE,
+                    "state": session.provider_state.to_private_record(),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            if session.provider_state is not None
+            else None
+        )
+        message_lines = [json.dumps(msg, ensure_ascii=False) + "\n" for msg in session.messages]
+
+        state = self._append_states.pop(session.key, None)
+        if (
+            self.incremental_saves
+            and not fsync
+            and state is not None
+            and self._append_unlocked(
+                path,
+                session.key,
+                state,
+                metadata_line,
+                provider_state_line,
+                message_lines,
+            )
+        ):
+            self._persist_token_counts_unlocked(session)
+            return
+        self._write_compacted_unlocked(
+            path,
+            session.key,
+            metadata_line,
+            provider_state_line,
+            message_lines,
+            fsync=fsync,
+        )
+        self._persist_token_counts_unlocked(session)
+
+    def get_token_counts_path(self, key: str) -> Path:
+        return self.sessions_dir / f".{self.storage_key(key)}.tokens"
+
+    def _load_token_counts_unlocked(self, session: Session) -> None:
+        """Seed ``session.token_counts`` from its sidecar; the sidecar is only a cache."""
+        path = self.get_token_counts_path(session.key)
+        entries: list[tuple[str, int]] = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        data = _json_object(json.loads(line))
+                    except (*_SESSION_DATA_ERRORS, UnicodeDecodeError):
+                        continue
+                    digest = data.get("h")
+                    tokens = data.get("n")
+                    if (
+                        isinstance(digest, str)
+                        and isinstance(tokens, int)
+                        and not isinstance(tokens, bool)
+                        and tokens > 0
+                    ):
+                        entries.append((digest, tokens))
+        except OSError:
+            return
+        session.token_counts.load(entries)
+        self._token_count_lines[session.key] = len(entries)
+
+    def _persist_token_counts_unlocked(self, session: Session) -> None:
+        """Append newly estimated counts, rewriting the sidecar once it doubles the cache."""
+        pending = session.token_counts.drain_pending()
+        if not pending:
+            return
+        path = self.get_token_counts_path(session.key)
+        written = self._token_count_lines.get(session.key, 0)
+        try:
+            if written + len(pending) > 2 * session.token_counts.max_entries:
+                entries = session.token_counts.items()
+                tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(8)}.tmp")
+                try:
+                    with open(tmp_path, "x", encoding="utf-8") as f:
+                        f.writelines(
+                            json.dumps({"h": digest, "n": tokens}) + "\n"
+                            for digest, tokens in entries
+                        )
+                    os.replace(tmp_path, path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                self._token_count_lines[session.key] = len(entries)
+            else:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.writelines(
+                        json.dumps({"h": digest, "n": tokens}) + "\n"
+                        for digest, tokens in pending.items()
+                    )
+                self._token_count_lines[session.key] = written + len(pending)
+        except OSError as e:
+            logger.debug("Failed to persist token counts for session {}: {}", session.key, e)
+
+    @staticmethod
+    def _metadata_record(session: Session) -> dict[str, Any]:
+        return {
+            "_type": "metadata",
+            "key": session.key,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+            "last_consolidated": session.last_consolidated,
+            "has_unarchived_messages": session.last_consolidated < len(session.messages),
+        }
+
+    @staticmethod
+    def _line_digest(line: str | None) -> str | None:
+        if line is None:
+            return None
+        return hashlib.sha256(line.encode("utf-8")).hexdigest()
+
+    def _write_compacted_unlocked(
+        self,
+        path: Path,
+        key: str,
+        metadata_line: str,
+        provider_state_line: str | None,
+        message_lines: list[str],
+        *,
+        fsync: bool,
+    ) -> None:
         tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
 
         try:
+            message_digest = hashlib.sha256()
             with open(tmp_path, "x", encoding="utf-8") as f:
-                metadata_line = {
-                    "_type": "metadata",
-                    "key": session.key,
-                    "created_at": session.created_at.isoformat(),
-                    "updated_at": session.updated_at.isoformat(),
-                    "metadata": session.metadata,
-                    "last_consolidated": session.last_consolidated,
-                }
-                f.write(json.dumps(metadata_line, ensure_ascii=False) + "\n")
-                if session.provider_state is not None:
-                    provider_state_line = {
-                        "_type": _PROVIDER_STATE_RECORD_TYPE,
-                        "state": session.provider_state.to_private_record(),
-                    }
-                    f.write(json.dumps(provider_state_line, ensure_ascii=False) + "\n")
-                for msg in session.messages:
-                    f.write(json.dumps(msg, ensure_ascii=False) + "\n")
+                f.write(metadata_line)
+                if provider_state_line is not None:
+                    f.write(provider_state_line)
+                for line in message_lines:
+                    f.write(line)
+                    message_digest.update(line.encode("utf-8"))
                 if fsync:
                     f.flush()
                     os.fsync(f.fileno())
@@ -1228,6 +1441,94 @@ class JsonlSessionStore:
         finally:
             tmp_path.unlink(missing_ok=True)
 
+        if not self.incremental_saves:
+            return
+        with suppress(OSError):
+            st = path.stat()
+            provider_state_chars = len(provider_state_line or "")
+            self._append_states[key] = _AppendState(
+                message_count=len(message_lines),
+                message_digest=message_digest,
+                provider_state_digest=self._line_digest(provider_state_line),
+                provider_state_chars=provider_state_chars,
+                trailer_chars=len(metadata_line),
+                stale_chars=0,
+                live_chars=sum(map(len, message_lines)) + provider_state_chars,
+                inode=st.st_ino,
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+            )
+
+    def _append_unlocked(
+        self,
+        path: Path,
+        key: str,
+        state: _AppendState,
+        metadata_line: str,
+        provider_state_line: str | None,
+        message_lines: list[str],
+    ) -> bool:
+        """Append the unsaved message suffix and a metadata trailer.
+
+        Returns False when the file no longer matches the last save or the
+        in-memory history was rewritten, so the caller must compact instead.
+        """
+        if len(message_lines) < state.message_count:
+            return False
+        provider_state_digest = self._line_digest(provider_state_line)
+        if provider_state_line is None and state.provider_state_digest is not None:
+            # A cleared provider state cannot be expressed by appending records.
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if (st.st_ino, st.st_size, st.st_mtime_ns) != (state.inode, state.size, state.mtime_ns):
+            return False
+
+        message_digest = hashlib.sha256()
+        for line in message_lines[: state.message_count]:
+            message_digest.update(line.encode("utf-8"))
+        if message_digest.digest() != state.message_digest.digest():
+            return False
+
+        appended = message_lines[state.message_count :]
+        stale_chars = state.stale_chars + state.trailer_chars
+        live_chars = state.live_chars + sum(map(len, appended))
+        provider_state_chars = state.provider_state_chars
+        if provider_state_line is not None and provider_state_digest != state.provider_state_digest:
+            appended.append(provider_state_line)
+            stale_chars += state.provider_state_chars
+            live_chars += len(provider_state_line) - state.provider_state_chars
+            provider_state_chars = len(provider_state_line)
+        if stale_chars > max(live_chars, _APPEND_COMPACTION_MIN_STALE_CHARS):
+            return False
+        appended.append(metadata_line)
+
+        # The caller already dropped ``state``, so a failed append leaves no
+        # append state behind: the torn tail is repaired on load and the next
+        # save rewrites the file atomically.
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(appended))
+            f.flush()
+            st = os.fstat(f.fileno())
+
+        for line in message_lines[state.message_count :]:
+            message_digest.update(line.encode("utf-8"))
+        self._append_states[key] = _AppendState(
+            message_count=len(message_lines),
+            message_digest=message_digest,
+            provider_state_digest=provider_state_digest,
+            provider_state_chars=provider_state_chars,
+            trailer_chars=len(metadata_line),
+            stale_chars=stale_chars,
+            live_chars=live_chars,
+            inode=st.st_ino,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        )
+        return True
+
     def update_metadata(
         self,
         key: str,
@@ -1240,6 +1541,7 @@ class JsonlSessionStore:
             path = self.get_session_path(key)
             if not path.exists():
                 return False
+            self._append_states.pop(key, None)
             tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
             try:
                 with open(path, encoding="utf-8") as source:
@@ -1247,6 +1549,7 @@ class JsonlSessionStore:
                     data = _json_object(json.loads(first_line))
                     if data.get("_type") != "metadata":
                         return False
+                    data = _latest_metadata_record(data, path)
                     raw_metadata = cast(object, data.get("metadata", {}))
                     metadata = (
                         dict(cast(dict[str, Any], raw_metadata))
@@ -1257,7 +1560,11 @@ class JsonlSessionStore:
                     data["metadata"] = metadata
                     with open(tmp_path, "x", encoding="utf-8") as target:
                         target.write(json.dumps(data, ensure_ascii=False) + "\n")
-                        shutil.copyfileobj(source, target)
+                        # Fold appended metadata trailers into the rewritten first line.
+                        for line in source:
+                            if _METADATA_RECORD_PREFIX_RE.match(line.encode("utf-8")):
+                                continue
+                            target.write(line)
                         if fsync:
                             target.flush()
                             os.fsync(target.fileno())
@@ -1276,6 +1583,10 @@ class JsonlSessionStore:
             return self._delete_unlocked(key)
 
     def _delete_unlocked(self, key: str) -> bool:
+        self._append_states.pop(key, None)
+        self._token_count_lines.pop(key, None)
+        with suppress(OSError):
+            self.get_token_counts_path(key).unlink(missing_ok=True)
         paths = [
             self.get_session_path(key),
             self.get_legacy_lossy_path(key),
@@ -1370,6 +1681,7 @@ class JsonlSessionStore:
                     data = _json_object(raw_data)
                     if data.get("_type") != "metadata":
                         return None
+                    data = _latest_metadata_record(data, path)
                     metadata_value = cast(object, data.get("metadata", {}))
                     key_value = cast(object, data.get("key"))
                     created_at_value = cast(object, data.get("created_at"))
@@ -1420,6 +1732,7 @@ class JsonlSessionStore:
                         raw_data: object = json.loads(first_line)
                         data = _json_object(raw_data)
                         if data.get("_type") == "metadata":
+                            data = _latest_metadata_record(data, path)
                             key_value = cast(object, data.get("key"))
                             key = (
                                 key_value
@@ -1463,24 +1776,26 @@ class JsonlSessionStore:
                             fallback_time = datetime.fromtimestamp(path.stat().st_mtime).isoformat()
                             created_at = cast(object, data.get("created_at"))
                             updated_at = cast(object, data.get("updated_at"))
-                            sessions.append(
-                                {
-                                    "key": key,
-                                    "created_at": (
-                                        created_at
-                                        if isinstance(created_at, str) and created_at
-                                        else fallback_time
-                                    ),
-                                    "updated_at": (
-                                        updated_at
-                                        if isinstance(updated_at, str) and updated_at
-                                        else fallback_time
-                                    ),
-                                    "title": title,
-                                    "preview": preview,
-                                    "path": str(path),
-                                }
-                            )
+                            info: SessionInfo = {
+                                "key": key,
+                                "created_at": (
+                                    created_at
+                                    if isinstance(created_at, str) and created_at
+                                    else fallback_time
+                                ),
+                                "updated_at": (
+                                    updated_at
+                                    if isinstance(updated_at, str) and updated_at
+                                    else fallback_time
+                                ),
+                                "title": title,
+                                "preview": preview,
+                                "path": str(path),
+                            }
+                            unarchived = data.get("has_unarchived_messages")
+                            if isinstance(unarchived, bool):
+                                info["has_unarchived_messages"] = unarchived
+                            sessions.append(info)
             except FileNotFoundError:
                 continue
             except _SESSION_DATA_ERRORS:
@@ -1527,6 +1842,7 @@ class SessionManager:
         self._overflow_cache: WeakValueDictionary[str, Session] = WeakValueDictionary()
         self._max_cached_sessions = SESSION_CACHE_MAX_SIZE
         self._delete_observer: Callable[[str], None] | None = None
+        self._save_observer: Callable[[str, Session | None], None] | None = None
 
     def _remember(self, session: Session) -> None:
         """Keep recent sessions strongly cached without duplicating live objects."""
@@ -1556,6 +1872,18 @@ class SessionManager:
         """Observe explicit session deletion for process-local state cleanup."""
         self._delete_observer = observer
 
+    def set_save_observer(self, observer: Callable[[str, Session | None], None]) -> None:
+        """Observe sessions as they are saved or loaded; ``None`` means deleted."""
+        self._save_observer = observer
+
+    def _notify_save_observer(self, key: str, session: Session | None) -> None:
+        if self._save_observer is None:
+            return
+        try:
+            self._save_observer(key, session)
+        except Exception:
+            logger.exception("Session save observer failed for {}", key)
+
     @staticmethod
     def safe_key(key: str) -> str:
         """Public helper used by HTTP handlers to map an arbitrary key to a stable filename stem."""
@@ -1616,6 +1944,8 @@ class SessionManager:
         session = self._load(key)
         if session is None:
             session = Session(key=key)
+        else:
+            self._notify_save_observer(key, session)
 
         self._remember(session)
         return session
@@ -1652,6 +1982,7 @@ class SessionManager:
 
         self._store.save(session, fsync=fsync)
         self._remember(session)
+        self._notify_save_observer(session.key, session)
 
     def rename_model_preset(self, old_name: str, new_name: str) -> int:
         """Rename a session-scoped model preset across durable and live sessions."""
@@ -1723,6 +2054,7 @@ class SessionManager:
         deleted = self._store.delete(key)
         if self._delete_observer is not None:
             self._delete_observer(key)
+        self._notify_save_observer(key, None)
         return deleted
 
     def restore_sessions_to_workspace(self) -> SessionRestoreResult:
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import time
 import uuid
+from collections import deque
 from collections.abc import Awaitable, Callable
-from typing import Any
+from contextlib import suppress
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Literal
 
 from loguru import logger
+from watchfiles import Change, awatch  # pyright: ignore[reportUnknownVariableType]
 
 from nanobot.agent.automation_turns import AutomationTurnError
 from nanobot.bus.events import InboundMessage, OutboundMessage
@@ -17,15 +23,74 @@ from nanobot.triggers.local_types import LocalTrigger, TriggerDelivery
 from nanobot.webui.metadata import WEBUI_MESSAGE_SOURCE_METADATA_KEY, WEBUI_TURN_METADATA_KEY
 
 
+@dataclass(slots=True)
+class _TriggerQueueStats:
+    queue_depth: int = 0
+    claimed: int = 0
+    running: int = 0
+    delivered: int = 0
+    failed: int = 0
+    last_latency_ms: int | None = None
+    max_latency_ms: int | None = None
+    active: bool = False
+
+    def reset(self, *, active: bool) -> None:
+        for spec in fields(self):
+            setattr(self, spec.name, spec.default)
+        self.active = active
+
+    def started(self, delivery: TriggerDelivery) -> None:
+        self.claimed -= 1
+        self.running += 1
+        latency_ms = max(0, int(time.time() * 1000) - delivery.created_at_ms)
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms or 0, latency_ms)
+
+
+_QUEUE_STATS = _TriggerQueueStats()
+
+
+def local_trigger_queue_stats() -> dict[str, int | None]:
+    """Return queue depth and delivery latency counters of the running queue.
+
+    ``queue_depth`` counts deliveries waiting in the inbox at the last claim,
+    ``claimed`` those claimed but still waiting for a slot, and latency is the
+    time from ``enqueue`` until the delivery's turn was submitted.  ``active``
+    is false (and every counter zero) while no queue runs in this process.
+    """
+    return asdict(_QUEUE_STATS)
+
+
+def format_local_trigger_queue_stats(stats: dict[str, int | None]) -> str:
+    """One ``/status`` line from :func:`local_trigger_queue_stats`."""
+    line = (
+        f"\U0001f514 Trigger queue: {stats['queue_depth']} pending, {stats['claimed']} claimed, "
+        f"{stats['running']} running, {stats['delivered']} delivered, {stats['failed']} failed"
+    )
+    if stats["last_latency_ms"] is not None:
+        line += f", last latency {stats['last_latency_ms']} ms"
+    return line
+
+
 async def run_local_trigger_queue(
     *,
     store: LocalTriggerStore,
     submit_turn: Callable[[InboundMessage], Awaitable[OutboundMessage | None]] | None = None,
     is_channel_enabled: Callable[[str], bool],
-    poll_interval_s: float = 0.5,
+    poll_interval_s: float = 5.0,
     batch_size: int = 20,
+    max_concurrent: int = 4,
+    watch_inbox: bool = True,
 ) -> None:
-    """Poll local trigger deliveries and submit them as session turns."""
+    """Submit local trigger deliveries as session turns.
+
+    The loop sleeps until the inbox changes: ``enqueue`` in this process wakes
+    it directly and a filesystem watcher covers other processes such as the
+    ``nanobot trigger`` CLI.  ``poll_interval_s`` is only a fallback, which
+    also paces retried deliveries.  Deliveries bound to different sessions
+    run concurrently, at most ``max_concurrent`` at a time; deliveries for
+    one session keep their inbox order.
+    """
     if submit_turn is None:
         raise ValueError("run_local_trigger_queue requires submit_turn")
     logger.info("Local trigger queue started")
@@ -35,92 +100,227 @@ async def run_local_trigger_queue(
             "Trigger: recovered {} interrupted delivery file(s) from processing",
             recovered,
         )
-    while True:
-        deliveries = store.claim_deliveries(limit=batch_size)
-        if not deliveries:
-            await asyncio.sleep(poll_interval_s)
-            continue
-
-        for delivery in deliveries:
-            try:
-                await _deliver_delivery(
-                    store,
-                    delivery,
-                    submit_turn=submit_turn,
-                    is_channel_enabled=is_channel_enabled,
-                )
-                store.complete_delivery(delivery)
-            except asyncio.CancelledError as exc:
-                store.retry_delivery(delivery, str(exc) or exc.__class__.__name__)
-                _write_delivery_run_record(
-                    store,
-                    delivery,
-                    status="interrupted",
-                    error=str(exc) or exc.__class__.__name__,
-                )
-                raise
-            except _TerminalDeliveryError as exc:
-                store.record_delivery(
-                    delivery.trigger_id,
-                    status="error",
-                    error=str(exc),
-                    run_at_ms=delivery.created_at_ms,
-                )
-                _write_delivery_run_record(
-                    store,
-                    delivery,
-                    status="error",
-                    error=str(exc),
-                )
-                store.complete_delivery(delivery)
-                logger.warning(
-                    "Trigger: dropped delivery {} for {}: {}",
-                    delivery.id,
-                    delivery.trigger_id,
-                    exc,
-                )
-            except AutomationTurnError as exc:
-                error = str(exc) or exc.__class__.__name__
-                store.record_delivery(
-                    delivery.trigger_id,
-                    status="error",
-                    error=error,
-                    run_at_ms=delivery.created_at_ms,
-                )
-                _write_delivery_run_record(
-                    store,
-                    delivery,
-                    status="error",
-                    error=error,
-                )
-                store.complete_delivery(delivery)
-                logger.warning(
-                    "Trigger: delivery {} for {} reached the agent but failed: {}",
-                    delivery.id,
-                    delivery.trigger_id,
-                    error,
-                )
-            except Exception as exc:
-                error = str(exc) or exc.__class__.__name__
-                retried = store.retry_delivery(delivery, error)
-                _write_delivery_run_record(
-                    store,
-                    delivery,
-                    status="retrying" if retried else "error",
-                    error=error,
-                )
-                store.record_delivery(
-                    delivery.trigger_id,
-                    status="error",
-                    error=error,
-                    run_at_ms=delivery.created_at_ms,
-                )
-                logger.exception(
-                    "Trigger: failed delivery {} for {}{}",
-                    delivery.id,
-                    delivery.trigger_id,
-                    "; queued retry" if retried else "; moved to failed queue",
-                )
+
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+
+    def wake() -> None:
+        loop.call_soon_threadsafe(wakeup.set)
+
+    # Retries are requeued into the inbox by this loop; they wait for the
+    # fallback poll instead of waking it, which keeps failing turns paced.
+    requeued: set[str] = set()
+
+    def on_inbox_change(names: set[str]) -> None:
+        fresh = names - requeued
+        requeued.difference_update(names)
+        if fresh:
+            wakeup.set()
+
+    remove_listener = store.add_inbox_listener(wake)
+    watcher = (
+        asyncio.create_task(
+            _watch_inbox(store.inbox_dir, on_inbox_change),
+            name="nanobot-trigger-inbox",
+        )
+        if watch_inbox
+        else None
+    )
+    slots = asyncio.Semaphore(max(1, max_concurrent))
+    lanes: dict[str, deque[TriggerDelivery]] = {}
+    workers: dict[str, asyncio.Task[None]] = {}
+    stats = _QUEUE_STATS
+    stats.reset(active=True)
+
+    async def drain(lane_key: str) -> None:
+        lane = lanes[lane_key]
+        try:
+            while lane:
+                async with slots:
+                    delivery = lane.popleft()
+                    stats.started(delivery)
+                    try:
+                        outcome = await _process_delivery(
+                            store,
+                            delivery,
+                            submit_turn=submit_turn,
+                            is_channel_enabled=is_channel_enabled,
+                        )
+                    finally:
+                        stats.running -= 1
+                if outcome == "ok":
+                    stats.delivered += 1
+                else:
+                    stats.failed += 1
+                if outcome == "retrying":
+                    if delivery.path is not None:
+                        requeued.add(delivery.path.name)
+                else:
+                    wakeup.set()
+        finally:
+            if not lane:
+                lanes.pop(lane_key, None)
+            workers.pop(lane_key, None)
+
+    try:
+        while True:
+            wakeup.clear()
+            free = batch_size - stats.claimed - stats.running
+            deliveries = store.claim_deliveries(limit=free) if free > 0 else []
+            stats.queue_depth = store.pending_delivery_count()
+            if not deliveries:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout=poll_interval_s)
+                continue
+
+            session_keys = _delivery_session_keys(store)
+            for delivery in deliveries:
+                lane_key = session_keys.get(delivery.trigger_id, f"trigger:{delivery.trigger_id}")
+                lanes.setdefault(lane_key, deque()).append(delivery)
+                stats.claimed += 1
+                if lane_key not in workers:
+                    workers[lane_key] = asyncio.create_task(
+                        drain(lane_key),
+                        name=f"nanobot-trigger-lane:{lane_key}",
+                    )
+    finally:
+        stats.reset(active=False)
+        remove_listener()
+        pending = [task for task in (watcher, *workers.values()) if task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # Claimed deliveries that never started go back to the inbox as-is.
+        for lane in lanes.values():
+            while lane:
+                delivery = lane.popleft()
+                stats.claimed -= 1
+                try:
+                    store.release_delivery(delivery)
+                except Exception:
+                    logger.exception("Trigger: failed to release delivery {}", delivery.id)
+        lanes.clear()
+
+
+def _delivery_session_keys(store: LocalTriggerStore) -> dict[str, str]:
+    try:
+        return {
+            trigger.id: f"session:{trigger.session_key}"
+            for trigger in store.list_triggers(include_disabled=True)
+        }
+    except Exception:
+        logger.exception("Trigger: failed to load triggers for delivery lanes")
+        return {}
+
+
+async def _watch_inbox(inbox_dir: Path, on_change: Callable[[set[str]], None]) -> None:
+    """Report delivery files that appear in the inbox, e.g. from the CLI."""
+
+    def is_delivery(change: Change, changed_path: str) -> bool:
+        return change != Change.deleted and changed_path.endswith(".json")
+
+    try:
+        async for changes in awatch(inbox_dir, watch_filter=is_delivery, recursive=False):
+            on_change({Path(changed_path).name for _change, changed_path in changes})
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.warning(
+            "Trigger: inbox watcher unavailable ({}); falling back to polling",
+            exc,
+        )
+
+
+async def _process_delivery(
+    store: LocalTriggerStore,
+    delivery: TriggerDelivery,
+    *,
+    submit_turn: Callable[[InboundMessage], Awaitable[OutboundMessage | None]],
+    is_channel_enabled: Callable[[str], bool],
+) -> Literal["ok", "error", "retrying"]:
+    """Deliver one claimed delivery and report how it ended."""
+    try:
+        await _deliver_delivery(
+            store,
+            delivery,
+            submit_turn=submit_turn,
+            is_channel_enabled=is_channel_enabled,
+        )
+        store.complete_delivery(delivery)
+        return "ok"
+    except asyncio.CancelledError as exc:
+        store.retry_delivery(delivery, str(exc) or exc.__class__.__name__)
+        _write_delivery_run_record(
+            store,
+            delivery,
+            status="interrupted",
+            error=str(exc) or exc.__class__.__name__,
+        )
+        raise
+    except _TerminalDeliveryError as exc:
+        store.record_delivery(
+            delivery.trigger_id,
+            status="error",
+            error=str(exc),
+            run_at_ms=delivery.created_at_ms,
+        )
+        _write_delivery_run_record(
+            store,
+            delivery,
+            status="error",
+            error=str(exc),
+        )
+        store.complete_delivery(delivery)
+        logger.warning(
+            "Trigger: dropped delivery {} for {}: {}",
+            delivery.id,
+            delivery.trigger_id,
+            exc,
+        )
+    except AutomationTurnError as exc:
+        error = str(exc) or exc.__class__.__name__
+        store.record_delivery(
+            delivery.trigger_id,
+            status="error",
+            error=error,
+            run_at_ms=delivery.created_at_ms,
+        )
+        _write_delivery_run_record(
+            store,
+            delivery,
+            status="error",
+            error=error,
+        )
+        store.complete_delivery(delivery)
+        logger.warning(
+            "Trigger: delivery {} for {} reached the agent but failed: {}",
+            delivery.id,
+            delivery.trigger_id,
+            error,
+        )
+    except Exception as exc:
+        error = str(exc) or exc.__class__.__name__
+        retried = store.retry_delivery(delivery, error)
+        _write_delivery_run_record(
+            store,
+            delivery,
+            status="retrying" if retried else "error",
+            error=error,
+        )
+        store.record_delivery(
+            delivery.trigger_id,
+            status="error",
+            error=error,
+            run_at_ms=delivery.created_at_ms,
+        )
+        logger.exception(
+            "Trigger: failed delivery {} for {}{}",
+            delivery.id,
+            delivery.trigger_id,
+            "; queued retry" if retried else "; moved to failed queue",
+        )
+        return "retrying" if retried else "error"
+    return "error"
 
 
 class _TerminalDeliveryError(RuntimeError):
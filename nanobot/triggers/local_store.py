@@ -6,8 +6,10 @@ import errno
 import json
 import os
 import secrets
+import threading
 import time
 import uuid
+from collections.abc import Callable
 from contextlib import suppress
 from pathlib import Path
 from typing import Any, cast
@@ -25,6 +27,11 @@ _MAX_DELIVERY_ATTEMPTS = 10
 _RUN_RECORD_TEXT_MAX_CHARS = 4000
 _PROCESSING_RECOVERY_ERROR = "delivery was recovered from interrupted processing"
 
+# In-process inbox listeners, keyed by inbox directory, so an ``enqueue`` from
+# any store instance in the gateway wakes the delivery loop immediately.
+_INBOX_LISTENERS: dict[Path, list[Callable[[], None]]] = {}
+_INBOX_LISTENERS_LOCK = threading.Lock()
+
 
 class TriggerStoreError(RuntimeError):
     """Base class for trigger store errors."""
@@ -197,7 +204,44 @@ class LocalTriggerStore:
                     run_record_path.unlink(missing_ok=True)
                 delivery.path = None
                 raise
-            return delivery
+        self._notify_inbox_listeners()
+        return delivery
+
+    def add_inbox_listener(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call *callback* after each in-process ``enqueue``; return a remover.
+
+        The callback runs on the enqueuing thread and must be thread-safe.
+        """
+        key = self.inbox_dir.resolve(strict=False)
+        with _INBOX_LISTENERS_LOCK:
+            _INBOX_LISTENERS.setdefault(key, []).append(callback)
+
+        def remove() -> None:
+            with _INBOX_LISTENERS_LOCK:
+                listeners = _INBOX_LISTENERS.get(key, [])
+                with suppress(ValueError):
+                    listeners.remove(callback)
+                if not listeners:
+                    _INBOX_LISTENERS.pop(key, None)
+
+        return remove
+
+    def _notify_inbox_listeners(self) -> None:
+        with _INBOX_LISTENERS_LOCK:
+            listeners = list(_INBOX_LISTENERS.get(self.inbox_dir.resolve(strict=False), ()))
+        for callback in listeners:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Trigger: inbox listener failed")
+
+    def pending_delivery_count(self) -> int:
+        """Return the number of deliveries waiting in the inbox."""
+        try:
+            with os.scandir(self.inbox_dir) as entries:
+                return sum(1 for entry in entries if entry.name.endswith(".json"))
+        except OSError:
+            return 0
 
     def claim_deliveries(self, *, limit: int = 20) -> list[TriggerDelivery]:
         """Move pending deliveries into processing and return them."""
@@ -219,6 +263,15 @@ class LocalTriggerStore:
                 claimed.append(delivery)
         return claimed
 
+    def release_delivery(self, delivery: TriggerDelivery) -> None:
+        """Return a claimed delivery that never started to the inbox unchanged."""
+        if delivery.path is None:
+            return
+        self._ensure_dirs()
+        with self._lock:
+            with suppress(FileNotFoundError):
+                os.replace(delivery.path, self.inbox_dir / delivery.path.name)
+
     def recover_processing_deliveries(self) -> int:
         """Requeue deliveries left in processing by an interrupted gateway."""
         self._ensure_dirs()
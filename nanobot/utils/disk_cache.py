@@ -0,0 +1,96 @@
+"""Flat cache directories under the instance's runtime data dir.
+
+The image pipeline and the web result cache both keep derived data on disk
+so a restart does not redo the work.  :class:`DiskCacheDir` owns the shared
+mechanics: files are replaced atomically, and once a directory holds more
+than its bound the oldest files are pruned.  The directory is resolved on
+first use, so building a cache never touches the disk and picks up the data
+dir of the config that is active by then.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from loguru import logger
+
+from nanobot.config.paths import get_runtime_subdir
+
+
+def runtime_cache_dir(name: str, *parts: str) -> Path:
+    """Return ``<data dir>/<name>[/<parts>...]`` for a cache kept across restarts."""
+    return get_runtime_subdir(name).joinpath(*parts)
+
+
+class DiskCacheDir:
+    """Bounded directory of cache files, written atomically and pruned oldest-first.
+
+    *directory* is either a path or a zero-argument callable returning one
+    (see :meth:`runtime`).  Only files ending in *suffix* count toward
+    *max_entries*.  All methods do blocking I/O; async callers should run
+    them in a worker thread.
+    """
+
+    def __init__(
+        self,
+        directory: Path | Callable[[], Path],
+        *,
+        max_entries: int,
+        suffix: str = "",
+    ) -> None:
+        self._directory = directory
+        self.max_entries = max_entries
+        self.suffix = suffix
+
+    @classmethod
+    def runtime(cls, name: str, *parts: str, max_entries: int, suffix: str = "") -> DiskCacheDir:
+        """Cache directory under :func:`nanobot.config.paths.get_runtime_subdir`."""
+        return cls(partial(runtime_cache_dir, name, *parts), max_entries=max_entries, suffix=suffix)
+
+    @property
+    def path(self) -> Path:
+        if not isinstance(self._directory, Path):
+            self._directory = self._directory()
+        return self._directory
+
+    def read_bytes(self, filename: str) -> bytes | None:
+        try:
+            return (self.path / filename).read_bytes()
+        except OSError:
+            return None
+
+    def write_bytes(self, filename: str, data: bytes) -> bool:
+        """Atomically replace *filename* with *data*; returns ``False`` if the write failed."""
+        target: Path | None = None
+        tmp: Path | None = None
+        try:
+            directory = self.path
+            target = directory / filename
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+            self.prune()
+        except OSError as e:
+            logger.debug("Could not write cache file {}: {}", target or filename, e)
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+            return False
+        return True
+
+    def prune(self) -> None:
+        """Delete the oldest cache files beyond :attr:`max_entries`."""
+        entries = [
+            entry
+            for entry in os.scandir(self.path)
+            if entry.is_file() and entry.name.endswith(self.suffix) and not entry.name.endswith(".tmp")
+        ]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[: len(entries) - self.max_entries]:
+            Path(entry.path).unlink(missing_ok=True)
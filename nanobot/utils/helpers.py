@@ -1,6 +1,7 @@
 """Utility functions for nanobot."""
 
 import base64
+import hashlib
 import json
 import os
 import re
@@ -8,6 +9,8 @@ import shutil
 import stat
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from contextlib import suppress
 from datetime import datetime
 from functools import lru_cache
@@ -19,6 +22,7 @@ from loguru import logger
 
 _TOOLS_TOKEN_CACHE_MAX_ENTRIES = 64
 _TOOLS_TOKEN_CACHE: dict[int, tuple[tuple[int, ...], dict[bool, int]]] = {}
+_TOKEN_COUNT_CACHE_MAX_ENTRIES = 8192
 _T = TypeVar("_T")
 
 
@@ -730,8 +734,7 @@ def estimate_prompt_tokens(
     return estimated
 
 
-def estimate_message_tokens(message: dict[str, Any]) -> int:
-    """Estimate prompt tokens contributed by one persisted message."""
+def _message_token_payload(message: dict[str, Any], *, text_parts_only: bool = False) -> str:
     content = message.get("content")
     parts: list[str] = []
     if isinstance(content, str):
@@ -743,7 +746,7 @@ def estimate_message_tokens(message: dict[str, Any]) -> int:
                 text = part.get("text", "")
                 if isinstance(text, str) and text:
                     parts.append(text)
-            else:
+            elif not text_parts_only:
                 parts.append(json.dumps(raw_part, ensure_ascii=False))
     elif content is not None:
         parts.append(json.dumps(content, ensure_ascii=False))
@@ -759,7 +762,10 @@ def estimate_message_tokens(message: dict[str, Any]) -> int:
     if isinstance(rc, str) and rc:
         parts.append(rc)
 
-    payload = "\n".join(parts)
+    return "\n".join(parts)
+
+
+def _count_payload_tokens(payload: str) -> int:
     if not payload:
         return 4
     try:
@@ -769,19 +775,124 @@ def estimate_message_tokens(message: dict[str, Any]) -> int:
         return max(4, len(payload.encode("utf-8")) + 4)
 
 
+def _token_encoding_available() -> bool:
+    try:
+        _get_token_encoding()
+    except Exception:
+        return False
+    return True
+
+
+class TokenCountCache:
+    """Bounded per-message token counts keyed by a hash of the counted payload.
+
+    Hashing the payload is far cheaper than re-encoding it, so replaying an
+    unchanged history costs one dict lookup per message. Entries added since
+    the last :meth:`drain_pending` call are tracked so a store can persist only
+    the new counts. Only counts from the real encoder are cached; byte-heuristic
+    fallbacks are recomputed until the encoder loads.
+    """
+
+    def __init__(self, max_entries: int = _TOKEN_COUNT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._pending: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @staticmethod
+    def payload_key(payload: str) -> str:
+        return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+    def count(
+        self,
+        message: dict[str, Any],
+        estimate: Callable[[dict[str, Any]], int] | None = None,
+    ) -> int:
+        """Return the cached count for *message*, estimating it on a miss.
+
+        Without *estimate*, only text content parts are counted, as in the
+        whole-prompt estimate, so image data is not counted as text.
+        """
+        payload = _message_token_payload(message, text_parts_only=estimate is None)
+        key = self.payload_key(payload)
+        cached = self._counts.get(key)
+        if cached is not None:
+            self._counts.move_to_end(key)
+            return cached
+        tokens = estimate(message) if estimate is not None else _count_payload_tokens(payload)
+        if not _token_encoding_available():
+            return tokens
+        self._store(key, tokens)
+        self._pending[key] = tokens
+        return tokens
+
+    def load(self, entries: Iterable[tuple[str, int]]) -> None:
+        """Seed counts persisted by a previous process without marking them pending."""
+        for key, tokens in entries:
+            self._store(key, tokens)
+
+    def items(self) -> list[tuple[str, int]]:
+        return list(self._counts.items())
+
+    def drain_pending(self) -> dict[str, int]:
+        pending, self._pending = self._pending, {}
+        return {key: tokens for key, tokens in pending.items() if key in self._counts}
+
+    def _store(self, key: str, tokens: int) -> None:
+        self._counts[key] = tokens
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+
+
+def estimate_message_tokens(message: dict[str, Any]) -> int:
+    """Estimate prompt tokens contributed by one persisted message."""
+    return _count_payload_tokens(_message_token_payload(message))
+
+
 def estimate_prompt_tokens_chain(
     provider: object,
     model: str | None,
     messages: list[dict[str, Any]],
     tools: list[dict[str, Any]] | None = None,
+    *,
+    cache: TokenCountCache | None = None,
+    cacheable: Callable[[dict[str, Any]], bool] | None = None,
 ) -> tuple[int, str]:
-    """Estimate prompt tokens via provider, tiktoken, then a byte heuristic."""
+    """Estimate prompt tokens via provider, tiktoken, then a byte heuristic.
+
+    With *cache*, the local estimate sums cached per-message counts instead of
+    encoding the whole joined payload, so unchanged messages are not re-encoded.
+    Messages rejected by *cacheable* (e.g. a per-turn system prompt) are
+    counted without entering the cache.
+    """
     provider_counter = getattr(provider, "estimate_prompt_tokens", None)
     if callable(provider_counter):
         with suppress(Exception):
             tokens, source = cast(tuple[object, object], provider_counter(messages, tools, model))
             if isinstance(tokens, (int, float)) and tokens > 0:
                 return int(tokens), str(source or "provider_counter")
+    if cache is not None:
+        try:
+            enc = _get_token_encoding()
+        except Exception:
+            enc = None
+        if enc is not None:
+            message_tokens = sum(
+                cache.count(message)
+                if cacheable is None or cacheable(message)
+                else _count_payload_tokens(_message_token_payload(message, text_parts_only=True))
+                for message in messages
+            )
+            tool_tokens = (
+                _estimate_tools_tokens(enc, tools, leading_separator=bool(messages))
+                if tools
+                else 0
+            )
+            if message_tokens + tool_tokens > 0:
+                return message_tokens + tool_tokens, "tiktoken"
     estimated, source = _estimate_prompt_tokens_with_source(messages, tools)
     if estimated > 0:
         return int(estimated), source
@@ -800,6 +911,8 @@ def build_status_content(
     search_usage_text: str | None = None,
     active_task_count: int = 0,
     max_completion_tokens: int = 8192,
+    admission_text: str | None = None,
+    runtime_lines: Sequence[str] = (),
 ) -> str:
     """Build a human-readable runtime status snapshot.
 
@@ -807,6 +920,10 @@ def build_status_content(
         search_usage_text: Optional pre-formatted web search usage string
                            (produced by SearchUsageInfo.format()). When provided
                            it is appended as an extra section.
+        admission_text: Optional provider admission summary, shown after the
+                        task count while the model is being throttled.
+        runtime_lines: Process-wide queue and cache summaries, shown after the
+                       admission line.
     """
     uptime_s = int(time.time() - start_time)
     uptime = (
@@ -839,6 +956,9 @@ def build_status_content(
         f"\u23f1 Uptime: {uptime}",
         f"\u26a1 Tasks: {active_task_count} active",
     ]
+    if admission_text:
+        lines.append(admission_text)
+    lines.extend(runtime_lines)
     if search_usage_text:
         lines.append(search_usage_text)
     return "\n".join(lines)
@@ -0,0 +1,169 @@
+"""Process-wide pool of keep-alive ``httpx.AsyncClient`` instances.
+
+Web search/fetch, transcription and image generation used to open a fresh
+client per call and paid TCP+TLS setup every time.  They now borrow a shared
+client keyed by its :class:`HttpClientPolicy` (proxy, timeout, redirect and
+DNS-pinning behaviour), so connections stay alive between calls.  Clients
+are bound to the event loop that created them; the gateway closes the pool
+on shutdown via :func:`close_http_clients`.  Pooled clients serve every
+session, so they never store cookies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import weakref
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, replace
+from functools import cache
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+from loguru import logger
+
+# httpx's own default when no timeout is passed.
+DEFAULT_TIMEOUT_S = 5.0
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+
+
+@dataclass(frozen=True, slots=True)
+class HttpClientPolicy:
+    """Everything that makes two pooled clients non-interchangeable."""
+
+    proxy: str | None = None
+    timeout: float | None = DEFAULT_TIMEOUT_S
+    trust_env: bool = True
+    follow_redirects: bool = False
+    # Builds the client's transport, e.g. a PinnedDNSAsyncTransport for SSRF-
+    # pinned fetches; called with the pool's ``limits=`` keyword.  Pass a
+    # module-level callable so equal policies share a client; an explicit
+    # proxy takes precedence and owns DNS resolution.
+    transport_factory: Callable[..., httpx.AsyncBaseTransport] | None = None
+    # Only honoured when the optional ``h2`` package is installed.
+    http2: bool = False
+
+
+class HttpClientPool:
+    """Shared clients per (event loop, policy) with hit/miss counters."""
+
+    def __init__(self, *, limits: httpx.Limits = _POOL_LIMITS) -> None:
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[HttpClientPolicy, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def client(self, policy: HttpClientPolicy | None = None, **fields: Any) -> httpx.AsyncClient:
+        """Return the shared client for *policy* on the running loop, creating it on a miss."""
+        policy = replace(policy or HttpClientPolicy(), **fields)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(policy)
+            if client is not None and not getattr(client, "is_closed", False):
+                self.hits += 1
+                return client
+            self.misses += 1
+            client = clients[policy] = self._build(policy)
+            return client
+
+    @asynccontextmanager
+    async def borrow(
+        self, policy: HttpClientPolicy | None = None, **fields: Any
+    ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """``async with`` form of :meth:`client`; leaving the block keeps the client open."""
+        yield self.client(policy, **fields)
+
+    async def aclose(self) -> None:
+        """Close every client owned by the running loop.
+
+        Clients of other loops cannot be closed from here; they stay pooled
+        for their own loop and are dropped with it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = list(self._clients.pop(loop, {}).values())
+        for client in owned:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Closing pooled HTTP client failed: {}", e)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            open_clients = sum(len(clients) for clients in self._clients.values())
+            return {"hits": self.hits, "misses": self.misses, "open_clients": open_clients}
+
+    def client_kwargs(self, policy: HttpClientPolicy) -> dict[str, Any]:
+        """Keyword arguments the pooled ``httpx.AsyncClient`` for *policy* is built with."""
+        kwargs: dict[str, Any] = {
+            # A jar that accepts no cookies: a Set-Cookie from one caller's
+            # response must not ride along on another caller's request.
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            "timeout": policy.timeout,
+            "trust_env": policy.trust_env,
+            "follow_redirects": policy.follow_redirects,
+        }
+        if policy.proxy:
+            kwargs["proxy"] = policy.proxy
+        elif policy.transport_factory is not None:
+            from nanobot.security.network import httpx_env_proxy_mounts
+
+            # httpx ignores ``limits`` once a transport is given, so the pool
+            # limits go to the transport.  A custom transport also disables
+            # httpx's env-proxy lookup, so mount the environment's proxies
+            # explicitly.
+            kwargs["transport"] = policy.transport_factory(limits=self._limits)
+            mounts = httpx_env_proxy_mounts(limits=self._limits) if policy.trust_env else {}
+            if mounts:
+                kwargs["mounts"] = mounts
+            return kwargs
+        kwargs["limits"] = self._limits
+        if policy.http2 and _h2_available():
+            kwargs["http2"] = True
+        return kwargs
+
+    def _build(self, policy: HttpClientPolicy) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self.client_kwargs(policy))
+
+
+@cache
+def _h2_available() -> bool:
+    return find_spec("h2") is not None
+
+
+_pool = HttpClientPool()
+
+
+def http_client_pool() -> HttpClientPool:
+    return _pool
+
+
+def pooled_client(
+    policy: HttpClientPolicy | None = None, **fields: Any
+) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Borrow the shared client for *policy*: ``async with pooled_client(proxy=p) as client``."""
+    return _pool.borrow(policy, **fields)
+
+
+async def close_http_clients() -> None:
+    await _pool.aclose()
+
+
+def http_client_pool_stats() -> dict[str, int]:
+    """Return pooled client hit/miss counters and the number of open clients."""
+    return _pool.stats()
+
+
+def format_http_client_pool_stats(stats: dict[str, int]) -> str:
+    """One ``/status`` line from :func:`http_client_pool_stats`."""
+    return (
+        f"\U0001f517 HTTP pool: {stats['hits']} reused, {stats['misses']} opened, "
+        f"{stats['open_clients']} open"
+    )
@@ -0,0 +1,237 @@
+"""Downscale and cache image attachments before they are sent to a provider.
+
+Phone photos are often 8-12 MB; base64-encoding them verbatim makes every
+request that carries the turn huge and slow to serialise.  The pipeline
+shrinks oversized images to the active provider's :class:`ImageLimits`,
+keyed by a hash of the original bytes, and keeps the encoded result both in
+an in-memory LRU bounded by total data-URL size and under the runtime
+``image-cache`` directory so a restart does not redo the work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import io
+import mimetypes
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from nanobot.utils.disk_cache import DiskCacheDir
+from nanobot.utils.helpers import detect_image_mime
+
+_IMAGE_CACHE_DIR = "image-cache"
+# Data URLs are ~4/3 of the image bytes; a few dozen provider-sized images.
+_MEMORY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_DISK_CACHE_MAX_ENTRIES = 512
+_DIGEST_MEMO_MAX_ENTRIES = 1024
+_JPEG_QUALITIES = (85, 75, 65, 50)
+_MIN_EDGE = 256
+_NOT_AN_IMAGE = ""
+_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif", "image/webp": ".webp"}
+
+
+@dataclass(frozen=True, slots=True)
+class ImageLimits:
+    """Largest image a provider should receive: long edge in pixels and encoded bytes."""
+
+    max_edge: int = 2048
+    max_bytes: int = 5 * 1024 * 1024
+
+    @property
+    def tag(self) -> str:
+        return f"{self.max_edge}x{self.max_bytes}"
+
+
+DEFAULT_IMAGE_LIMITS = ImageLimits()
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedImage:
+    mime: str
+    data_url: str
+
+
+class ImagePipeline:
+    """Content-hash cache of provider-ready image data URLs.
+
+    :meth:`prepare` is synchronous and safe to call from any thread; the
+    agent loop calls :meth:`warm` first so decoding and resizing happen in a
+    worker thread and message assembly only hits the in-memory cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | DiskCacheDir | None,
+        *,
+        max_bytes: int = _MEMORY_CACHE_MAX_BYTES,
+        max_disk_entries: int = _DISK_CACHE_MAX_ENTRIES,
+    ) -> None:
+        if isinstance(cache_dir, Path):
+            cache_dir = DiskCacheDir(cache_dir, max_entries=max_disk_entries)
+        self.disk = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._prepared: OrderedDict[tuple[str, ImageLimits], PreparedImage] = OrderedDict()
+        self._prepared_bytes = 0
+        # (path, size, mtime_ns) -> content digest, so cache hits skip reading the file.
+        self._digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+    @classmethod
+    def for_runtime(cls) -> ImagePipeline:
+        """Pipeline whose disk tier lives in the instance's ``image-cache`` directory."""
+        return cls(DiskCacheDir.runtime(_IMAGE_CACHE_DIR, max_entries=_DISK_CACHE_MAX_ENTRIES))
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total data-URL characters currently held by the in-memory LRU."""
+        with self._lock:
+            return self._prepared_bytes
+
+    def prepare(self, path: str | Path, limits: ImageLimits = DEFAULT_IMAGE_LIMITS) -> PreparedImage | None:
+        """Return the data URL for the image at *path*, or ``None`` if it is not an image."""
+        p = Path(path)
+        try:
+            stat = p.stat()
+        except OSError:
+            return None
+        stat_key = (str(p), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            known = self._digests.get(stat_key)
+            if known == _NOT_AN_IMAGE:
+                return None
+            if known is not None and (cached := self._prepared.get((known, limits))) is not None:
+                self._prepared.move_to_end((known, limits))
+                return cached
+        try:
+            raw = p.read_bytes()
+        except OSError:
+            return None
+        # Re-detect from the bytes used for the request: the file may have
+        # changed since attachment routing, and the data URL needs its MIME.
+        mime = detect_image_mime(raw) or mimetypes.guess_type(str(p))[0]
+        if not mime or not mime.startswith("image/"):
+            with self._lock:
+                self._remember(self._digests, stat_key, _NOT_AN_IMAGE, _DIGEST_MEMO_MAX_ENTRIES)
+            return None
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        prepared = self._load_disk(digest, limits)
+        if prepared is None:
+            data, out_mime = shrink_image(raw, mime, limits)
+            prepared = _prepared(data, out_mime)
+            if data is not raw:
+                self._store_disk(digest, limits, data, out_mime)
+        with self._lock:
+            self._remember(self._digests, stat_key, digest, _DIGEST_MEMO_MAX_ENTRIES)
+            self._remember_prepared((digest, limits), prepared)
+        return prepared
+
+    async def warm(self, paths: Iterable[str], limits: ImageLimits = DEFAULT_IMAGE_LIMITS) -> None:
+        """Prepare *paths* in a worker thread so later :meth:`prepare` calls are cache hits."""
+        pending = list(paths)
+        if pending:
+            await asyncio.to_thread(self._prepare_all, pending, limits)
+
+    def _prepare_all(self, paths: list[str], limits: ImageLimits) -> None:
+        for path in paths:
+            self.prepare(path, limits)
+
+    @staticmethod
+    def _remember(cache: OrderedDict[Any, Any], key: object, value: object, limit: int) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def _remember_prepared(self, key: tuple[str, ImageLimits], prepared: PreparedImage) -> None:
+        """Insert under ``self._lock``, evicting least recently used images past :attr:`max_bytes`."""
+        previous = self._prepared.pop(key, None)
+        if previous is not None:
+            self._prepared_bytes -= len(previous.data_url)
+        self._prepared[key] = prepared
+        self._prepared_bytes += len(prepared.data_url)
+        # Always keep the newest image, even one larger than the whole budget.
+        while self._prepared_bytes > self.max_bytes and len(self._prepared) > 1:
+            _key, evicted = self._prepared.popitem(last=False)
+            self._prepared_bytes -= len(evicted.data_url)
+
+    def _disk_stem(self, digest: str, limits: ImageLimits) -> str:
+        return f"{digest}-{limits.tag}"
+
+    def _load_disk(self, digest: str, limits: ImageLimits) -> PreparedImage | None:
+        if self.disk is None:
+            return None
+        stem = self._disk_stem(digest, limits)
+        for mime, ext in _EXTENSIONS.items():
+            data = self.disk.read_bytes(f"{stem}{ext}")
+            if data is not None:
+                return _prepared(data, mime)
+        return None
+
+    def _store_disk(self, digest: str, limits: ImageLimits, data: bytes, mime: str) -> None:
+        if self.disk is not None:
+            self.disk.write_bytes(f"{self._disk_stem(digest, limits)}{_EXTENSIONS.get(mime, '.bin')}", data)
+
+
+def _prepared(data: bytes, mime: str) -> PreparedImage:
+    return PreparedImage(mime=mime, data_url=f"data:{mime};base64,{base64.b64encode(data).decode()}")
+
+
+def shrink_image(raw: bytes, mime: str, limits: ImageLimits) -> tuple[bytes, str]:
+    """Fit *raw* within *limits*; returns the original bytes when it already fits.
+
+    Oversized images are EXIF-rotated, scaled to ``max_edge`` and re-encoded
+    (PNG when they carry transparency, otherwise JPEG at falling quality),
+    halving the edge further until the result fits ``max_bytes``.  Without
+    Pillow, or for images it cannot decode, the original is returned as is.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return raw, mime
+    try:
+        with Image.open(io.BytesIO(raw)) as probe:
+            width, height = probe.size
+        if len(raw) <= limits.max_bytes and max(width, height) <= limits.max_edge:
+            return raw, mime
+        with Image.open(io.BytesIO(raw)) as source:
+            image = ImageOps.exif_transpose(source)
+            image.load()
+    except Exception as e:
+        logger.warning("Could not decode image for resizing ({}); sending original: {}", mime, e)
+        return raw, mime
+
+    keep_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+    edge = min(limits.max_edge, max(image.size))
+    best: tuple[bytes, str] = (raw, mime)
+    while True:
+        resized = image.copy()
+        resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        for data, out_mime in _encodings(resized, keep_alpha):
+            if len(data) < len(best[0]):
+                best = (data, out_mime)
+            if len(data) <= limits.max_bytes:
+                return data, out_mime
+        if edge <= _MIN_EDGE:
+            return best
+        edge = max(_MIN_EDGE, edge // 2)
+
+
+def _encodings(image: Any, keep_alpha: bool) -> Iterator[tuple[bytes, str]]:
+    if keep_alpha:
+        buffer = io.BytesIO()
+        image.convert("RGBA").save(buffer, format="PNG", optimize=True)
+        yield buffer.getvalue(), "image/png"
+        return
+    rgb = image.convert("RGB")
+    for quality in _JPEG_QUALITIES:
+        buffer = io.BytesIO()
+        rgb.save(buffer, format="JPEG", quality=quality, optimize=True)
+        yield buffer.getvalue(), "image/jpeg"
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, cast
 
+from nanobot.utils.web_cache import WebCacheCounters, web_cache_stats
+
 
 @dataclass
 class SearchUsageInfo:
@@ -26,17 +28,20 @@ class SearchUsageInfo:
     extract_used: int | None = None
     crawl_used: int | None = None
 
+    # Local web_search / web_fetch result cache, keyed by "search" / "fetch"
+    cache: dict[str, WebCacheCounters] = field(default_factory=dict)
+
     def format(self) -> str:
         """Return a human-readable multi-line string for /status output."""
         lines: list[str] = [f"🔍 Web Search: {self.provider}"]
 
         if not self.supported:
             lines.append("   Usage tracking: not available for this provider")
-            return "\n".join(lines)
+            return self._with_cache_line(lines)
 
         if self.error:
             lines.append(f"   Usage: unavailable ({self.error})")
-            return "\n".join(lines)
+            return self._with_cache_line(lines)
 
         if self.used is not None and self.limit is not None:
             lines.append(f"   Usage: {self.used} / {self.limit} requests")
@@ -60,6 +65,20 @@ class SearchUsageInfo:
         if self.reset_date:
             lines.append(f"   Resets: {self.reset_date}")
 
+        return self._with_cache_line(lines)
+
+    def _with_cache_line(self, lines: list[str]) -> str:
+        parts: list[str] = []
+        for kind in ("search", "fetch"):
+            counters = self.cache.get(kind)
+            if counters is None or not counters.lookups:
+                continue
+            part = f"{kind} {counters.hits}/{counters.lookups} hits ({counters.hit_rate:.0%})"
+            if counters.revalidated:
+                part += f", {counters.revalidated} revalidated"
+            parts.append(part)
+        if parts:
+            lines.append(f"   Cache: {' | '.join(parts)}")
         return "\n".join(lines)
 
 
@@ -80,10 +99,12 @@ async def fetch_search_usage(
     p = (provider or "duckduckgo").strip().lower()
 
     if p == "tavily":
-        return await _fetch_tavily_usage(api_key)
+        info = await _fetch_tavily_usage(api_key)
     else:
         # brave, duckduckgo, searxng, jina, unknown — no usage API
-        return SearchUsageInfo(provider=p, supported=False)
+        info = SearchUsageInfo(provider=p, supported=False)
+    info.cache = web_cache_stats()
+    return info
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,211 @@
+"""Bounded memory + disk cache for ``web_search`` and ``web_fetch`` results.
+
+Agents often repeat the same search or re-read the same page within a
+session, and every repeat costs a provider request and seconds of latency.
+Results are kept in a small in-memory LRU and as JSON files under the
+runtime ``web-cache/<kind>/`` directory so restarts keep them; the disk tier
+is read and written in a worker thread, off the event loop.  Entries
+carry the time they were stored plus any ``ETag`` / ``Last-Modified``
+validators; a stale fetch entry with validators can be revalidated with a
+conditional request instead of being re-extracted.  Process-wide hit/miss
+counters are reported by ``/status`` through :func:`web_cache_stats`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from nanobot.utils.disk_cache import DiskCacheDir
+
+_WEB_CACHE_DIR = "web-cache"
+_MEMORY_CACHE_MAX_ENTRIES = 128
+_DISK_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass(slots=True)
+class WebCacheEntry:
+    """One cached result; ``payload`` is whatever JSON the owning tool stores."""
+
+    payload: dict[str, Any]
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, ttl_s: float, now: float | None = None) -> bool:
+        return ((now if now is not None else time.time()) - self.stored_at) < ttl_s
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(slots=True)
+class WebCacheCounters:
+    """Lookup outcomes for one cache kind (``search`` or ``fetch``)."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+_counters_lock = threading.Lock()
+_counters: dict[str, WebCacheCounters] = {}
+
+
+def record_web_cache_lookup(kind: str, *, hit: bool, revalidated: bool = False) -> None:
+    """Count one lookup; a revalidated entry counts as a hit."""
+    with _counters_lock:
+        counters = _counters.setdefault(kind, WebCacheCounters())
+        if hit:
+            counters.hits += 1
+            if revalidated:
+                counters.revalidated += 1
+        else:
+            counters.misses += 1
+
+
+def web_cache_stats() -> dict[str, WebCacheCounters]:
+    """Return a snapshot of the per-kind lookup counters."""
+    with _counters_lock:
+        return {kind: WebCacheCounters(**asdict(c)) for kind, c in _counters.items()}
+
+
+def reset_web_cache_stats() -> None:
+    with _counters_lock:
+        _counters.clear()
+
+
+class WebResultCache:
+    """Key -> :class:`WebCacheEntry` store with an LRU front and an optional disk tier.
+
+    Lookups return stale entries too; callers decide between serving,
+    revalidating or refetching with :meth:`WebCacheEntry.is_fresh`.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        ttl_s: float,
+        directory: Path | DiskCacheDir | None = None,
+        max_entries: int = _MEMORY_CACHE_MAX_ENTRIES,
+        max_disk_entries: int = _DISK_CACHE_MAX_ENTRIES,
+    ) -> None:
+        if isinstance(directory, Path):
+            directory = DiskCacheDir(directory, max_entries=max_disk_entries, suffix=".json")
+        self.kind = kind
+        self.ttl_s = ttl_s
+        self.disk = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, WebCacheEntry] = OrderedDict()
+
+    @classmethod
+    def for_runtime(
+        cls,
+        kind: str,
+        *,
+        ttl_s: float,
+        max_entries: int = _MEMORY_CACHE_MAX_ENTRIES,
+        max_disk_entries: int = _DISK_CACHE_MAX_ENTRIES,
+    ) -> WebResultCache:
+        """Cache whose disk tier lives in the instance's ``web-cache/<kind>`` directory."""
+        return cls(
+            kind,
+            ttl_s=ttl_s,
+            directory=DiskCacheDir.runtime(
+                _WEB_CACHE_DIR, kind, max_entries=max_disk_entries, suffix=".json"
+            ),
+            max_entries=max_entries,
+        )
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> WebCacheEntry | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if self.disk is None:
+            return None
+        entry = await asyncio.to_thread(self._load_disk, self.disk, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def get_fresh(self, key: str) -> WebCacheEntry | None:
+        """Return the entry for *key* only while it is within the TTL, counting the lookup."""
+        entry = await self.get(key)
+        hit = entry is not None and entry.is_fresh(self.ttl_s)
+        record_web_cache_lookup(self.kind, hit=hit)
+        return entry if hit else None
+
+    async def put(
+        self,
+        key: str,
+        payload: dict[str, Any],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> WebCacheEntry:
+        entry = WebCacheEntry(payload=payload, stored_at=time.time(), etag=etag, last_modified=last_modified)
+        self._remember(key, entry)
+        if self.disk is not None:
+            data = json.dumps(asdict(entry), ensure_ascii=False).encode("utf-8")
+            await asyncio.to_thread(self.disk.write_bytes, f"{key}.json", data)
+        return entry
+
+    async def refresh(self, key: str, entry: WebCacheEntry) -> WebCacheEntry:
+        """Restart *entry*'s TTL after the origin confirmed it unchanged (HTTP 304)."""
+        return await self.put(key, entry.payload, etag=entry.etag, last_modified=entry.last_modified)
+
+    def _remember(self, key: str, entry: WebCacheEntry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _load_disk(disk: DiskCacheDir, key: str) -> WebCacheEntry | None:
+        raw = disk.read_bytes(f"{key}.json")
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+            return WebCacheEntry(
+                payload=data["payload"],
+                stored_at=float(data["stored_at"]),
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
@@ -76,6 +76,11 @@ def host_for_url(host: str, port: int) -> str:
 
 
 def accepts_gzip(value: str) -> bool:
+    return accepts_content_coding(value, "gzip")
+
+
+def accepts_content_coding(value: str, coding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows *coding* (``q=0`` rejects it)."""
     wildcard_quality: float | None = None
     for item in value.split(","):
         name, *params = (part.strip() for part in item.split(";"))
@@ -88,7 +93,7 @@ def accepts_gzip(value: str) -> bool:
                 except ValueError:
                     quality = 0.0
                 break
-        if name.lower() == "gzip":
+        if name.lower() == coding:
             return quality > 0
         if name == "*":
             wildcard_quality = quality
@@ -139,6 +144,33 @@ def http_response(
     return Response(status, reason, Headers(headers), body)
 
 
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header value against *etag*."""
+    value = if_none_match.strip()
+    if not value:
+        return False
+    if value == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    wanted = opaque(etag)
+    return any(opaque(candidate) == wanted for candidate in value.split(","))
+
+
+def http_not_modified(etag: str, *, extra_headers: list[tuple[str, str]] | None = None) -> Response:
+    headers = [
+        ("Date", email.utils.formatdate(usegmt=True)),
+        ("Connection", "close"),
+        ("ETag", etag),
+    ]
+    if extra_headers:
+        headers.extend(extra_headers)
+    return Response(304, http.HTTPStatus.NOT_MODIFIED.phrase, Headers(headers), b"")
+
+
 def http_error(status: int, message: str | None = None) -> Response:
     body = (message or http.HTTPStatus(status).phrase).encode("utf-8")
     return http_response(body, status=status)
@@ -177,6 +177,7 @@ def _serialize_job(
                     "run_at_ms": record.run_at_ms,
                     "status": record.status,
                     "duration_ms": record.duration_ms,
+                    "lag_ms": record.lag_ms,
                     "error": record.error,
                 }
                 for record in job.state.run_history[-5:]
@@ -32,7 +32,9 @@ def session_context_payload(session: Session) -> dict[str, Any]:
         if isinstance(last_active, str):
             summary_at = last_active
 
-    replay_tokens = sum(estimate_message_tokens(message) for message in replay)
+    replay_tokens = sum(
+        session.token_counts.count(message, estimate_message_tokens) for message in replay
+    )
     summary_tokens = (
         estimate_message_tokens({"role": "system", "content": summary}) if summary else 0
     )
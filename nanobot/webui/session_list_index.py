@@ -27,10 +27,12 @@ from nanobot.session.manager import (
     Session,
     SessionManager,
     _is_provider_state_record_line,  # pyright: ignore[reportPrivateUsage]
+    _latest_metadata_record,  # pyright: ignore[reportPrivateUsage]
     _message_preview_text,  # pyright: ignore[reportPrivateUsage]
     _metadata_title,  # pyright: ignore[reportPrivateUsage]
 )
 from nanobot.session.model_selection import model_preset_from_metadata
+from nanobot.webui.transcript import flush_webui_transcripts
 
 _INDEX_VERSION = 7
 _INDEX_FILENAME = ".webui_session_index.json"
@@ -57,6 +59,8 @@ _TRANSCRIPT_NON_ANSWER_KINDS = {"progress", "reasoning", "tool_hint"}
 
 def list_webui_sessions(session_manager: SessionManager) -> list[dict[str, Any]]:
     """Return session rows for the WebUI sidebar, backed by a rebuildable cache."""
+    # Transcripts scanned below may still have appends in the write-behind queue.
+    flush_webui_transcripts()
     with session_manager.locked_session_files():
         rows, changed = _reconcile_index(session_manager)
         if changed:
@@ -627,6 +631,7 @@ def _scan_session_row(
             data = json.loads(first_line)
             if data.get("_type") != "metadata":
                 return None
+            data = _latest_metadata_record(data, path)
             preview = ""
             fallback_preview = ""
             visible_message_at = None
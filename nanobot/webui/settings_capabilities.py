@@ -8,7 +8,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypedDict
 
-from nanobot.agent.tools.web import SEARCH_PROVIDER_OPTIONS
+from nanobot.agent.tools.config import SEARCH_PROVIDER_OPTIONS
 from nanobot.api.runtime import ApiRuntime, ApiStartOptions
 from nanobot.audio.transcription import resolve_transcription_config
 from nanobot.audio.transcription_registry import (
@@ -0,0 +1,178 @@
+"""In-memory cache of the built WebUI ``dist`` directory.
+
+The SPA bundle does not change while the gateway runs, so each file is read
+once on first request and kept with everything needed to answer later
+requests from memory: its content type and ``Cache-Control`` policy, a
+content-hash ``ETag``, and gzip/brotli variants.  Variants come from the
+``.gz``/``.br`` siblings the Vite build writes; a missing gzip variant is
+compressed once here, and a missing brotli variant only when the optional
+``brotli`` package is installed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from nanobot.webui.http_utils import accepts_content_coding
+
+# Matches GZIP_MIN_BYTES in webui/vite.config.ts.
+_COMPRESS_MIN_BYTES = 4 * 1024
+_GZIP_LEVEL = 9
+_BROTLI_QUALITY = 11
+# SPA routes are unbounded, so the path -> asset memo is an LRU; the assets
+# themselves are bounded by the size of the dist directory.
+_MAX_REQUEST_PATHS = 512
+
+
+@dataclass(frozen=True, slots=True)
+class StaticAsset:
+    """One dist file with its precomputed encodings and validators."""
+
+    content_type: str
+    cache_control: str
+    etag: str
+    body: bytes
+    compressible: bool = False
+    gzip_body: bytes | None = None
+    br_body: bytes | None = None
+
+    @property
+    def etags(self) -> tuple[str, ...]:
+        """Every validator handed out for this asset, one per encoding."""
+        tags = [self.etag]
+        if self.gzip_body is not None:
+            tags.append(_variant_etag(self.etag, "gz"))
+        if self.br_body is not None:
+            tags.append(_variant_etag(self.etag, "br"))
+        return tuple(tags)
+
+    def select(self, accept_encoding: str) -> tuple[bytes, str | None, str]:
+        """Return ``(body, content_encoding, etag)`` for the client's ``Accept-Encoding``."""
+        if self.br_body is not None and accepts_content_coding(accept_encoding, "br"):
+            return self.br_body, "br", _variant_etag(self.etag, "br")
+        if self.gzip_body is not None and accepts_content_coding(accept_encoding, "gzip"):
+            return self.gzip_body, "gzip", _variant_etag(self.etag, "gz")
+        return self.body, None, self.etag
+
+
+class StaticAssetCache:
+    """Request path -> :class:`StaticAsset` for one dist directory, populated lazily."""
+
+    def __init__(self, root: Path, *, max_request_paths: int = _MAX_REQUEST_PATHS) -> None:
+        self.root = root
+        self.max_request_paths = max_request_paths
+        self._lock = threading.Lock()
+        self._assets: dict[Path, StaticAsset] = {}
+        self._paths: OrderedDict[str, StaticAsset] = OrderedDict()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, rel: str) -> StaticAsset | None:
+        """Asset for the dist-relative *rel*, falling back to ``index.html``.
+
+        Returns ``None`` when neither exists.  Raises ``ValueError`` when *rel*
+        resolves outside the dist directory and ``OSError`` when a file
+        cannot be read.
+        """
+        with self._lock:
+            asset = self._paths.get(rel)
+            if asset is not None:
+                self._paths.move_to_end(rel)
+                self.hits += 1
+                return asset
+        candidate = (self.root / rel).resolve()
+        candidate.relative_to(self.root)
+        if not candidate.is_file():
+            candidate = self.root / "index.html"
+            if not candidate.is_file():
+                return None
+        with self._lock:
+            asset = self._assets.get(candidate)
+        if asset is None:
+            asset = _load_asset(candidate)
+            with self._lock:
+                asset = self._assets.setdefault(candidate, asset)
+                self.loads += 1
+        with self._lock:
+            self._paths[rel] = asset
+            self._paths.move_to_end(rel)
+            while len(self._paths) > self.max_request_paths:
+                self._paths.popitem(last=False)
+        return asset
+
+    def clear(self) -> None:
+        with self._lock:
+            self._assets.clear()
+            self._paths.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "loads": self.loads, "assets": len(self._assets)}
+
+
+def _variant_etag(etag: str, suffix: str) -> str:
+    return f'{etag[:-1]}-{suffix}"'
+
+
+def _load_asset(path: Path) -> StaticAsset:
+    body = path.read_bytes()
+    ctype, _ = mimetypes.guess_type(path.name)
+    if ctype is None:
+        ctype = "application/octet-stream"
+    utf8_text = ctype.startswith("text/") or ctype in {
+        "application/javascript",
+        "application/json",
+    }
+    compressible = utf8_text or ctype == "image/svg+xml"
+    if utf8_text:
+        ctype = f"{ctype}; charset=utf-8"
+    if path.name == "index.html":
+        cache_control = "no-cache"
+    else:
+        cache_control = "public, max-age=31536000, immutable"
+    gzip_body = br_body = None
+    if compressible:
+        gzip_body = _read_sibling(path, ".gz")
+        br_body = _read_sibling(path, ".br")
+        if len(body) >= _COMPRESS_MIN_BYTES:
+            if gzip_body is None:
+                gzip_body = _smaller(gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0), body)
+            if br_body is None:
+                br_body = _smaller(_brotli_compress(body), body)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return StaticAsset(
+        content_type=ctype,
+        cache_control=cache_control,
+        etag=f'"{digest}"',
+        body=body,
+        compressible=compressible,
+        gzip_body=gzip_body,
+        br_body=br_body,
+    )
+
+
+def _read_sibling(path: Path, suffix: str) -> bytes | None:
+    sibling = path.with_name(f"{path.name}{suffix}")
+    try:
+        return sibling.read_bytes() if sibling.is_file() else None
+    except OSError:
+        return None
+
+
+def _smaller(compressed: bytes | None, body: bytes) -> bytes | None:
+    return compressed if compressed is not None and len(compressed) < len(body) else None
+
+
+def _brotli_compress(body: bytes) -> bytes | None:
+    try:
+        import brotli  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return cast(bytes, brotli.compress(body, quality=_BROTLI_QUALITY))  # pyright: ignore[reportUnknownMemberType]
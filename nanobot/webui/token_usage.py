@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
 import threading
 import time
+from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Mapping, cast
@@ -29,7 +32,10 @@ _USAGE_KEYS = (
 )
 _REQUEST_KEYS = ("requests", "provider_requests", "estimated_requests")
 _SOURCE_KEYS = ("user", "api", "cron", "dream", "system")
-_WRITE_LOCK = threading.Lock()
+# Hook-driven updates are batched in memory; a crash loses at most this many
+# updates or this much wall time, whichever comes first.
+_FLUSH_EVERY_UPDATES = 32
+_FLUSH_INTERVAL_S = 30.0
 
 
 def token_usage_state_path() -> Path:
@@ -197,7 +203,7 @@ def read_token_usage_state() -> dict[str, Any]:
     return normalize_token_usage_state(raw)
 
 
-def write_token_usage_state(raw: dict[str, Any]) -> dict[str, Any]:
+def write_token_usage_state(raw: dict[str, Any], *, path: Path | None = None) -> dict[str, Any]:
     state = normalize_token_usage_state(raw)
     state["updated_at"] = _utc_now_iso()
     encoded = json.dumps(
@@ -209,7 +215,7 @@ def write_token_usage_state(raw: dict[str, Any]) -> dict[str, Any]:
     if len(encoded) > _MAX_STATE_FILE_BYTES:
         raise ValueError("token usage state is too large")
 
-    path = token_usage_state_path()
+    path = path or token_usage_state_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".json.tmp")
     with open(tmp, "wb") as f:
@@ -229,6 +235,188 @@ def write_token_usage_state(raw: dict[str, Any]) -> dict[str, Any]:
     return state
 
 
+def _apply_usage(
+    state: dict[str, Any],
+    day: str,
+    normalized: dict[str, int],
+    source_key: str,
+) -> None:
+    days_by_date = cast(dict[str, dict[str, Any]], state["days"])
+    row: dict[str, Any] = dict(days_by_date.get(day) or {"date": day, "requests": 0})
+    for key in _USAGE_KEYS:
+        row[key] = _clean_int(row.get(key)) + normalized.get(key, 0)
+    row["requests"] = _clean_int(row.get("requests")) + 1
+    if normalized.get("estimated_tokens", 0) > 0 and normalized.get("provider_tokens", 0) <= 0:
+        row["estimated_requests"] = _clean_int(row.get("estimated_requests")) + 1
+    else:
+        row["provider_requests"] = _clean_int(row.get("provider_requests")) + 1
+
+    sources: dict[str, dict[str, Any]] = dict(
+        cast(Mapping[str, dict[str, Any]], row.get("sources") or {})
+    )
+    source_row: dict[str, Any] = dict(sources.get(source_key) or {"requests": 0})
+    for key in _USAGE_KEYS:
+        source_row[key] = _clean_int(source_row.get(key)) + normalized.get(key, 0)
+    source_row["requests"] = _clean_int(source_row.get("requests")) + 1
+    if normalized.get("estimated_tokens", 0) > 0 and normalized.get("provider_tokens", 0) <= 0:
+        source_row["estimated_requests"] = _clean_int(source_row.get("estimated_requests")) + 1
+    else:
+        source_row["provider_requests"] = _clean_int(source_row.get("provider_requests")) + 1
+    sources[source_key] = source_row
+    row["sources"] = sources
+
+    days_by_date[day] = row
+    if len(days_by_date) > _MAX_DAYS_RETAINED:
+        state["days"] = dict(sorted(days_by_date.items())[-_MAX_DAYS_RETAINED:])
+
+
+def _state_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class _TokenUsageAggregator:
+    """In-memory token usage counters with batched, crash-bounded persistence.
+
+    Reads are served from memory. Updates are written out after
+    ``_FLUSH_EVERY_UPDATES`` updates, ``_FLUSH_INTERVAL_S`` seconds, an
+    explicit :func:`flush_token_usage`, or process exit. When another process
+    has rewritten the file since our last read or write, the pending updates
+    are replayed onto the on-disk state instead of overwriting it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._path: Path | None = None
+        self._signature: tuple[int, int, int] | None = None
+        self._state: dict[str, Any] = default_token_usage_state()
+        self._pending: list[tuple[str, dict[str, int], str]] = []
+        self._timer: threading.Timer | None = None
+        # Set while ``flush`` writes outside ``_lock``: the file changing then
+        # is our own write landing, not another process.
+        self._flushing = False
+
+    def _sync_locked(self) -> None:
+        """Load or merge the on-disk state when it changed underneath us."""
+        path = token_usage_state_path()
+        if path != self._path:
+            if self._pending and self._path is not None:
+                # The state directory moved (tests, profile switches): persist
+                # what was recorded against the old location first.
+                with suppress(Exception):
+                    self._write_locked()
+            self._path = path
+            self._pending = []
+            self._signature = None
+            self._state = read_token_usage_state()
+            self._signature = _state_signature(path)
+            return
+        if self._flushing:
+            return
+        signature = _state_signature(path)
+        if signature == self._signature:
+            return
+        state = read_token_usage_state()
+        for day, normalized, source_key in self._pending:
+            _apply_usage(state, day, normalized, source_key)
+        self._state = state
+        self._signature = signature
+
+    def _write_locked(self) -> dict[str, Any]:
+        assert self._path is not None
+        written = write_token_usage_state(self._state, path=self._path)
+        self._state = written
+        self._pending = []
+        self._signature = _state_signature(self._path)
+        return written
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._sync_locked()
+            return normalize_token_usage_state(self._state)
+
+    def add(
+        self,
+        normalized: dict[str, int],
+        *,
+        source: str,
+        timezone_name: str | None,
+        now: datetime | None,
+    ) -> bool:
+        """Record one update in memory; return whether a flush is due."""
+        day = _local_day(now, timezone_name=timezone_name)
+        source_key = _clean_source(source)
+        with self._lock:
+            self._sync_locked()
+            _apply_usage(self._state, day, normalized, source_key)
+            self._pending.append((day, normalized, source_key))
+            if len(self._pending) >= _FLUSH_EVERY_UPDATES:
+                return True
+            if self._timer is None:
+                self._timer = threading.Timer(_FLUSH_INTERVAL_S, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        return False
+
+    def flush(self) -> dict[str, Any]:
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._sync_locked()
+                if not self._pending:
+                    return normalize_token_usage_state(self._state)
+                path = self._path
+                assert path is not None
+                flushed = len(self._pending)
+                state = normalize_token_usage_state(self._state)
+                self._flushing = True
+            # Disk I/O happens outside ``_lock`` so recording never waits on fsync.
+            try:
+                written = write_token_usage_state(state, path=path)
+                signature = _state_signature(path)
+            except BaseException:
+                with self._lock:
+                    self._flushing = False
+                raise
+            with self._lock:
+                self._flushing = False
+                if path == self._path:
+                    # Updates recorded during the write stay pending and are
+                    # replayed if another process rewrites the file later.
+                    del self._pending[:flushed]
+                    self._state["updated_at"] = written["updated_at"]
+                    self._signature = signature
+                return normalize_token_usage_state(self._state)
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("failed to flush token usage")
+
+
+_AGGREGATOR = _TokenUsageAggregator()
+
+
+def flush_token_usage() -> None:
+    """Persist any batched token usage; safe to call at any time."""
+    try:
+        _AGGREGATOR.flush()
+    except Exception:
+        logger.exception("failed to flush token usage")
+
+
+atexit.register(flush_token_usage)
+
+
 def record_token_usage(
     usage: dict[str, Any] | None,
     *,
@@ -236,42 +424,12 @@ def record_token_usage(
     timezone_name: str | None = None,
     now: datetime | None = None,
 ) -> dict[str, Any]:
+    """Record one provider response and persist it immediately."""
     normalized = _normalize_usage(usage)
     if not normalized:
-        return read_token_usage_state()
-
-    with _WRITE_LOCK:
-        state = read_token_usage_state()
-        days_by_date = cast(dict[str, dict[str, Any]], state["days"])
-        day = _local_day(now, timezone_name=timezone_name)
-        row: dict[str, Any] = dict(days_by_date.get(day) or {"date": day, "requests": 0})
-        for key in _USAGE_KEYS:
-            row[key] = _clean_int(row.get(key)) + normalized.get(key, 0)
-        row["requests"] = _clean_int(row.get("requests")) + 1
-        if normalized.get("estimated_tokens", 0) > 0 and normalized.get("provider_tokens", 0) <= 0:
-            row["estimated_requests"] = _clean_int(row.get("estimated_requests")) + 1
-        else:
-            row["provider_requests"] = _clean_int(row.get("provider_requests")) + 1
-
-        source_key = _clean_source(source)
-        sources: dict[str, dict[str, Any]] = dict(
-            cast(Mapping[str, dict[str, Any]], row.get("sources") or {})
-        )
-        source_row: dict[str, Any] = dict(sources.get(source_key) or {"requests": 0})
-        for key in _USAGE_KEYS:
-            source_row[key] = _clean_int(source_row.get(key)) + normalized.get(key, 0)
-        source_row["requests"] = _clean_int(source_row.get("requests")) + 1
-        if normalized.get("estimated_tokens", 0) > 0 and normalized.get("provider_tokens", 0) <= 0:
-            source_row["estimated_requests"] = _clean_int(source_row.get("estimated_requests")) + 1
-        else:
-            source_row["provider_requests"] = _clean_int(source_row.get("provider_requests")) + 1
-        sources[source_key] = source_row
-        row["sources"] = sources
-
-        days_by_date[day] = row
-        if len(days_by_date) > _MAX_DAYS_RETAINED:
-            state["days"] = dict(sorted(days_by_date.items())[-_MAX_DAYS_RETAINED:])
-        return write_token_usage_state(state)
+        return _AGGREGATOR.snapshot()
+    _AGGREGATOR.add(normalized, source=source, timezone_name=timezone_name, now=now)
+    return _AGGREGATOR.flush()
 
 
 def record_response_token_usage(
@@ -296,7 +454,7 @@ def token_usage_payload(
     timezone_name: str | None = None,
     now: datetime | None = None,
 ) -> dict[str, Any]:
-    state = read_token_usage_state()
+    state = _AGGREGATOR.snapshot()
     days_by_date = cast(dict[str, dict[str, Any]], state["days"])
     today = datetime.fromisoformat(_local_day(now, timezone_name=timezone_name)).date()
     start = today - timedelta(days=max(1, days) - 1)
@@ -353,7 +511,10 @@ def token_usage_payload(
 
 
 class TokenUsageHook(AgentHook):
-    """Persist provider-reported token usage without coupling it to chat messages."""
+    """Record provider-reported token usage without coupling it to chat messages.
+
+    Updates are batched in memory; see :class:`_TokenUsageAggregator`.
+    """
 
     def __init__(self, *, timezone_name: str | None = None) -> None:
         super().__init__()
@@ -361,10 +522,16 @@ class TokenUsageHook(AgentHook):
 
     async def after_iteration(self, context: AgentHookContext) -> None:
         try:
-            record_token_usage(
-                context.usage,
+            normalized = _normalize_usage(context.usage)
+            if not normalized:
+                return
+            flush_due = _AGGREGATOR.add(
+                normalized,
                 source=_source_from_session_key(context.session_key),
                 timezone_name=self._timezone_name,
+                now=None,
             )
+            if flush_due:
+                await asyncio.to_thread(_AGGREGATOR.flush)
         except Exception:
             logger.exception("failed to record token usage")
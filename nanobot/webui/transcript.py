@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import base64
 import binascii
 import hashlib
@@ -9,8 +11,11 @@ import json
 import os
 import re
 import shutil
+import threading
 import time
 import uuid
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Callable, Mapping, NamedTuple, Sequence, cast
 from urllib.parse import unquote, urlparse
@@ -389,6 +394,12 @@ def _append_segment_turns(session_key: str, turns: list[list[dict[str, Any]]]) -
 
 
 def _rotate_active_transcript_if_needed(session_key: str) -> None:
+    with _TRANSCRIPT_WRITER.session_lock(session_key):
+        _TRANSCRIPT_WRITER.flush(session_key)
+        _rotate_active_transcript_locked(session_key)
+
+
+def _rotate_active_transcript_locked(session_key: str) -> None:
     path = webui_transcript_path(session_key)
     if not path.is_file():
         return
@@ -635,25 +646,322 @@ def read_transcript_lines(session_key: str) -> list[dict[str, Any]]:
     return lines
 
 
+# Bytes just before the cached offset that must still match for the active
+# file to count as appended-to rather than rewritten in place.
+_REPLAY_CACHE_GUARD_BYTES = 256
+_REPLAY_CACHE_MAX_SESSIONS = 64
+
+_SegmentSignature = tuple[tuple[str, int, int, int], ...]
+
+
+class _ReplayState:
+    __slots__ = (
+        "lock",
+        "segments",
+        "segment_records",
+        "active_inode",
+        "active_stat",
+        "active_offset",
+        "active_guard",
+        "active_records",
+        "active_tail",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.segments: _SegmentSignature | None = None
+        self.segment_records: list[dict[str, Any]] = []
+        self.active_inode: int | None = None
+        self.active_stat: tuple[int, int, int] | None = None
+        self.active_offset = 0
+        self.active_guard = b""
+        self.active_records: list[dict[str, Any]] = []
+        self.active_tail: list[dict[str, Any]] = []
+
+
+class _TranscriptReplayCache:
+    """Parsed transcript records per session, extended as the active file grows.
+
+    Rotated segments never change once written, so they are re-read only when
+    the segment set does.  Between rotations the active ``.jsonl`` only grows
+    by appends: while its inode is unchanged and the bytes before the cached
+    offset still match, only lines written after that offset are parsed.  A
+    rewrite (``os.replace``), truncation or rotation falls back to a full read.
+    Records are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_sessions: int = _REPLAY_CACHE_MAX_SESSIONS) -> None:
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._states: OrderedDict[Path, _ReplayState] = OrderedDict()
+        self.full_reads = 0
+        self.incremental_reads = 0
+
+    def records(self, session_key: str) -> tuple[str, list[dict[str, Any]]]:
+        """Return ``(version, records)``; the version changes whenever the records may."""
+        state = self._state(session_key)
+        with state.lock:
+            self._refresh(session_key, state)
+            marker = (state.segments, state.active_inode, state.active_offset, len(state.active_tail))
+            version = hashlib.blake2b(repr(marker).encode("utf-8"), digest_size=12).hexdigest()
+            return version, [*state.segment_records, *state.active_records, *state.active_tail]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def _state(self, session_key: str) -> _ReplayState:
+        path = webui_transcript_path(session_key)
+        with self._lock:
+            state = self._states.get(path)
+            if state is None:
+                state = self._states[path] = _ReplayState()
+            self._states.move_to_end(path)
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+            return state
+
+    def _refresh(self, session_key: str, state: _ReplayState) -> None:
+        chunk_ids = _chunk_ids(session_key)
+        signature: list[tuple[str, int, int, int]] = []
+        for chunk_id in chunk_ids:
+            if chunk_id == _TRANSCRIPT_ACTIVE_CHUNK_ID:
+                continue
+            try:
+                st = _segment_file_path(session_key, chunk_id).stat()
+            except OSError:
+                continue
+            signature.append((chunk_id, st.st_ino, st.st_size, st.st_mtime_ns))
+        segments = tuple(signature)
+        rebuild = segments != state.segments
+        if rebuild:
+            state.segments = segments
+            state.segment_records = [
+                record
+                for chunk_id, *_ in segments
+                for record in _read_transcript_file(_segment_file_path(session_key, chunk_id))
+            ]
+        path = webui_transcript_path(session_key)
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or _TRANSCRIPT_ACTIVE_CHUNK_ID not in chunk_ids:
+            state.active_inode = None
+            state.active_stat = None
+            state.active_offset = 0
+            state.active_guard = b""
+            state.active_records = []
+            state.active_tail = []
+            return
+        active_stat = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if not rebuild and active_stat == state.active_stat:
+            return
+        state.active_stat = active_stat
+        appended = (
+            not rebuild
+            and st.st_ino == state.active_inode
+            and st.st_size >= state.active_offset
+        )
+        if not (appended and self._read_active(path, state, incremental=True)):
+            state.active_inode = st.st_ino
+            self._read_active(path, state, incremental=False)
+
+    def _read_active(self, path: Path, state: _ReplayState, *, incremental: bool) -> bool:
+        offset = state.active_offset if incremental else 0
+        try:
+            with open(path, "rb") as f:
+                if offset:
+                    guard_start = max(0, offset - _REPLAY_CACHE_GUARD_BYTES)
+                    f.seek(guard_start)
+                    if f.read(offset - guard_start) != state.active_guard:
+                        return False
+                data = f.read()
+        except OSError as e:
+            logger.warning("read transcript failed {}: {}", path, e)
+            data = b""
+        if incremental:
+            self.incremental_reads += 1
+        else:
+            self.full_reads += 1
+            state.active_records = []
+            state.active_guard = b""
+        # Only newline-terminated lines advance the offset; an unterminated
+        # tail is parsed on every read until its newline arrives.
+        cut = data.rfind(b"\n") + 1
+        state.active_records.extend(_parse_transcript_bytes(path, data[:cut]))
+        state.active_tail = _parse_transcript_bytes(path, data[cut:], warn=False)
+        state.active_offset = offset + cut
+        state.active_guard = (state.active_guard + data[:cut])[-_REPLAY_CACHE_GUARD_BYTES:]
+        return True
+
+
+def _parse_transcript_bytes(path: Path, data: bytes, *, warn: bool = True) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] = []
+    for raw in data.splitlines():
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            obj = json.loads(raw)
+        except ValueError:
+            if warn:
+                logger.warning("bad jsonl at {}", path)
+            continue
+        if isinstance(obj, dict):
+            records.append(cast(dict[str, Any], obj))
+    return records
+
+
+_REPLAY_CACHE = _TranscriptReplayCache()
+
+
+def webui_transcript_version(session_key: str) -> str:
+    """Token that changes whenever the session's transcript records may have changed."""
+    return _REPLAY_CACHE.records(session_key)[0]
+
+
+def clear_webui_transcript_replay_cache() -> None:
+    _REPLAY_CACHE.clear()
+
+
 def _write_transcript_lines(session_key: str, rows: list[dict[str, Any]]) -> None:
-    delete_webui_transcript(session_key)
+    with _TRANSCRIPT_WRITER.session_lock(session_key):
+        delete_webui_transcript(session_key)
+        path = webui_transcript_path(session_key)
+        _write_records_to_path(path, rows)
+        _rotate_active_transcript_if_needed(session_key)
+
+
+class _TranscriptWriter:
+    """Write-behind queue for active transcript appends.
+
+    Appends made on an event loop only queue their line.  A background task
+    then writes everything queued for the session with one append and one
+    fsync in a worker thread, and rotates the file when the batch ended a
+    turn.  Every transcript read goes through :func:`_chunk_ids`, and the
+    session listing calls :func:`flush_webui_transcripts`, so readers flush
+    the queue first and still see their own writes.  Deleting a transcript
+    drops its queue; all file access for a session holds its lock.  Locks
+    are held weakly, so a session's lock goes away once nobody is using it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[str]] = {}
+        self._rotate: set[str] = set()
+        self._session_locks: weakref.WeakValueDictionary[str, threading.RLock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def session_lock(self, session_key: str) -> threading.RLock:
+        with self._lock:
+            lock = self._session_locks.get(session_key)
+            if lock is None:
+                lock = self._session_locks[session_key] = threading.RLock()
+            return lock
+
+    def enqueue(self, session_key: str, line: str, *, rotate: bool) -> bool:
+        """Queue *line*; return True when the session had nothing queued."""
+        with self._lock:
+            pending = self._pending.get(session_key)
+            first = pending is None
+            if pending is None:
+                pending = self._pending[session_key] = []
+            pending.append(line)
+            if rotate:
+                self._rotate.add(session_key)
+            return first
+
+    def discard(self, session_key: str) -> bool:
+        """Drop queued lines; return True when there were any."""
+        with self._lock:
+            self._rotate.discard(session_key)
+            return bool(self._pending.pop(session_key, None))
+
+    def flush(self, session_key: str) -> None:
+        """Write and fsync the session's queued lines in one append."""
+        with self.session_lock(session_key):
+            with self._lock:
+                lines = self._pending.pop(session_key, None)
+            if lines:
+                _write_active_transcript_lines(session_key, lines)
+
+    def flush_all(self) -> None:
+        with self._lock:
+            session_keys = list(self._pending)
+        for session_key in session_keys:
+            try:
+                self.flush(session_key)
+            except OSError as e:
+                logger.warning("webui transcript flush failed for {}: {}", session_key, e)
+
+    def schedule(self, loop: asyncio.AbstractEventLoop, session_key: str) -> None:
+        task = loop.create_task(self._commit(session_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _commit_sync(self, session_key: str) -> None:
+        self.flush(session_key)
+        with self._lock:
+            rotate = session_key in self._rotate
+            self._rotate.discard(session_key)
+        if rotate:
+            _rotate_active_transcript_if_needed(session_key)
+
+    async def _commit(self, session_key: str) -> None:
+        try:
+            await asyncio.to_thread(self._commit_sync, session_key)
+        except OSError as e:
+            logger.warning("webui transcript flush failed for {}: {}", session_key, e)
+
+
+_TRANSCRIPT_WRITER = _TranscriptWriter()
+
+
+def flush_webui_transcripts() -> None:
+    """Write every transcript append still waiting in the write-behind queue."""
+    _TRANSCRIPT_WRITER.flush_all()
+
+
+atexit.register(flush_webui_transcripts)
+
+
+def _write_active_transcript_lines(session_key: str, lines: list[str]) -> None:
     path = webui_transcript_path(session_key)
-    _write_records_to_path(path, rows)
-    _rotate_active_transcript_if_needed(session_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(lines))
+        f.flush()
+        os.fsync(f.fileno())
 
 
-def _append_to_active_transcript(session_key: str, obj: dict[str, Any]) -> None:
+def _append_to_active_transcript(
+    session_key: str,
+    obj: dict[str, Any],
+    *,
+    turn_end: bool = False,
+) -> None:
     raw = _record_json_line(obj)
     if len(raw.encode("utf-8")) > _MAX_TRANSCRIPT_FILE_BYTES:
         msg = "webui transcript line too large"
         raise ValueError(msg)
-    path = webui_transcript_path(session_key)
-    path.parent.mkdir(parents=True, exist_ok=True)
     line = raw + "\n"
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(line)
-        f.flush()
-        os.fsync(f.fileno())
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        if _TRANSCRIPT_WRITER.enqueue(session_key, line, rotate=turn_end):
+            _TRANSCRIPT_WRITER.schedule(loop, session_key)
+        return
+    with _TRANSCRIPT_WRITER.session_lock(session_key):
+        # Lines queued from a loop go first, so the file keeps append order.
+        _TRANSCRIPT_WRITER.flush(session_key)
+        _write_active_transcript_lines(session_key, [line])
+    if turn_end:
+        _rotate_active_transcript_if_needed(session_key)
 
 
 def _now_ms() -> int:
@@ -678,9 +986,8 @@ def _record_for_append(obj: dict[str, Any]) -> dict[str, Any]:
 
 def append_transcript_object(session_key: str, obj: dict[str, Any]) -> None:
     record = _record_for_append(obj)
-    _append_to_active_transcript(session_key, record)
-    if record.get("event") == "turn_end":
-        _rotate_active_transcript_if_needed(session_key)
+    # Turn completion is when the active file may need rotating.
+    _append_to_active_transcript(session_key, record, turn_end=record.get("event") == "turn_end")
 
 
 def append_session_message_input(
@@ -827,8 +1134,7 @@ class WebUITranscriptRecorder:
 
     def append(self, chat_id: str, event: dict[str, Any]) -> bool:
         try:
-            dup = json.loads(json.dumps(event, ensure_ascii=False))
-            append_transcript_object(f"websocket:{chat_id}", dup)
+            append_transcript_object(f"websocket:{chat_id}", event)
         except (OSError, ValueError, TypeError) as e:
             self._log.warning("webui transcript append failed: {}", e)
             return False
@@ -962,6 +1268,12 @@ def write_session_messages_as_transcript(
 
 
 def delete_webui_transcript(session_key: str) -> bool:
+    with _TRANSCRIPT_WRITER.session_lock(session_key):
+        discarded = _TRANSCRIPT_WRITER.discard(session_key)
+        return _delete_webui_transcript_locked(session_key) or discarded
+
+
+def _delete_webui_transcript_locked(session_key: str) -> bool:
     removed = False
     for path in (webui_transcript_path(session_key), _legacy_webui_thread_path(session_key)):
         if not path.is_file():
@@ -2585,7 +2897,7 @@ def build_webui_thread_response(
     if paginated:
         lines, page = _select_transcript_page(session_key, limit=limit, before=before)
     else:
-        lines = _annotate_replay_identities(read_transcript_lines(session_key))
+        lines = _annotate_replay_identities(_REPLAY_CACHE.records(session_key)[1])
     if not lines and active_turn_started_at is None:
         return None
     needs_user_backfill = _needs_user_event_backfill(lines)
@@ -10,10 +10,14 @@ Also houses shared HTTP utility functions used by both this module and
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import mimetypes
 import re
+import secrets
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -39,15 +43,15 @@ from nanobot.webui.file_preview import (
     file_preview_payload,
 )
 from nanobot.webui.gateway_tokens import GatewayTokenStore, token_response_payload
-from nanobot.webui.http_utils import (
-    accepts_gzip as _accepts_gzip,
-)
 from nanobot.webui.http_utils import (
     case_insensitive_header as _case_insensitive_header,
 )
 from nanobot.webui.http_utils import (
     combined_list_header as _combined_list_header,
 )
+from nanobot.webui.http_utils import (
+    etag_matches as _etag_matches,
+)
 from nanobot.webui.http_utils import (
     host_for_url as _host_for_url,
 )
@@ -57,6 +61,9 @@ from nanobot.webui.http_utils import (
 from nanobot.webui.http_utils import (
     http_json_response as _http_json_response,
 )
+from nanobot.webui.http_utils import (
+    http_not_modified as _http_not_modified,
+)
 from nanobot.webui.http_utils import (
     http_response as _http_response,
 )
@@ -125,11 +132,13 @@ from nanobot.webui.skills_marketplace import (
     search_marketplace_skills,
     trending_marketplace_skills,
 )
+from nanobot.webui.static_assets import StaticAssetCache
 from nanobot.webui.thread_disk import delete_webui_thread
-from nanobot.webui.transcript import build_webui_thread_response
+from nanobot.webui.transcript import build_webui_thread_response, webui_transcript_version
 from nanobot.webui.workspaces import WebUIWorkspaceController
 
 _SLOW_WEBUI_HTTP_LOG_MS = 1_000
+_WEBUI_THREAD_PAYLOAD_CACHE_SIZE = 32
 _WEBUI_MUTATION_PAYLOAD_ATTR = "_nanobot_webui_mutation_payload"
 _WEBUI_MUTATION_REQUEST_ATTR = "_nanobot_webui_mutation_request"
 _NO_STORE_HEADERS = [("Cache-Control", "no-store")]
@@ -328,6 +337,9 @@ class GatewayHTTPHandler:
         self.config = config
         self.session_manager = session_manager
         self.static_dist_path = static_dist_path
+        self.static_assets = (
+            StaticAssetCache(static_dist_path) if static_dist_path is not None else None
+        )
         self.runtime_model_name = runtime_model_name
         self.bus = bus
         self.tokens = tokens
@@ -348,6 +360,12 @@ class GatewayHTTPHandler:
         self.local_trigger_pending_ids = local_trigger_pending_ids
         self._log = log
         self._runtime_surface = runtime_surface
+        # Last WebUI thread payload per session, keyed by its ETag.  The salt
+        # keeps ETags from one gateway process from validating in the next,
+        # whose media URLs are signed differently.
+        self._thread_etag_salt = secrets.token_hex(8)
+        self._thread_payloads: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+        self._thread_payloads_lock = threading.Lock()
 
         from nanobot.webui.settings_api import runtime_capabilities as _rc
         from nanobot.webui.settings_routes import WebUISettingsRouter
@@ -536,6 +554,7 @@ class GatewayHTTPHandler:
             response = self._serve_static(
                 got,
                 accept_encoding=_combined_list_header(request.headers, "Accept-Encoding"),
+                if_none_match=_combined_list_header(request.headers, "If-None-Match"),
             )
             if response is not None:
                 return response
@@ -680,7 +699,7 @@ class GatewayHTTPHandler:
     async def _dispatch_session_routes(self, request: WsRequest, got: str) -> Response | None:
         m = re.match(r"^/api/sessions/([^/]+)/webui-thread$", got)
         if m:
-            return self._handle_webui_thread_get(request, m.group(1))
+            return await self._serve_webui_thread(request, m.group(1))
 
         m = re.match(r"^/api/sessions/([^/]+)/context$", got)
         if m:
@@ -765,7 +784,22 @@ class GatewayHTTPHandler:
             cleaned.append(row)
         return {"sessions": cleaned}
 
-    def _handle_webui_thread_get(self, request: WsRequest, key: str) -> Response:
+    async def _serve_webui_thread(self, request: WsRequest, key: str) -> Response:
+        """Read the active-turn state on the loop, then replay the thread in a worker thread."""
+        decoded_key = _decode_api_key(key)
+        turn_state = (
+            _webui_active_turn_state(decoded_key.split(":", 1)[1])
+            if decoded_key is not None and _is_websocket_channel_session_key(decoded_key)
+            else None
+        )
+        return await asyncio.to_thread(self._handle_webui_thread_get, request, key, turn_state)
+
+    def _handle_webui_thread_get(
+        self,
+        request: WsRequest,
+        key: str,
+        turn_state: tuple[float | None, str | None, bool] | None = None,
+    ) -> Response:
         if not self.check_api_token(request):
             return _http_error(401, "Unauthorized")
         decoded_key = _decode_api_key(key)
@@ -774,8 +808,11 @@ class GatewayHTTPHandler:
         if not _is_websocket_channel_session_key(decoded_key):
             return _http_error(404, "session not found")
         scope = self.workspaces.scope_for_session_key(decoded_key)
+        session_consulted = False
 
         def load_session_messages() -> list[dict[str, Any]] | None:
+            nonlocal session_consulted
+            session_consulted = True
             if self.session_manager is None:
                 return None
             session_data = self.session_manager.read_session_file(decoded_key)
@@ -801,42 +838,76 @@ class GatewayHTTPHandler:
         if direction is not None and direction not in {"latest"}:
             return _http_error(400, "invalid direction")
         before = _query_first(query, "before")
-        from nanobot.session.webui_turns import (
-            websocket_turn_id,
-            websocket_turn_transcript_persistence_failed,
-            websocket_turn_wall_started_at,
-        )
 
-        chat_id = decoded_key.split(":", 1)[1]
-        active_turn_started_at = websocket_turn_wall_started_at(chat_id)
-        active_turn_id = websocket_turn_id(chat_id)
-        active_turn_transcript_persistence_failed = (
-            websocket_turn_transcript_persistence_failed(chat_id)
+        if turn_state is None:
+            turn_state = _webui_active_turn_state(decoded_key.split(":", 1)[1])
+        active_turn_started_at, active_turn_id, active_turn_transcript_persistence_failed = (
+            turn_state
         )
-        data = build_webui_thread_response(
-            decoded_key,
-            augment_user_media=self.media.augment_transcript_media,
-            augment_assistant_media=self.media.augment_transcript_media,
-            augment_assistant_text=lambda text: self.media.rewrite_local_markdown_images(
-                text,
-                workspace_path=scope.project_path,
-            ),
-            session_messages_loader=load_session_messages,
-            active_turn_started_at=active_turn_started_at,
-            active_turn_id=active_turn_id,
-            active_turn_transcript_persistence_failed=(
-                active_turn_transcript_persistence_failed
-            ),
-            limit=limit,
-            direction=direction,
-            before=before,
+        scope_payload = scope.payload()
+        # Everything the payload is derived from, except the agent session
+        # file, which is only read to repair incomplete transcripts; such
+        # payloads are never cached.
+        etag_source = json.dumps(
+            [
+                self._thread_etag_salt,
+                webui_transcript_version(decoded_key),
+                list(turn_state),
+                [limit, direction, before],
+                scope_payload,
+            ],
+            default=str,
+            sort_keys=True,
         )
-        if data is None:
-            return _http_error(404, "webui thread not found")
-        data["workspace_scope"] = scope.payload()
+        etag = f'"{hashlib.blake2b(etag_source.encode("utf-8"), digest_size=16).hexdigest()}"'
+        if_none_match = _combined_list_header(request.headers, "If-None-Match")
+        with self._thread_payloads_lock:
+            cached = self._thread_payloads.get(decoded_key)
+            if cached is not None and cached[0] == etag:
+                self._thread_payloads.move_to_end(decoded_key)
+        if cached is not None and cached[0] == etag:
+            if _etag_matches(if_none_match, etag):
+                return _http_not_modified(etag, extra_headers=[("Cache-Control", "no-cache")])
+            data = cached[1]
+        else:
+            built = build_webui_thread_response(
+                decoded_key,
+                augment_user_media=self.media.augment_transcript_media,
+                augment_assistant_media=self.media.augment_transcript_media,
+                augment_assistant_text=lambda text: self.media.rewrite_local_markdown_images(
+                    text,
+                    workspace_path=scope.project_path,
+                ),
+                session_messages_loader=load_session_messages,
+                active_turn_started_at=active_turn_started_at,
+                active_turn_id=active_turn_id,
+                active_turn_transcript_persistence_failed=(
+                    active_turn_transcript_persistence_failed
+                ),
+                limit=limit,
+                direction=direction,
+                before=before,
+            )
+            if built is None:
+                return _http_error(404, "webui thread not found")
+            data = built
+            data["workspace_scope"] = scope_payload
+            if session_consulted:
+                return _http_json_response(
+                    data,
+                    accept_encoding=_combined_list_header(request.headers, "Accept-Encoding"),
+                )
+            with self._thread_payloads_lock:
+                self._thread_payloads[decoded_key] = (etag, data)
+                self._thread_payloads.move_to_end(decoded_key)
+                while len(self._thread_payloads) > _WEBUI_THREAD_PAYLOAD_CACHE_SIZE:
+                    self._thread_payloads.popitem(last=False)
+            if _etag_matches(if_none_match, etag):
+                return _http_not_modified(etag, extra_headers=[("Cache-Control", "no-cache")])
         return _http_json_response(
             data,
             accept_encoding=_combined_list_header(request.headers, "Accept-Encoding"),
+            extra_headers=[("ETag", etag), ("Cache-Control", "no-cache")],
         )
 
     def _handle_file_preview(self, request: WsRequest, key: str) -> Response:
@@ -1390,56 +1461,37 @@ class GatewayHTTPHandler:
         request_path: str,
         *,
         accept_encoding: str = "",
+        if_none_match: str = "",
     ) -> Response | None:
-        assert self.static_dist_path is not None
+        assert self.static_assets is not None
         rel = request_path.lstrip("/")
         if not rel:
             rel = "index.html"
         if ".." in rel.split("/") or rel.startswith("/"):
             return _http_error(403, "Forbidden")
-        candidate = (self.static_dist_path / rel).resolve()
         try:
-            candidate.relative_to(self.static_dist_path)
+            asset = self.static_assets.get(rel)
         except ValueError:
             return _http_error(403, "Forbidden")
-        if not candidate.is_file():
-            index = self.static_dist_path / "index.html"
-            if index.is_file():
-                candidate = index
-            else:
-                return None
-        ctype, _ = mimetypes.guess_type(candidate.name)
-        if ctype is None:
-            ctype = "application/octet-stream"
-        utf8_text = ctype.startswith("text/") or ctype in {
-            "application/javascript",
-            "application/json",
-        }
-        compressible = utf8_text or ctype == "image/svg+xml"
-        response_path = candidate
-        extra_headers: list[tuple[str, str]] = []
-        if compressible:
-            extra_headers.append(("Vary", "Accept-Encoding"))
-            gzip_candidate = candidate.with_name(f"{candidate.name}.gz")
-            if _accepts_gzip(accept_encoding) and gzip_candidate.is_file():
-                response_path = gzip_candidate
-                extra_headers.append(("Content-Encoding", "gzip"))
-        try:
-            body = response_path.read_bytes()
         except OSError as e:
-            self._log.warning("static: failed to read {}: {}", response_path, e)
+            self._log.warning("static: failed to read {}: {}", rel, e)
             return _http_error(500, "Internal Server Error")
-        if utf8_text:
-            ctype = f"{ctype}; charset=utf-8"
-        if candidate.name == "index.html":
-            cache = "no-cache"
-        else:
-            cache = "public, max-age=31536000, immutable"
+        if asset is None:
+            return None
+        body, encoding, etag = asset.select(accept_encoding)
+        extra_headers = [("Cache-Control", asset.cache_control)]
+        if asset.compressible:
+            extra_headers.append(("Vary", "Accept-Encoding"))
+        if any(_etag_matches(if_none_match, tag) for tag in asset.etags):
+            return _http_not_modified(etag, extra_headers=extra_headers)
+        extra_headers.append(("ETag", etag))
+        if encoding is not None:
+            extra_headers.append(("Content-Encoding", encoding))
         return _http_response(
             body,
             status=200,
-            content_type=ctype,
-            extra_headers=[("Cache-Control", cache), *extra_headers],
+            content_type=asset.content_type,
+            extra_headers=extra_headers,
         )
 
 
@@ -1581,3 +1633,18 @@ def _positive_int(value: Any) -> int | None:
 
 def _is_websocket_channel_session_key(key: str) -> bool:
     return key.startswith("websocket:")
+
+
+def _webui_active_turn_state(chat_id: str) -> tuple[float | None, str | None, bool]:
+    """``(started_at, turn_id, transcript_persistence_failed)`` of the chat's running turn."""
+    from nanobot.session.webui_turns import (
+        websocket_turn_id,
+        websocket_turn_transcript_persistence_failed,
+        websocket_turn_wall_started_at,
+    )
+
+    return (
+        websocket_turn_wall_started_at(chat_id),
+        websocket_turn_id(chat_id),
+        websocket_turn_transcript_persistence_failed(chat_id),
+    )
@@ -0,0 +1,72 @@
+"""Measure cold-start import time of the agent and flag eagerly loaded tools.
+
+Usage: python scripts/bench_import_time.py [--runs 5] [--budget-ms 1500] [--module nanobot.agent.loop]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+
+# Tool implementations that must only be imported once their tool is enabled.
+LAZY_MODULES = (
+    "nanobot.agent.tools.web",
+    "nanobot.agent.tools.image_generation",
+    "nanobot.agent.tools.cli_apps",
+    "nanobot.agent.tools.shell",
+    "nanobot.providers.image_generation",
+)
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """Import *module* in a fresh interpreter; return ms and lazy modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+    loaded = set(payload["modules"])
+    return payload["ms"], [name for name in LAZY_MODULES if name in loaded]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="nanobot.agent.loop")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    timings: list[float] = []
+    eager: list[str] = []
+    for _ in range(max(1, args.runs)):
+        elapsed, eager = measure(args.module)
+        timings.append(elapsed)
+    median = statistics.median(timings)
+    print(f"import {args.module}: median {median:.0f} ms, min {min(timings):.0f} ms over {len(timings)} runs")
+
+    failed = False
+    if eager:
+        print(f"eagerly imported tool modules: {', '.join(eager)}")
+        failed = True
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"over budget: {median:.0f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
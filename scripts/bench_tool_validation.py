@@ -0,0 +1,118 @@
+"""Measure per-call cost of tool parameter validation, interpreted vs compiled.
+
+Usage: python scripts/bench_tool_validation.py [--calls 20000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from nanobot.agent.tools.base import Schema, Tool, tool_parameters
+
+# Shaped like a typical MCP server tool: nested objects, arrays and enums.
+_MCP_LIKE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1, "maxLength": 500},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+        "sort": {"type": "string", "enum": ["relevance", "date", "title"]},
+        "filters": {
+            "type": "object",
+            "properties": {
+                "labels": {"type": "array", "items": {"type": "string"}, "maxItems": 20},
+                "state": {"type": ["string", "null"], "enum": ["open", "closed", None]},
+                "score": {"type": "number", "minimum": 0},
+            },
+            "additionalProperties": False,
+        },
+    },
+    "required": ["query"],
+}
+
+_MCP_LIKE_PARAMS: dict[str, Any] = {
+    "query": "parser regressions",
+    "limit": 25,
+    "sort": "date",
+    "filters": {"labels": ["bug", "parser", "p1"], "state": "open", "score": 0.5},
+}
+
+
+class _StoredSchemaTool(Tool):
+    """Returns one stored schema dict, like MCP tool wrappers."""
+
+    @property
+    def name(self) -> str:
+        return "bench_mcp"
+
+    @property
+    def description(self) -> str:
+        return "benchmark tool"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return _MCP_LIKE_SCHEMA
+
+    async def execute(self, **kwargs: Any) -> str:
+        return ""
+
+
+@tool_parameters(_MCP_LIKE_SCHEMA)
+class _DecoratedTool(Tool):
+    """Declares its schema with ``@tool_parameters``, like built-in tools."""
+
+    @property
+    def name(self) -> str:
+        return "bench"
+
+    @property
+    def description(self) -> str:
+        return "benchmark tool"
+
+    async def execute(self, **kwargs: Any) -> str:
+        return ""
+
+
+def _cases() -> list[tuple[str, Tool, dict[str, Any]]]:
+    invalid = {**_MCP_LIKE_PARAMS, "limit": 0, "filters": {"labels": [1], "extra": True}}
+    return [
+        ("stored schema", _StoredSchemaTool(), _MCP_LIKE_PARAMS),
+        ("stored schema, invalid", _StoredSchemaTool(), invalid),
+        ("@tool_parameters", _DecoratedTool(), _MCP_LIKE_PARAMS),
+    ]
+
+
+def _interpreted(tool: Tool, params: dict[str, Any]) -> Callable[[], list[str]]:
+    """Validation as it ran before compilation: copy the schema, then interpret it."""
+
+    def run() -> list[str]:
+        schema = tool.parameters or {}
+        return Schema.validate_json_schema_value(params, {**schema, "type": "object"}, "")
+
+    return run
+
+
+def per_call_us(fn: Callable[[], Any], calls: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for label, tool, params in _cases():
+        before = _interpreted(tool, params)
+        assert before() == tool.validate_params(params), label
+        old = per_call_us(before, args.calls, args.repeat)
+        new = per_call_us(lambda: tool.validate_params(params), args.calls, args.repeat)
+        print(f"{label}: interpreted {old:.2f} us/call, compiled {new:.2f} us/call ({old / new:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -421,6 +421,110 @@ class TestCheckExpired:
         scheduler.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# Idle-expiry index
+# ---------------------------------------------------------------------------
+
+
+class TestIdleIndex:
+    """Test the heap that replaces per-check session scans."""
+
+    @staticmethod
+    def _scheduler(scheduled: list):
+        def schedule(coro):
+            scheduled.append(coro)
+            coro.close()
+
+        return schedule
+
+    def test_only_the_first_check_lists_sessions(self):
+        ac = _make_autocompact(ttl=15)
+        ac.sessions.list_sessions.return_value = []
+        ac.check_expired(MagicMock(), _runtime)
+        ac.check_expired(MagicMock(), _runtime)
+        ac.sessions.list_sessions.assert_called_once()
+
+    def test_saved_session_becomes_due_without_scanning(self):
+        ac = _make_autocompact(ttl=15)
+        ac.sessions.list_sessions.return_value = []
+        ac.check_expired(MagicMock(), _runtime)
+
+        old = _make_session("cli:old")
+        _add_turns(old, 2)
+        old.updated_at = datetime.now() - timedelta(minutes=20)
+        fresh = _make_session("cli:fresh")
+        _add_turns(fresh, 2)
+        ac.observe_session(old.key, old)
+        ac.observe_session(fresh.key, fresh)
+        ac.sessions.get_or_create.side_effect = {old.key: old, fresh.key: fresh}.__getitem__
+        scheduled: list = []
+
+        ac.check_expired(self._scheduler(scheduled), _runtime)
+
+        assert len(scheduled) == 1
+        assert ac._archiving == {"cli:old"}
+        ac.sessions.get_or_create.assert_called_once_with("cli:old")
+
+    def test_archived_or_deleted_sessions_leave_the_index(self):
+        ac = _make_autocompact(ttl=15)
+        ac.sessions.list_sessions.return_value = []
+        ac.check_expired(MagicMock(), _runtime)
+        done = _make_session("cli:done")
+        _add_turns(done, 2)
+        done.updated_at = datetime.now() - timedelta(minutes=20)
+        ac.observe_session(done.key, done)
+        gone = _make_session("cli:gone")
+        _add_turns(gone, 2)
+        gone.updated_at = done.updated_at
+        ac.observe_session(gone.key, gone)
+
+        done.last_consolidated = len(done.messages)
+        ac.observe_session(done.key, done)
+        ac.observe_session(gone.key, None)
+        scheduler = MagicMock()
+        ac.check_expired(scheduler, _runtime)
+
+        scheduler.assert_not_called()
+        ac.sessions.get_or_create.assert_not_called()
+
+    def test_busy_session_stays_due_for_the_next_check(self):
+        ac = _make_autocompact(ttl=15)
+        old_dt = datetime.now() - timedelta(minutes=20)
+        session = _make_session("cli:busy")
+        _add_turns(session, 2)
+        ac.sessions.list_sessions.return_value = [
+            {"key": "cli:busy", "updated_at": old_dt.isoformat()}
+        ]
+        ac.sessions.get_or_create.return_value = session
+        scheduled: list = []
+
+        ac.check_expired(self._scheduler(scheduled), _runtime, active_session_keys={"cli:busy"})
+        assert scheduled == []
+        ac.check_expired(self._scheduler(scheduled), _runtime)
+
+        assert len(scheduled) == 1
+
+    def test_persisted_flag_skips_archived_sessions_when_seeding(self, tmp_path):
+        manager = SessionManager(tmp_path)
+        archived = manager.get_or_create("cli:archived")
+        _add_turns(archived, 2)
+        archived.last_consolidated = len(archived.messages)
+        manager.save(archived)
+        pending = manager.get_or_create("cli:pending")
+        _add_turns(pending, 2)
+        manager.save(pending)
+
+        flags = {
+            info["key"]: info.get("has_unarchived_messages")
+            for info in SessionManager(tmp_path).list_sessions()
+        }
+        assert flags == {"cli:archived": False, "cli:pending": True}
+
+        ac = _make_autocompact(ttl=15, sessions=SessionManager(tmp_path))
+        ac.check_expired(MagicMock(), _runtime)
+        assert set(ac._idle_at) == {"cli:pending"}
+
+
 # ---------------------------------------------------------------------------
 # _archive
 # ---------------------------------------------------------------------------
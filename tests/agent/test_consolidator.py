@@ -23,6 +23,7 @@ from nanobot.runtime_context import (
 )
 from nanobot.session.keys import UNIFIED_SESSION_KEY, remember_last_channel
 from nanobot.session.manager import Session
+from nanobot.utils.helpers import TokenCountCache
 from nanobot.utils.llm_runtime import LLMRuntime
 from nanobot.utils.prompt_templates import render_template
 
@@ -400,6 +401,23 @@ class TestConsolidatorTokenBudget:
         assert len(captured["history"]) == 8
         assert captured["history"][0]["content"] == "msg-2"
 
+    async def test_estimate_caches_only_persisted_history(self, consolidator, runtime, monkeypatch):
+        """The per-turn system prompt and the probe must not reach the session sidecar."""
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text: list(range(max(1, len(text) // 4)))
+        monkeypatch.setattr("nanobot.utils.helpers._get_token_encoding", lambda: encoding)
+        session = Session(key="test:token-cache")
+        for i in range(3):
+            session.add_message("user" if i % 2 == 0 else "assistant", f"msg-{i}")
+        consolidator._build_messages = _build_test_messages
+
+        consolidator.estimate_session_prompt_tokens(session, runtime=runtime)
+
+        cached = {key for key, _tokens in session.token_counts.items()}
+        assert TokenCountCache.payload_key("system prompt") not in cached
+        assert TokenCountCache.payload_key("[token-probe]") not in cached
+        assert len(cached) == 3
+
     async def test_token_overflow_appends_prompt_to_replay_prefix(
         self,
         consolidator,
@@ -449,6 +467,7 @@ class TestConsolidatorTokenBudget:
         duplicate [RAW] entries into history.jsonl."""
         consolidator._SAFETY_BUFFER = 0
         session = MagicMock()
+        session.token_counts = TokenCountCache()
         session.last_consolidated = 0
         session.key = "test:key"
         session.messages = [
@@ -477,6 +496,7 @@ class TestConsolidatorTokenBudget:
         same maybe_consolidate_by_tokens invocation — bail after one fallback."""
         consolidator._SAFETY_BUFFER = 0
         session = MagicMock()
+        session.token_counts = TokenCountCache()
         session.last_consolidated = 0
         session.key = "test:key"
         session.messages = [
@@ -502,6 +522,7 @@ class TestConsolidatorTokenBudget:
         """When boundary points past a long tool chain, the full chunk is archived."""
         consolidator._SAFETY_BUFFER = 0
         session = MagicMock()
+        session.token_counts = TokenCountCache()
         session.last_consolidated = 0
         session.key = "test:key"
         session.messages = [
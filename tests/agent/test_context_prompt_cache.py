@@ -444,3 +444,52 @@ def test_customized_memory_md_is_injected(tmp_path, monkeypatch) -> None:
     assert "# Memory\n\n## Long-term Memory" in prompt
     assert "User prefers dark mode" in prompt
     assert calls == 1
+
+
+def test_static_prompt_sections_are_reused_until_inputs_change(tmp_path, monkeypatch) -> None:
+    workspace = _make_workspace(tmp_path)
+    builder = ContextBuilder(workspace)
+    (workspace / "USER.md").write_text("Call me Sam.\n", encoding="utf-8")
+
+    loads = 0
+    load_bootstrap_files = builder._load_bootstrap_files
+
+    def tracked_load_bootstrap_files(root):
+        nonlocal loads
+        loads += 1
+        return load_bootstrap_files(root)
+
+    monkeypatch.setattr(builder, "_load_bootstrap_files", tracked_load_bootstrap_files)
+
+    first = builder.build_system_prompt(channel="cli")
+    second = builder.build_system_prompt(channel="cli")
+    assert first == second
+    assert loads == 1
+
+    (workspace / "USER.md").write_text("Call me Alex, please.\n", encoding="utf-8")
+    third = builder.build_system_prompt(channel="cli")
+    assert loads == 2
+    assert "Call me Alex, please." in third
+
+    skill_dir = workspace / "skills" / "fresh-skill"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: fresh-skill\ndescription: Newly installed skill\n---\n\nBody\n",
+        encoding="utf-8",
+    )
+    fourth = builder.build_system_prompt(channel="cli")
+    assert loads == 3
+    assert "fresh-skill" in fourth
+
+
+def test_static_prompt_cache_keeps_volatile_sections_fresh(tmp_path) -> None:
+    workspace = _make_workspace(tmp_path)
+    builder = ContextBuilder(workspace)
+
+    before = builder.build_system_prompt(session_key="cli:direct")
+    builder.memory.append_history("Discussed the release plan", session_key="cli:direct")
+    after = builder.build_system_prompt(session_key="cli:direct")
+
+    assert "Discussed the release plan" not in before
+    assert "Discussed the release plan" in after
+    assert after.startswith(before)
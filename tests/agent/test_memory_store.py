@@ -252,6 +252,61 @@ class TestHistoryWithCursor:
         entries = store.read_unprocessed_history(since_cursor=0)
         assert [entry["cursor"] for entry in entries] == list(range(21, 101))
 
+    def test_prompt_history_reads_only_the_indexed_tail(self, store, monkeypatch):
+        for index in range(1, 51):
+            session_key = "telegram:chat-1" if index % 10 == 0 else "slack:chat-2"
+            store.append_history(f"event {index}", session_key=session_key)
+
+        parsed: list[bytes] = []
+        original = MemoryStore._parse_history_line
+
+        def counting_parse(raw_line: bytes):
+            parsed.append(raw_line)
+            return original(raw_line)
+
+        monkeypatch.setattr(MemoryStore, "_parse_history_line", staticmethod(counting_parse))
+
+        entries = store.read_recent_history_for_prompt(
+            since_cursor=25,
+            session_key="telegram:chat-1",
+        )
+
+        assert [e["content"] for e in entries] == ["event 30", "event 40", "event 50"]
+        assert len(parsed) == 3
+        assert [e["cursor"] for e in store.read_unprocessed_history(45)] == [46, 47, 48, 49, 50]
+
+    def test_history_index_follows_external_appends_and_rewrites(self, store):
+        store.append_history("event 1")
+        store.append_history("event 2")
+        assert [e["cursor"] for e in store.read_unprocessed_history(0)] == [1, 2]
+
+        with open(store.history_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"cursor": 3, "timestamp": "2026-01-01 00:00", "content": "ext"}) + "\n")
+        assert [e["content"] for e in store.read_unprocessed_history(2)] == ["ext"]
+
+        store.history_file.write_text(
+            "\n".join(
+                json.dumps({"cursor": c, "timestamp": "2026-01-01 00:00", "content": f"new {c}"})
+                for c in (7, 8, 9, 10)
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        assert [e["content"] for e in store.read_unprocessed_history(8)] == ["new 9", "new 10"]
+        assert store.append_history("after rewrite") == 11
+
+    def test_compact_history_keeps_index_in_sync(self, tmp_path):
+        store = MemoryStore(tmp_path, max_history_entries=3)
+        for index in range(1, 7):
+            store.append_history(f"event {index}", session_key="cli:direct")
+        store.set_last_dream_cursor(6)
+        store.compact_history()
+        store.append_history("event 7", session_key="cli:direct")
+
+        entries = store.read_recent_history_for_prompt(3, session_key="cli:direct")
+
+        assert [e["cursor"] for e in entries] == [4, 5, 6, 7]
+
     def test_write_entries_uses_atomic_write(self, tmp_path):
         """_write_entries uses temp file + os.replace for atomicity."""
         store = MemoryStore(tmp_path)
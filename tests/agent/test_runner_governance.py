@@ -1047,3 +1047,119 @@ def test_strip_placeholder_keeps_assistant_with_tool_calls():
     ]
     result = ContextGovernor.strip_placeholder_assistant_messages(messages)
     assert result is messages
+
+
+def _tool_turn(call_id: str, content: str, *, name: str = "read_file") -> list[dict]:
+    return [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [{"id": call_id, "type": "function", "function": {"name": name, "arguments": "{}"}}],
+        },
+        {"role": "tool", "tool_call_id": call_id, "name": name, "content": content},
+    ]
+
+
+def test_prepare_for_model_reuses_repaired_prefix_across_iterations():
+    from nanobot.agent.context_governance import ContextGovernanceState
+
+    provider = MagicMock()
+    tools = MagicMock()
+    tools.get_definitions.return_value = []
+    messages: list[dict] = [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "go"},
+        {"role": "assistant", "content": "[Previous assistant message omitted.]"},
+        {"role": "tool", "tool_call_id": "stray", "content": "orphan"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [{"id": "bad", "type": "function", "function": {"name": None, "arguments": "{}"}}],
+        },
+    ]
+    spec = make_run_spec(provider,
+        initial_messages=messages,
+        tools=tools,
+        model="test-model",
+        max_iterations=1,
+        max_tool_result_chars=_MAX_TOOL_RESULT_CHARS,
+    )
+    config = _governance_config(provider, tools, spec)
+    governor = ContextGovernor()
+    state = ContextGovernanceState()
+
+    def check() -> None:
+        incremental = governor.prepare_for_model(config, messages, set(), state=state)
+        assert incremental == governor.prepare_for_model(config, messages, set())
+
+    check()
+    for i in range(5):
+        messages.extend(_tool_turn(f"c{i}", f"result {i}"))
+        check()
+    assert (state.full_passes, state.incremental_passes) == (1, 5)
+
+    # A call still waiting for its result is not memoized; the next pass is full.
+    messages.append(_tool_turn("late", "")[0])
+    check()
+    messages.append({"role": "tool", "tool_call_id": "late", "name": "read_file", "content": "done"})
+    check()
+    assert (state.full_passes, state.incremental_passes) == (2, 6)
+
+    # Merging an injected message replaces the tail and invalidates the memo too.
+    messages.append({"role": "user", "content": "more"})
+    check()
+    messages[-1] = {"role": "user", "content": "more\n\nand more"}
+    check()
+    assert (state.full_passes, state.incremental_passes) == (3, 7)
+
+
+def test_prepare_for_model_runs_full_pass_after_inflight_compaction(monkeypatch):
+    from nanobot.agent.context_governance import ContextGovernanceState
+
+    provider = MagicMock()
+    provider.generation = SimpleNamespace(max_tokens=0)
+    tools = MagicMock()
+    tools.get_definitions.return_value = []
+    long_content = "x" * 600
+    messages = [{"role": "system", "content": "system"}, {"role": "user", "content": "go"}]
+    for i in range(3):
+        messages.extend(_tool_turn(f"c{i}", long_content))
+    spec = make_run_spec(provider,
+        initial_messages=messages,
+        tools=tools,
+        model="test-model",
+        max_iterations=1,
+        max_tool_result_chars=_MAX_TOOL_RESULT_CHARS,
+        max_tokens=0,
+        context_window_tokens=1274,  # input budget 250
+    )
+
+    def estimate(_provider, _model, msgs, _tools, **_kwargs):
+        return sum(
+            100 if msg.get("content") == long_content else 1
+            for msg in msgs
+            if msg.get("role") == "tool"
+        ), "test"
+
+    monkeypatch.setattr("nanobot.agent.context_governance.estimate_prompt_tokens_chain", estimate)
+    config = _governance_config(provider, tools, spec)
+    governor = ContextGovernor()
+    state = ContextGovernanceState()
+    compacted: set[str] = set()
+
+    governor.prepare_for_model(config, messages, compacted, state=state)
+    assert compacted == {"c0"}
+    assert state.full_passes == 1
+
+    messages.extend(_tool_turn("c3", "short"))
+    result = governor.prepare_for_model(config, messages, compacted, state=state)
+
+    assert state.full_passes == 2
+    assert [m["content"] for m in result if m.get("tool_call_id") == "c0"] == [
+        ContextGovernor._tool_result_compaction_message({"name": "read_file"})
+    ]
+    assert messages[3]["content"] == long_content
+
+    messages.extend(_tool_turn("c4", "short"))
+    governor.prepare_for_model(config, messages, compacted, state=state)
+    assert (state.full_passes, state.incremental_passes) == (2, 1)
@@ -3,6 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from filelock import Timeout
@@ -265,6 +266,252 @@ class TestAtomicSave:
         assert loaded.messages == [{"role": "user", "content": "safe"}]
 
 
+class TestIncrementalSave:
+    @staticmethod
+    def _records(path: Path) -> list[dict]:
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    def test_unchanged_prefix_appends_messages_and_metadata_trailer(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:append")
+        session.add_message("user", "first")
+        mgr.save(session)
+        path = mgr._get_session_path(session.key)
+        inode = path.stat().st_ino
+
+        session.add_message("assistant", "second")
+        session.metadata["title"] = "Appended"
+        mgr.save(session)
+
+        assert path.stat().st_ino == inode
+        records = self._records(path)
+        assert [r.get("_type") or r["content"] for r in records] == [
+            "metadata",
+            "first",
+            "second",
+            "metadata",
+        ]
+        assert mgr.read_session_metadata(session.key)["metadata"] == {"title": "Appended"}
+        assert mgr.list_sessions()[0]["title"] == "Appended"
+
+        mgr.invalidate(session.key)
+        loaded = mgr.get_or_create(session.key)
+        assert [m["content"] for m in loaded.messages] == ["first", "second"]
+        assert loaded.metadata == {"title": "Appended"}
+
+    def test_torn_append_falls_back_to_newest_intact_trailer(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:torn")
+        session.add_message("user", "first")
+        mgr.save(session)
+        session.add_message("assistant", "second")
+        session.metadata["title"] = "Appended"
+        mgr.save(session)
+        path = mgr._get_session_path(session.key)
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"role": "user", "content": "third"}\n{"_type": "metadata", "metad')
+
+        assert mgr.read_session_metadata(session.key)["metadata"] == {"title": "Appended"}
+        assert mgr.list_sessions()[0]["title"] == "Appended"
+
+    def test_fsync_save_compacts(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:fsync-compact")
+        session.add_message("user", "first")
+        mgr.save(session)
+        path = mgr._get_session_path(session.key)
+        inode = path.stat().st_ino
+
+        session.add_message("assistant", "second")
+        mgr.save(session, fsync=True)
+
+        assert path.stat().st_ino != inode
+        assert [r.get("_type") or r["content"] for r in self._records(path)] == [
+            "metadata",
+            "first",
+            "second",
+        ]
+
+    def test_rewritten_history_compacts_atomically(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:compact")
+        for i in range(4):
+            session.add_message("user", f"msg{i}")
+            mgr.save(session)
+        path = mgr._get_session_path(session.key)
+        inode = path.stat().st_ino
+
+        session.retain_recent_legal_suffix(2)
+        mgr.save(session)
+
+        assert path.stat().st_ino != inode
+        records = self._records(path)
+        assert [r.get("_type") or r["content"] for r in records] == [
+            "metadata",
+            "msg2",
+            "msg3",
+        ]
+
+        session.clear()
+        mgr.save(session)
+        assert [r.get("_type") for r in self._records(path)] == ["metadata"]
+
+    def test_in_place_message_edit_is_not_appended(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:edit")
+        session.add_message("assistant", "reply")
+        mgr.save(session)
+
+        session.messages[-1]["latency_ms"] = 42
+        mgr.save(session)
+
+        mgr.invalidate(session.key)
+        loaded = mgr.get_or_create(session.key)
+        assert loaded.messages == session.messages
+
+    def test_external_rewrite_forces_compaction(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:external")
+        session.add_message("user", "hello")
+        mgr.save(session)
+
+        assert mgr.update_session_metadata(session.key, {"title": "Renamed"})
+        session.add_message("assistant", "hi")
+        mgr.save(session)
+
+        records = self._records(mgr._get_session_path(session.key))
+        assert [r.get("_type") for r in records] == ["metadata", None, None]
+        assert records[0]["metadata"] == {"title": "Renamed"}
+
+    def test_update_metadata_folds_appended_trailers(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:fold")
+        session.add_message("user", "hello")
+        mgr.save(session)
+        session.metadata["goal"] = "kept"
+        session.add_message("assistant", "hi")
+        mgr.save(session)
+
+        assert mgr._jsonl_store.update_metadata(session.key, {"title": "Renamed"})
+
+        records = self._records(mgr._get_session_path(session.key))
+        assert [r.get("_type") for r in records] == ["metadata", None, None]
+        assert records[0]["metadata"] == {"goal": "kept", "title": "Renamed"}
+
+    def test_stale_trailers_trigger_compaction(self, tmp_path: Path, monkeypatch):
+        import nanobot.session.manager as session_manager
+
+        monkeypatch.setattr(session_manager, "_APPEND_COMPACTION_MIN_STALE_CHARS", 0)
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:stale")
+        session.add_message("user", "hello")
+        mgr.save(session)
+        for i in range(10):
+            session.metadata["checkpoint"] = "x" * 200 + str(i)
+            mgr.save(session)
+
+        records = self._records(mgr._get_session_path(session.key))
+        assert sum(1 for r in records if r.get("_type") == "metadata") <= 2
+        metadata = mgr.read_session_metadata(session.key)
+        assert metadata is not None
+        assert metadata["metadata"]["checkpoint"].endswith("9")
+
+    def test_torn_append_is_recovered_and_rewritten(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:torn")
+        session.add_message("user", "hello")
+        mgr.save(session)
+        path = mgr._get_session_path(session.key)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"role": "assistant", "content": "par')
+
+        mgr.invalidate(session.key)
+        loaded = mgr.get_or_create(session.key)
+        assert [m["content"] for m in loaded.messages] == ["hello"]
+
+        loaded.add_message("assistant", "complete")
+        mgr.save(loaded)
+        records = self._records(path)
+        assert [r.get("_type") or r["content"] for r in records] == [
+            "metadata",
+            "hello",
+            "complete",
+        ]
+
+    def test_cleared_provider_state_compacts(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(
+            key="test:provider-clear",
+            provider_state=ProviderConversationState(
+                kind="openai_responses",
+                provider="openai:test",
+                model="gpt-5.6",
+                version=1,
+                payload={"items": []},
+            ),
+        )
+        session.add_message("user", "hello")
+        mgr.save(session)
+
+        session.provider_state = None
+        session.add_message("assistant", "hi")
+        mgr.save(session)
+
+        mgr.invalidate(session.key)
+        assert mgr.get_or_create(session.key).provider_state is None
+
+    def test_incremental_saves_can_be_disabled(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        mgr._jsonl_store.incremental_saves = False
+        session = Session(key="test:full")
+        session.add_message("user", "first")
+        mgr.save(session)
+        session.add_message("user", "second")
+        mgr.save(session)
+
+        records = self._records(mgr._get_session_path(session.key))
+        assert [r.get("_type") for r in records] == ["metadata", None, None]
+
+
+class TestTokenCountSidecar:
+    @pytest.fixture(autouse=True)
+    def _token_encoding(self, monkeypatch):
+        """Only real encoder counts are cached, so stub tiktoken for offline runs."""
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text: list(range(max(1, len(text) // 4)))
+        monkeypatch.setattr("nanobot.utils.helpers._get_token_encoding", lambda: encoding)
+
+    def test_token_counts_survive_reload(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:tokens")
+        session.add_message("user", "hello")
+        session.add_message("assistant", "hi there")
+        session.get_history(max_tokens=10_000)
+        mgr.save(session)
+
+        sidecar = mgr._jsonl_store.get_token_counts_path(session.key)
+        assert len(sidecar.read_text(encoding="utf-8").splitlines()) == 2
+
+        mgr.invalidate(session.key)
+        loaded = mgr.get_or_create(session.key)
+        assert loaded.token_counts.items() == session.token_counts.items()
+        loaded.get_history(max_tokens=10_000)
+        assert loaded.token_counts.drain_pending() == {}
+
+    def test_delete_removes_token_counts(self, tmp_path: Path):
+        mgr = SessionManager(tmp_path)
+        session = Session(key="test:tokens-delete")
+        session.add_message("user", "hello")
+        session.get_history(max_tokens=10_000)
+        mgr.save(session)
+        sidecar = mgr._jsonl_store.get_token_counts_path(session.key)
+        assert sidecar.exists()
+
+        assert mgr.delete_session(session.key)
+        assert not sidecar.exists()
+
+
 class TestRepairCorruptFile:
     def _write_corrupt_jsonl(self, path: Path, lines: list[str]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
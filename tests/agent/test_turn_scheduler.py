@@ -0,0 +1,153 @@
+"""Tests for weighted fair turn admission."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nanobot.agent.turn_scheduler import (
+    TurnScheduler,
+    classify_turn,
+    format_turn_scheduler_stats,
+    model_limit_keys,
+)
+from nanobot.bus.events import InboundMessage
+
+
+async def _admission_order(scheduler: TurnScheduler, requests: list[tuple[str, str]]) -> list[str]:
+    """Hold the only slot, queue *requests*, then release and record admission order."""
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot("interactive", session_key="holder", channel="cli"):
+            await release.wait()
+
+    async def turn(turn_class: str, session_key: str) -> None:
+        async with scheduler.slot(turn_class, session_key=session_key, channel="test"):  # type: ignore[arg-type]
+            order.append(session_key)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = []
+    for turn_class, session_key in requests:
+        tasks.append(asyncio.create_task(turn(turn_class, session_key)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_interactive_turns_are_admitted_ahead_of_an_automation_burst() -> None:
+    scheduler = TurnScheduler(1)
+    requests = [("automation", f"cron:{idx}") for idx in range(6)]
+    requests += [("interactive", "websocket:a"), ("interactive", "api:b")]
+
+    order = await _admission_order(scheduler, requests)
+
+    assert order.index("websocket:a") < 3
+    assert order.index("api:b") < 4
+    stats = scheduler.stats()["classes"]
+    assert stats["automation"]["admitted"] == 6
+    assert stats["automation"]["max_wait_ms"] > 0
+    assert stats["interactive"]["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_busy_session_yields_to_quieter_sessions_in_its_class() -> None:
+    scheduler = TurnScheduler(1)
+    # The chatty session already had two turns admitted.
+    for _ in range(2):
+        async with scheduler.slot("interactive", session_key="telegram:group", channel="telegram"):
+            pass
+
+    order = await _admission_order(
+        scheduler,
+        [("interactive", "telegram:group"), ("interactive", "websocket:quiet")],
+    )
+
+    assert order == ["websocket:quiet", "telegram:group"]
+
+
+@pytest.mark.asyncio
+async def test_class_and_model_limits_cap_running_turns_independently() -> None:
+    scheduler = TurnScheduler(
+        None,
+        class_limits={"subagent": 1},
+        concurrency_limits={"anthropic": 1},
+    )
+    release = asyncio.Event()
+    running: list[str] = []
+
+    async def turn(turn_class: str, name: str, keys: tuple[str, ...] = ()) -> None:
+        async with scheduler.slot(turn_class, session_key=name, channel="x", limit_keys=keys):  # type: ignore[arg-type]
+            running.append(name)
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(turn("subagent", "sub-1")),
+        asyncio.create_task(turn("subagent", "sub-2")),
+        asyncio.create_task(turn("interactive", "claude-1", model_limit_keys("anthropic/claude"))),
+        asyncio.create_task(turn("interactive", "claude-2", model_limit_keys("anthropic/claude"))),
+        asyncio.create_task(turn("interactive", "local", model_limit_keys("ollama/llama"))),
+    ]
+    await asyncio.sleep(0.01)
+
+    assert sorted(running) == ["claude-1", "local", "sub-1"]
+    assert scheduler.stats()["classes"]["subagent"]["waiting"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    scheduler = TurnScheduler(1)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot("interactive", session_key="a", channel="x"):
+            await release.wait()
+
+    async def wait_turn() -> None:
+        async with scheduler.slot("interactive", session_key="b", channel="x"):
+            pass
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(wait_turn())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    release.set()
+    await holder
+
+    assert scheduler.running == 0
+    assert scheduler.stats()["classes"]["interactive"]["waiting"] == 0
+
+
+def test_classify_turn() -> None:
+    def msg(channel: str, sender_id: str = "u", metadata: dict | None = None) -> InboundMessage:
+        return InboundMessage(
+            channel=channel, sender_id=sender_id, chat_id="c", content="hi", metadata=metadata or {}
+        )
+
+    assert classify_turn(msg("websocket")) == "interactive"
+    assert classify_turn(msg("system", sender_id="subagent")) == "subagent"
+    assert classify_turn(msg("system")) == "automation"
+
+
+@pytest.mark.asyncio
+async def test_status_line_reports_per_class_queue_wait() -> None:
+    scheduler = TurnScheduler(1)
+
+    await _admission_order(scheduler, [("automation", "cron:1")])
+    line = format_turn_scheduler_stats(scheduler.stats())
+
+    assert line.startswith("\u23f3 Turns: 0/1 running; ")
+    assert "interactive 0 queued, avg wait 0 ms" in line
+    assert "automation 0 queued, avg wait" in line
+    assert "subagent" not in line
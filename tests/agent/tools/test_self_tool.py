@@ -39,7 +39,7 @@ def _make_mock_loop(**overrides):
     loop.max_tool_result_chars = 16000
     loop.model_preset = None
     loop.model_presets = {}
-    loop._concurrency_gate = None
+    loop._turn_scheduler = None
     loop._unified_session = False
     loop._extra_hooks = []
     loop.set_runtime_model.side_effect = lambda value: setattr(loop, "model", value)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 
@@ -109,6 +110,42 @@ def test_descriptor_rejects_runtime_class_owned_by_another_name():
         plugin.load_channel_class()
 
 
+@pytest.mark.asyncio
+async def test_running_manager_reloads_config_after_snapshot_invalidation(tmp_path, monkeypatch):
+    from nanobot.config.snapshot import config_snapshots, load_config_snapshot
+
+    path = (tmp_path / "config.json").resolve()
+    data = {
+        "agents": {"defaults": {"model": "a/one", "workspace": str(tmp_path / "file-ws")}},
+        "channels": {"hot": {"enabled": True, "token": "${HOT_TOKEN}"}},
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr("nanobot.config.loader._current_config_path", path)
+    monkeypatch.setenv("HOT_TOKEN", "secret-token")
+    _stub_registry(monkeypatch, _plugin(_HotChannel))
+
+    runtime_config = load_config_snapshot(path, resolve_env=True)
+    runtime_config.agents.defaults.workspace = str(tmp_path / "override-ws")
+    manager = ChannelManager(runtime_config, MessageBus(), config_path=path)
+    run = asyncio.create_task(manager.start_all())
+    await asyncio.wait_for(manager.channels["hot"].started.wait(), timeout=1)
+
+    data["agents"]["defaults"]["model"] = "a/two"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    config_snapshots().invalidate(path)
+    manager._sync_config()
+
+    assert manager.config.agents.defaults.model == "a/two"
+    assert manager.config is not config_snapshots().get(path, shared=True)
+    assert manager._channel_section("hot", default_enabled=False)["token"] == "secret-token"
+    assert manager.config.workspace_path == tmp_path / "override-ws"
+
+    await manager.stop_all()
+    await run
+    config_snapshots().invalidate(path)
+    assert manager._config_stale is False
+
+
 @pytest.mark.asyncio
 async def test_apply_channel_feature_action_starts_and_stops_channel(monkeypatch):
     disabled = Config.model_validate({
@@ -126,7 +163,7 @@ async def test_apply_channel_feature_action_starts_and_stops_channel(monkeypatch
 
     configs = iter([enabled, disabled])
     _stub_registry(monkeypatch, _plugin(_HotChannel))
-    monkeypatch.setattr("nanobot.config.loader.load_config", lambda: next(configs))
+    monkeypatch.setattr("nanobot.config.snapshot.load_config_snapshot", lambda *_a, **_k: next(configs))
 
     manager = ChannelManager(disabled, MessageBus())
     manager._started = True
@@ -157,7 +194,7 @@ async def test_apply_channel_feature_action_keeps_running_channel_when_rebuild_f
     })
 
     _stub_registry(monkeypatch, _plugin(_HotChannel))
-    monkeypatch.setattr("nanobot.config.loader.load_config", lambda: enabled)
+    monkeypatch.setattr("nanobot.config.snapshot.load_config_snapshot", lambda *_a, **_k: enabled)
 
     manager = ChannelManager(enabled, MessageBus())
     old_channel = manager.channels["hot"]
@@ -193,7 +230,7 @@ async def test_apply_channel_feature_action_uses_channel_runtime_name(monkeypatc
     })
 
     _stub_registry(monkeypatch, _plugin(_MultiHotChannel, multi_instance=True))
-    monkeypatch.setattr("nanobot.config.loader.load_config", lambda: config)
+    monkeypatch.setattr("nanobot.config.snapshot.load_config_snapshot", lambda *_a, **_k: config)
 
     manager = ChannelManager(config, MessageBus())
     product = manager.channels["multi.product"]
@@ -248,7 +285,7 @@ async def test_default_multi_channel_action_reconciles_only_default_runtime(monk
 
     _stub_registry(monkeypatch, _plugin(_MultiHotChannel, multi_instance=True))
     configs = iter([disabled, enabled])
-    monkeypatch.setattr("nanobot.config.loader.load_config", lambda: next(configs))
+    monkeypatch.setattr("nanobot.config.snapshot.load_config_snapshot", lambda *_a, **_k: next(configs))
 
     manager = ChannelManager(initial, MessageBus())
     default = manager.channels["multi"]
@@ -0,0 +1,162 @@
+"""Tests for per-channel outbound dispatch lanes in ChannelManager."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nanobot.bus.events import OutboundMessage
+from nanobot.bus.outbound_events import StreamDeltaEvent, StreamEndEvent, outbound_message_for_event
+from nanobot.bus.queue import MessageBus
+from nanobot.channels.base import BaseChannel
+from nanobot.channels.manager import ChannelManager
+from nanobot.config.schema import Config
+
+
+class _LaneChannel(BaseChannel):
+    name = "lane"
+    display_name = "Lane"
+
+    def __init__(self, config, bus):
+        super().__init__(config, bus)
+        self._send_mock = AsyncMock()
+        self._send_delta_mock = AsyncMock()
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def send(self, msg):
+        return await self._send_mock(msg)
+
+    async def send_delta(self, chat_id, delta, metadata=None, *, stream_id=None, **kwargs):
+        return await self._send_delta_mock(chat_id, delta, stream_id=stream_id, **kwargs)
+
+
+@pytest.fixture
+def manager():
+    config = Config.model_validate({"channels": {"websocket": {"enabled": False}}})
+    manager = ChannelManager(config, MessageBus())
+    manager.channels["slow"] = manager._build_channel("slow", _LaneChannel, {})
+    manager.channels["fast"] = manager._build_channel("fast", _LaneChannel, {})
+    return manager
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_blocked_channel_does_not_delay_other_channels(manager):
+    release = asyncio.Event()
+
+    async def _blocked_send(msg):
+        await release.wait()
+
+    manager.channels["slow"]._send_mock.side_effect = _blocked_send
+
+    await manager.bus.publish_outbound(OutboundMessage(channel="slow", chat_id="a", content="one"))
+    await manager.bus.publish_outbound(OutboundMessage(channel="slow", chat_id="a", content="two"))
+    await manager.bus.publish_outbound(OutboundMessage(channel="fast", chat_id="b", content="hi"))
+
+    task = asyncio.create_task(manager._dispatch_outbound())
+    try:
+        await _wait_for(lambda: manager.channels["fast"]._send_mock.await_count == 1)
+        assert manager.channels["slow"]._send_mock.await_count == 1
+
+        release.set()
+        await _wait_for(lambda: manager.channels["slow"]._send_mock.await_count == 2)
+        sent = [call.args[0].content for call in manager.channels["slow"]._send_mock.await_args_list]
+        assert sent == ["one", "two"]
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert manager._outbound_lanes == {}
+
+
+@pytest.mark.asyncio
+async def test_lane_stats_are_reported_in_status(manager):
+    manager.config.channels.send_max_retries = 1
+    manager.channels["slow"]._send_mock.side_effect = RuntimeError("down")
+
+    await manager.bus.publish_outbound(OutboundMessage(channel="slow", chat_id="a", content="x"))
+    await manager.bus.publish_outbound(OutboundMessage(channel="fast", chat_id="b", content="y"))
+
+    task = asyncio.create_task(manager._dispatch_outbound())
+    try:
+        await _wait_for(
+            lambda: manager._outbound_lanes.get("slow") is not None
+            and manager._outbound_lanes["slow"].failed == 1
+            and manager._outbound_lanes.get("fast") is not None
+            and manager._outbound_lanes["fast"].sent == 1
+        )
+        status = manager.get_status()
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert status["slow"]["outbound"]["failed"] == 1
+    assert status["slow"]["outbound"]["sent"] == 0
+    assert status["fast"]["outbound"]["sent"] == 1
+    assert status["fast"]["outbound"]["queued"] == 0
+    assert status["fast"]["outbound"]["capacity"] == 1000
+    assert status["fast"]["outbound"]["overflowed"] == 0
+    assert status["fast"]["outbound"]["last_latency_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_full_lane_merges_deltas_without_blocking_other_channels(manager):
+    manager.config.channels.outbound_queue_size = 2
+    release = asyncio.Event()
+
+    async def _blocked_send(msg):
+        await release.wait()
+
+    slow = manager.channels["slow"]
+    slow._send_mock.side_effect = _blocked_send
+    await manager.bus.publish_outbound(OutboundMessage(channel="slow", chat_id="a", content="first"))
+    for idx in range(10):
+        await manager.bus.publish_outbound(
+            outbound_message_for_event(
+                channel="slow", chat_id="a", event=StreamDeltaEvent(content=str(idx), stream_id="s1"),
+            )
+        )
+    await manager.bus.publish_outbound(
+        outbound_message_for_event(channel="slow", chat_id="a", event=StreamEndEvent(stream_id="s1"))
+    )
+    await manager.bus.publish_outbound(OutboundMessage(channel="slow", chat_id="a", content="final"))
+    await manager.bus.publish_outbound(OutboundMessage(channel="fast", chat_id="b", content="hi"))
+
+    task = asyncio.create_task(manager._dispatch_outbound())
+    try:
+        await _wait_for(lambda: manager.channels["fast"]._send_mock.await_count == 1)
+        status = manager.get_status()["slow"]["outbound"]
+        assert status["queued"] <= 4
+        assert status["overflowed"] > 0
+
+        release.set()
+        await _wait_for(lambda: slow._send_mock.await_count == 2)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    streamed = "".join(call.args[1] for call in slow._send_delta_mock.await_args_list)
+    assert streamed == "0123456789"
+    assert any(call.kwargs.get("stream_end") for call in slow._send_delta_mock.await_args_list)
+    assert [call.args[0].content for call in slow._send_mock.await_args_list] == ["first", "final"]
+
+
+def test_status_includes_channel_transport_status(manager):
+    lag = {"connections": [{"queued": 3, "max_lag_ms": 12.5, "chat_ids": ["a"]}]}
+    manager.channels["fast"].transport_status = lambda: lag
+
+    status = manager.get_status()
+
+    assert status["fast"]["transport"] == lag
+    assert "transport" not in status["slow"]
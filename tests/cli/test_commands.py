@@ -2126,7 +2126,7 @@ def test_heartbeat_empty_response_still_retains_recent_messages(
             return [{"key": "telegram:u1"}]
 
     class _FakeCron:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
             seen["cron"] = self
 
@@ -2812,11 +2812,13 @@ def test_gateway_uses_workspace_directory_for_cron_store(monkeypatch, tmp_path:
     config_file = _write_instance_config(tmp_path)
     config = Config()
     config.agents.defaults.workspace = str(tmp_path / "config-workspace")
-    seen: dict[str, Path] = {}
+    config.gateway.cron_max_concurrent_jobs = 7
+    seen: dict[str, object] = {}
 
     class _StopCron:
-        def __init__(self, store_path: Path) -> None:
+        def __init__(self, store_path: Path, max_concurrent_jobs: int = 4) -> None:
             seen["cron_store"] = store_path
+            seen["max_concurrent_jobs"] = max_concurrent_jobs
             raise _StopGatewayError("stop")
 
     _patch_cli_command_runtime(
@@ -2831,6 +2833,7 @@ def test_gateway_uses_workspace_directory_for_cron_store(monkeypatch, tmp_path:
 
     assert isinstance(result.exception, _StopGatewayError)
     assert seen["cron_store"] == config.workspace_path / "cron" / "jobs.json"
+    assert seen["max_concurrent_jobs"] == 7
 
 
 def test_gateway_unbound_agent_cron_is_skipped(
@@ -2885,7 +2888,7 @@ def test_gateway_unbound_agent_cron_is_skipped(
     monkeypatch.setattr("nanobot.session.manager.SessionManager", _FakeSessionManager)
 
     class _FakeCron:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
             seen["cron"] = self
 
@@ -2998,7 +3001,7 @@ def test_gateway_bound_cron_runs_as_session_turn(
     monkeypatch.setattr("nanobot.session.manager.SessionManager", _FakeSessionManager)
 
     class _FakeCron:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
             seen["cron"] = self
 
@@ -3182,7 +3185,7 @@ def test_gateway_local_trigger_queue_submits_agent_turns(
         config,
         message_bus=lambda: bus,
         session_manager=lambda _workspace: _FakeSessionManager(),
-        cron_service=lambda _store_path: _FakeCronService(),
+        cron_service=lambda _store_path, **_kwargs: _FakeCronService(),
     )
 
     class _FakeMemory:
@@ -3321,7 +3324,7 @@ def test_gateway_workspace_override_does_not_migrate_legacy_cron(
     seen: dict[str, Path] = {}
 
     class _StopCron:
-        def __init__(self, store_path: Path) -> None:
+        def __init__(self, store_path: Path, max_concurrent_jobs: int = 4) -> None:
             seen["cron_store"] = store_path
             raise _StopGatewayError("stop")
 
@@ -3360,7 +3363,7 @@ def test_gateway_custom_config_workspace_does_not_migrate_legacy_cron(
     seen: dict[str, Path] = {}
 
     class _StopCron:
-        def __init__(self, store_path: Path) -> None:
+        def __init__(self, store_path: Path, max_concurrent_jobs: int = 4) -> None:
             seen["cron_store"] = store_path
             raise _StopGatewayError("stop")
 
@@ -3513,7 +3516,7 @@ def test_gateway_health_endpoint_binds_and_serves_expected_responses(
             return None
 
     class _FakeCronService:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
 
         async def start(self) -> None:
@@ -3739,7 +3742,7 @@ def test_gateway_agent_task_owns_initial_mcp_provider_close(
             seen["channels_stopped"] = True
 
     class _FakeCronService:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
 
         async def start(self) -> None:
@@ -3850,7 +3853,7 @@ def test_gateway_shutdown_event_exits_forever_runtime_tasks(
             shutdown_order.append("channels_stopped")
 
     class _FakeCronService:
-        def __init__(self, _store_path: Path) -> None:
+        def __init__(self, _store_path: Path, max_concurrent_jobs: int = 4) -> None:
             self.on_job = None
 
         async def start(self) -> None:
@@ -104,6 +104,10 @@ async def test_model_command_switches_preset(tmp_path) -> None:
     assert _saved_model_preset(loop) == "fast"
     status = await loop.process_direct("/status", session_key="cli:direct")
     assert status is not None and "openai/gpt-4.1" in status.content
+    assert "Turns: 0/" in status.content
+    loop._turn_scheduler.concurrency_limits = {"openai": 1}
+    assert loop._turn_limit_keys("cli:direct") == ("openai/gpt-4.1", "openai")
+    assert loop._turn_limit_keys("cli:other") == ("base-model",)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,133 @@
+"""Tests for the process-wide config snapshot cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from nanobot.config.errors import ConfigLoadError
+from nanobot.config.loader import load_config, save_config
+from nanobot.config.snapshot import ConfigSnapshotService
+
+
+def _write(path: Path, model: str, *, mtime_ns: int | None = None) -> None:
+    path.write_text(json.dumps({"agents": {"defaults": {"model": model}}}), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+_OLD_NS = 1_600_000_000 * 10**9
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    _write(path, "a/one", mtime_ns=_OLD_NS)
+    service = ConfigSnapshotService()
+
+    first = service.get(path, shared=True)
+    monkeypatch.setattr(
+        "nanobot.config.snapshot.load_config",
+        lambda *_args: pytest.fail("unchanged config was parsed again"),
+    )
+
+    assert service.get(path, shared=True) is first
+    assert service.stats() == {"hits": 1, "reloads": 1, "paths": 1}
+
+
+def test_default_snapshot_is_a_private_copy(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, "a/one", mtime_ns=_OLD_NS)
+    service = ConfigSnapshotService()
+
+    mine = service.get(path)
+    mine.agents.defaults.model = "a/mutated"
+
+    assert service.get(path).agents.defaults.model == "a/one"
+    assert service.get(path, shared=True).agents.defaults.model == "a/one"
+    assert service.get(path) is not service.get(path)
+    assert service.stats()["reloads"] == 1
+
+
+def test_changed_file_is_reparsed_and_subscribers_notified(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, "a/one", mtime_ns=_OLD_NS)
+    service = ConfigSnapshotService()
+    changes: list[Path] = []
+    unsubscribe = service.subscribe(changes.append)
+
+    assert service.get(path).agents.defaults.model == "a/one"
+    _write(path, "a/two", mtime_ns=_OLD_NS + 1)
+
+    assert service.get(path).agents.defaults.model == "a/two"
+    assert changes == [path]
+    unsubscribe()
+    _write(path, "a/three", mtime_ns=_OLD_NS + 2)
+    service.get(path)
+    assert changes == [path]
+
+
+def test_touch_without_content_change_keeps_snapshot(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, "a/one", mtime_ns=_OLD_NS)
+    service = ConfigSnapshotService()
+    changes: list[Path] = []
+    service.subscribe(changes.append)
+    first = service.get(path, shared=True)
+
+    os.utime(path, ns=(_OLD_NS + 5, _OLD_NS + 5))
+
+    assert service.get(path, shared=True) is first
+    assert changes == []
+
+
+def test_recent_same_size_rewrite_is_detected_by_hash(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, "a/one")
+    stat = path.stat()
+    service = ConfigSnapshotService()
+    service.get(path)
+
+    _write(path, "a/two")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert service.get(path).agents.defaults.model == "a/two"
+
+
+def test_resolved_snapshot_tracks_referenced_env_vars(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps({"providers": {"openrouter": {"apiKey": "${NANOBOT_TEST_SNAPSHOT_KEY}"}}}),
+        encoding="utf-8",
+    )
+    service = ConfigSnapshotService()
+    monkeypatch.setenv("NANOBOT_TEST_SNAPSHOT_KEY", "one")
+
+    assert service.get(path, resolve_env=True).providers.openrouter.api_key == "one"
+    assert service.get(path).providers.openrouter.api_key == "${NANOBOT_TEST_SNAPSHOT_KEY}"
+    monkeypatch.setenv("NANOBOT_TEST_SNAPSHOT_KEY", "two")
+    assert service.get(path, resolve_env=True).providers.openrouter.api_key == "two"
+    monkeypatch.delenv("NANOBOT_TEST_SNAPSHOT_KEY")
+    with pytest.raises(ConfigLoadError):
+        service.get(path, resolve_env=True)
+
+
+def test_save_config_invalidates_shared_snapshot(tmp_path):
+    from nanobot.config.snapshot import config_snapshots, load_config_snapshot
+
+    path = tmp_path / "config.json"
+    _write(path, "a/one", mtime_ns=_OLD_NS)
+    changes: list[Path] = []
+    unsubscribe = config_snapshots().subscribe(changes.append)
+    try:
+        assert load_config_snapshot(path).agents.defaults.model == "a/one"
+        config = load_config(path)
+        config.agents.defaults.model = "a/two"
+        save_config(config, path)
+
+        assert changes == [path]
+        assert load_config_snapshot(path).agents.defaults.model == "a/two"
+    finally:
+        unsubscribe()
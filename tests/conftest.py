@@ -0,0 +1,24 @@
+"""Shared fixtures for the whole test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from nanobot.config.snapshot import clear_config_snapshots
+from nanobot.security.network import clear_dns_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_dns_cache():
+    """Tests patch the resolver per test; never serve a neighbour's answers."""
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_snapshots():
+    """Config files are rewritten per test; never serve a neighbour's parse."""
+    clear_config_snapshots()
+    yield
+    clear_config_snapshots()
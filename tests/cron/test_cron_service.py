@@ -1388,3 +1388,88 @@ def test_load_jobs_skips_null_run_history_elements(tmp_path) -> None:
     assert len(jobs[0].state.run_history) == 1
     assert jobs[0].state.run_history[0].run_at_ms == 1
     assert jobs[0].state.run_history[0].status == "ok"
+
+
+@pytest.mark.asyncio
+async def test_due_jobs_run_concurrently_but_serialise_per_session(tmp_path) -> None:
+    store_path = tmp_path / "cron" / "jobs.json"
+    running: set[str] = set()
+    overlaps: list[set[str]] = []
+    release = asyncio.Event()
+
+    async def on_job(job: CronJob) -> None:
+        running.add(job.name)
+        overlaps.append(set(running))
+        await release.wait()
+        running.discard(job.name)
+
+    service = CronService(store_path, on_job=on_job, max_concurrent_jobs=2)
+    service._running = True
+    service._load_store()
+    for name, chat in (("a1", "a"), ("a2", "a"), ("b", "b"), ("c", "c")):
+        service.add_job(
+            name=name,
+            schedule=CronSchedule(kind="every", every_ms=3_600_000),
+            message="test",
+            **_bound_chat(chat),
+        )
+    scheduled_ms = int(time.time() * 1000) - 1000
+    for job in service._store.jobs:
+        job.state.next_run_at_ms = scheduled_ms
+    service._save_store()
+
+    tick = asyncio.create_task(service._on_timer())
+    await _wait_until(lambda: len(running) == 2)
+    assert running == {"a1", "b"}
+
+    release.set()
+    await tick
+    service.stop()
+
+    # Same-session jobs never overlap; the semaphore caps parallelism.
+    assert all(not {"a1", "a2"} <= seen for seen in overlaps)
+    assert max(len(seen) for seen in overlaps) == 2
+    for job in service.list_jobs():
+        assert job.state.run_history[-1].lag_ms is not None
+        assert job.state.run_history[-1].lag_ms >= 1000
+
+
+@pytest.mark.asyncio
+async def test_finished_job_is_persisted_before_slow_batch_completes(tmp_path) -> None:
+    store_path = tmp_path / "cron" / "jobs.json"
+    release = asyncio.Event()
+
+    async def on_job(job: CronJob) -> None:
+        if job.name == "slow":
+            await release.wait()
+
+    service = CronService(store_path, on_job=on_job)
+    service._running = True
+    service._load_store()
+    for name in ("fast", "slow"):
+        service.add_job(
+            name=name,
+            schedule=CronSchedule(kind="every", every_ms=3_600_000),
+            message="test",
+            **_bound_chat(name),
+        )
+    for job in service._store.jobs:
+        job.state.next_run_at_ms = int(time.time() * 1000) - 1
+    service._save_store()
+
+    tick = asyncio.create_task(service._on_timer())
+
+    def fast_persisted() -> bool:
+        if not store_path.exists():
+            return False
+        raw = json.loads(store_path.read_text())
+        fast = next(j for j in raw["jobs"] if j["name"] == "fast")
+        return fast["state"]["lastStatus"] == "ok"
+
+    await _wait_until(fast_persisted)
+    raw = json.loads(store_path.read_text())
+    assert "lagMs" in raw["jobs"][0]["state"]["runHistory"][0]
+
+    release.set()
+    await tick
+    service.stop()
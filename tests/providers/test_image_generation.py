@@ -22,6 +22,7 @@ from nanobot.providers.image_generation import (
     StepFunImageGenerationClient,
     ZhipuImageGenerationClient,
 )
+from nanobot.utils.http_pool import HttpClientPolicy
 
 PNG_BYTES = (
     b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
@@ -1944,8 +1945,8 @@ def test_image_provider_http_client_kwargs_include_explicit_proxy() -> None:
         proxy=proxy,
     )
 
-    assert client._http_client_kwargs() == {
-        "timeout": client.timeout,
-        "proxy": proxy,
-        "trust_env": False,
-    }
+    assert client._http_client_policy() == HttpClientPolicy(
+        proxy=proxy,
+        timeout=client.timeout,
+        trust_env=False,
+    )
@@ -7,6 +7,7 @@ import pytest
 
 from nanobot.providers import image_generation
 from nanobot.providers.image_generation import ImageGenerationError, _download_image_data_url
+from nanobot.utils.http_pool import HttpClientPolicy, http_client_pool
 
 PNG_BYTES = (
     b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
@@ -178,6 +179,7 @@ async def test_generated_image_download_delegates_unresolved_host_to_provider_pr
         "timeout": image_generation._DEFAULT_TIMEOUT_S,
         "trust_env": False,
         "proxy": proxy,
+        "limits": http_client_pool().client_kwargs(HttpClientPolicy())["limits"],
     }
 
 
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from nanobot.providers.admission import ProviderAdmissionController
+from nanobot.providers.base import LLMProvider, LLMResponse
+
+
+class GatedProvider(LLMProvider):
+    def __init__(self, responses=None):
+        super().__init__()
+        self._responses = list(responses or [])
+        self.release = asyncio.Event()
+        self.running = 0
+        self.max_running = 0
+
+    async def chat(self, *args, **kwargs) -> LLMResponse:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return self._responses.pop(0) if self._responses else LLMResponse(content="ok")
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_shrinks_limit_and_later_requests_queue_locally(monkeypatch) -> None:
+    async def _fake_sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("nanobot.providers.base.asyncio.sleep", _fake_sleep)
+    provider = GatedProvider([
+        LLMResponse(
+            content="429 rate limit",
+            finish_reason="error",
+            error_status_code=429,
+            error_retry_after_s=0.01,
+        ),
+    ])
+    controller = provider.admission_controller()
+    controller.limit = 4.0
+    assert provider.admission_status() is None
+
+    provider.release.set()
+    first = await provider.chat_with_retry(messages=[{"role": "user", "content": "hi"}])
+    assert first.content == "ok"
+    assert controller.throttled == 1
+    # Halved by the 429, then one additive step from the successful retry.
+    assert controller.snapshot()["limit"] == 2
+
+    monkeypatch.undo()
+    provider.release.clear()
+    calls = [
+        asyncio.create_task(provider.chat_with_retry(messages=[{"role": "user", "content": "x"}]))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    assert provider.running == 2
+    assert controller.waiting == 1
+    status = provider.admission_status()
+    assert status is not None and "1 queued" in status
+
+    provider.release.set()
+    await asyncio.gather(*calls)
+    assert provider.max_running == 2
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_non_throttling_errors_do_not_shrink_the_limit() -> None:
+    provider = GatedProvider([
+        LLMResponse(content="invalid request", finish_reason="error", error_status_code=400),
+    ])
+    provider.release.set()
+
+    response = await provider.chat_with_retry(messages=[{"role": "user", "content": "hi"}])
+
+    assert response.finish_reason == "error"
+    controller = provider.admission_controller()
+    assert controller.throttled == 0
+    assert controller.snapshot()["limit"] == 16
+
+
+@pytest.mark.asyncio
+async def test_controller_grows_back_additively_and_cancelled_waiters_free_their_place() -> None:
+    controller = ProviderAdmissionController("p:m")
+    controller.on_throttle()
+    controller.on_throttle()  # same burst: counted once
+    assert controller.snapshot()["limit"] == 8
+    controller.limit = 1.0
+
+    await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    controller.release()
+    await asyncio.wait_for(controller.acquire(), timeout=1)
+    controller.release()
+
+    for _ in range(3):
+        controller.on_success()
+    assert controller.snapshot()["limit"] == 2
+
+
+def test_throttling_is_detected_from_status_not_numbers_in_text() -> None:
+    def _error(content: str, status: int | None = None) -> LLMResponse:
+        return LLMResponse(content=content, finish_reason="error", error_status_code=status)
+
+    assert LLMProvider._is_rate_limited_response(_error("upstream busy", 429))
+    assert LLMProvider._is_rate_limited_response(_error("Too Many Requests"))
+    assert not LLMProvider._is_rate_limited_response(_error("prompt is 4290 tokens too long"))
+    assert not LLMProvider._is_rate_limited_response(_error("error 429 in field 3", 400))
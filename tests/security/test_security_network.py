@@ -11,11 +11,15 @@ import pytest
 from nanobot.security.network import (
     configure_ssrf_whitelist,
     contains_internal_url,
+    contains_internal_url_async,
+    dns_resolution_stats,
     env_proxy_applies_to_url,
+    format_dns_resolution_stats,
     httpx_env_proxy_mounts,
     is_loopback_host,
     pin_resolved_url_dns,
     resolve_url_target,
+    resolve_url_target_async,
     validate_url_target,
 )
 
@@ -236,6 +240,57 @@ def test_resolve_url_target_does_not_delegate_local_targets(url: str):
     assert not ok
 
 
+@pytest.mark.asyncio
+async def test_resolve_url_target_async_caches_lookups_but_rechecks_addresses():
+    calls: list[str] = []
+    resolver = _fake_resolve("ts.local", ["100.100.1.1"])
+
+    def _counting_resolver(hostname, port, family=0, type_=0):
+        calls.append(hostname)
+        return resolver(hostname, port, family, type_)
+
+    lookups_before = dns_resolution_stats()["lookups"]
+    try:
+        with patch("nanobot.security.network.socket.getaddrinfo", _counting_resolver):
+            ok, _, _ = await resolve_url_target_async("http://ts.local/api")
+            assert not ok
+
+            configure_ssrf_whitelist(["100.64.0.0/10"])
+            ok, err, resolved_ips = await resolve_url_target_async("http://ts.local/api")
+            assert ok, err
+            assert resolved_ips == ("100.100.1.1",)
+
+            configure_ssrf_whitelist([])
+            ok, _, _ = await resolve_url_target_async("http://TS.local./other")
+            assert not ok
+    finally:
+        configure_ssrf_whitelist([])
+
+    assert calls == ["ts.local"]
+    stats = dns_resolution_stats()
+    assert stats["lookups"] == lookups_before + 1
+    assert stats["cache_hits"] >= 2
+    assert f"{stats['lookups']} lookups" in format_dns_resolution_stats(stats)
+
+
+@pytest.mark.asyncio
+async def test_resolve_url_target_async_caches_failures_briefly():
+    calls: list[str] = []
+
+    def _failing_resolver(hostname, port, family=0, type_=0):
+        calls.append(hostname)
+        raise socket.gaierror("no such host")
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _failing_resolver):
+        first = await resolve_url_target_async("https://missing.example/")
+        second = await resolve_url_target_async("https://missing.example/")
+        trusted = await resolve_url_target_async("https://missing.example/", trust_remote_dns=True)
+
+    assert first == second == (False, "Cannot resolve hostname: missing.example", ())
+    assert trusted == (True, "", ())
+    assert calls == ["missing.example"]
+
+
 def test_pin_resolved_url_dns_prevents_second_resolution_rebind():
     def _rebinding_resolver(hostname, port, family=0, type_=0):
         return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("169.254.169.254", 0))]
@@ -362,3 +417,20 @@ def test_whitelist_allows_ipv6_mapped_cgnat():
             assert ok, f"Whitelisted IPv6-mapped CGNAT should be allowed, got: {err}"
     finally:
         configure_ssrf_whitelist([])
+
+
+@pytest.mark.asyncio
+async def test_contains_internal_url_async_reuses_cached_resolutions():
+    calls: list[str] = []
+    resolver = _fake_resolve("example.com", ["93.184.216.34"])
+
+    def _counting_resolver(hostname, port, family=0, type_=0):
+        calls.append(hostname)
+        return resolver(hostname, port, family, type_)
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _counting_resolver):
+        assert not await contains_internal_url_async("curl https://example.com/a")
+        assert not await contains_internal_url_async("wget https://example.com/b")
+        assert await contains_internal_url_async("curl http://127.0.0.1:8080/")
+
+    assert calls == ["example.com", "127.0.0.1"]
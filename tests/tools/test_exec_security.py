@@ -111,6 +111,23 @@ def test_exec_full_workspace_scope_still_blocks_metadata(tmp_path):
     assert "internal/private" in error
 
 
+@pytest.mark.asyncio
+async def test_exec_resolves_command_urls_through_the_cached_resolver():
+    tool = ExecTool()
+    calls: list[str] = []
+
+    def _counting_resolve(hostname, port, family=0, type_=0):
+        calls.append(hostname)
+        return _fake_resolve_private(hostname, port, family, type_)
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _counting_resolve):
+        for _ in range(2):
+            result = await tool.execute(command="curl http://metadata.internal/")
+            assert "internal/private" in result
+
+    assert calls == ["metadata.internal"]
+
+
 @pytest.mark.asyncio
 async def test_exec_allows_normal_commands():
     tool = ExecTool(timeout=5)
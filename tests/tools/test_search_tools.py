@@ -327,6 +327,40 @@ def test_grep_description_keeps_size_thresholds_implementation_specific(tmp_path
     assert "100 MB" not in tool.description
 
 
+@pytest.mark.asyncio
+async def test_search_index_picks_up_edits_between_searches(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    target = tmp_path / "src" / "app.py"
+    target.write_text("alpha = 1\n", encoding="utf-8")
+    grep = GrepTool(workspace=tmp_path, allowed_dir=tmp_path)
+    find = FindFilesTool(workspace=tmp_path, allowed_dir=tmp_path)
+
+    assert await grep.execute(pattern="alpha", path=".") == "src/app.py"
+    assert "No matches found" in await grep.execute(pattern="gamma", path=".")
+    assert await find.execute(path=".") == "src/app.py"
+
+    target.write_text("gamma = 22\n", encoding="utf-8")
+    os.utime(target, ns=(time.time_ns() + 1_000_000_000,) * 2)
+    (tmp_path / "src" / "new.py").write_text("gamma\n", encoding="utf-8")
+
+    assert "No matches found" in await grep.execute(pattern="alpha", path=".")
+    result = await grep.execute(pattern="gamma", path=".")
+    assert sorted(result.splitlines()) == ["src/app.py", "src/new.py"]
+    assert (await find.execute(path=".")).splitlines() == ["src/app.py", "src/new.py"]
+
+
+@pytest.mark.asyncio
+async def test_grep_content_filter_keeps_case_insensitive_matches(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text("Hello World\n", encoding="utf-8")
+    tool = GrepTool(workspace=tmp_path, allowed_dir=tmp_path)
+
+    assert "No matches found" in await tool.execute(pattern="hello world", path=".")
+    assert await tool.execute(
+        pattern="hello world", path=".", case_insensitive=True
+    ) == "notes.md"
+    assert await tool.execute(pattern="Hello", path=".", fixed_strings=True) == "notes.md"
+
+
 @pytest.mark.asyncio
 async def test_search_tools_reject_paths_outside_workspace(tmp_path: Path) -> None:
     outside = tmp_path.parent / "outside-search.txt"
@@ -7,6 +7,7 @@ from typing import Any
 from unittest.mock import MagicMock
 
 from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.config import WebCacheConfig
 from nanobot.agent.tools.context import ToolContext
 from nanobot.agent.tools.loader import _SKIP_MODULES, ToolLoader
 
@@ -308,6 +309,7 @@ def test_web_search_tool_create():
     mock_config.web.search = MagicMock()
     mock_config.web.proxy = None
     mock_config.web.user_agent = None
+    mock_config.web.cache = WebCacheConfig()
     ctx = ToolContext(config=mock_config, workspace="/tmp")
     tool = WebSearchTool.create(ctx)
     assert isinstance(tool, WebSearchTool)
@@ -320,6 +322,7 @@ def test_web_fetch_tool_create():
     mock_config.web.fetch = MagicMock()
     mock_config.web.proxy = None
     mock_config.web.user_agent = None
+    mock_config.web.cache = WebCacheConfig()
     ctx = ToolContext(config=mock_config, workspace="/tmp")
     tool = WebFetchTool.create(ctx)
     assert isinstance(tool, WebFetchTool)
@@ -402,6 +405,7 @@ def test_loader_registers_same_tools_as_old_hardcoded():
     mock_config.web.fetch = MagicMock()
     mock_config.web.proxy = None
     mock_config.web.user_agent = None
+    mock_config.web.cache = WebCacheConfig()
     mock_config.image_generation.enabled = False
     mock_config.my.enable = True
 
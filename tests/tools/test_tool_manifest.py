@@ -0,0 +1,101 @@
+"""The static tool manifest must match the package and keep imports lazy."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from nanobot.agent.tools.context import ToolContext
+from nanobot.agent.tools.manifest import BUILTIN_TOOLS, ToolManifestEntry, scanned_manifest
+from nanobot.config.schema import ToolsConfig
+
+_LAZY_TOOL_MODULES = (
+    "nanobot.agent.tools.web",
+    "nanobot.agent.tools.image_generation",
+    "nanobot.agent.tools.cli_apps",
+    "nanobot.agent.tools.shell",
+    "nanobot.providers.image_generation",
+)
+
+
+def _open_ctx() -> ToolContext:
+    config = ToolsConfig()
+    config.image_generation.enabled = True
+    return ToolContext(
+        config=config,
+        workspace="/tmp",
+        bus=MagicMock(),
+        cron_service=MagicMock(),
+        sessions=MagicMock(),
+    )
+
+
+def _close_gate(ctx: ToolContext, path: str) -> ToolContext:
+    head, _, attr = path.rpartition(".")
+    if not head:
+        return replace(ctx, **{attr: None})
+    config = ctx.config.model_copy(deep=True)
+    target = config
+    for part in head.split(".")[1:]:
+        target = getattr(target, part)
+    setattr(target, attr, False)
+    return replace(ctx, config=config)
+
+
+def _imported_after(code: str) -> list[str]:
+    probe = code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    modules = set(json.loads(result.stdout.strip().splitlines()[-1]))
+    return [name for name in _LAZY_TOOL_MODULES if name in modules]
+
+
+def test_manifest_matches_package_scan() -> None:
+    listed = [(entry.module, entry.class_name, entry.scopes) for entry in BUILTIN_TOOLS]
+
+    assert listed == scanned_manifest()
+
+
+@pytest.mark.parametrize("entry", BUILTIN_TOOLS, ids=lambda entry: entry.class_name)
+def test_manifest_gates_mirror_enabled(entry: ToolManifestEntry) -> None:
+    tool_cls = entry.load()
+    ctx = _open_ctx()
+    assert entry.gate_open(ctx)
+    assert tool_cls.enabled(ctx)
+
+    for path in entry.requires:
+        closed = _close_gate(ctx, path)
+        assert not entry.gate_open(closed)
+        assert not tool_cls.enabled(closed), f"{entry.class_name}.enabled ignores {path}"
+
+
+def test_agent_loop_import_does_not_load_tool_implementations() -> None:
+    assert _imported_after("import nanobot.agent.loop") == []
+
+
+def test_loader_imports_only_enabled_tool_modules() -> None:
+    code = """
+from nanobot.agent.tools.context import ToolContext
+from nanobot.agent.tools.loader import ToolLoader
+from nanobot.agent.tools.registry import ToolRegistry
+from nanobot.config.schema import ToolsConfig
+
+config = ToolsConfig()
+config.web.enable = False
+config.cli_apps.enable = False
+config.exec.enable = False
+registered = ToolLoader().load(ToolContext(config=config, workspace="."), ToolRegistry())
+assert "read_file" in registered and "web_search" not in registered, registered
+"""
+
+    assert _imported_after(code) == []
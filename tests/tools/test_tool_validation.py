@@ -215,6 +215,81 @@ def test_validate_params_validates_typed_additional_properties() -> None:
     assert errors == ["extra should be integer"]
 
 
+_PARITY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 2, "maxLength": 5},
+        "count": {"type": "integer", "minimum": 1, "maximum": 10},
+        "ratio": {"type": "number", "minimum": 0},
+        "mode": {"type": ["string", "null"], "enum": ["fast", "full"]},
+        "flag": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 2},
+        "meta": {
+            "type": "object",
+            "properties": {"tag": {"type": "string"}},
+            "required": ["tag"],
+            "additionalProperties": {"type": "integer"},
+        },
+        "strict": {"type": "object", "properties": {}, "additionalProperties": False},
+        "anything": {},
+    },
+    "required": ["query", "count"],
+}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"query": "hi", "count": 2},
+        {"query": "h", "count": 0, "mode": "slow", "ratio": -1},
+        {"query": "toolong", "count": 11, "ratio": float("nan"), "mode": None},
+        {"query": 1, "count": True, "ratio": True, "flag": "yes"},
+        {"query": "hi", "count": 2.0, "tags": [], "strict": {"x": 1}},
+        {"query": "hi", "count": 2, "tags": [1, "a", None], "meta": {"n": "1", "m": 2}},
+        {"count": 3, "meta": [], "anything": object, "extra": 1},
+        {},
+    ],
+)
+def test_compiled_validator_matches_interpreter(params: dict[str, Any]) -> None:
+    from nanobot.agent.tools.base import compile_json_schema
+
+    expected = Schema.validate_json_schema_value(params, _PARITY_SCHEMA, "")
+
+    assert compile_json_schema(_PARITY_SCHEMA)(params, "") == expected
+    assert CastTestTool(_PARITY_SCHEMA).validate_params(params) == expected
+
+
+def test_compiled_validators_are_shared_by_schema_fingerprint() -> None:
+    from nanobot.agent.tools import base
+
+    base.clear_compiled_schemas()
+    before = base._COMPILED_SCHEMAS.stats()
+    first = CastTestTool(dict(_PARITY_SCHEMA))
+    second = CastTestTool(dict(_PARITY_SCHEMA))
+
+    first.validate_params({"query": "hi", "count": 2})
+    first.validate_params({"query": "hi", "count": 3})
+    second.validate_params({"query": "hi", "count": 2})
+
+    stats = base._COMPILED_SCHEMAS.stats()
+    assert stats["compiles"] - before["compiles"] == 1
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["schemas"] == 1
+    assert first._compiled_params[1] is second._compiled_params[1]
+
+
+def test_decorated_tool_validates_without_copying_schema(monkeypatch) -> None:
+    tool = DecoratedSampleTool()
+    tool.validate_params({"query": "hi", "count": 2})
+    monkeypatch.setattr(
+        "nanobot.agent.tools.base.deepcopy",
+        lambda *_args: pytest.fail("schema copied on the validation path"),
+    )
+
+    assert tool.validate_params({"query": "h", "count": 2}) == ["query must be at least 2 chars"]
+    assert tool.cast_params({"query": "hi", "count": "2"}) == {"query": "hi", "count": 2}
+
+
 async def test_registry_returns_validation_error() -> None:
     reg = ToolRegistry()
     reg.register(SampleTool())
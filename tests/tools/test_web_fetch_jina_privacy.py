@@ -204,7 +204,7 @@ async def test_execute_fetches_credential_urls_locally(monkeypatch) -> None:
 
     monkeypatch.setattr(tool, "_extract_readable_html", lambda html, mode: "ok")
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
         result = await tool.execute(url="https://example.com/download?token=abc123")
@@ -268,7 +268,7 @@ async def test_execute_does_not_send_redirected_credential_url_to_jina(monkeypat
 
     monkeypatch.setattr(tool, "_extract_readable_html", lambda html, mode: "ok")
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
         result = await tool.execute(url=short_url)
@@ -19,6 +19,7 @@ from nanobot.security.workspace_access import (
     build_workspace_scope,
     reset_workspace_scope,
 )
+from nanobot.utils.http_pool import HttpClientPolicy, http_client_pool
 
 _REAL_GETADDRINFO = socket.getaddrinfo
 _PROXY_ENV_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy")
@@ -78,7 +79,7 @@ def _patch_web_fetch_fake_client(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
             return FakeJinaResponse()
 
     monkeypatch.setattr(web_module.httpx, "AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
     monkeypatch.setattr(
         "nanobot.security.network.httpx.AsyncHTTPTransport",
         lambda **_kwargs: object(),
@@ -227,13 +228,15 @@ async def test_web_fetch_env_proxy_adds_proxy_mounts_and_keeps_pinned_transport(
 def test_web_fetch_no_proxy_env_keeps_pinned_direct_route(monkeypatch):
     monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:8080")
     monkeypatch.setenv("NO_PROXY", "example.com")
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
     monkeypatch.setattr(
         "nanobot.security.network.httpx.AsyncHTTPTransport",
         lambda **_kwargs: object(),
     )
 
-    kwargs = web_module._fetch_client_kwargs(None, 15.0)
+    kwargs = http_client_pool().client_kwargs(
+        HttpClientPolicy(timeout=15.0, transport_factory=web_module._pinned_dns_transport)
+    )
 
     assert "transport" in kwargs
     assert any(transport is None for transport in kwargs["mounts"].values())
@@ -246,7 +249,9 @@ async def test_web_fetch_does_not_fallback_after_pinned_dns_rebind_rejection(mon
     def _rebinding_resolver(hostname, port, family=0, type_=0, proto=0, flags=0):
         host = str(hostname).rstrip(".").lower()
         calls[host] += 1
-        ip = "93.184.216.34" if calls[host] <= 2 else "169.254.169.254"
+        # Pre-flight checks share one cached lookup; the transport's
+        # connect-time lookup is the one that observes the rebind.
+        ip = "93.184.216.34" if calls[host] <= 1 else "169.254.169.254"
         return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", (ip, 0))]
 
     tool = WebFetchTool()
@@ -257,8 +262,8 @@ async def test_web_fetch_does_not_fallback_after_pinned_dns_rebind_rejection(mon
     async def _unexpected_readability(*args, **kwargs):
         raise AssertionError("Readability fallback should not run after an SSRF rejection")
 
-    monkeypatch.setattr(tool, "_fetch_jina", _unexpected_jina)
-    monkeypatch.setattr(tool, "_fetch_readability", _unexpected_readability)
+    monkeypatch.setattr(tool, "_extract_jina", _unexpected_jina)
+    monkeypatch.setattr(tool, "_extract_readability", _unexpected_readability)
 
     class FailTransport(httpx.AsyncBaseTransport):
         async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
@@ -267,7 +272,7 @@ async def test_web_fetch_does_not_fallback_after_pinned_dns_rebind_rejection(mon
     monkeypatch.setattr(
         web_module,
         "_pinned_dns_transport",
-        lambda: PinnedDNSAsyncTransport(inner=FailTransport()),
+        lambda **_kwargs: PinnedDNSAsyncTransport(inner=FailTransport()),
     )
 
     with patch("nanobot.security.network.socket.getaddrinfo", _rebinding_resolver):
@@ -276,7 +281,7 @@ async def test_web_fetch_does_not_fallback_after_pinned_dns_rebind_rejection(mon
     data = json.loads(result)
     assert "error" in data
     assert "blocked" in data["error"].lower()
-    assert calls["evil.example"] == 3
+    assert calls["evil.example"] == 2
 
 
 @pytest.mark.asyncio
@@ -332,10 +337,10 @@ async def test_web_fetch_can_skip_jina_and_use_custom_user_agent(monkeypatch):
             seen_headers.append(headers or {})
             return FakeResponse()
 
-    monkeypatch.setattr(tool, "_fetch_jina", _fail_jina)
+    monkeypatch.setattr(tool, "_extract_jina", _fail_jina)
     monkeypatch.setattr(tool, "_extract_readable_html", lambda html, mode: "Hello world")
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
         result = await tool.execute(url="https://example.com/page")
@@ -379,7 +384,7 @@ async def test_web_fetch_falls_back_when_readability_dependency_is_missing(monke
 
     monkeypatch.setattr(tool, "_extract_readable_html", _missing_readability)
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
         result = await tool._fetch_readability("https://example.com/page", "markdown", 5000)
@@ -437,7 +442,7 @@ async def test_web_fetch_blocks_private_redirect_before_readability_request(monk
             return FakeRedirectResponse()
 
     monkeypatch.setattr(web_module.httpx, "AsyncClient", FakeClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     def resolve_public_start_only(hostname, port, family=0, type_=0):
         if hostname == "attacker.example":
@@ -483,7 +488,7 @@ async def test_web_fetch_blocks_private_redirect_before_returning_image(monkeypa
             super().__init__(*args, transport=transport, **kwargs)
 
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", TransportAsyncClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     def resolve_public_start_only(hostname, port, family=0, type_=0):
         if hostname == "example.com":
@@ -524,7 +529,7 @@ async def test_web_fetch_does_not_request_private_redirect_target(monkeypatch):
             super().__init__(*args, **kwargs)
 
     monkeypatch.setattr(web_module.httpx, "AsyncClient", TransportAsyncClient)
-    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda: object())
+    monkeypatch.setattr(web_module, "_pinned_dns_transport", lambda **_kwargs: object())
 
     def resolve_public_start_only(hostname, port, family=0, type_=0):
         if hostname == "attacker.example":
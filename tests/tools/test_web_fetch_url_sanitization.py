@@ -47,7 +47,7 @@ def _patched_web_fetch():
     with (
         patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public),
         patch("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient),
-        patch("nanobot.agent.tools.web._pinned_dns_transport", lambda: object()),
+        patch("nanobot.agent.tools.web._pinned_dns_transport", lambda **_kwargs: object()),
     ):
         yield
 
@@ -0,0 +1,213 @@
+"""Tests for the web_search / web_fetch result cache."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from nanobot.agent.tools import web as web_module
+from nanobot.agent.tools.registry import is_tool_error_result
+from nanobot.agent.tools.web import WebFetchTool, WebSearchTool, _FetchedPage
+from nanobot.config.schema import WebSearchConfig
+from nanobot.utils.web_cache import WebResultCache, reset_web_cache_stats, web_cache_stats
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_web_cache_stats()
+    yield
+    reset_web_cache_stats()
+
+
+def _brave_response(status: int = 200) -> httpx.Response:
+    r = httpx.Response(status, json={
+        "web": {"results": [{"title": "NanoBot", "url": "https://example.com", "description": "AI"}]}
+    })
+    r._request = httpx.Request("GET", "https://mock")
+    return r
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_cache(monkeypatch, tmp_path):
+    calls = {"n": 0}
+
+    async def mock_get(self, url, **kw):
+        calls["n"] += 1
+        return _brave_response()
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    cache = WebResultCache("search", ttl_s=60, directory=tmp_path)
+    tool = WebSearchTool(config=WebSearchConfig(provider="brave", api_key="k"), cache=cache)
+
+    first = await tool.execute(query="nanobot", count=1)
+    second = await tool.execute(query="nanobot", count=1)
+    other = await tool.execute(query="nanobot", count=2)
+
+    assert second == first
+    assert "NanoBot" in other
+    assert calls["n"] == 2
+    stats = web_cache_stats()["search"]
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_not_cached(monkeypatch):
+    responses = [_brave_response(500), _brave_response()]
+
+    async def mock_get(self, url, **kw):
+        return responses.pop(0)
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    tool = WebSearchTool(
+        config=WebSearchConfig(provider="brave", api_key="k"),
+        cache=WebResultCache("search", ttl_s=60),
+    )
+
+    assert is_tool_error_result(await tool.execute(query="nanobot"))
+    assert "NanoBot" in await tool.execute(query="nanobot")
+
+
+class _Preflight:
+    def __init__(self, status: int, headers: dict[str, str]):
+        self.status_code = status
+        self.headers = headers
+
+
+def _fetch_tool(monkeypatch, cache: WebResultCache, preflights: list[_Preflight], sent: list[dict]):
+    async def _safe(url):
+        return True, ""
+
+    async def _stream(client, url, *, headers):
+        sent.append(headers)
+        return preflights.pop(0), None, None, False
+
+    extractions = {"n": 0}
+
+    async def _extract(url, extract_mode):
+        extractions["n"] += 1
+        return _FetchedPage(final_url=url, status=200, extractor="readability", text="# Page\n\n" + "x" * 100)
+
+    monkeypatch.setattr(web_module, "_validate_url_safe", _safe)
+    monkeypatch.setattr(web_module, "_stream_with_safe_redirects", _stream)
+    tool = WebFetchTool(cache=cache)
+    monkeypatch.setattr(tool, "_extract_jina", lambda url: _none())
+    monkeypatch.setattr(tool, "_extract_readability", _extract)
+    return tool, extractions
+
+
+async def _none():
+    return None
+
+
+@pytest.mark.asyncio
+async def test_fresh_fetch_is_served_without_network_and_rendered_per_request(monkeypatch, tmp_path):
+    sent: list[dict] = []
+    cache = WebResultCache("fetch", ttl_s=60, directory=tmp_path)
+    tool, extractions = _fetch_tool(monkeypatch, cache, [_Preflight(200, {"content-type": "text/html"})], sent)
+
+    full = json.loads(await tool.execute(url="https://example.com/a"))
+    short = json.loads(await tool.execute(url="https://example.com/a", maxChars=10))
+
+    assert extractions["n"] == 1
+    assert len(sent) == 1
+    assert full["truncated"] is False
+    assert short["truncated"] is True
+    assert short["text"].endswith("# Page\n\nxx")
+
+
+@pytest.mark.asyncio
+async def test_stale_fetch_is_revalidated_with_validators(monkeypatch, tmp_path):
+    sent: list[dict] = []
+    cache = WebResultCache("fetch", ttl_s=0, directory=tmp_path)
+    preflights = [
+        _Preflight(200, {"content-type": "text/html", "etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _Preflight(304, {}),
+    ]
+    tool, extractions = _fetch_tool(monkeypatch, cache, preflights, sent)
+
+    first = await tool.execute(url="https://example.com/a")
+    second = await tool.execute(url="https://example.com/a")
+
+    assert second == first
+    assert extractions["n"] == 1
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert sent[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    stats = web_cache_stats()["fetch"]
+    assert (stats.hits, stats.misses, stats.revalidated) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_restart_and_disk_is_bounded(tmp_path):
+    cache = WebResultCache("search", ttl_s=60, directory=tmp_path, max_disk_entries=2)
+    for index in range(4):
+        await cache.put(cache.make_key("q", index), {"result": f"r{index}"})
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    reopened = WebResultCache("search", ttl_s=60, directory=tmp_path)
+    entry = await reopened.get_fresh(reopened.make_key("q", 3))
+    assert entry is not None and entry.payload == {"result": "r3"}
+
+
+@pytest.mark.asyncio
+async def test_runtime_cache_lives_under_the_data_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr("nanobot.config.loader._current_config_path", tmp_path / "config.json")
+    cache = WebResultCache.for_runtime("fetch", ttl_s=60)
+
+    await cache.put("k", {"result": "r"})
+
+    assert (tmp_path / "web-cache" / "fetch" / "k.json").is_file()
+
+
+@pytest.mark.asyncio
+async def test_error_pages_are_not_cached(monkeypatch, tmp_path):
+    sent: list[dict] = []
+    cache = WebResultCache("fetch", ttl_s=60, directory=tmp_path)
+    preflights = [_Preflight(404, {"content-type": "text/html"}), _Preflight(404, {"content-type": "text/html"})]
+    tool, extractions = _fetch_tool(monkeypatch, cache, preflights, sent)
+
+    async def _not_found(url, extract_mode):
+        extractions["n"] += 1
+        return _FetchedPage(final_url=url, status=404, extractor="readability", text="# Not Found")
+
+    monkeypatch.setattr(tool, "_extract_readability", _not_found)
+    await tool.execute(url="https://example.com/missing")
+    await tool.execute(url="https://example.com/missing")
+
+    assert extractions["n"] == 2
+    assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.asyncio
+async def test_duckduckgo_fallback_is_not_cached_as_the_configured_provider(monkeypatch):
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.setenv("JINA_API_KEY", "k")
+    calls = {"ddg": 0}
+
+    async def _ddg(self, query, n):
+        self._served_by_duckduckgo.set(True)
+        calls["ddg"] += 1
+        return "ddg results"
+
+    async def _failing_jina_post(self, url, **kw):
+        raise httpx.ConnectError("down")
+
+    monkeypatch.setattr(WebSearchTool, "_search_duckduckgo", _ddg)
+    monkeypatch.setattr(httpx.AsyncClient, "post", _failing_jina_post)
+    monkeypatch.setattr(httpx.AsyncClient, "get", _failing_jina_post)
+    cache = WebResultCache("search", ttl_s=60)
+
+    # Missing key: DuckDuckGo answers and is cached under its own key.
+    tavily = WebSearchTool(config=WebSearchConfig(provider="tavily"), cache=cache)
+    await tavily.execute(query="nanobot")
+    await tavily.execute(query="nanobot")
+    assert calls["ddg"] == 1
+    assert await cache.get(cache.make_key("tavily", "nanobot", 5, {})) is None
+
+    # A keyed provider that fails over at runtime is not cached at all.
+    jina = WebSearchTool(config=WebSearchConfig(provider="jina"), cache=cache)
+    await jina.execute(query="other")
+    await jina.execute(query="other")
+    assert calls["ddg"] == 3
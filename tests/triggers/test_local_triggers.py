@@ -11,7 +11,11 @@ import pytest
 
 from nanobot.agent.automation_turns import AutomationTurnError
 from nanobot.bus.events import InboundMessage, OutboundMessage
-from nanobot.triggers.local_runner import run_local_trigger_queue
+from nanobot.triggers.local_runner import (
+    format_local_trigger_queue_stats,
+    local_trigger_queue_stats,
+    run_local_trigger_queue,
+)
 from nanobot.triggers.local_store import LocalTriggerStore, TriggerDisabledError
 from nanobot.triggers.local_types import LocalTrigger, TriggerDelivery
 from nanobot.webui.metadata import WEBUI_MESSAGE_SOURCE_METADATA_KEY, WEBUI_TURN_METADATA_KEY
@@ -589,6 +593,138 @@ async def test_local_trigger_queue_recovers_processing_delivery_on_start(
     assert restarted.claim_deliveries() == []
 
 
+@pytest.mark.asyncio
+async def test_local_trigger_queue_wakes_on_enqueue_without_polling(tmp_path: Path) -> None:
+    store = LocalTriggerStore(tmp_path)
+    trigger = store.create(
+        name="PR review",
+        channel="websocket",
+        chat_id="chat-1",
+        session_key="websocket:chat-1",
+    )
+    submitted: list[InboundMessage] = []
+    done = asyncio.Event()
+
+    async def _submit_turn(msg: InboundMessage):
+        submitted.append(msg)
+        done.set()
+        return None
+
+    task = asyncio.create_task(
+        run_local_trigger_queue(
+            store=store,
+            submit_turn=_submit_turn,
+            is_channel_enabled=_channel_is_enabled,
+            poll_interval_s=60,
+            watch_inbox=False,
+        )
+    )
+    try:
+        await asyncio.sleep(0.05)
+        LocalTriggerStore(tmp_path).enqueue(trigger.id, "Review PR #4600")
+        await asyncio.wait_for(done.wait(), timeout=1)
+        for _ in range(100):
+            if local_trigger_queue_stats()["delivered"] == 1:
+                break
+            await asyncio.sleep(0.01)
+        stats = local_trigger_queue_stats()
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    assert [msg.content for msg in submitted] == ["Review PR #4600"]
+    assert stats["delivered"] == 1
+    assert stats["running"] == 0
+    assert stats["last_latency_ms"] is not None
+    assert stats["active"]
+    assert "0 running, 1 delivered, 0 failed" in format_local_trigger_queue_stats(stats)
+    assert not local_trigger_queue_stats()["active"]
+
+
+@pytest.mark.asyncio
+async def test_local_trigger_queue_runs_sessions_concurrently_in_order(tmp_path: Path) -> None:
+    store = LocalTriggerStore(tmp_path)
+    first = store.create(name="a", channel="websocket", chat_id="a", session_key="websocket:a")
+    second = store.create(name="b", channel="websocket", chat_id="b", session_key="websocket:b")
+    same_session = store.create(name="a2", channel="websocket", chat_id="a", session_key="websocket:a")
+    for trigger, content in ((first, "a-1"), (same_session, "a-2"), (second, "b-1")):
+        store.enqueue(trigger.id, content)
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _submit_turn(msg: InboundMessage):
+        started.append(msg.content)
+        await release.wait()
+        return None
+
+    task = asyncio.create_task(
+        run_local_trigger_queue(
+            store=store,
+            submit_turn=_submit_turn,
+            is_channel_enabled=_channel_is_enabled,
+            poll_interval_s=0.01,
+            watch_inbox=False,
+        )
+    )
+    try:
+        for _ in range(100):
+            if len(started) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert sorted(started) == ["a-1", "b-1"]
+        assert local_trigger_queue_stats()["claimed"] == 1
+
+        release.set()
+        for _ in range(100):
+            if len(started) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert started[-1] == "a-2"
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_local_trigger_queue_paces_retries_by_the_poll_interval(tmp_path: Path) -> None:
+    store = LocalTriggerStore(tmp_path)
+    trigger = store.create(
+        name="PR review",
+        channel="websocket",
+        chat_id="chat-1",
+        session_key="websocket:chat-1",
+    )
+    store.enqueue(trigger.id, "Review PR #4600")
+    attempts = 0
+
+    async def _submit_turn(msg: InboundMessage):
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("provider unavailable")
+
+    task = asyncio.create_task(
+        run_local_trigger_queue(
+            store=store,
+            submit_turn=_submit_turn,
+            is_channel_enabled=_channel_is_enabled,
+            poll_interval_s=60,
+            watch_inbox=False,
+        )
+    )
+    try:
+        await asyncio.sleep(0.3)
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    assert attempts == 1
+    assert store.pending_delivery_count() == 1
+
+
 def test_local_trigger_from_dict_accepts_null_run_at_ms() -> None:
     trigger = LocalTrigger.from_dict(
         {
@@ -0,0 +1,141 @@
+"""Tests for the shared keep-alive HTTP client pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from nanobot.security.network import PinnedDNSAsyncTransport
+from nanobot.utils.http_pool import (
+    HttpClientPolicy,
+    HttpClientPool,
+    format_http_client_pool_stats,
+)
+
+
+@pytest.mark.asyncio
+async def test_equal_policies_share_one_client_and_count_hits() -> None:
+    pool = HttpClientPool()
+
+    first = pool.client(proxy=None, timeout=10.0)
+    second = pool.client(HttpClientPolicy(timeout=10.0))
+    other = pool.client(timeout=20.0)
+
+    assert first is second
+    assert other is not first
+    assert pool.stats() == {"hits": 1, "misses": 2, "open_clients": 2}
+    assert format_http_client_pool_stats(pool.stats()).endswith("1 reused, 2 opened, 2 open")
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_borrowed_client_stays_open_and_closed_clients_are_replaced() -> None:
+    pool = HttpClientPool()
+
+    async with pool.borrow() as client:
+        pass
+    assert not client.is_closed
+    await client.aclose()
+
+    assert pool.client() is not client
+    await pool.aclose()
+    assert pool.stats()["open_clients"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transport_factory_builds_pinned_client_with_env_proxy_mounts(monkeypatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:8080")
+    monkeypatch.setenv("NO_PROXY", "example.com")
+    pool = HttpClientPool()
+    policy = HttpClientPolicy(transport_factory=PinnedDNSAsyncTransport)
+
+    kwargs = pool.client_kwargs(policy)
+
+    assert isinstance(kwargs["transport"], PinnedDNSAsyncTransport)
+    assert any(transport is None for transport in kwargs["mounts"].values())
+    assert "mounts" not in pool.client_kwargs(HttpClientPolicy(
+        transport_factory=PinnedDNSAsyncTransport, trust_env=False,
+    ))
+    # An explicit proxy owns DNS resolution, so the pinned transport is skipped.
+    assert "transport" not in pool.client_kwargs(HttpClientPolicy(
+        proxy="http://127.0.0.1:3128", transport_factory=PinnedDNSAsyncTransport,
+    ))
+
+
+def test_clients_are_not_shared_across_event_loops() -> None:
+    pool = HttpClientPool()
+
+    async def _get() -> httpx.AsyncClient:
+        return pool.client()
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+
+    assert first is not second
+    assert pool.stats()["misses"] == 2
+
+
+def test_transport_factory_receives_pool_limits() -> None:
+    pool = HttpClientPool()
+    seen: list[httpx.Limits | None] = []
+
+    def _factory(*, limits: httpx.Limits | None = None) -> httpx.AsyncBaseTransport:
+        seen.append(limits)
+        return PinnedDNSAsyncTransport(limits=limits)
+
+    kwargs = pool.client_kwargs(HttpClientPolicy(transport_factory=_factory, trust_env=False))
+
+    assert seen == [pool._limits]
+    assert "limits" not in kwargs
+
+
+def test_aclose_keeps_clients_of_other_loops() -> None:
+    pool = HttpClientPool()
+    other_loop = asyncio.new_event_loop()
+
+    async def _get() -> httpx.AsyncClient:
+        return pool.client()
+
+    async def _get_and_close() -> None:
+        pool.client()
+        await pool.aclose()
+
+    try:
+        other = other_loop.run_until_complete(_get())
+        asyncio.run(_get_and_close())
+
+        assert not other.is_closed
+        assert pool.stats()["open_clients"] == 1
+        other_loop.run_until_complete(pool.aclose())
+        assert other.is_closed
+    finally:
+        other_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_clients_do_not_carry_cookies_between_requests() -> None:
+    seen_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("cookie"))
+        if request.url.path == "/login":
+            return httpx.Response(
+                302,
+                headers={"set-cookie": "sid=secret; Path=/", "location": "http://example.com/home"},
+            )
+        return httpx.Response(200, headers={"set-cookie": "theme=dark; Path=/"})
+
+    def mock_transport(*, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+        return httpx.MockTransport(handler)
+
+    pool = HttpClientPool()
+    policy = HttpClientPolicy(transport_factory=mock_transport, trust_env=False, follow_redirects=True)
+
+    await pool.client(policy).get("http://example.com/login")
+    await pool.client(policy).get("http://example.com/next")
+
+    assert seen_cookies == [None, None, None]
+    assert not pool.client(policy).cookies
+    await pool.aclose()
@@ -0,0 +1,138 @@
+"""Tests for image attachment downscaling and its content-hash cache."""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from nanobot.agent.context import ContextBuilder
+from nanobot.utils.image_pipeline import ImageLimits, ImagePipeline, shrink_image
+
+_SMALL = ImageLimits(max_edge=256, max_bytes=20_000)
+
+
+def _noisy_jpeg(width: int, height: int) -> bytes:
+    image = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def _decode(data_url: str) -> tuple[str, bytes]:
+    header, payload = data_url.split(",", 1)
+    return header.removeprefix("data:").removesuffix(";base64"), base64.b64decode(payload)
+
+
+def test_image_within_limits_is_sent_unchanged(tmp_path):
+    raw = _noisy_jpeg(64, 48)
+    path = tmp_path / "small.jpg"
+    path.write_bytes(raw)
+
+    prepared = ImagePipeline(tmp_path / "cache").prepare(path, _SMALL)
+
+    assert prepared is not None
+    assert _decode(prepared.data_url) == ("image/jpeg", raw)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_oversized_image_is_downscaled_to_fit(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(_noisy_jpeg(1200, 900))
+
+    prepared = ImagePipeline(tmp_path / "cache").prepare(path, _SMALL)
+
+    assert prepared is not None
+    mime, data = _decode(prepared.data_url)
+    assert mime == "image/jpeg"
+    assert len(data) <= _SMALL.max_bytes
+    with Image.open(io.BytesIO(data)) as image:
+        assert max(image.size) <= _SMALL.max_edge
+
+
+def test_transparent_png_stays_png(tmp_path):
+    image = Image.new("RGBA", (800, 400), (255, 0, 0, 128))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+
+    data, mime = shrink_image(buffer.getvalue(), "image/png", _SMALL)
+
+    assert mime == "image/png"
+    with Image.open(io.BytesIO(data)) as resized:
+        assert resized.size == (256, 128)
+        assert resized.mode == "RGBA"
+
+
+def test_undecodable_image_falls_back_to_original_bytes():
+    raw = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+    assert shrink_image(raw, "image/png", ImageLimits(max_edge=1, max_bytes=1)) == (raw, "image/png")
+
+
+def test_resized_image_is_reused_from_memory_and_disk(tmp_path, monkeypatch):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(_noisy_jpeg(1200, 900))
+    pipeline = ImagePipeline(tmp_path / "cache")
+    first = pipeline.prepare(path, _SMALL)
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("image was resized again")
+
+    monkeypatch.setattr("nanobot.utils.image_pipeline.shrink_image", _fail)
+    assert pipeline.prepare(path, _SMALL) is first
+    # A fresh process finds the resized copy on disk.
+    assert ImagePipeline(tmp_path / "cache").prepare(path, _SMALL) == first
+
+
+def test_disk_cache_is_bounded(tmp_path):
+    pipeline = ImagePipeline(tmp_path / "cache", max_disk_entries=2)
+    for index in range(4):
+        path = tmp_path / f"photo-{index}.jpg"
+        path.write_bytes(_noisy_jpeg(600, 400))
+        pipeline.prepare(path, _SMALL)
+
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+def test_memory_cache_is_bounded_by_bytes(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"small-{index}.jpg"
+        path.write_bytes(_noisy_jpeg(64, 48))
+        paths.append(path)
+    pipeline = ImagePipeline(None)
+    one = len(pipeline.prepare(paths[0], _SMALL).data_url)
+    pipeline.max_bytes = one * 5 // 2
+
+    for path in paths:
+        pipeline.prepare(path, _SMALL)
+
+    assert len(pipeline._prepared) == 2
+    assert pipeline.memory_bytes <= pipeline.max_bytes
+
+
+@pytest.mark.asyncio
+async def test_warm_prepares_attachments_for_build_user_content(tmp_path, monkeypatch):
+    monkeypatch.setattr("nanobot.config.loader._current_config_path", tmp_path / "config.json")
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(_noisy_jpeg(1200, 900))
+    builder = ContextBuilder(workspace=tmp_path)
+
+    await builder.images.warm([str(path)], _SMALL)
+    monkeypatch.setattr(
+        "nanobot.utils.image_pipeline.shrink_image",
+        lambda *_args: pytest.fail("resized on the event loop"),
+    )
+    content = builder.build_user_content("look", [str(path)], image_limits=_SMALL)
+
+    assert isinstance(content, list)
+    _mime, data = _decode(content[0]["image_url"]["url"])
+    assert len(data) <= _SMALL.max_bytes
+    assert content[0]["_meta"] == {"path": str(path)}
+    # The resized copy lives in the instance's runtime cache, not the workspace.
+    assert len(list((tmp_path / "image-cache").iterdir())) == 1
+    assert not (tmp_path / ".nanobot").exists()
@@ -12,6 +12,7 @@ from nanobot.utils.searchusage import (
     _parse_tavily_usage,
     fetch_search_usage,
 )
+from nanobot.utils.web_cache import WebCacheCounters
 
 # ---------------------------------------------------------------------------
 # SearchUsageInfo.format() tests
@@ -71,6 +72,21 @@ class TestSearchUsageInfoFormat:
         assert "brave" in text
         assert "not available" in text
 
+    def test_cache_hit_rates_are_listed(self):
+        info = SearchUsageInfo(
+            provider="brave",
+            cache={
+                "search": WebCacheCounters(hits=3, misses=1),
+                "fetch": WebCacheCounters(hits=1, misses=1, revalidated=1),
+            },
+        )
+        text = info.format()
+        assert "Cache: search 3/4 hits (75%) | fetch 1/2 hits (50%), 1 revalidated" in text
+
+    def test_cache_line_omitted_without_lookups(self):
+        info = SearchUsageInfo(provider="brave", cache={"search": WebCacheCounters()})
+        assert "Cache" not in info.format()
+
 
 # ---------------------------------------------------------------------------
 # _parse_tavily_usage tests
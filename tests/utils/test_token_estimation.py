@@ -1,7 +1,11 @@
 import json
+from unittest.mock import MagicMock
+
+import pytest
 
 from nanobot.utils import helpers
 from nanobot.utils.helpers import (
+    TokenCountCache,
     estimate_message_tokens,
     estimate_prompt_tokens,
     estimate_prompt_tokens_chain,
@@ -13,6 +17,14 @@ class _NoCounterProvider:
     pass
 
 
+@pytest.fixture
+def stub_token_encoding(monkeypatch):
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text: list(range(max(1, len(text) // 4)))
+    monkeypatch.setattr(helpers, "_get_token_encoding", lambda: encoding)
+    return encoding
+
+
 class _BrokenCounterProvider:
     def estimate_prompt_tokens(self, messages, tools=None, model=None):
         raise RuntimeError("counter unavailable")
@@ -153,3 +165,112 @@ def test_estimate_prompt_tokens_recomputes_when_tool_items_change(monkeypatch) -
     after_tools = "\n" + json.dumps(tools, ensure_ascii=False)
     assert before_tools in fake_encoding.encoded
     assert after_tools in fake_encoding.encoded
+
+
+def test_token_count_cache_encodes_unchanged_messages_once(monkeypatch) -> None:
+    helpers._get_token_encoding.cache_clear()
+
+    class FakeEncoding:
+        def __init__(self) -> None:
+            self.encoded: list[str] = []
+
+        def encode(self, text: str) -> list[int]:
+            self.encoded.append(text)
+            return list(range(max(1, len(text) // 4)))
+
+    fake_encoding = FakeEncoding()
+    monkeypatch.setattr(helpers.tiktoken, "get_encoding", lambda _name: fake_encoding)
+
+    cache = TokenCountCache()
+    message = {"role": "user", "content": "hello world, this is cached"}
+    expected = estimate_message_tokens(message)
+    fake_encoding.encoded.clear()
+
+    assert cache.count(message) == expected
+    assert cache.count(dict(message), estimate_message_tokens) == expected
+    assert fake_encoding.encoded == [message["content"]]
+    assert list(cache.drain_pending().values()) == [expected]
+    assert cache.drain_pending() == {}
+
+
+def test_token_count_cache_is_bounded(stub_token_encoding) -> None:
+    cache = TokenCountCache(max_entries=2)
+    for i in range(3):
+        cache.count({"role": "user", "content": f"msg-{i}"})
+
+    assert len(cache) == 2
+    assert len(cache.drain_pending()) == 2
+
+
+def test_estimate_prompt_tokens_chain_sums_cached_message_counts(stub_token_encoding) -> None:
+    messages = [
+        {"role": "system", "content": "system prompt"},
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": "hi there"},
+    ]
+    cache = TokenCountCache()
+
+    tokens, source = estimate_prompt_tokens_chain(
+        _NoCounterProvider(), "test-model", messages, cache=cache
+    )
+
+    assert source == "tiktoken"
+    assert tokens == sum(estimate_message_tokens(message) for message in messages)
+    assert len(cache) == 3
+
+
+def test_cached_prompt_estimate_ignores_image_data() -> None:
+    text_only = {"role": "user", "content": [{"type": "text", "text": "describe this"}]}
+    with_image = {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "describe this"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64," + "A" * 100_000}},
+        ],
+    }
+
+    assert TokenCountCache().count(with_image) == estimate_message_tokens(text_only)
+    assert estimate_message_tokens(with_image) > estimate_message_tokens(text_only)
+    assert TokenCountCache().count(with_image, estimate_message_tokens) == estimate_message_tokens(
+        with_image
+    )
+
+
+def test_token_count_cache_does_not_keep_heuristic_counts(monkeypatch) -> None:
+    message = {"role": "user", "content": "hello world, this is cached"}
+    cache = TokenCountCache()
+    monkeypatch.setattr(
+        helpers,
+        "_get_token_encoding",
+        lambda: (_ for _ in ()).throw(RuntimeError("encoding unavailable")),
+    )
+
+    heuristic = cache.count(message)
+
+    assert heuristic == len(message["content"].encode("utf-8")) + 4
+    assert len(cache) == 0
+    assert cache.drain_pending() == {}
+
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text: [0]
+    monkeypatch.setattr(helpers, "_get_token_encoding", lambda: encoding)
+
+    assert cache.count(message) == 5
+    assert list(cache.drain_pending().values()) == [5]
+
+
+def test_estimate_prompt_tokens_chain_skips_uncacheable_messages(stub_token_encoding) -> None:
+    system = {"role": "system", "content": "per-turn system prompt"}
+    history = {"role": "user", "content": "hello"}
+    cache = TokenCountCache()
+
+    tokens, _source = estimate_prompt_tokens_chain(
+        _NoCounterProvider(),
+        "test-model",
+        [system, history],
+        cache=cache,
+        cacheable=lambda message: message is history,
+    )
+
+    assert tokens == estimate_message_tokens(system) + estimate_message_tokens(history)
+    assert [key for key, _tokens in cache.items()] == [TokenCountCache.payload_key("hello")]
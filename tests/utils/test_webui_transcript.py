@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
+
+import pytest
+
 import nanobot.webui.transcript as transcript_module
 from nanobot.session.history_visibility import HIDDEN_HISTORY_META
 from nanobot.webui.transcript import (
@@ -37,6 +42,77 @@ def test_append_stamps_created_at_ms(tmp_path, monkeypatch) -> None:
     assert lines[0]["created_at_ms"] == 1_700_000_000_000
 
 
+@pytest.mark.asyncio
+async def test_async_appends_are_group_committed_in_order(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
+    fsyncs: list[int] = []
+    real_fsync = transcript_module.os.fsync
+    monkeypatch.setattr(
+        transcript_module.os,
+        "fsync",
+        lambda fd: (fsyncs.append(fd), real_fsync(fd))[1],
+    )
+    key = "websocket:t-batched"
+
+    for idx in range(5):
+        append_transcript_object(key, {"event": "progress", "chat_id": "t-batched", "text": str(idx)})
+    assert fsyncs == []
+    # Nothing touches the file on the event loop; the batch is written off-loop.
+    assert not transcript_module.webui_transcript_path(key).exists()
+
+    for _ in range(50):
+        if fsyncs:
+            break
+        await asyncio.sleep(0.01)
+    assert len(fsyncs) == 1
+    assert [line["text"] for line in read_transcript_lines(key)] == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_reads_and_turn_end_flush_pending_appends(tmp_path, monkeypatch) -> None:
+    from nanobot.webui.transcript import delete_webui_transcript, webui_transcript_path
+
+    monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
+    key = "websocket:t-flush"
+
+    append_transcript_object(key, {"event": "user", "chat_id": "t-flush", "text": "hi"})
+    assert [line["text"] for line in read_transcript_lines(key)] == ["hi"]
+
+    append_transcript_object(key, {"event": "message", "chat_id": "t-flush", "text": "yo"})
+    append_transcript_object(key, {"event": "turn_end", "chat_id": "t-flush"})
+    rows = transcript_module._read_transcript_file(webui_transcript_path(key))
+    assert [row["event"] for row in rows] == ["user"]
+    for _ in range(50):
+        rows = transcript_module._read_transcript_file(webui_transcript_path(key))
+        if len(rows) == 3:
+            break
+        await asyncio.sleep(0.01)
+    assert [row["event"] for row in rows] == ["user", "message", "turn_end"]
+
+    append_transcript_object(key, {"event": "user", "chat_id": "t-flush", "text": "late"})
+    assert delete_webui_transcript(key) is True
+    await asyncio.sleep(0.05)
+    assert not webui_transcript_path(key).exists()
+
+
+@pytest.mark.asyncio
+async def test_session_locks_are_released_after_commit(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
+    writer = transcript_module._TRANSCRIPT_WRITER
+    keys = [f"websocket:t-lock-{idx}" for idx in range(3)]
+
+    for key in keys:
+        append_transcript_object(key, {"event": "user", "chat_id": key, "text": "hi"})
+    for _ in range(50):
+        if not writer._tasks:
+            break
+        await asyncio.sleep(0.01)
+    gc.collect()
+
+    assert not set(keys) & set(writer._session_locks.keys())
+    assert [line["text"] for line in read_transcript_lines(keys[0])] == ["hi"]
+
+
 def _force_small_transcript_budget(monkeypatch, *, limit: int = 520, target: int = 260) -> None:
     monkeypatch.setattr("nanobot.webui.transcript._MAX_TRANSCRIPT_FILE_BYTES", limit)
     monkeypatch.setattr("nanobot.webui.transcript._ACTIVE_TRANSCRIPT_ROTATE_BYTES", limit)
@@ -219,6 +295,47 @@ def test_rotation_does_not_reread_existing_segments(tmp_path, monkeypatch) -> No
     assert segment_reads == []
 
 
+def test_thread_replay_parses_only_appended_lines(tmp_path, monkeypatch) -> None:
+    key = "websocket:replay-cache"
+    _write_segmented_turns(tmp_path, monkeypatch, key, "replay-cache", 4)
+    cache = transcript_module._TranscriptReplayCache()
+    version, records = cache.records(key)
+    assert cache.full_reads == 1
+
+    def fail_read(path):
+        raise AssertionError(f"unexpected full read of {path}")
+
+    monkeypatch.setattr(transcript_module, "_read_transcript_file", fail_read)
+    assert cache.records(key)[0] == version
+    transcript_module._append_to_active_transcript(
+        key, {"event": "user", "chat_id": "replay-cache", "text": "late question"}
+    )
+
+    new_version, new_records = cache.records(key)
+    assert new_version != version
+    assert new_records[: len(records)] == records
+    assert new_records[-1]["text"] == "late question"
+    assert (cache.full_reads, cache.incremental_reads) == (1, 1)
+
+
+def test_thread_replay_rereads_rewritten_active_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.config.paths.get_data_dir", lambda: tmp_path)
+    key = "websocket:replay-rewrite"
+    append_transcript_object(key, {"event": "user", "chat_id": "replay-rewrite", "text": "one"})
+    cache = transcript_module._TranscriptReplayCache()
+    assert [r["text"] for r in cache.records(key)[1]] == ["one"]
+
+    path = transcript_module.webui_transcript_path(key)
+    path.write_text(
+        '{"event":"user","chat_id":"replay-rewrite","text":"two"}\n'
+        '{"event":"user","chat_id":"replay-rewrite","text":"three"}',
+        encoding="utf-8",
+    )
+
+    assert [r["text"] for r in cache.records(key)[1]] == ["two", "three"]
+    assert cache.full_reads == 2
+
+
 def test_delete_webui_transcript_removes_segments(tmp_path, monkeypatch) -> None:
     from nanobot.webui.thread_disk import webui_thread_file_path
     from nanobot.webui.transcript import delete_webui_transcript, webui_transcript_path
@@ -4,12 +4,14 @@ import gzip
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from nanobot.webui.static_assets import StaticAssetCache
 from nanobot.webui.ws_http import GatewayHTTPHandler
 
 
 def _handler(static_dist_path: Path) -> GatewayHTTPHandler:
     handler = object.__new__(GatewayHTTPHandler)
     handler.static_dist_path = static_dist_path
+    handler.static_assets = StaticAssetCache(static_dist_path)
     handler._log = MagicMock()
     return handler
 
@@ -70,3 +72,47 @@ def test_spa_fallback_uses_precompressed_index_without_long_term_cache(tmp_path)
     assert response.headers["Content-Encoding"] == "gzip"
     assert response.headers["Cache-Control"] == "no-cache"
     assert gzip.decompress(response.body) == source
+
+
+def test_static_asset_prefers_brotli_variant_and_answers_revalidation(tmp_path) -> None:
+    source = b"export const answer = 42;\n" * 200
+    asset = tmp_path / "assets" / "app-abc123.js"
+    asset.parent.mkdir()
+    asset.write_bytes(source)
+    asset.with_name(f"{asset.name}.br").write_bytes(b"brotli-bytes")
+    handler = _handler(tmp_path)
+
+    response = handler._serve_static("/assets/app-abc123.js", accept_encoding="gzip, br")
+
+    assert response is not None
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.body == b"brotli-bytes"
+    etag = response.headers["ETag"]
+
+    revalidated = handler._serve_static(
+        "/assets/app-abc123.js",
+        accept_encoding="gzip, br",
+        if_none_match=etag,
+    )
+    assert revalidated is not None
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.body == b""
+
+
+def test_static_asset_compresses_missing_gzip_variant_once(tmp_path, monkeypatch) -> None:
+    source = b"body { color: black; }\n" * 400
+    asset = tmp_path / "assets" / "app-abc123.css"
+    asset.parent.mkdir()
+    asset.write_bytes(source)
+    handler = _handler(tmp_path)
+
+    first = handler._serve_static("/assets/app-abc123.css", accept_encoding="gzip")
+    monkeypatch.setattr(Path, "read_bytes", MagicMock(side_effect=AssertionError("re-read")))
+    second = handler._serve_static("/assets/app-abc123.css", accept_encoding="gzip")
+
+    assert first is not None and second is not None
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(second.body) == source
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert handler.static_assets.stats() == {"hits": 1, "loads": 1, "assets": 1}
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
 
 from nanobot.agent.hook import AgentHookContext
+from nanobot.webui import token_usage
 from nanobot.webui.token_usage import (
     TokenUsageHook,
+    flush_token_usage,
     record_response_token_usage,
     record_token_usage,
     token_usage_payload,
@@ -201,3 +204,96 @@ async def test_token_usage_hook_classifies_source_from_session_key(tmp_path, mon
     payload = token_usage_payload(now=datetime(2026, 6, 3, tzinfo=timezone.utc))
 
     assert payload["days"][0]["sources"]["cron"]["total_tokens"] == 15
+
+
+@pytest.mark.asyncio
+async def test_token_usage_hook_batches_writes_until_flush(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.webui.token_usage.get_webui_dir", lambda: tmp_path / "webui")
+    monkeypatch.setattr("nanobot.webui.token_usage._local_day", lambda *_, **__: "2026-06-03")
+    state_file = tmp_path / "webui" / "token-usage.json"
+
+    hook = TokenUsageHook()
+    for _ in range(3):
+        await hook.after_iteration(
+            AgentHookContext(
+                iteration=0,
+                messages=[],
+                session_key="websocket:chat",
+                usage={"prompt_tokens": 10, "completion_tokens": 5},
+            )
+        )
+
+    assert not state_file.exists()
+    payload = token_usage_payload(now=datetime(2026, 6, 3, tzinfo=timezone.utc))
+    assert payload["total_tokens_30d"] == 45
+    assert payload["requests_30d"] == 3
+
+    flush_token_usage()
+
+    raw = json.loads(state_file.read_text(encoding="utf-8"))
+    assert raw["days"]["2026-06-03"]["total_tokens"] == 45
+
+
+@pytest.mark.asyncio
+async def test_token_usage_flush_merges_external_writes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.webui.token_usage.get_webui_dir", lambda: tmp_path / "webui")
+    monkeypatch.setattr("nanobot.webui.token_usage._local_day", lambda *_, **__: "2026-06-03")
+    _write_state(tmp_path, {"2026-06-02": {"total_tokens": 5, "requests": 1}})
+
+    await TokenUsageHook().after_iteration(
+        AgentHookContext(
+            iteration=0,
+            messages=[],
+            session_key="websocket:chat",
+            usage={"prompt_tokens": 10, "completion_tokens": 5},
+        )
+    )
+    # Another process records usage before this one flushes.
+    _write_state(tmp_path, {
+        "2026-06-02": {"total_tokens": 5, "requests": 1},
+        "2026-06-03": {"total_tokens": 100, "requests": 2},
+    })
+
+    flush_token_usage()
+
+    raw = json.loads((tmp_path / "webui" / "token-usage.json").read_text(encoding="utf-8"))
+    assert raw["days"]["2026-06-02"]["total_tokens"] == 5
+    assert raw["days"]["2026-06-03"]["total_tokens"] == 115
+    assert raw["days"]["2026-06-03"]["requests"] == 3
+
+
+def test_token_usage_updates_during_flush_are_counted_once(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.webui.token_usage.get_webui_dir", lambda: tmp_path / "webui")
+    monkeypatch.setattr("nanobot.webui.token_usage._local_day", lambda *_, **__: "2026-06-03")
+    usage = {"prompt_tokens": 10, "completion_tokens": 5}
+    aggregator = token_usage._AGGREGATOR
+    real_write = token_usage.write_token_usage_state
+    writes = 0
+
+    def _write_then_record(state, *, path=None):
+        nonlocal writes
+        written = real_write(state, path=path)
+        writes += 1
+        if writes == 1:
+            # Another session records usage while the flush is still on disk I/O.
+            recorder = threading.Thread(
+                target=aggregator.add,
+                args=(token_usage._normalize_usage(usage),),
+                kwargs={"source": "user", "timezone_name": None, "now": None},
+            )
+            recorder.start()
+            recorder.join()
+        return written
+
+    monkeypatch.setattr("nanobot.webui.token_usage.write_token_usage_state", _write_then_record)
+    for _ in range(3):
+        aggregator.add(token_usage._normalize_usage(usage), source="user", timezone_name=None, now=None)
+
+    flush_token_usage()
+    payload = token_usage_payload(now=datetime(2026, 6, 3, tzinfo=timezone.utc))
+    assert payload["requests_30d"] == 4
+    flush_token_usage()
+
+    raw = json.loads((tmp_path / "webui" / "token-usage.json").read_text(encoding="utf-8"))
+    assert raw["days"]["2026-06-03"]["requests"] == 4
+    assert raw["days"]["2026-06-03"]["total_tokens"] == 60
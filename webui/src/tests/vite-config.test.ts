@@ -1,7 +1,7 @@
 import { mkdirSync, mkdtempSync, readFileSync, rmSync, writeFileSync } from "node:fs";
 import { tmpdir } from "node:os";
 import path from "node:path";
-import { gunzipSync } from "node:zlib";
+import { brotliDecompressSync, gunzipSync } from "node:zlib";
 import { describe, expect, it } from "vitest";
 
 import {
@@ -29,6 +29,7 @@ describe("gzipWebuiAssets", () => {
       writeCompressedWebuiAssets(outputDir, ["assets/index-final.js"]);
 
       expect(gunzipSync(readFileSync(`${assetPath}.gz`))).toEqual(finalized);
+      expect(brotliDecompressSync(readFileSync(`${assetPath}.br`))).toEqual(finalized);
     } finally {
       rmSync(outputDir, { recursive: true, force: true });
     }
@@ -2,7 +2,7 @@ import { defineConfig, loadEnv, type Plugin } from "vite";
 import react from "@vitejs/plugin-react";
 import { readFileSync, writeFileSync } from "node:fs";
 import path from "node:path";
-import { gzipSync } from "node:zlib";
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from "node:zlib";
 
 const GZIP_MIN_BYTES = 4 * 1024;
 const GZIP_ASSET_PATTERN = /\.(?:css|html|js|json|mjs|svg)$/i;
@@ -38,9 +38,15 @@ export function writeCompressedWebuiAssets(outputDir: string, fileNames: string[
     const outputPath = path.resolve(outputDir, fileName);
     const bytes = readFileSync(outputPath);
     if (bytes.byteLength < GZIP_MIN_BYTES) continue;
-    const compressed = gzipSync(bytes, { level: 9 });
-    if (compressed.byteLength >= bytes.byteLength) continue;
-    writeFileSync(`${outputPath}.gz`, compressed);
+    const gzipped = gzipSync(bytes, { level: 9 });
+    if (gzipped.byteLength < bytes.byteLength) writeFileSync(`${outputPath}.gz`, gzipped);
+    const brotli = brotliCompressSync(bytes, {
+      params: {
+        [zlibConstants.BROTLI_PARAM_QUALITY]: zlibConstants.BROTLI_MAX_QUALITY,
+        [zlibConstants.BROTLI_PARAM_SIZE_HINT]: bytes.byteLength,
+      },
+    });
+    if (brotli.byteLength < bytes.byteLength) writeFileSync(`${outputPath}.br`, brotli);
   }
 }
 